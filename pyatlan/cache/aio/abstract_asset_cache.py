@@ -4,9 +4,24 @@ from __future__ import annotations
 
 import asyncio
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Any, Dict
+from contextlib import AsyncExitStack, asynccontextmanager
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncGenerator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+)
 
 from pyatlan.cache.abstract_asset_cache import AbstractAssetName
+from pyatlan.cache.common import AssetCacheStore, KeyedLocks
+from pyatlan.cache.common.asset_cache_store import DEFAULT_MAX_ENTRIES
+from pyatlan.cache.common.backend import CacheBackend
 from pyatlan.errors import ErrorCode
 from pyatlan.model.assets import Asset
 from pyatlan.model.enums import AtlanConnectorType
@@ -21,12 +36,39 @@ class AsyncAbstractAssetCache(ABC):
     to all caches, where a cache is populated entry-by-entry.
     """
 
-    def __init__(self, client: AsyncAtlanClient):
+    SEARCH_ATTRIBUTES: List[str] = []
+    LOOKUP_BATCH_SIZE = 100
+    # Namespace of the cache's entries in a (shared) cache backend
+    BACKEND_NAMESPACE = ""
+
+    def __init__(
+        self,
+        client: AsyncAtlanClient,
+        max_entries: Optional[int] = DEFAULT_MAX_ENTRIES,
+        ttl: Optional[float] = None,
+        backend: Optional[CacheBackend] = None,
+    ):
+        """
+        :param client: connectivity to an Atlan tenant
+        :param max_entries: maximum number of assets to cache (least-recently used are evicted first), or None for no limit
+        :param ttl: number of seconds for which to cache each asset, or None to cache them until evicted
+        :param backend: through which to share cached assets with other clients, or None to keep them in this cache only
+        """
         self.client = client
         self.lock = asyncio.Lock()
-        self.name_to_guid: Dict[str, str] = dict()
-        self.guid_to_asset: Dict[str, Asset] = dict()
-        self.qualified_name_to_guid: Dict[str, str] = dict()
+        self.key_locks: KeyedLocks[asyncio.Lock] = KeyedLocks(asyncio.Lock)
+        self.store = AssetCacheStore(
+            attributes=self.SEARCH_ATTRIBUTES,
+            max_entries=max_entries,
+            ttl=ttl,
+            backend=backend,
+            namespace=self.BACKEND_NAMESPACE,
+        )
+        self.name_to_guid: Mapping[str, str] = self.store.name_to_guid
+        self.guid_to_asset: Mapping[str, Asset] = self.store.guid_to_asset
+        self.qualified_name_to_guid: Mapping[str, str] = (
+            self.store.qualified_name_to_guid
+        )
 
     @abstractmethod
     async def lookup_by_guid(self, guid: str):
@@ -40,6 +82,28 @@ class AsyncAbstractAssetCache(ABC):
     async def lookup_by_name(self, name: Any):
         """Abstract method to lookup asset by name."""
 
+    async def lookup_by_guids(self, guids: List[str]) -> None:
+        """
+        Look up several assets by their UUIDs, and cache those that are found.
+        By default each asset is looked up on its own: subclasses should override
+        this to look up all of them in a single search.
+
+        :param guids: UUIDs of the assets to look up
+        """
+        for guid in guids:
+            await self.lookup_by_guid(guid)
+
+    async def lookup_by_qualified_names(self, qualified_names: List[str]) -> None:
+        """
+        Look up several assets by their qualified names, and cache those that are found.
+        By default each asset is looked up on its own: subclasses should override
+        this to look up all of them in a single search.
+
+        :param qualified_names: unique Atlan-internal names of the assets to look up
+        """
+        for qualified_name in qualified_names:
+            await self.lookup_by_qualified_name(qualified_name)
+
     @abstractmethod
     def get_name(self, asset: Asset):
         """Abstract method to get name from asset."""
@@ -87,9 +151,119 @@ class AsyncAbstractAssetCache(ABC):
             name = name_result
         if not all([name, asset.guid, asset.qualified_name]):
             return
-        self.name_to_guid[name] = asset.guid  # type: ignore[index]
-        self.guid_to_asset[asset.guid] = asset  # type: ignore[index]
-        self.qualified_name_to_guid[asset.qualified_name] = asset.guid  # type: ignore[index]
+        self.store.put(name, asset, share=False)  # type: ignore[arg-type]
+        if self.store.backend is not None:
+            # The backend may wait on another process (to write), so is used in a thread
+            await asyncio.to_thread(self.store.share, name, asset)  # type: ignore[arg-type]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Retrieve statistics describing the use of the cache.
+
+        :returns: the statistics of the cache (as in CacheStats.snapshot), where each refresh is a
+                  lookup of assets that were not cached, along with counts of assets that were evicted or expired
+        """
+        return self.store.get_stats()
+
+    @asynccontextmanager
+    async def _locked_misses(
+        self, index: str, keys: Iterable[str]
+    ) -> AsyncGenerator[List[str], None]:
+        """
+        Lock the given keys (only), and determine which of them are still not cached
+        (nor shared by another client through the cache backend) once they are locked.
+        This ensures that concurrent misses on a key result in a single lookup, while
+        misses on other keys can be looked up at the same time.
+
+        :param index: name of the index in which to look for the keys
+            (name_to_guid, guid_to_asset or qualified_name_to_guid)
+        :param keys: to lock
+        :returns: the (distinct) keys that are still not cached, while the lock is held
+        """
+        keys = [key for key in dict.fromkeys(keys) if key]
+        async with AsyncExitStack() as stack:
+            for lock in self.key_locks.get_all((index, key) for key in keys):
+                await stack.enter_async_context(lock)
+            cached = getattr(self, index)
+            missing = [key for key in keys if key not in cached]
+            if missing and self.store.backend is not None:
+                # Assets another client already looked up need not be looked up again
+                # (the backend may wait on another process, so is used in a thread)
+                missing = await asyncio.to_thread(
+                    self.store.load_shared, index, missing
+                )
+            if missing:
+                stack.enter_context(self.store.stats.timed_refresh())
+            yield missing
+
+    async def _get_by_guids(
+        self, guids: Iterable[str], allow_refresh: bool = True
+    ) -> Dict[str, Asset]:
+        """
+        Retrieve several assets from the cache by their UUIDs. Any assets that are not
+        yet cached are looked up in batches of LOOKUP_BATCH_SIZE, rather than one-by-one.
+
+        :param guids: UUIDs of the assets in Atlan
+        :param allow_refresh: whether to allow a refresh of the cache (`True`) or not (`False`)
+        :returns: the assets that were found, keyed by UUID (any not found are omitted)
+        :raises AtlanError: on any API communication problem if the cache needs to be refreshed
+        """
+        return await self._get_all(
+            "guid_to_asset", guids, self.lookup_by_guids, allow_refresh
+        )
+
+    async def _get_by_qualified_names(
+        self, qualified_names: Iterable[str], allow_refresh: bool = True
+    ) -> Dict[str, Asset]:
+        """
+        Retrieve several assets from the cache by their unique Atlan-internal names. Any assets
+        that are not yet cached are looked up in batches of LOOKUP_BATCH_SIZE, rather than one-by-one.
+
+        :param qualified_names: unique Atlan-internal names of the assets
+        :param allow_refresh: whether to allow a refresh of the cache (`True`) or not (`False`)
+        :returns: the assets that were found, keyed by qualified name (any not found are omitted)
+        :raises AtlanError: on any API communication problem if the cache needs to be refreshed
+        """
+        return await self._get_all(
+            "qualified_name_to_guid",
+            qualified_names,
+            self.lookup_by_qualified_names,
+            allow_refresh,
+        )
+
+    async def _get_all(
+        self,
+        index: str,
+        keys: Iterable[str],
+        lookup: Callable[[List[str]], Awaitable[None]],
+        allow_refresh: bool,
+    ) -> Dict[str, Asset]:
+        found: Dict[str, Asset] = {}
+        missing: List[str] = []
+        for key in dict.fromkeys(keys):
+            if not key:
+                continue
+            asset = self._get_cached(index, key)
+            self.store.record_lookup(found=bool(asset))
+            if asset:
+                found[key] = asset
+            else:
+                missing.append(key)
+        if allow_refresh:
+            for start in range(0, len(missing), self.LOOKUP_BATCH_SIZE):
+                batch = missing[start : start + self.LOOKUP_BATCH_SIZE]  # noqa: E203
+                await lookup(batch)
+                for key in batch:
+                    asset = self._get_cached(index, key)
+                    if asset:
+                        found[key] = asset
+        return found
+
+    def _get_cached(self, index: str, key: str) -> Optional[Asset]:
+        if index == "guid_to_asset":
+            return self.guid_to_asset.get(key)
+        guid = getattr(self, index).get(key)
+        return self.guid_to_asset.get(guid) if guid else None
 
     async def _get_by_guid(self, guid: str, allow_refresh: bool = True):
         """
@@ -105,6 +279,7 @@ class AsyncAbstractAssetCache(ABC):
         if not guid:
             raise ErrorCode.MISSING_ID.exception_with_parameters()
         asset = self.guid_to_asset.get(guid)
+        self.store.record_lookup(found=bool(asset))
         if not asset and allow_refresh:
             await self.lookup_by_guid(guid)
             asset = self.guid_to_asset.get(guid)
@@ -128,18 +303,20 @@ class AsyncAbstractAssetCache(ABC):
         if not qualified_name:
             raise ErrorCode.MISSING_ID.exception_with_parameters()
         guid = self.qualified_name_to_guid.get(qualified_name)
-        if not guid and allow_refresh:
+        asset = guid and self.guid_to_asset.get(guid)
+        self.store.record_lookup(found=bool(asset))
+        if not asset and allow_refresh:
             await self.lookup_by_qualified_name(qualified_name)
             guid = self.qualified_name_to_guid.get(qualified_name)
-        if not guid:
+            asset = guid and self.guid_to_asset.get(guid)
+        if not asset:
             raise ErrorCode.ASSET_NOT_FOUND_BY_QN.exception_with_parameters(
                 qualified_name,
                 AtlanConnectorType._get_connector_type_from_qualified_name(
                     qualified_name
                 ).value,
             )
-
-        return await self._get_by_guid(guid=guid, allow_refresh=False)
+        return asset
 
     async def _get_by_name(self, name, allow_refresh: bool = True):
         """
@@ -155,12 +332,14 @@ class AsyncAbstractAssetCache(ABC):
         if not isinstance(name, AbstractAssetName):
             raise ErrorCode.MISSING_NAME.exception_with_parameters()
         guid = self.name_to_guid.get(str(name))
-        if not guid and allow_refresh:
+        asset = guid and self.guid_to_asset.get(guid)
+        self.store.record_lookup(found=bool(asset))
+        if not asset and allow_refresh:
             await self.lookup_by_name(name)
             guid = self.name_to_guid.get(str(name))
-        if not guid:
+            asset = guid and self.guid_to_asset.get(guid)
+        if not asset:
             raise ErrorCode.ASSET_NOT_FOUND_BY_NAME.exception_with_parameters(
                 name._TYPE_NAME, name
             )
-
-        return await self._get_by_guid(guid=guid, allow_refresh=False)
+        return asset
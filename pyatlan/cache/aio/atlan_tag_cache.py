@@ -3,10 +3,11 @@
 from __future__ import annotations
 
 import asyncio
-from typing import TYPE_CHECKING, Dict, Optional, Set
+from typing import TYPE_CHECKING, Any, Dict, Mapping, Optional, Set
 
 from pyatlan.cache.common import AtlanTagCacheCommon
-from pyatlan.errors import ErrorCode
+from pyatlan.cache.common.stats import CacheStats
+from pyatlan.errors import ErrorCode, NotFoundError
 from pyatlan.model.enums import AtlanTypeCategory
 from pyatlan.model.typedef import AtlanTagDef
 
@@ -22,19 +23,35 @@ class AsyncAtlanTagCache:
 
     def __init__(self, client: AsyncAtlanClient):
         self.client: AsyncAtlanClient = client
-        self.cache_by_id: Dict[str, AtlanTagDef] = {}
+        self.cache_by_id: Mapping[str, AtlanTagDef] = {}
         self.map_id_to_name: Dict[str, str] = {}
         self.map_name_to_id: Dict[str, str] = {}
         self.deleted_ids: Set[str] = set()
         self.deleted_names: Set[str] = set()
         self.map_id_to_source_tags_attr_id: Dict[str, str] = {}
+        self.loaded: bool = False
+        self.stats: CacheStats = CacheStats()
         self.lock: asyncio.Lock = asyncio.Lock()
 
     async def refresh_cache(self) -> None:
         """
         Refreshes the cache of Atlan tags by requesting the full set of Atlan tags from Atlan.
         """
-        await self._refresh_cache()
+        await self._refresh_cache(force=True)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Retrieve statistics describing the use of the cache.
+
+        :returns: the statistics of the cache (as in CacheStats.snapshot)
+        """
+        return self.stats.snapshot(
+            len(self.cache_by_id),
+            self.cache_by_id,
+            self.map_id_to_name,
+            self.map_name_to_id,
+            self.map_id_to_source_tags_attr_id,
+        )
 
     async def get_id_for_name(self, name: str) -> Optional[str]:
         """
@@ -64,29 +81,59 @@ class AsyncAtlanTagCache:
         """
         return await self._get_source_tags_attr_id(id)
 
-    async def _refresh_cache(self) -> None:
+    async def _refresh_cache(self, force: bool = False) -> None:
         """
         Refreshes the cache of Atlan tags by requesting the full set of Atlan tags from Atlan.
+
+        :param force: if True, request the type definitions from Atlan again even if this
+                      cache has not yet been loaded
         """
         async with self.lock:
-            # Make async API call directly
-            response = await self.client.typedef.get(
-                type_category=[
-                    AtlanTypeCategory.CLASSIFICATION,
-                    AtlanTypeCategory.STRUCT,
-                ]
-            )
+            with self.stats.timed_refresh():
+                # Build from the typedef snapshot shared by all typedef-backed caches
+                # (requesting it again if forced, or if this cache has already been loaded)
+                snapshot = await self.client.typedef._get_snapshot(
+                    refresh=force or self.loaded
+                )
+
+                if not snapshot.defs(AtlanTypeCategory.STRUCT):
+                    raise ErrorCode.EXPIRED_API_TOKEN.exception_with_parameters()
+
+                # Process snapshot using shared logic
+                (
+                    self.cache_by_id,
+                    self.map_id_to_name,
+                    self.map_name_to_id,
+                    self.map_id_to_source_tags_attr_id,
+                ) = AtlanTagCacheCommon.refresh_cache_data(snapshot)
+                self.loaded = True
+
+    async def _refresh_tag(self, idstr: str) -> None:
+        """
+        Retrieve only the given Atlan tag, which is not (yet) cached, and add it to the cache,
+        rather than refreshing the full set of Atlan tags (for example, when an asset refers to
+        an Atlan tag created since the cache was loaded).
 
-            if not response or not response.struct_defs:
-                raise ErrorCode.EXPIRED_API_TOKEN.exception_with_parameters()
-
-            # Process response using shared logic
-            (
-                self.cache_by_id,
-                self.map_id_to_name,
-                self.map_name_to_id,
-                self.map_id_to_source_tags_attr_id,
-            ) = AtlanTagCacheCommon.refresh_cache_data(response)
+        :param idstr: Atlan-internal ID string of the Atlan tag
+        """
+        async with self.lock:
+            # Another caller may have retrieved the Atlan tag while waiting for the lock
+            if idstr in self.map_id_to_name:
+                return
+            with self.stats.timed_refresh():
+                try:
+                    atlan_tag = await self.client.typedef.get_by_name(idstr)
+                except NotFoundError:
+                    return
+                if not isinstance(atlan_tag, AtlanTagDef):
+                    return
+                self.cache_by_id = AtlanTagCacheCommon.merge_tags(
+                    [atlan_tag],
+                    self.cache_by_id,
+                    self.map_id_to_name,
+                    self.map_name_to_id,
+                    self.map_id_to_source_tags_attr_id,
+                )
 
     async def _get_id_for_name(self, name: str) -> Optional[str]:
         """
@@ -100,6 +147,7 @@ class AsyncAtlanTagCache:
         result, should_refresh = AtlanTagCacheCommon.get_id_for_name(
             name, self.map_name_to_id, self.deleted_names
         )
+        self.stats.record_lookup(found=not should_refresh)
         if should_refresh:
             await self._refresh_cache()
             return AtlanTagCacheCommon.get_id_for_name_after_refresh(
@@ -119,8 +167,9 @@ class AsyncAtlanTagCache:
         result, should_refresh = AtlanTagCacheCommon.get_name_for_id(
             idstr, self.map_id_to_name, self.deleted_ids
         )
+        self.stats.record_lookup(found=not should_refresh)
         if should_refresh:
-            await self._refresh_cache()
+            await self._refresh_tag(idstr)
             return AtlanTagCacheCommon.get_name_for_id_after_refresh(
                 idstr, self.map_id_to_name, self.deleted_ids
             )
@@ -139,8 +188,9 @@ class AsyncAtlanTagCache:
         result, should_refresh = AtlanTagCacheCommon.get_source_tags_attr_id(
             id, self.map_id_to_source_tags_attr_id, self.deleted_ids
         )
+        self.stats.record_lookup(found=not should_refresh)
         if should_refresh:
-            await self._refresh_cache()
+            await self._refresh_tag(id)
             return AtlanTagCacheCommon.get_source_tags_attr_id_after_refresh(
                 id, self.map_id_to_source_tags_attr_id, self.deleted_ids
             )
@@ -3,15 +3,17 @@
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING, Union
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Union
 
 from pyatlan.cache.aio.abstract_asset_cache import AsyncAbstractAssetCache
+from pyatlan.cache.common.asset_cache_store import DEFAULT_MAX_ENTRIES
+from pyatlan.cache.common.backend import CacheBackend
 from pyatlan.cache.connection_cache import (
     ConnectionName,  # Reuse the sync ConnectionName class
 )
 from pyatlan.model.assets import Asset, Connection
 from pyatlan.model.fluent_search import FluentSearch
-from pyatlan.model.search import Term
+from pyatlan.model.search import Query, Term
 
 if TYPE_CHECKING:
     from pyatlan.client.aio import AsyncAtlanClient
@@ -38,9 +40,16 @@ class AsyncConnectionCache(AsyncAbstractAssetCache):
         Connection.CONNECTOR_NAME,
     ]
     SEARCH_ATTRIBUTES = [field.atlan_field_name for field in _SEARCH_FIELDS]
+    BACKEND_NAMESPACE = "connection_cache"
 
-    def __init__(self, client: AsyncAtlanClient):
-        super().__init__(client)
+    def __init__(
+        self,
+        client: AsyncAtlanClient,
+        max_entries: Optional[int] = DEFAULT_MAX_ENTRIES,
+        ttl: Optional[float] = None,
+        backend: Optional[CacheBackend] = None,
+    ):
+        super().__init__(client, max_entries=max_entries, ttl=ttl, backend=backend)
 
     async def get_by_guid(self, guid: str, allow_refresh: bool = True) -> Connection:
         """
@@ -90,40 +99,71 @@ class AsyncConnectionCache(AsyncAbstractAssetCache):
         """
         return await self._get_by_name(name, allow_refresh)
 
+    async def get_by_guids(
+        self, guids: Iterable[str], allow_refresh: bool = True
+    ) -> Dict[str, Connection]:
+        """
+        Retrieve several connections from the cache by their UUIDs.
+        Any connections that are not yet cached are looked up in batches, rather than one-by-one.
+
+        :param guids: UUIDs of the connections in Atlan
+        :param allow_refresh: whether to allow a refresh of the cache (True) or not (False)
+        :returns: connections that were found, keyed by UUID (any not found are omitted)
+        :raises AtlanError: on any API communication problem if the cache needs to be refreshed
+        """
+        return await self._get_by_guids(guids, allow_refresh)  # type: ignore[return-value]
+
+    async def get_by_qualified_names(
+        self, qualified_names: Iterable[str], allow_refresh: bool = True
+    ) -> Dict[str, Connection]:
+        """
+        Retrieve several connections from the cache by their qualifiedNames.
+        Any connections that are not yet cached are looked up in batches, rather than one-by-one.
+
+        :param qualified_names: qualifiedNames of the connections in Atlan
+        :param allow_refresh: whether to allow a refresh of the cache (True) or not (False)
+        :returns: connections that were found, keyed by qualifiedName (any not found are omitted)
+        :raises AtlanError: on any API communication problem if the cache needs to be refreshed
+        """
+        return await self._get_by_qualified_names(qualified_names, allow_refresh)  # type: ignore[return-value]
+
     async def lookup_by_guid(self, guid: str) -> None:
-        if not guid:
-            return
-        async with self.lock:
-            response = await (
-                FluentSearch(_includes_on_results=self.SEARCH_ATTRIBUTES)
-                .where(Term.with_state("ACTIVE"))
-                .where(Term.with_super_type_names("Asset"))
-                .where(Connection.GUID.eq(guid))
-                .execute_async(self.client)
-            )
-            candidate = (response.current_page() and response.current_page()[0]) or None
-            if candidate and isinstance(candidate, Connection):
-                await self.cache(candidate)
+        await self.lookup_by_guids([guid])
 
     async def lookup_by_qualified_name(self, connection_qn: str) -> None:
-        if not connection_qn:
+        await self.lookup_by_qualified_names([connection_qn])
+
+    async def lookup_by_guids(self, guids: List[str]) -> None:
+        async with self._locked_misses("guid_to_asset", guids) as missing:
+            await self._lookup(Connection.GUID.within(missing), len(missing))
+
+    async def lookup_by_qualified_names(self, qualified_names: List[str]) -> None:
+        async with self._locked_misses(
+            "qualified_name_to_guid", qualified_names
+        ) as missing:
+            await self._lookup(Connection.QUALIFIED_NAME.within(missing), len(missing))
+
+    async def _lookup(self, condition: Query, count: int) -> None:
+        if not count:
             return
-        async with self.lock:
-            response = await (
-                FluentSearch(_includes_on_results=self.SEARCH_ATTRIBUTES)
-                .where(Term.with_state("ACTIVE"))
-                .where(Term.with_super_type_names("Asset"))
-                .where(Connection.QUALIFIED_NAME.eq(connection_qn))
-                .execute_async(self.client)
-            )
-            candidate = (response.current_page() and response.current_page()[0]) or None
-            if candidate and isinstance(candidate, Connection):
+        response = await (
+            FluentSearch(_includes_on_results=self.SEARCH_ATTRIBUTES)
+            .where(Term.with_state("ACTIVE"))
+            .where(Term.with_super_type_names("Asset"))
+            .where(condition)
+            .page_size(count)
+            .execute_async(self.client)
+        )
+        async for candidate in response:
+            if isinstance(candidate, Connection):
                 await self.cache(candidate)
 
     async def lookup_by_name(self, name: ConnectionName) -> None:
         if not isinstance(name, ConnectionName):
             return
-        async with self.lock:
+        async with self._locked_misses("name_to_guid", [str(name)]) as missing:
+            if not missing:
+                return
             results = await self.client.asset.find_connections_by_name(
                 name=name.name,  # type: ignore[arg-type]
                 connector_type=name.type,  # type: ignore[arg-type]
@@ -3,10 +3,11 @@
 from __future__ import annotations
 
 import asyncio
-from typing import TYPE_CHECKING, Dict, List, Optional, Set
+from typing import TYPE_CHECKING, Any, Dict, List, Mapping, Optional, Set
 
 from pyatlan.cache.common import CustomMetadataCacheCommon
-from pyatlan.errors import ErrorCode
+from pyatlan.cache.common.stats import CacheStats
+from pyatlan.errors import ErrorCode, NotFoundError
 from pyatlan.model.enums import AtlanTypeCategory
 from pyatlan.model.typedef import AttributeDef, CustomMetadataDef
 
@@ -22,14 +23,16 @@ class AsyncCustomMetadataCache:
 
     def __init__(self, client: AsyncAtlanClient):
         self.client: AsyncAtlanClient = client
-        self.cache_by_id: Dict[str, CustomMetadataDef] = {}
-        self.attr_cache_by_id: Dict[str, AttributeDef] = {}
+        self.cache_by_id: Mapping[str, CustomMetadataDef] = {}
+        self.attr_cache_by_id: Mapping[str, AttributeDef] = {}
         self.map_id_to_name: Dict[str, str] = {}
         self.map_name_to_id: Dict[str, str] = {}
         self.map_attr_id_to_name: Dict[str, Dict[str, str]] = {}
         self.map_attr_name_to_id: Dict[str, Dict[str, str]] = {}
         self.archived_attr_ids: Dict[str, str] = {}
         self.types_by_asset: Dict[str, Set[type]] = {}
+        self.loaded: bool = False
+        self.stats: CacheStats = CacheStats()
         self.lock: asyncio.Lock = asyncio.Lock()
 
     async def refresh_cache(self) -> None:
@@ -38,7 +41,24 @@ class AsyncCustomMetadataCache:
         structures from Atlan.
         :raises LogicError: if duplicate custom attributes are detected
         """
-        await self._refresh_cache()
+        await self._refresh_cache(force=True)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Retrieve statistics describing the use of the cache.
+
+        :returns: the statistics of the cache (as in CacheStats.snapshot)
+        """
+        return self.stats.snapshot(
+            len(self.cache_by_id),
+            self.cache_by_id,
+            self.attr_cache_by_id,
+            self.map_id_to_name,
+            self.map_name_to_id,
+            self.map_attr_id_to_name,
+            self.map_attr_name_to_id,
+            self.archived_attr_ids,
+        )
 
     async def get_id_for_name(self, name: str) -> str:
         """
@@ -202,35 +222,76 @@ class AsyncCustomMetadataCache:
             return await self._get_attribute_for_search_results_(set_id, attr_name)
         return None
 
-    async def _refresh_cache(self) -> None:
+    async def _refresh_cache(self, force: bool = False) -> None:
         """
         Refreshes the cache of custom metadata structures by requesting the full set of custom metadata
         structures from Atlan.
+        :param force: if True, request the type definitions from Atlan again even if this
+                      cache has not yet been loaded
         :raises LogicError: if duplicate custom attributes are detected
         """
         async with self.lock:
-            # Make async API call directly
-            response = await self.client.typedef.get(
-                type_category=[
-                    AtlanTypeCategory.CUSTOM_METADATA,
-                    AtlanTypeCategory.STRUCT,
-                ]
-            )
+            with self.stats.timed_refresh():
+                # Build from the typedef snapshot shared by all typedef-backed caches
+                # (requesting it again if forced, or if this cache has already been loaded)
+                snapshot = await self.client.typedef._get_snapshot(
+                    refresh=force or self.loaded
+                )
+
+                if not snapshot.defs(AtlanTypeCategory.STRUCT):
+                    raise ErrorCode.EXPIRED_API_TOKEN.exception_with_parameters()
 
-            if not response or not response.struct_defs:
-                raise ErrorCode.EXPIRED_API_TOKEN.exception_with_parameters()
-
-            # Process response using shared logic
-            (
-                self.cache_by_id,
-                self.attr_cache_by_id,
-                self.map_id_to_name,
-                self.map_name_to_id,
-                self.map_attr_id_to_name,
-                self.map_attr_name_to_id,
-                self.archived_attr_ids,
-                self.types_by_asset,
-            ) = CustomMetadataCacheCommon.refresh_cache_data(response)
+                # Process snapshot using shared logic
+                (
+                    self.cache_by_id,
+                    self.attr_cache_by_id,
+                    self.map_id_to_name,
+                    self.map_name_to_id,
+                    self.map_attr_id_to_name,
+                    self.map_attr_name_to_id,
+                    self.archived_attr_ids,
+                    self.types_by_asset,
+                ) = CustomMetadataCacheCommon.refresh_cache_data(snapshot)
+                self.loaded = True
+
+    async def _refresh_set(self, set_id: str, attr_id: Optional[str] = None) -> None:
+        """
+        Retrieve only the given custom metadata set, and add it to (or replace it in) the cache,
+        rather than refreshing the full set of custom metadata structures (for example, when an
+        asset refers to a custom metadata set created since the cache was loaded).
+
+        :param set_id: Atlan-internal ID string of the custom metadata set
+        :param attr_id: Atlan-internal ID string of an attribute of the set that is not cached, if any
+        """
+        async with self.lock:
+            # Another caller may have retrieved the set while waiting for the lock
+            cached = (
+                self.map_attr_id_to_name.get(set_id, {})
+                if attr_id
+                else self.map_id_to_name
+            )
+            if (attr_id or set_id) in cached:
+                return
+            with self.stats.timed_refresh():
+                try:
+                    cm = await self.client.typedef.get_by_name(set_id)
+                except NotFoundError:
+                    return
+                if not isinstance(cm, CustomMetadataDef):
+                    return
+                (
+                    self.cache_by_id,
+                    self.attr_cache_by_id,
+                ) = CustomMetadataCacheCommon.merge_custom_metadata(
+                    [cm],
+                    self.cache_by_id,
+                    self.attr_cache_by_id,
+                    self.map_id_to_name,
+                    self.map_name_to_id,
+                    self.map_attr_id_to_name,
+                    self.map_attr_name_to_id,
+                    self.archived_attr_ids,
+                )
 
     async def _get_id_for_name(self, name: str) -> str:
         """
@@ -243,7 +304,9 @@ class AsyncCustomMetadataCache:
         """
         if not name or not name.strip():
             raise ErrorCode.MISSING_CM_NAME.exception_with_parameters()
-        if cm_id := self.map_name_to_id.get(name):
+        if not self.cache_by_id:
+            await self._refresh_cache()
+        if cm_id := self.stats.observe(self.map_name_to_id.get(name)):
             return cm_id
         # If not found, refresh the cache and look again (could be stale)
         await self._refresh_cache()
@@ -277,10 +340,12 @@ class AsyncCustomMetadataCache:
         """
         if not idstr or not idstr.strip():
             raise ErrorCode.MISSING_CM_ID.exception_with_parameters()
-        if cm_name := self.map_id_to_name.get(idstr):
+        if not self.cache_by_id:
+            await self._refresh_cache()
+        if cm_name := self.stats.observe(self.map_id_to_name.get(idstr)):
             return cm_name
-        # If not found, refresh the cache and look again (could be stale)
-        await self._refresh_cache()
+        # If not found, retrieve (only) that set and look again (could be new)
+        await self._refresh_set(idstr)
         if cm_name := self.map_id_to_name.get(idstr):
             return cm_name
         raise ErrorCode.CM_NOT_FOUND_BY_ID.exception_with_parameters(idstr)
@@ -303,14 +368,16 @@ class AsyncCustomMetadataCache:
         if not self.cache_by_id:
             await self._refresh_cache()
 
-        cm_id = self.map_name_to_id.get(cm_name)
+        cm_id = self.stats.observe(self.map_name_to_id.get(cm_name))
         if not cm_id:
             await self._refresh_cache()
             cm_id = self.map_name_to_id.get(cm_name)
             if not cm_id:
                 raise ErrorCode.CM_NOT_FOUND_BY_NAME.exception_with_parameters(cm_name)
 
-        attr_id = self.map_attr_name_to_id.get(cm_id, {}).get(attr_name)
+        attr_id = self.stats.observe(
+            self.map_attr_name_to_id.get(cm_id, {}).get(attr_name)
+        )
         if not attr_id:
             await self._refresh_cache()
             attr_id = self.map_attr_name_to_id.get(cm_id, {}).get(attr_name)
@@ -336,7 +403,7 @@ class AsyncCustomMetadataCache:
         if not self.cache_by_id:
             await self._refresh_cache()
 
-        attr_def = self.attr_cache_by_id.get(attr_id)
+        attr_def = self.stats.observe(self.attr_cache_by_id.get(attr_id))
         if not attr_def:
             await self._refresh_cache()
             attr_def = self.attr_cache_by_id.get(attr_id)
@@ -427,9 +494,12 @@ class AsyncCustomMetadataCache:
         if not self.cache_by_id:
             await self._refresh_cache()
 
-        attr_name = self.map_attr_id_to_name.get(set_id, {}).get(attr_id)
+        attr_name = self.stats.observe(
+            self.map_attr_id_to_name.get(set_id, {}).get(attr_id)
+        )
         if not attr_name:
-            await self._refresh_cache()
+            # Retrieve (only) that set and look again (could be new, or stale)
+            await self._refresh_set(set_id, attr_id)
             attr_name = self.map_attr_id_to_name.get(set_id, {}).get(attr_id)
             if not attr_name:
                 raise ErrorCode.CM_ATTR_NOT_FOUND_BY_ID.exception_with_parameters(
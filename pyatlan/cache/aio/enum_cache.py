@@ -3,9 +3,10 @@
 from __future__ import annotations
 
 import asyncio
-from typing import TYPE_CHECKING, Dict, Optional
+from typing import TYPE_CHECKING, Any, Dict, Mapping, Optional
 
 from pyatlan.cache.common import EnumCacheCommon
+from pyatlan.cache.common.stats import CacheStats
 from pyatlan.errors import ErrorCode
 from pyatlan.model.enums import AtlanTypeCategory
 from pyatlan.model.typedef import EnumDef
@@ -21,7 +22,9 @@ class AsyncEnumCache:
 
     def __init__(self, client: AsyncAtlanClient):
         self.client: AsyncAtlanClient = client
-        self.cache_by_name: Dict[str, EnumDef] = {}
+        self.cache_by_name: Mapping[str, EnumDef] = {}
+        self.loaded: bool = False
+        self.stats: CacheStats = CacheStats()
         self.lock: asyncio.Lock = asyncio.Lock()
 
     async def get_by_name(self, name: str) -> EnumDef:
@@ -36,21 +39,40 @@ class AsyncEnumCache:
             raise ErrorCode.ENUM_NOT_FOUND.exception_with_parameters(name)
         return enum
 
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Retrieve statistics describing the use of the cache.
+
+        :returns: the statistics of the cache (as in CacheStats.snapshot)
+        """
+        return self.stats.snapshot(len(self.cache_by_name), self.cache_by_name)
+
     async def refresh_cache(self) -> None:
         """
         Refreshes the cache of enumerations by requesting the full set of enumerations from Atlan.
         """
-        async with self.lock:
-            # Make async API call directly
-            response = await self.client.typedef.get(
-                type_category=AtlanTypeCategory.ENUM
-            )
+        await self._refresh_cache(force=True)
 
-            if not response or not response.enum_defs:
-                raise ErrorCode.EXPIRED_API_TOKEN.exception_with_parameters()
+    async def _refresh_cache(self, force: bool = False) -> None:
+        """
+        Refreshes the cache of enumerations by requesting the full set of enumerations from Atlan.
+
+        :param force: if True, request the type definitions from Atlan again even if this
+                      cache has not yet been loaded
+        """
+        async with self.lock:
+            with self.stats.timed_refresh():
+                # Build from the typedef snapshot shared by all typedef-backed caches
+                # (requesting it again if forced, or if this cache has already been loaded)
+                snapshot = await self.client.typedef._get_snapshot(
+                    refresh=force or self.loaded
+                )
+                if not snapshot.defs(AtlanTypeCategory.ENUM):
+                    raise ErrorCode.EXPIRED_API_TOKEN.exception_with_parameters()
 
-            # Process response using shared logic
-            self.cache_by_name = EnumCacheCommon.refresh_cache_data(response)
+                # Process snapshot using shared logic
+                self.cache_by_name = EnumCacheCommon.refresh_cache_data(snapshot)
+                self.loaded = True
 
     async def _get_by_name(self, name: str) -> Optional[EnumDef]:
         """
@@ -60,10 +82,10 @@ class AsyncEnumCache:
         :returns: enumeration definition or None if not found
         """
         if not self.cache_by_name:
-            await self.refresh_cache()
+            await self._refresh_cache()
 
-        enum_def = self.cache_by_name.get(name)
+        enum_def = self.stats.observe(self.cache_by_name.get(name))
         if not enum_def:
-            await self.refresh_cache()
+            await self._refresh_cache()
             enum_def = self.cache_by_name.get(name)
         return enum_def
@@ -3,9 +3,12 @@
 from __future__ import annotations
 
 import asyncio
-from typing import TYPE_CHECKING, Dict, Iterable, Optional
+import time
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional
 
-from pyatlan.cache.common import GroupCacheCommon
+from pyatlan.cache.common import CacheMissPolicy, GroupCacheCommon
+from pyatlan.cache.common.backend import CacheBackend, refresh_snapshot_async
+from pyatlan.cache.common.stats import CacheStats
 
 if TYPE_CHECKING:
     from pyatlan.client.aio import AsyncAtlanClient
@@ -16,12 +19,24 @@ class AsyncGroupCache:
     Async lazily-loaded cache for translating Atlan-internal groups into their various IDs.
     """
 
-    def __init__(self, client: AsyncAtlanClient):
+    BACKEND_NAMESPACE = "group_cache"
+
+    def __init__(
+        self, client: AsyncAtlanClient, backend: Optional[CacheBackend] = None
+    ):
+        """
+        :param client: connectivity to an Atlan tenant
+        :param backend: through which to share the groups with other clients, or None to keep them in this cache only
+        """
         self.client: AsyncAtlanClient = client
+        self.backend: Optional[CacheBackend] = backend
+        self.snapshot_saved_at: float = 0.0
         self.map_id_to_name: Dict[str, str] = {}
         self.map_name_to_id: Dict[str, str] = {}
         self.map_alias_to_id: Dict[str, str] = {}
         self.lock: asyncio.Lock = asyncio.Lock()
+        self.miss_policy: CacheMissPolicy = CacheMissPolicy()
+        self.stats: CacheStats = CacheStats()
 
     async def get_id_for_name(self, name: str) -> Optional[str]:
         """
@@ -80,14 +95,71 @@ class AsyncGroupCache:
         """
         await self._refresh_cache()
 
-    async def _refresh_cache(self) -> None:
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Retrieve statistics describing the use of the cache.
+
+        :returns: the statistics of the cache (as in CacheStats.snapshot)
+        """
+        return self.stats.snapshot(
+            len(self.map_id_to_name),
+            self.map_id_to_name,
+            self.map_name_to_id,
+            self.map_alias_to_id,
+        )
+
+    async def _refresh_cache(self, generation: Optional[int] = None) -> None:
+        """
+        Refreshes the cache of groups by requesting the full set of groups from Atlan.
+
+        :param generation: refresh generation observed on a cache miss, when refreshing due to one
+                           (in which case the miss policy decides whether to actually refresh)
+        """
         async with self.lock:
-            groups = [group async for group in await self.client.group.get_all()]
-            if not groups:
+            if generation is not None and not self.miss_policy.should_refresh(
+                generation
+            ):
                 return
-            (self.map_id_to_name, self.map_name_to_id, self.map_alias_to_id) = (
-                GroupCacheCommon.refresh_cache_data(groups)
-            )
+            with self.stats.timed_refresh():
+                # An explicit refresh only uses groups that another client saved after it was requested
+                newer_than = (
+                    time.time() if generation is None else self.snapshot_saved_at
+                )
+                snapshot = await refresh_snapshot_async(
+                    self.backend, self.BACKEND_NAMESPACE, self._fetch_maps, newer_than
+                )
+                if not snapshot:
+                    return
+                maps, self.snapshot_saved_at = snapshot
+                (self.map_id_to_name, self.map_name_to_id, self.map_alias_to_id) = maps
+                self.miss_policy.refreshed()
+
+    async def _fetch_maps(self) -> Optional[List[Dict[str, str]]]:
+        """
+        Request the full set of groups from Atlan.
+
+        :returns: lookup maps of the groups (as in GroupCacheCommon.refresh_cache_data), or None if there are no groups
+        """
+        groups = [group async for group in await self.client.group.get_all()]
+        return list(GroupCacheCommon.refresh_cache_data(groups)) if groups else None
+
+    async def _refresh_on_miss(self, index: str, key: str) -> Optional[str]:
+        """
+        Look up a key that was not found in one of the cache's indexes, after refreshing the
+        cache if the miss policy calls for it. Keys that are still not found are remembered
+        (for a while) as unknown, so that looking them up again does not refresh the cache.
+
+        :param index: name of the index (lookup map) in which the key was not found
+        :param key: key that was not found
+        :returns: value of the key in the index, or None if it is (still) unknown
+        """
+        if self.miss_policy.is_known_miss(index, key):
+            return None
+        await self._refresh_cache(self.miss_policy.generation)
+        if value := getattr(self, index).get(key):
+            return value
+        self.miss_policy.record_miss(index, key)
+        return None
 
     async def _get_id_for_name(self, name: str) -> Optional[str]:
         """
@@ -96,10 +168,9 @@ class AsyncGroupCache:
         :param name: internal name of the group
         :returns: unique identifier (GUID) of the group
         """
-        if group_id := self.map_name_to_id.get(name):
+        if group_id := self.stats.observe(self.map_name_to_id.get(name)):
             return group_id
-        await self._refresh_cache()
-        return self.map_name_to_id.get(name)
+        return await self._refresh_on_miss("map_name_to_id", name)
 
     async def _get_id_for_alias(self, alias: str) -> Optional[str]:
         """
@@ -108,10 +179,9 @@ class AsyncGroupCache:
         :param alias: name of the group as it appears in the UI
         :returns: unique identifier (GUID) of the group
         """
-        if group_id := self.map_alias_to_id.get(alias):
+        if group_id := self.stats.observe(self.map_alias_to_id.get(alias)):
             return group_id
-        await self._refresh_cache()
-        return self.map_alias_to_id.get(alias)
+        return await self._refresh_on_miss("map_alias_to_id", alias)
 
     async def _get_name_for_id(self, idstr: str) -> Optional[str]:
         """
@@ -120,7 +190,6 @@ class AsyncGroupCache:
         :param idstr: unique identifier (GUID) of the group
         :returns: internal name of the group
         """
-        if group_name := self.map_id_to_name.get(idstr):
+        if group_name := self.stats.observe(self.map_id_to_name.get(idstr)):
             return group_name
-        await self._refresh_cache()
-        return self.map_id_to_name.get(idstr)
+        return await self._refresh_on_miss("map_id_to_name", idstr)
@@ -3,17 +3,20 @@
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING, Union
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Union
 
 from pyatlan.cache.abstract_asset_cache import (
     AbstractAssetName,  # Import base class for AsyncSourceTagName
 )
 from pyatlan.cache.aio.abstract_asset_cache import AsyncAbstractAssetCache
+from pyatlan.cache.common.asset_cache_store import DEFAULT_MAX_ENTRIES
+from pyatlan.cache.common.backend import CacheBackend
 from pyatlan.cache.connection_cache import ConnectionName  # Reuse sync ConnectionName
+from pyatlan.cache.source_tag_cache import _connection_qualified_name
 from pyatlan.errors import AtlanError
 from pyatlan.model.assets import Asset, Tag
 from pyatlan.model.fluent_search import FluentSearch
-from pyatlan.model.search import Term
+from pyatlan.model.search import Query, Term
 
 if TYPE_CHECKING:
     from pyatlan.client.aio import AsyncAtlanClient
@@ -36,9 +39,16 @@ class AsyncSourceTagCache(AsyncAbstractAssetCache):
 
     _SEARCH_FIELDS = [Asset.NAME]
     SEARCH_ATTRIBUTES = [field.atlan_field_name for field in _SEARCH_FIELDS]
+    BACKEND_NAMESPACE = "source_tag_cache"
 
-    def __init__(self, client: AsyncAtlanClient):
-        super().__init__(client)
+    def __init__(
+        self,
+        client: AsyncAtlanClient,
+        max_entries: Optional[int] = DEFAULT_MAX_ENTRIES,
+        ttl: Optional[float] = None,
+        backend: Optional[CacheBackend] = None,
+    ):
+        super().__init__(client, max_entries=max_entries, ttl=ttl, backend=backend)
 
     async def get_by_guid(self, guid: str, allow_refresh: bool = True) -> Tag:
         """
@@ -89,41 +99,49 @@ class AsyncSourceTagCache(AsyncAbstractAssetCache):
             name = await AsyncSourceTagName.creator(self.client, name)
         return await self._get_by_name(name, allow_refresh)
 
+    async def get_by_guids(
+        self, guids: Iterable[str], allow_refresh: bool = True
+    ) -> Dict[str, Tag]:
+        """
+        Retrieve several source tags from the cache by their UUIDs.
+        Any source tags that are not yet cached are looked up in batches, rather than one-by-one.
+
+        :param guids: UUIDs of the source tags in Atlan
+        :param allow_refresh: whether to allow a refresh of the cache (True) or not (False)
+        :returns: source tags that were found, keyed by UUID (any not found are omitted)
+        :raises AtlanError: on any API communication problem if the cache needs to be refreshed
+        """
+        return await self._get_by_guids(guids, allow_refresh)  # type: ignore[return-value]
+
+    async def get_by_qualified_names(
+        self, qualified_names: Iterable[str], allow_refresh: bool = True
+    ) -> Dict[str, Tag]:
+        """
+        Retrieve several source tags from the cache by their qualifiedNames.
+        Any source tags that are not yet cached are looked up in batches, rather than one-by-one.
+
+        :param qualified_names: qualifiedNames of the source tags in Atlan
+        :param allow_refresh: whether to allow a refresh of the cache (True) or not (False)
+        :returns: source tags that were found, keyed by qualifiedName (any not found are omitted)
+        :raises AtlanError: on any API communication problem if the cache needs to be refreshed
+        """
+        return await self._get_by_qualified_names(qualified_names, allow_refresh)  # type: ignore[return-value]
+
     async def lookup_by_guid(self, guid: str) -> None:
-        if not guid:
-            return
-        async with self.lock:
-            response = await (
-                FluentSearch(_includes_on_results=self.SEARCH_ATTRIBUTES)
-                .where(Term.with_state("ACTIVE"))
-                .where(Asset.SUPER_TYPE_NAMES.eq(Tag.__name__))
-                .where(Asset.GUID.eq(guid))
-                .execute_async(self.client)
-            )
-            candidate = (response.current_page() and response.current_page()[0]) or None
-            # NOTE: Checking if the first result is an "Asset" since in pyatlan,
-            # "DbtTag" extends "Dbt" (unlike other tags like "SnowflakeTag" that extend the "Tag" model),
-            # preventing Dbt tags from being excluded from caching:
-            if candidate and isinstance(candidate, Asset):
-                await self.cache(candidate)
+        await self.lookup_by_guids([guid])
 
     async def lookup_by_qualified_name(self, source_tag_qn: str) -> None:
-        if not source_tag_qn:
-            return
-        async with self.lock:
-            response = await (
-                FluentSearch(_includes_on_results=self.SEARCH_ATTRIBUTES)
-                .where(Term.with_state("ACTIVE"))
-                .where(Asset.SUPER_TYPE_NAMES.eq(Tag.__name__))
-                .where(Asset.QUALIFIED_NAME.eq(source_tag_qn))
-                .execute_async(self.client)
-            )
-            candidate = (response.current_page() and response.current_page()[0]) or None
-            # NOTE: Checking if the first result is an "Asset" since in pyatlan,
-            # "DbtTag" extends "Dbt" (unlike other tags like "SnowflakeTag" that extend the "Tag" model),
-            # preventing Dbt tags from being excluded from caching:
-            if candidate and isinstance(candidate, Asset):
-                await self.cache(candidate)
+        await self.lookup_by_qualified_names([source_tag_qn])
+
+    async def lookup_by_guids(self, guids: List[str]) -> None:
+        async with self._locked_misses("guid_to_asset", guids) as missing:
+            await self._lookup(Asset.GUID.within(missing), len(missing))
+
+    async def lookup_by_qualified_names(self, qualified_names: List[str]) -> None:
+        async with self._locked_misses(
+            "qualified_name_to_guid", qualified_names
+        ) as missing:
+            await self._lookup(Asset.QUALIFIED_NAME.within(missing), len(missing))
 
     async def lookup_by_name(self, stn: AsyncSourceTagName) -> None:
         if not isinstance(stn, AsyncSourceTagName):
@@ -133,22 +151,31 @@ class AsyncSourceTagCache(AsyncAbstractAssetCache):
             connection_name  # type: ignore[arg-type]
         )
         connection_qn = connection.qualified_name
-        source_tag_qn = f"{connection_qn}/{stn.partial_tag_name}"
-
-        async with self.lock:
-            response = await (
-                FluentSearch(_includes_on_results=self.SEARCH_ATTRIBUTES)
-                .where(Term.with_state("ACTIVE"))
-                .where(Asset.SUPER_TYPE_NAMES.eq(Tag.__name__))
-                .where(Asset.QUALIFIED_NAME.eq(source_tag_qn))
-                .execute_async(self.client)
-            )
-            candidate = (response.current_page() and response.current_page()[0]) or None
-            # NOTE: Checking if the first result is an "Asset" since in pyatlan,
-            # "DbtTag" extends "Dbt" (unlike other tags like "SnowflakeTag" that extend the "Tag" model),
-            # preventing Dbt tags from being excluded from caching:
-            if candidate and isinstance(candidate, Asset):
-                await self.cache(candidate)
+        await self.lookup_by_qualified_name(f"{connection_qn}/{stn.partial_tag_name}")
+
+    async def _lookup(self, condition: Query, count: int) -> None:
+        if not count:
+            return
+        response = await (
+            FluentSearch(_includes_on_results=self.SEARCH_ATTRIBUTES)
+            .where(Term.with_state("ACTIVE"))
+            .where(Asset.SUPER_TYPE_NAMES.eq(Tag.__name__))
+            .where(condition)
+            .page_size(count)
+            .execute_async(self.client)
+        )
+        # NOTE: Checking if each result is an "Asset" since in pyatlan,
+        # "DbtTag" extends "Dbt" (unlike other tags like "SnowflakeTag" that extend the "Tag" model),
+        # preventing Dbt tags from being excluded from caching:
+        candidates = [
+            candidate async for candidate in response if isinstance(candidate, Asset)
+        ]
+        # Resolve the connections of all the source tags at once, rather than one-by-one
+        await self.client.connection_cache.get_by_qualified_names(
+            _connection_qualified_name(candidate) for candidate in candidates
+        )
+        for candidate in candidates:
+            await self.cache(candidate)
 
     async def get_name(self, asset: Asset):
         # NOTE: Checking if the first result is an "Asset" since in pyatlan,
@@ -206,8 +233,7 @@ class AsyncSourceTagName(AbstractAssetName):
         # preventing Dbt tags from being excluded from caching:
         if isinstance(tag, Asset):
             source_tag_qn = tag.qualified_name or ""
-            tokens = source_tag_qn.split("/")
-            connection_qn = "/".join(tokens[:3]) if len(tokens) >= 3 else ""
+            connection_qn = _connection_qualified_name(tag)
             conn = await client.connection_cache.get_by_qualified_name(connection_qn)
             instance.connection = ConnectionName(conn)
             instance.partial_tag_name = source_tag_qn[len(connection_qn) + 1 :]  # noqa
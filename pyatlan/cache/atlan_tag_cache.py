@@ -3,10 +3,11 @@
 from __future__ import annotations
 
 from threading import Lock
-from typing import TYPE_CHECKING, Dict, Optional, Set
+from typing import TYPE_CHECKING, Any, Dict, Mapping, Optional, Set
 
 from pyatlan.cache.common import AtlanTagCacheCommon
-from pyatlan.errors import ErrorCode
+from pyatlan.cache.common.stats import CacheStats
+from pyatlan.errors import ErrorCode, NotFoundError
 from pyatlan.model.enums import AtlanTypeCategory
 from pyatlan.model.typedef import AtlanTagDef
 
@@ -24,19 +25,35 @@ class AtlanTagCache:
 
     def __init__(self, client: AtlanClient):
         self.client: AtlanClient = client
-        self.cache_by_id: Dict[str, AtlanTagDef] = {}
+        self.cache_by_id: Mapping[str, AtlanTagDef] = {}
         self.map_id_to_name: Dict[str, str] = {}
         self.map_name_to_id: Dict[str, str] = {}
         self.deleted_ids: Set[str] = set()
         self.deleted_names: Set[str] = set()
         self.map_id_to_source_tags_attr_id: Dict[str, str] = {}
+        self.loaded: bool = False
+        self.stats: CacheStats = CacheStats()
         self.lock: Lock = Lock()
 
     def refresh_cache(self) -> None:
         """
         Refreshes the cache of Atlan tags by requesting the full set of Atlan tags from Atlan.
         """
-        self._refresh_cache()
+        self._refresh_cache(force=True)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Retrieve statistics describing the use of the cache.
+
+        :returns: the statistics of the cache (as in CacheStats.snapshot)
+        """
+        return self.stats.snapshot(
+            len(self.cache_by_id),
+            self.cache_by_id,
+            self.map_id_to_name,
+            self.map_name_to_id,
+            self.map_id_to_source_tags_attr_id,
+        )
 
     def get_id_for_name(self, name: str) -> Optional[str]:
         """
@@ -66,29 +83,56 @@ class AtlanTagCache:
         """
         return self._get_source_tags_attr_id(id)
 
-    def _refresh_cache(self) -> None:
+    def _refresh_cache(self, force: bool = False) -> None:
         """
         Refreshes the cache of Atlan tags by requesting the full set of Atlan tags from Atlan.
+
+        :param force: if True, request the type definitions from Atlan again even if this
+                      cache has not yet been loaded
         """
-        with self.lock:
-            # Make API call directly
-            response = self.client.typedef.get(
-                type_category=[
-                    AtlanTypeCategory.CLASSIFICATION,
-                    AtlanTypeCategory.STRUCT,
-                ]
-            )
+        with self.lock, self.stats.timed_refresh():
+            # Build from the typedef snapshot shared by all typedef-backed caches
+            # (requesting it again if forced, or if this cache has already been loaded)
+            snapshot = self.client.typedef._get_snapshot(refresh=force or self.loaded)
 
-            if not response or not response.struct_defs:
+            if not snapshot.defs(AtlanTypeCategory.STRUCT):
                 raise ErrorCode.EXPIRED_API_TOKEN.exception_with_parameters()
 
-            # Process response using shared logic
+            # Process snapshot using shared logic
             (
                 self.cache_by_id,
                 self.map_id_to_name,
                 self.map_name_to_id,
                 self.map_id_to_source_tags_attr_id,
-            ) = AtlanTagCacheCommon.refresh_cache_data(response)
+            ) = AtlanTagCacheCommon.refresh_cache_data(snapshot)
+            self.loaded = True
+
+    def _refresh_tag(self, idstr: str) -> None:
+        """
+        Retrieve only the given Atlan tag, which is not (yet) cached, and add it to the cache,
+        rather than refreshing the full set of Atlan tags (for example, when an asset refers to
+        an Atlan tag created since the cache was loaded).
+
+        :param idstr: Atlan-internal ID string of the Atlan tag
+        """
+        with self.lock:
+            # Another caller may have retrieved the Atlan tag while waiting for the lock
+            if idstr in self.map_id_to_name:
+                return
+            with self.stats.timed_refresh():
+                try:
+                    atlan_tag = self.client.typedef.get_by_name(idstr)
+                except NotFoundError:
+                    return
+                if not isinstance(atlan_tag, AtlanTagDef):
+                    return
+                self.cache_by_id = AtlanTagCacheCommon.merge_tags(
+                    [atlan_tag],
+                    self.cache_by_id,
+                    self.map_id_to_name,
+                    self.map_name_to_id,
+                    self.map_id_to_source_tags_attr_id,
+                )
 
     def _get_id_for_name(self, name: str) -> Optional[str]:
         """
@@ -102,6 +146,7 @@ class AtlanTagCache:
         result, should_refresh = AtlanTagCacheCommon.get_id_for_name(
             name, self.map_name_to_id, self.deleted_names
         )
+        self.stats.record_lookup(found=not should_refresh)
         if should_refresh:
             self._refresh_cache()
             return AtlanTagCacheCommon.get_id_for_name_after_refresh(
@@ -121,8 +166,9 @@ class AtlanTagCache:
         result, should_refresh = AtlanTagCacheCommon.get_name_for_id(
             idstr, self.map_id_to_name, self.deleted_ids
         )
+        self.stats.record_lookup(found=not should_refresh)
         if should_refresh:
-            self._refresh_cache()
+            self._refresh_tag(idstr)
             return AtlanTagCacheCommon.get_name_for_id_after_refresh(
                 idstr, self.map_id_to_name, self.deleted_ids
             )
@@ -141,8 +187,9 @@ class AtlanTagCache:
         result, should_refresh = AtlanTagCacheCommon.get_source_tags_attr_id(
             id, self.map_id_to_source_tags_attr_id, self.deleted_ids
         )
+        self.stats.record_lookup(found=not should_refresh)
         if should_refresh:
-            self._refresh_cache()
+            self._refresh_tag(id)
             return AtlanTagCacheCommon.get_source_tags_attr_id_after_refresh(
                 id, self.map_id_to_source_tags_attr_id, self.deleted_ids
             )
@@ -13,21 +13,45 @@ to ensure zero code duplication between sync and async cache implementations.
 from __future__ import annotations
 
 # Cache shared logic classes
+from .asset_cache_store import AssetCacheStore
 from .atlan_tag_cache import AtlanTagCacheCommon
+from .backend import CacheBackend, InProcessCacheBackend, SQLiteCacheBackend
 from .custom_metadata_cache import CustomMetadataCacheCommon
 from .dq_template_config_cache import DQTemplateConfigCacheCommon
 from .enum_cache import EnumCacheCommon
 from .group_cache import GroupCacheCommon
+from .keyed_locks import KeyedLocks
+from .miss_policy import CacheMissPolicy
 from .role_cache import RoleCacheCommon
+from .stats import CacheStats
+from .typedef_snapshot import (
+    LazyModels,
+    SharedTypeDefSnapshot,
+    TypeDefSnapshot,
+    TypeDefSnapshotFile,
+)
 from .user_cache import UserCacheCommon
+from .warmup import CacheWarmup
 
 __all__ = [
     # Cache shared logic classes
+    "AssetCacheStore",
     "AtlanTagCacheCommon",
+    "CacheBackend",
+    "CacheWarmup",
+    "CacheMissPolicy",
+    "CacheStats",
     "CustomMetadataCacheCommon",
     "DQTemplateConfigCacheCommon",
     "EnumCacheCommon",
     "GroupCacheCommon",
+    "InProcessCacheBackend",
+    "KeyedLocks",
     "RoleCacheCommon",
+    "SharedTypeDefSnapshot",
+    "SQLiteCacheBackend",
+    "LazyModels",
+    "TypeDefSnapshot",
+    "TypeDefSnapshotFile",
     "UserCacheCommon",
 ]
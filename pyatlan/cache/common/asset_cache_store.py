@@ -0,0 +1,377 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2025 Atlan Pte. Ltd.
+"""
+Shared, bounded storage for caches that are populated entry-by-entry
+(connections, source tags).
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import threading
+import time
+from collections import OrderedDict
+from typing import (
+    Any,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+)
+
+from pydantic.v1 import BaseModel, ValidationError, parse_obj_as
+
+from pyatlan.cache.common.backend import CacheBackend
+from pyatlan.cache.common.stats import CacheStats
+from pyatlan.model.assets import Asset
+
+DEFAULT_MAX_ENTRIES = 10_000
+_MUTABLE_TYPES = (list, dict, set)
+
+
+class _AssetLayout:
+    """
+    Describes which fields of an asset type are kept in a cache record,
+    and how to rebuild an (incomplete) asset of that type from such a record.
+    """
+
+    __slots__ = ("asset_type", "fields", "_defaults", "_attribute_defaults")
+
+    def __init__(self, asset_type: Type[Asset], attributes: Sequence[str]):
+        self.asset_type = asset_type
+        # (python field name, whether it is nested under the asset's attributes)
+        self.fields: List[Tuple[str, bool]] = []
+        top_level = {field.alias: name for name, field in asset_type.__fields__.items()}
+        nested = {
+            field.alias: name
+            for name, field in asset_type.Attributes.__fields__.items()
+        }
+        for atlan_name in ["qualifiedName", *attributes]:
+            if atlan_name in nested:
+                self.fields.append((nested[atlan_name], True))
+            elif atlan_name in top_level:
+                self.fields.append((top_level[atlan_name], False))
+        self._defaults = dict(asset_type.construct().__dict__)
+        self._attribute_defaults = dict(asset_type.Attributes.construct().__dict__)
+
+    def values(self, asset: Asset) -> Tuple[Any, ...]:
+        """
+        :param asset: from which to retrieve the values to keep
+        :returns: values of the fields kept in a cache record, in layout order
+        """
+        return tuple(
+            getattr(asset.attributes if is_nested else asset, name)
+            for name, is_nested in self.fields
+        )
+
+    def to_asset(self, record: AssetRecord) -> Asset:
+        """
+        Rebuild an asset from a cache record, without re-validating its values.
+
+        :param record: cache record from which to build the asset
+        :returns: a new asset, with only the fields kept in the record set
+        """
+        values: Dict[str, Any] = {"type_name": self.asset_type.__name__}
+        attributes: Dict[str, Any] = {}
+        for (name, is_nested), value in zip(self.fields, record.values):
+            if value is not None:
+                (attributes if is_nested else values)[name] = value
+        values["guid"] = record.guid
+        values["attributes"] = self._construct(
+            self.asset_type.Attributes, self._attribute_defaults, attributes
+        )
+        return self._construct(self.asset_type, self._defaults, values)
+
+    @staticmethod
+    def _construct(
+        model: Type[BaseModel], defaults: Dict[str, Any], values: Dict[str, Any]
+    ):
+        # Equivalent to model.construct(**values), but reuses defaults
+        # computed once rather than recomputing them for every field
+        instance = model.__new__(model)
+        fields = {**defaults, **values}
+        for name, value in defaults.items():
+            if isinstance(value, _MUTABLE_TYPES) and name not in values:
+                fields[name] = type(value)(value)
+        object.__setattr__(instance, "__dict__", fields)
+        object.__setattr__(instance, "__fields_set__", set(values))
+        instance._init_private_attributes()
+        return instance
+
+
+class AssetRecord:
+    """
+    Compact record of a cached asset, holding only the
+    attributes that the cache retrieves for the asset.
+    """
+
+    __slots__ = ("layout", "guid", "qualified_name", "name", "values", "expires_at")
+
+    def __init__(
+        self,
+        layout: _AssetLayout,
+        guid: str,
+        qualified_name: str,
+        name: str,
+        values: Tuple[Any, ...],
+        expires_at: float,
+    ):
+        self.layout = layout
+        self.guid = guid
+        self.qualified_name = qualified_name
+        self.name = name
+        self.values = values
+        self.expires_at = expires_at
+
+
+class _GuidIndex(Mapping[str, str]):
+    """Read-only view translating a name or qualified name into a GUID."""
+
+    def __init__(self, store: AssetCacheStore, guids: Dict[str, str]):
+        self._store = store
+        self._guids = guids
+
+    def __getitem__(self, key: str) -> str:
+        with self._store._lock:
+            guid = self._guids[key]
+            if self._store._live(guid) is None:
+                raise KeyError(key)
+            return guid
+
+    def __iter__(self) -> Iterator[str]:
+        with self._store._lock:
+            return iter(list(self._guids))
+
+    def __len__(self) -> int:
+        return len(self._guids)
+
+
+class _AssetIndex(Mapping[str, Asset]):
+    """Read-only view translating a GUID into an asset."""
+
+    def __init__(self, store: AssetCacheStore):
+        self._store = store
+
+    def __getitem__(self, guid: str) -> Asset:
+        with self._store._lock:
+            record = self._store._live(guid)
+        if record is None:
+            raise KeyError(guid)
+        return record.layout.to_asset(record)
+
+    def __contains__(self, guid: object) -> bool:
+        with self._store._lock:
+            return self._store._live(guid) is not None  # type: ignore[arg-type]
+
+    def __iter__(self) -> Iterator[str]:
+        with self._store._lock:
+            return iter(list(self._store._records))
+
+    def __len__(self) -> int:
+        return len(self._store._records)
+
+
+class AssetCacheStore:
+    """
+    Bounded storage for assets cached by GUID, name and qualified name:
+
+    - only the asset's qualified name and the given attributes are kept (in a compact
+      record), and each retrieval returns a new, partial asset built from that record
+    - at most max_entries assets are kept, evicting the least-recently used first
+    - assets are forgotten ttl seconds after they were cached
+    - the three indexes (guid_to_asset, name_to_guid, qualified_name_to_guid)
+      are kept consistent: an asset is added to, or removed from, all of them at once
+    - when given a (shared) backend, assets are also saved to it, and assets not in the
+      store are loaded from it (if another client saved them) before looking them up
+    """
+
+    def __init__(
+        self,
+        attributes: Sequence[str],
+        max_entries: Optional[int] = DEFAULT_MAX_ENTRIES,
+        ttl: Optional[float] = None,
+        backend: Optional[CacheBackend] = None,
+        namespace: str = "",
+    ):
+        """
+        :param attributes: names of the attributes (in Atlan) to keep for each asset
+        :param max_entries: maximum number of assets to keep, or None for no limit
+        :param ttl: number of seconds for which to keep each asset, or None to keep them until evicted
+        :param backend: shared with other clients, or None to keep assets only in this store
+        :param namespace: under which to keep the assets in the backend
+        """
+        self.attributes = list(attributes)
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.backend = backend
+        self.namespace = namespace
+        self.stats = CacheStats()
+        self.evictions = 0
+        self.expirations = 0
+        self._lock = threading.Lock()
+        self._layouts: Dict[Type[Asset], _AssetLayout] = {}
+        self._records: OrderedDict[str, AssetRecord] = OrderedDict()
+        self._guid_by_name: Dict[str, str] = {}
+        self._guid_by_qualified_name: Dict[str, str] = {}
+        self.guid_to_asset: Mapping[str, Asset] = _AssetIndex(self)
+        self.name_to_guid: Mapping[str, str] = _GuidIndex(self, self._guid_by_name)
+        self.qualified_name_to_guid: Mapping[str, str] = _GuidIndex(
+            self, self._guid_by_qualified_name
+        )
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def put(self, name: str, asset: Asset, share: bool = True) -> None:
+        """
+        Add (or replace) an asset in the store, evicting the
+        least-recently used assets if the store is full.
+
+        :param name: human-constructable name of the asset
+        :param asset: to be stored, which must have a GUID and qualified name
+        :param share: whether to also save the asset to the backend (if any)
+        """
+        layout = self._layouts.get(type(asset))
+        if layout is None:
+            layout = self._layouts.setdefault(
+                type(asset), _AssetLayout(type(asset), self.attributes)
+            )
+        record = AssetRecord(
+            layout=layout,
+            guid=asset.guid,
+            qualified_name=asset.qualified_name,  # type: ignore[arg-type]
+            name=name,
+            values=layout.values(asset),
+            expires_at=math.inf if self.ttl is None else time.monotonic() + self.ttl,
+        )
+        with self._lock:
+            previous = self._records.get(record.guid)
+            if previous is not None:
+                self._remove(previous)
+            for key, index in (
+                (name, self._guid_by_name),
+                (record.qualified_name, self._guid_by_qualified_name),
+            ):
+                # Another asset may have had this name, in which case it is replaced
+                other = self._records.get(index.get(key, ""))
+                if other is not None:
+                    self._remove(other)
+                index[key] = record.guid
+            self._records[record.guid] = record
+            while self.max_entries is not None and len(self._records) > max(
+                self.max_entries, 1
+            ):
+                self._remove(next(iter(self._records.values())))
+                self.evictions += 1
+        if share:
+            self.share(name, asset)
+
+    def share(self, name: str, asset: Asset) -> None:
+        """
+        Save an asset to the backend (if any), for other clients to load.
+
+        :param name: human-constructable name of the asset
+        :param asset: to be saved, which must have a GUID and qualified name
+        """
+        if self.backend is None:
+            return
+        self.backend.put_many(
+            self.namespace,
+            {
+                f"guid_to_asset:{asset.guid}": {
+                    "name": name,
+                    "asset": json.loads(asset.json(by_alias=True, exclude_unset=True)),
+                },
+                f"name_to_guid:{name}": asset.guid,
+                f"qualified_name_to_guid:{asset.qualified_name}": asset.guid,
+            },
+        )
+
+    def load_shared(self, index: str, keys: List[str]) -> List[str]:
+        """
+        Add to the store any assets for the given keys that another client saved to the backend.
+
+        :param index: in which the keys were not found (guid_to_asset, name_to_guid or qualified_name_to_guid)
+        :param keys: that were not found
+        :returns: the keys that are still not found, once the assets from the backend are stored
+        """
+        if self.backend is None or not keys:
+            return keys
+        if index == "guid_to_asset":
+            guids = keys
+        else:
+            guids = list(
+                self.backend.get_many(
+                    self.namespace, [f"{index}:{key}" for key in keys]
+                ).values()
+            )
+        entries = self.backend.get_many(
+            self.namespace, [f"guid_to_asset:{guid}" for guid in guids]
+        )
+        for entry in entries.values():
+            try:
+                name = entry["name"]
+                asset = parse_obj_as(Asset, entry["asset"])  # type: ignore[arg-type]
+            except (ValidationError, KeyError, TypeError):
+                continue
+            self.put(name, asset, share=False)
+        found = getattr(self, index)
+        return [key for key in keys if key not in found]
+
+    def record_lookup(self, found: bool) -> None:
+        """
+        Count a lookup against the cache.
+
+        :param found: whether the asset was found in the cache (hit) or not (miss)
+        """
+        self.stats.record_lookup(found)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        :returns: the statistics of the store (as in CacheStats.snapshot), along with
+                  counts of assets that were evicted or expired
+        """
+        with self._lock:
+            stats = self.stats.snapshot(
+                len(self._records),
+                self._records,
+                self._guid_by_name,
+                self._guid_by_qualified_name,
+            )
+        stats["evictions"] = self.evictions
+        stats["expirations"] = self.expirations
+        return stats
+
+    def clear(self) -> None:
+        """
+        Remove all assets from the store.
+        """
+        with self._lock:
+            self._records.clear()
+            self._guid_by_name.clear()
+            self._guid_by_qualified_name.clear()
+
+    def _live(self, guid: str) -> Optional[AssetRecord]:
+        # To be called while holding the lock
+        record = self._records.get(guid)
+        if record is None:
+            return None
+        if record.expires_at <= time.monotonic():
+            self._remove(record)
+            self.expirations += 1
+            return None
+        self._records.move_to_end(guid)
+        return record
+
+    def _remove(self, record: AssetRecord) -> None:
+        # To be called while holding the lock
+        self._records.pop(record.guid, None)
+        if self._guid_by_name.get(record.name) == record.guid:
+            del self._guid_by_name[record.name]
+        if self._guid_by_qualified_name.get(record.qualified_name) == record.guid:
+            del self._guid_by_qualified_name[record.qualified_name]
@@ -6,50 +6,97 @@ Shared logic for Atlan tag cache operations.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Dict, Optional, Set
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Mapping, Optional, Set
 
+from pyatlan.cache.common.typedef_snapshot import merge_models, to_raw
+from pyatlan.model.enums import AtlanTypeCategory
 from pyatlan.model.typedef import AtlanTagDef
 
 if TYPE_CHECKING:
-    from pyatlan.model.typedef import TypeDefResponse
+    from pyatlan.cache.common.typedef_snapshot import TypeDefSnapshot
 
 
 class AtlanTagCacheCommon:
     """Shared logic for Atlan tag cache operations."""
 
     @staticmethod
-    def refresh_cache_data(response: TypeDefResponse) -> tuple:
+    def refresh_cache_data(snapshot: TypeDefSnapshot) -> tuple:
         """
-        Process typedef response to extract Atlan tag cache data.
+        Process a snapshot of type definitions to extract Atlan tag cache data.
 
-        :param response: TypeDefResponse from API
+        :param snapshot: snapshot of type definitions
         :returns: tuple of (cache_by_id, map_id_to_name, map_name_to_id, map_id_to_source_tags_attr_id)
         """
-        cache_by_id: Dict[str, AtlanTagDef] = {}
         map_id_to_name: Dict[str, str] = {}
         map_name_to_id: Dict[str, str] = {}
         map_id_to_source_tags_attr_id: Dict[str, str] = {}
 
-        if response and response.atlan_tag_defs:
-            for atlan_tag in response.atlan_tag_defs:
-                atlan_tag_id = atlan_tag.name
-                atlan_tag_name = atlan_tag.display_name
-                cache_by_id[atlan_tag_id] = atlan_tag
-                map_id_to_name[atlan_tag_id] = atlan_tag_name
-                map_name_to_id[atlan_tag_name] = atlan_tag_id
-                source_tags_id = ""
-                for attr_def in atlan_tag.attribute_defs or []:
-                    if attr_def.display_name == "sourceTagAttachment":
-                        source_tags_id = attr_def.name or ""
-                map_id_to_source_tags_attr_id[atlan_tag_id] = source_tags_id
+        for atlan_tag in snapshot.defs(AtlanTypeCategory.CLASSIFICATION):
+            AtlanTagCacheCommon._add_tag(
+                atlan_tag, map_id_to_name, map_name_to_id, map_id_to_source_tags_attr_id
+            )
 
         return (
-            cache_by_id,
+            snapshot.models(AtlanTypeCategory.CLASSIFICATION),
             map_id_to_name,
             map_name_to_id,
             map_id_to_source_tags_attr_id,
         )
 
+    @staticmethod
+    def merge_tags(
+        atlan_tags: Iterable[AtlanTagDef],
+        cache_by_id: Mapping[str, AtlanTagDef],
+        map_id_to_name: Dict[str, str],
+        map_name_to_id: Dict[str, str],
+        map_id_to_source_tags_attr_id: Dict[str, str],
+    ) -> Mapping[str, AtlanTagDef]:
+        """
+        Merge individually-retrieved Atlan tags into the cache data, in place of a full refresh.
+
+        :param atlan_tags: definitions of the Atlan tags to add to (or replace in) the cache data
+        :param cache_by_id: Atlan tag definitions, keyed by ID
+        :param map_id_to_name: ID to name mapping (updated in place)
+        :param map_name_to_id: name to ID mapping (updated in place)
+        :param map_id_to_source_tags_attr_id: mapping from tag ID to source tags attr ID (updated in place)
+        :returns: the Atlan tag definitions, including the merged ones
+        """
+        raw_by_id = {atlan_tag.name: to_raw(atlan_tag) for atlan_tag in atlan_tags}
+        for atlan_tag in raw_by_id.values():
+            # Forget the name of an Atlan tag that has since been renamed
+            previous = map_id_to_name.get(atlan_tag["name"])
+            if previous and map_name_to_id.get(previous) == atlan_tag["name"]:
+                del map_name_to_id[previous]
+            AtlanTagCacheCommon._add_tag(
+                atlan_tag, map_id_to_name, map_name_to_id, map_id_to_source_tags_attr_id
+            )
+        return merge_models(cache_by_id, raw_by_id, AtlanTagDef)
+
+    @staticmethod
+    def _add_tag(
+        atlan_tag: Dict[str, Any],
+        map_id_to_name: Dict[str, str],
+        map_name_to_id: Dict[str, str],
+        map_id_to_source_tags_attr_id: Dict[str, str],
+    ) -> None:
+        """
+        Add a raw (JSON) Atlan tag definition to the cache's lookup maps.
+
+        :param atlan_tag: raw Atlan tag definition
+        :param map_id_to_name: ID to name mapping
+        :param map_name_to_id: name to ID mapping
+        :param map_id_to_source_tags_attr_id: mapping from tag ID to source tags attr ID
+        """
+        atlan_tag_id = atlan_tag["name"]
+        atlan_tag_name = atlan_tag.get("displayName") or ""
+        map_id_to_name[atlan_tag_id] = atlan_tag_name
+        map_name_to_id[atlan_tag_name] = atlan_tag_id
+        source_tags_id = ""
+        for attr_def in atlan_tag.get("attributeDefs") or []:
+            if attr_def.get("displayName") == "sourceTagAttachment":
+                source_tags_id = attr_def.get("name") or ""
+        map_id_to_source_tags_attr_id[atlan_tag_id] = source_tags_id
+
     @staticmethod
     def get_id_for_name(
         name: str, map_name_to_id: Dict[str, str], deleted_names: Set[str]
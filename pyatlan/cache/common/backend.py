@@ -0,0 +1,515 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2025 Atlan Pte. Ltd.
+"""
+Pluggable storage behind caches, which several clients (in one process, or in
+several processes on one host) can share so that only one of them requests from
+Atlan what all of their caches need.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from abc import ABC, abstractmethod
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    Mapping,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+)
+
+LOGGER = logging.getLogger(__name__)
+
+DEFAULT_BACKEND_TTL = 900.0  # 15 mins
+DEFAULT_LOCK_TIMEOUT = 30.0
+LOCK_POLL_INTERVAL = 0.05
+SNAPSHOT_KEY = "snapshot"
+
+T = TypeVar("T")
+
+
+class CacheBackend(ABC):
+    """
+    Storage for cache entries that is shared beyond a single cache. Entries are grouped
+    into namespaces (one per kind of cache), and their values must be JSON-serializable.
+    Refreshing a namespace is coordinated through a lock, so that only one of the clients
+    sharing the backend requests its entries from Atlan at a time, while the others wait
+    for (and then use) the entries it saves.
+    """
+
+    @abstractmethod
+    def get_many(self, namespace: str, keys: Iterable[str]) -> Dict[str, Any]:
+        """
+        :param namespace: in which to look for the entries
+        :param keys: of the entries to retrieve
+        :returns: values of the entries that are present (and not expired), by key
+        """
+
+    @abstractmethod
+    def put_many(self, namespace: str, entries: Mapping[str, Any]) -> None:
+        """
+        Add (or replace) several entries.
+
+        :param namespace: in which to save the entries
+        :param entries: values to save, by key
+        """
+
+    @abstractmethod
+    def clear(self, namespace: Optional[str] = None) -> None:
+        """
+        Remove all entries of a namespace.
+
+        :param namespace: whose entries to remove, or None to remove the entries of every namespace
+        """
+
+    @abstractmethod
+    def try_lock(self, namespace: str) -> bool:
+        """
+        Try to become the only client refreshing the entries of a namespace, without waiting.
+
+        :param namespace: to be refreshed
+        :returns: True if the lock was acquired (and must be released with unlock), otherwise False
+        """
+
+    @abstractmethod
+    def unlock(self, namespace: str) -> None:
+        """
+        Release the lock on a namespace acquired through try_lock.
+
+        :param namespace: that is no longer being refreshed
+        """
+
+    def get(self, namespace: str, key: str) -> Optional[Any]:
+        """
+        :param namespace: in which to look for the entry
+        :param key: of the entry to retrieve
+        :returns: value of the entry, or None if it is not present (or expired)
+        """
+        return self.get_many(namespace, [key]).get(key)
+
+    def put(self, namespace: str, key: str, value: Any) -> None:
+        """
+        Add (or replace) an entry.
+
+        :param namespace: in which to save the entry
+        :param key: of the entry
+        :param value: to save
+        """
+        self.put_many(namespace, {key: value})
+
+
+class InProcessCacheBackend(CacheBackend):
+    """
+    Backend kept in the memory of the current process, through which several
+    clients of the same tenant (in that process) can share their cache entries.
+    Values are kept as given, so must not be modified once saved.
+    """
+
+    def __init__(self, ttl: Optional[float] = None):
+        """
+        :param ttl: number of seconds for which to keep each entry, or None to keep them until cleared
+        """
+        self.ttl = ttl
+        self._entries: Dict[Tuple[str, str], Tuple[Any, float]] = {}
+        self._locked: Set[str] = set()
+        self._lock = threading.Lock()
+
+    def get_many(self, namespace: str, keys: Iterable[str]) -> Dict[str, Any]:
+        oldest = -float("inf") if self.ttl is None else time.monotonic() - self.ttl
+        found: Dict[str, Any] = {}
+        for key in keys:
+            entry = self._entries.get((namespace, key))
+            if entry is not None and entry[1] > oldest:
+                found[key] = entry[0]
+        return found
+
+    def put_many(self, namespace: str, entries: Mapping[str, Any]) -> None:
+        now = time.monotonic()
+        with self._lock:
+            for key, value in entries.items():
+                self._entries[(namespace, key)] = (value, now)
+
+    def clear(self, namespace: Optional[str] = None) -> None:
+        with self._lock:
+            if namespace is None:
+                self._entries.clear()
+                return
+            for entry_key in [key for key in self._entries if key[0] == namespace]:
+                del self._entries[entry_key]
+
+    def try_lock(self, namespace: str) -> bool:
+        with self._lock:
+            if namespace in self._locked:
+                return False
+            self._locked.add(namespace)
+            return True
+
+    def unlock(self, namespace: str) -> None:
+        with self._lock:
+            self._locked.discard(namespace)
+
+
+class SQLiteCacheBackend(CacheBackend):
+    """
+    Backend kept in a local SQLite database file, which several processes on the same host
+    (for example, the workers of a web server or task queue) can read at the same time.
+    Each process opens its own connection to the database, including processes forked
+    after the backend was created. Any problem using the database is logged and treated
+    as if the entries were not present, so that caches fall back to requesting them.
+    """
+
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS entries (
+            namespace TEXT NOT NULL,
+            key TEXT NOT NULL,
+            value TEXT NOT NULL,
+            saved_at REAL NOT NULL,
+            PRIMARY KEY (namespace, key)
+        );
+        CREATE TABLE IF NOT EXISTS locks (
+            namespace TEXT PRIMARY KEY,
+            owner TEXT NOT NULL,
+            expires_at REAL NOT NULL
+        );
+    """
+    # Maximum number of keys to look up in a single query
+    _MAX_KEYS = 500
+
+    def __init__(
+        self,
+        path: str,
+        ttl: float = DEFAULT_BACKEND_TTL,
+        lock_ttl: float = DEFAULT_LOCK_TIMEOUT,
+    ):
+        """
+        :param path: of the database file (created if it does not exist)
+        :param ttl: number of seconds for which each saved entry is used
+        :param lock_ttl: number of seconds after which a lock is released, even if the
+                         process that acquired it never released it (for example, because it died)
+        """
+        self.path = path
+        self.ttl = ttl
+        self.lock_ttl = lock_ttl
+        self._lock = threading.Lock()
+        self._connection: Optional[sqlite3.Connection] = None
+        self._pid: Optional[int] = None
+        self._owner = ""
+
+    @classmethod
+    def for_tenant(
+        cls, base_url: str, directory: str, ttl: float = DEFAULT_BACKEND_TTL
+    ) -> SQLiteCacheBackend:
+        """
+        Create a backend in a database file of its own for a tenant, so that
+        entries of different tenants are never shared.
+
+        :param base_url: URL of the tenant whose entries are kept in the backend
+        :param directory: in which to keep the database file
+        :param ttl: number of seconds for which each saved entry is used
+        :returns: backend for the tenant
+        """
+        digest = hashlib.sha256(base_url.encode("utf-8")).hexdigest()[:16]
+        return cls(os.path.join(directory, f"caches-{digest}.sqlite"), ttl=ttl)
+
+    def get_many(self, namespace: str, keys: Iterable[str]) -> Dict[str, Any]:
+        keys = list(keys)
+
+        def select(connection: sqlite3.Connection) -> Dict[str, Any]:
+            found: Dict[str, Any] = {}
+            oldest = time.time() - self.ttl
+            for start in range(0, len(keys), self._MAX_KEYS):
+                batch = keys[start : start + self._MAX_KEYS]  # noqa: E203
+                rows = connection.execute(
+                    "SELECT key, value FROM entries WHERE namespace = ? AND saved_at > ?"
+                    f" AND key IN ({', '.join('?' * len(batch))})",
+                    [namespace, oldest, *batch],
+                )
+                found.update((key, json.loads(value)) for key, value in rows)
+            return found
+
+        return self._execute(select, {}) if keys else {}
+
+    def put_many(self, namespace: str, entries: Mapping[str, Any]) -> None:
+        now = time.time()
+        rows = [
+            (namespace, key, json.dumps(value, separators=(",", ":")), now)
+            for key, value in entries.items()
+        ]
+
+        def insert(connection: sqlite3.Connection) -> None:
+            with _Transaction(connection):
+                connection.executemany(
+                    "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?)", rows
+                )
+
+        self._execute(insert, None)
+
+    def clear(self, namespace: Optional[str] = None) -> None:
+        def delete(connection: sqlite3.Connection) -> None:
+            with _Transaction(connection):
+                if namespace is None:
+                    connection.execute("DELETE FROM entries")
+                else:
+                    connection.execute(
+                        "DELETE FROM entries WHERE namespace = ?", [namespace]
+                    )
+
+        self._execute(delete, None)
+
+    def try_lock(self, namespace: str) -> bool:
+        def acquire(connection: sqlite3.Connection) -> bool:
+            now = time.time()
+            with _Transaction(connection):
+                connection.execute(
+                    "DELETE FROM locks WHERE namespace = ? AND expires_at <= ?",
+                    [namespace, now],
+                )
+                cursor = connection.execute(
+                    "INSERT OR IGNORE INTO locks VALUES (?, ?, ?)",
+                    [namespace, self._owner, now + self.lock_ttl],
+                )
+            return cursor.rowcount == 1
+
+        # If the database cannot be used, refresh without coordinating with other processes
+        return self._execute(acquire, True)
+
+    def unlock(self, namespace: str) -> None:
+        def release(connection: sqlite3.Connection) -> None:
+            with _Transaction(connection):
+                connection.execute(
+                    "DELETE FROM locks WHERE namespace = ? AND owner = ?",
+                    [namespace, self._owner],
+                )
+
+        self._execute(release, None)
+
+    def close(self) -> None:
+        """
+        Close this process's connection to the database.
+        """
+        with self._lock:
+            if self._connection is not None and self._pid == os.getpid():
+                self._connection.close()
+            self._connection = None
+
+    def _execute(self, operation: Callable[[sqlite3.Connection], T], default: T) -> T:
+        with self._lock:
+            try:
+                return operation(self._connect())
+            except (sqlite3.Error, OSError) as err:
+                LOGGER.warning("Unable to use cache backend %s: %s", self.path, err)
+                return default
+
+    def _connect(self) -> sqlite3.Connection:
+        # To be called while holding the lock. A connection must not be used across
+        # a fork, so a (forked) process that did not open the connection opens its own
+        if self._connection is None or self._pid != os.getpid():
+            if directory := os.path.dirname(self.path):
+                os.makedirs(directory, exist_ok=True)
+            connection = sqlite3.connect(
+                self.path,
+                timeout=self.lock_ttl,
+                isolation_level=None,
+                check_same_thread=False,
+            )
+            # Write-ahead logging lets processes read while another one writes
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.executescript(self._SCHEMA)
+            self._connection = connection
+            self._pid = os.getpid()
+            self._owner = f"{self._pid}-{uuid.uuid4().hex}"
+        return self._connection
+
+
+class _Transaction:
+    """Immediate (write) transaction, committed on success and rolled back on any error."""
+
+    def __init__(self, connection: sqlite3.Connection):
+        self._connection = connection
+
+    def __enter__(self) -> sqlite3.Connection:
+        self._connection.execute("BEGIN IMMEDIATE")
+        return self._connection
+
+    def __exit__(self, exc_type, exc, traceback) -> None:
+        self._connection.execute("ROLLBACK" if exc_type else "COMMIT")
+
+
+def load_snapshot(
+    backend: CacheBackend, namespace: str, newer_than: float
+) -> Optional[Tuple[Any, float]]:
+    """
+    Load the snapshot of a cache that is loaded in full, if one was saved after the given time.
+
+    :param backend: in which the snapshot is saved
+    :param namespace: of the cache
+    :param newer_than: time (in seconds since the epoch) after which the snapshot must have been saved
+    :returns: tuple of (snapshot, time at which it was saved), or None if there is no such snapshot
+    """
+    entry = backend.get(namespace, SNAPSHOT_KEY)
+    if entry and entry.get("savedAt", 0) > newer_than:
+        return entry["value"], entry["savedAt"]
+    return None
+
+
+def save_snapshot(backend: CacheBackend, namespace: str, value: Any) -> float:
+    """
+    Save the snapshot of a cache that is loaded in full.
+
+    :param backend: in which to save the snapshot
+    :param namespace: of the cache
+    :param value: snapshot to save
+    :returns: time (in seconds since the epoch) at which the snapshot was saved
+    """
+    saved_at = time.time()
+    backend.put(namespace, SNAPSHOT_KEY, {"savedAt": saved_at, "value": value})
+    return saved_at
+
+
+def acquire_refresh_lock(
+    backend: CacheBackend,
+    namespace: str,
+    is_refreshed: Callable[[], bool],
+    timeout: float = DEFAULT_LOCK_TIMEOUT,
+) -> bool:
+    """
+    Wait to become the only client refreshing a namespace, unless another client refreshes
+    it in the meantime.
+
+    :param backend: whose namespace is to be refreshed
+    :param namespace: to be refreshed
+    :param is_refreshed: whether another client has refreshed the namespace (while waiting)
+    :param timeout: maximum number of seconds to wait for another client's refresh
+    :returns: True if the lock was acquired (and must be released), or False if another client
+              refreshed the namespace or did not finish doing so within the timeout
+    """
+    deadline = time.monotonic() + timeout
+    while not backend.try_lock(namespace):
+        if is_refreshed() or time.monotonic() >= deadline:
+            return False
+        time.sleep(LOCK_POLL_INTERVAL)
+    return True
+
+
+async def acquire_refresh_lock_async(
+    backend: CacheBackend,
+    namespace: str,
+    is_refreshed: Callable[[], bool],
+    timeout: float = DEFAULT_LOCK_TIMEOUT,
+) -> bool:
+    """
+    Wait (without blocking the event loop) to become the only client refreshing a
+    namespace, unless another client refreshes it in the meantime.
+
+    :param backend: whose namespace is to be refreshed
+    :param namespace: to be refreshed
+    :param is_refreshed: whether another client has refreshed the namespace (while waiting)
+    :param timeout: maximum number of seconds to wait for another client's refresh
+    :returns: True if the lock was acquired (and must be released), or False if another client
+              refreshed the namespace or did not finish doing so within the timeout
+    """
+    deadline = time.monotonic() + timeout
+    # The backend may wait on another process (to write), so is used in a thread
+    while not await asyncio.to_thread(backend.try_lock, namespace):
+        if await asyncio.to_thread(is_refreshed) or time.monotonic() >= deadline:
+            return False
+        await asyncio.sleep(LOCK_POLL_INTERVAL)
+    return True
+
+
+def refresh_snapshot(
+    backend: Optional[CacheBackend],
+    namespace: str,
+    fetch: Callable[[], Any],
+    newer_than: float,
+) -> Optional[Tuple[Any, float]]:
+    """
+    Refresh the snapshot of a cache that is loaded in full. If another client saved a snapshot
+    after the given time, that snapshot is used. Otherwise the snapshot is fetched from Atlan by
+    a single client at a time (while any others wait for it), and saved for the others to use.
+
+    :param backend: shared by the clients, or None to always fetch the snapshot
+    :param namespace: of the cache
+    :param fetch: retrieves the snapshot (JSON-serializable) from Atlan, or returns nothing if there is none
+    :param newer_than: time (in seconds since the epoch) after which a saved snapshot must have been saved to be used
+    :returns: tuple of (snapshot, time at which it was saved), or None if there is no snapshot
+    """
+    if backend is None:
+        value = fetch()
+        return (value, time.time()) if value else None
+    if snapshot := load_snapshot(backend, namespace, newer_than):
+        return snapshot
+    locked = acquire_refresh_lock(
+        backend,
+        namespace,
+        lambda: load_snapshot(backend, namespace, newer_than) is not None,
+    )
+    try:
+        # Another client may have saved the snapshot just before releasing the lock
+        if snapshot := load_snapshot(backend, namespace, newer_than):
+            return snapshot
+        value = fetch()
+        return (value, save_snapshot(backend, namespace, value)) if value else None
+    finally:
+        if locked:
+            backend.unlock(namespace)
+
+
+async def refresh_snapshot_async(
+    backend: Optional[CacheBackend],
+    namespace: str,
+    fetch: Callable[[], Awaitable[Any]],
+    newer_than: float,
+) -> Optional[Tuple[Any, float]]:
+    """
+    Refresh the snapshot of a cache that is loaded in full. If another client saved a snapshot
+    after the given time, that snapshot is used. Otherwise the snapshot is fetched from Atlan by
+    a single client at a time (while any others wait for it), and saved for the others to use.
+
+    :param backend: shared by the clients, or None to always fetch the snapshot
+    :param namespace: of the cache
+    :param fetch: retrieves the snapshot (JSON-serializable) from Atlan, or returns nothing if there is none
+    :param newer_than: time (in seconds since the epoch) after which a saved snapshot must have been saved to be used
+    :returns: tuple of (snapshot, time at which it was saved), or None if there is no snapshot
+    """
+    if backend is None:
+        value = await fetch()
+        return (value, time.time()) if value else None
+    # The backend may wait on another process (to write), so is used in a thread
+    if snapshot := await asyncio.to_thread(
+        load_snapshot, backend, namespace, newer_than
+    ):
+        return snapshot
+    locked = await acquire_refresh_lock_async(
+        backend,
+        namespace,
+        lambda: load_snapshot(backend, namespace, newer_than) is not None,
+    )
+    try:
+        # Another client may have saved the snapshot just before releasing the lock
+        if snapshot := await asyncio.to_thread(
+            load_snapshot, backend, namespace, newer_than
+        ):
+            return snapshot
+        value = await fetch()
+        if not value:
+            return None
+        saved_at = await asyncio.to_thread(save_snapshot, backend, namespace, value)
+        return value, saved_at
+    finally:
+        if locked:
+            await asyncio.to_thread(backend.unlock, namespace)
@@ -6,28 +6,30 @@ Shared logic for custom metadata cache operations.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Dict, Set
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Mapping, Set, Tuple
 
+from pyatlan.cache.common.typedef_snapshot import LazyModels, merge_models, to_raw
+from pyatlan.errors import ErrorCode
+from pyatlan.model.enums import AtlanTypeCategory
 from pyatlan.model.typedef import AttributeDef, CustomMetadataDef
 
 if TYPE_CHECKING:
-    from pyatlan.model.typedef import TypeDefResponse
+    from pyatlan.cache.common.typedef_snapshot import TypeDefSnapshot
 
 
 class CustomMetadataCacheCommon:
     """Shared logic for custom metadata cache operations."""
 
     @staticmethod
-    def refresh_cache_data(response: TypeDefResponse) -> tuple:
+    def refresh_cache_data(snapshot: TypeDefSnapshot) -> tuple:
         """
-        Process typedef response to extract custom metadata cache data.
+        Process a snapshot of type definitions to extract custom metadata cache data.
 
-        :param response: TypeDefResponse from API
+        :param snapshot: snapshot of type definitions
         :returns: tuple of cache data dictionaries
         :raises LogicError: if duplicate custom attributes are detected
         """
-        cache_by_id: Dict[str, CustomMetadataDef] = {}
-        attr_cache_by_id: Dict[str, AttributeDef] = {}
+        attr_defs_by_id: Dict[str, Dict[str, Any]] = {}
         map_id_to_name: Dict[str, str] = {}
         map_name_to_id: Dict[str, str] = {}
         map_attr_id_to_name: Dict[str, Dict[str, str]] = {}
@@ -35,87 +37,20 @@ class CustomMetadataCacheCommon:
         archived_attr_ids: Dict[str, str] = {}
         types_by_asset: Dict[str, Set[type]] = {}
 
-        if response and response.custom_metadata_defs:
-            for cm in response.custom_metadata_defs:
-                cm_id = cm.name
-                cm_name = cm.display_name
-                cache_by_id[cm_id] = cm
-                map_id_to_name[cm_id] = cm_name
-                map_name_to_id[cm_name] = cm_id
-                map_attr_id_to_name[cm_id] = {}
-                map_attr_name_to_id[cm_id] = {}
-
-                # Process attributes
-                if cm.attribute_defs:
-                    for attr_def in cm.attribute_defs:
-                        attr_id = attr_def.name
-                        attr_name = attr_def.display_name
-
-                        # Skip if either ID or name is None
-                        if attr_id is None or attr_name is None:
-                            continue
-
-                        attr_cache_by_id[attr_id] = attr_def
-                        map_attr_id_to_name[cm_id][attr_id] = attr_name
-                        map_attr_name_to_id[cm_id][attr_name] = attr_id
-
-                        # Check for archived attributes
-                        if hasattr(attr_def, "options") and attr_def.options:
-                            # Handle both dictionary and Options object cases
-                            if hasattr(attr_def.options, "get"):
-                                # Dictionary case
-                                archived_id = attr_def.options.get(
-                                    "archivedAttributeId"
-                                )
-                            else:
-                                # Options object case
-                                archived_id = getattr(
-                                    attr_def.options, "archivedAttributeId", None
-                                )
-                            if archived_id:
-                                archived_attr_ids[archived_id] = attr_id
-
-                        # Process applicable types
-                        if hasattr(attr_def, "options") and attr_def.options:
-                            # Handle both dictionary and Options object cases
-                            if hasattr(attr_def.options, "get"):
-                                # Dictionary case
-                                applicable_types_str = attr_def.options.get(
-                                    "applicableEntityTypes"
-                                )
-                            else:
-                                # Options object case
-                                applicable_types_str = getattr(
-                                    attr_def.options, "applicableEntityTypes", None
-                                )
-                            if applicable_types_str:
-                                try:
-                                    import json
-
-                                    applicable_types = json.loads(applicable_types_str)
-                                    if isinstance(applicable_types, list):
-                                        for type_name in applicable_types:
-                                            if type_name not in types_by_asset:
-                                                types_by_asset[type_name] = set()
-                                            # Import asset type dynamically
-                                            try:
-                                                from pyatlan.model.assets import Asset
-
-                                                asset_type = getattr(
-                                                    Asset, type_name, None
-                                                )
-                                                if asset_type:
-                                                    types_by_asset[type_name].add(
-                                                        asset_type
-                                                    )
-                                            except (AttributeError, ImportError):
-                                                pass
-                                except json.JSONDecodeError:
-                                    pass
+        for cm in snapshot.defs(AtlanTypeCategory.CUSTOM_METADATA):
+            CustomMetadataCacheCommon._add_custom_metadata(
+                cm,
+                attr_defs_by_id,
+                map_id_to_name,
+                map_name_to_id,
+                map_attr_id_to_name,
+                map_attr_name_to_id,
+                archived_attr_ids,
+            )
 
         return (
-            cache_by_id,
-            attr_cache_by_id,
+            snapshot.models(AtlanTypeCategory.CUSTOM_METADATA),
+            LazyModels(attr_defs_by_id, AttributeDef),
             map_id_to_name,
             map_name_to_id,
             map_attr_id_to_name,
@@ -123,3 +58,105 @@ class CustomMetadataCacheCommon:
             archived_attr_ids,
             types_by_asset,
         )
+
+    @staticmethod
+    def merge_custom_metadata(
+        custom_metadata_defs: Iterable[CustomMetadataDef],
+        cache_by_id: Mapping[str, CustomMetadataDef],
+        attr_cache_by_id: Mapping[str, AttributeDef],
+        map_id_to_name: Dict[str, str],
+        map_name_to_id: Dict[str, str],
+        map_attr_id_to_name: Dict[str, Dict[str, str]],
+        map_attr_name_to_id: Dict[str, Dict[str, str]],
+        archived_attr_ids: Dict[str, str],
+    ) -> Tuple[Mapping[str, CustomMetadataDef], Mapping[str, AttributeDef]]:
+        """
+        Merge individually-retrieved custom metadata sets into the cache data, in place of a full refresh.
+
+        :param custom_metadata_defs: definitions of the custom metadata sets to add to (or replace in) the cache data
+        :param cache_by_id: custom metadata definitions, keyed by ID
+        :param attr_cache_by_id: attribute definitions, keyed by ID
+        :param map_id_to_name: ID to name mapping (updated in place)
+        :param map_name_to_id: name to ID mapping (updated in place)
+        :param map_attr_id_to_name: attribute ID to name mapping, per set (updated in place)
+        :param map_attr_name_to_id: attribute name to ID mapping, per set (updated in place)
+        :param archived_attr_ids: names of archived attributes, keyed by ID (updated in place)
+        :returns: tuple of (cache_by_id, attr_cache_by_id), including the merged definitions
+        :raises LogicError: if duplicate custom attributes are detected
+        """
+        raw_by_id = {cm.name: to_raw(cm) for cm in custom_metadata_defs}
+        attr_defs_by_id: Dict[str, Dict[str, Any]] = {}
+        for cm in raw_by_id.values():
+            type_id = cm["name"]
+            # Forget the name of a set that has since been renamed, and its previous attributes
+            previous = map_id_to_name.get(type_id)
+            if previous and map_name_to_id.get(previous) == type_id:
+                del map_name_to_id[previous]
+            for attr_id in map_attr_id_to_name.get(type_id, {}):
+                archived_attr_ids.pop(attr_id, None)
+            CustomMetadataCacheCommon._add_custom_metadata(
+                cm,
+                attr_defs_by_id,
+                map_id_to_name,
+                map_name_to_id,
+                map_attr_id_to_name,
+                map_attr_name_to_id,
+                archived_attr_ids,
+            )
+        return (
+            merge_models(cache_by_id, raw_by_id, CustomMetadataDef),
+            merge_models(attr_cache_by_id, attr_defs_by_id, AttributeDef),
+        )
+
+    @staticmethod
+    def _add_custom_metadata(
+        cm: Dict[str, Any],
+        attr_defs_by_id: Dict[str, Dict[str, Any]],
+        map_id_to_name: Dict[str, str],
+        map_name_to_id: Dict[str, str],
+        map_attr_id_to_name: Dict[str, Dict[str, str]],
+        map_attr_name_to_id: Dict[str, Dict[str, str]],
+        archived_attr_ids: Dict[str, str],
+    ) -> None:
+        """
+        Add a raw (JSON) custom metadata definition to the cache's lookup maps.
+
+        :param cm: raw custom metadata definition
+        :param attr_defs_by_id: raw attribute definitions, keyed by ID
+        :param map_id_to_name: ID to name mapping
+        :param map_name_to_id: name to ID mapping
+        :param map_attr_id_to_name: attribute ID to name mapping, per set
+        :param map_attr_name_to_id: attribute name to ID mapping, per set
+        :param archived_attr_ids: names of archived attributes, keyed by ID
+        :raises LogicError: if duplicate custom attributes are detected
+        """
+        type_id = cm["name"]
+        type_name = str(cm.get("displayName"))
+        map_id_to_name[type_id] = type_name
+        map_name_to_id[type_name] = type_id
+        map_attr_id_to_name[type_id] = {}
+        map_attr_name_to_id[type_id] = {}
+        for attr in cm.get("attributeDefs") or []:
+            attr_id = str(attr.get("name"))
+            attr_name = str(attr.get("displayName"))
+            map_attr_id_to_name[type_id][attr_id] = attr_name
+            attr_defs_by_id[attr_id] = attr
+            if CustomMetadataCacheCommon._is_archived(attr):
+                archived_attr_ids[attr_id] = attr_name
+            elif attr_name in map_attr_name_to_id[type_id]:
+                raise ErrorCode.DUPLICATE_CUSTOM_ATTRIBUTES.exception_with_parameters(
+                    attr_name, type_name
+                )
+            else:
+                map_attr_name_to_id[type_id][attr_name] = attr_id
+
+    @staticmethod
+    def _is_archived(attr: Dict[str, Any]) -> bool:
+        """
+        Determine whether a raw (JSON) attribute definition has been archived.
+
+        :param attr: raw attribute definition
+        :returns: True if the attribute has been archived
+        """
+        is_archived = (attr.get("options") or {}).get("isArchived")
+        return is_archived is True or str(is_archived).lower() == "true"
@@ -6,11 +6,13 @@ Shared logic for dq template config cache operations.
 
 from __future__ import annotations
 
-from typing import Dict, Optional, Tuple
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
 
 from pyatlan.model.assets import Asset
 from pyatlan.model.assets.core.data_quality_rule_template import DataQualityRuleTemplate
-from pyatlan.model.fluent_search import FluentSearch
+
+if TYPE_CHECKING:
+    from pyatlan.model.fluent_search import FluentSearch
 
 
 class DQTemplateConfigCacheCommon:
@@ -26,6 +28,9 @@ class DQTemplateConfigCacheCommon:
 
         :returns: FluentSearch configured for DQ rule templates
         """
+        # Imported here, as the fluent search (indirectly) imports the caches
+        from pyatlan.model.fluent_search import FluentSearch
+
         try:
             return (
                 FluentSearch()
@@ -6,30 +6,24 @@ Shared logic for enum cache operations.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Dict
+from typing import TYPE_CHECKING, Mapping
 
-from pyatlan.model.typedef import EnumDef
+from pyatlan.model.enums import AtlanTypeCategory
 
 if TYPE_CHECKING:
-    from pyatlan.model.typedef import TypeDefResponse
+    from pyatlan.cache.common.typedef_snapshot import TypeDefSnapshot
+    from pyatlan.model.typedef import EnumDef
 
 
 class EnumCacheCommon:
     """Shared logic for enum cache operations."""
 
     @staticmethod
-    def refresh_cache_data(response: TypeDefResponse) -> Dict[str, EnumDef]:
+    def refresh_cache_data(snapshot: TypeDefSnapshot) -> Mapping[str, EnumDef]:
         """
-        Process typedef response to extract enum cache data.
+        Process a snapshot of type definitions to extract enum cache data.
 
-        :param response: TypeDefResponse from API
-        :returns: dictionary mapping enum names to EnumDef objects
+        :param snapshot: snapshot of type definitions
+        :returns: mapping from enum names to (lazily-parsed) EnumDef objects
         """
-        cache_by_name: Dict[str, EnumDef] = {}
-
-        if response and response.enum_defs:
-            for enum in response.enum_defs:
-                type_name = enum.name
-                cache_by_name[type_name] = enum
-
-        return cache_by_name
+        return snapshot.models(AtlanTypeCategory.ENUM)
@@ -0,0 +1,51 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2025 Atlan Pte. Ltd.
+"""
+Shared logic for locking individual cache keys, rather than a whole cache.
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import Any, Callable, Generic, Hashable, Iterable, List, TypeVar
+from weakref import WeakValueDictionary
+
+L = TypeVar("L")
+
+
+class KeyedLocks(Generic[L]):
+    """
+    Hands out a lock per key, so that work on one key (such as looking it up
+    in Atlan) does not block work on any other key. Locks are created on demand,
+    and discarded once no caller holds (or waits for) them any longer.
+    """
+
+    def __init__(self, factory: Callable[[], L]):
+        """
+        :param factory: creates a new lock (for example, threading.Lock or asyncio.Lock)
+        """
+        self._factory = factory
+        self._locks: WeakValueDictionary[Hashable, Any] = WeakValueDictionary()
+        self._guard = threading.Lock()
+
+    def get(self, key: Hashable) -> L:
+        """
+        :param key: for which to retrieve the lock
+        :returns: the lock for the key, which is the same for all callers using it at the same time
+        """
+        with self._guard:
+            lock = self._locks.get(key)
+            if lock is None:
+                lock = self._factory()
+                self._locks[key] = lock
+            return lock
+
+    def get_all(self, keys: Iterable[Hashable]) -> List[L]:
+        """
+        Retrieve the locks for several keys, in an order that is the same for all callers,
+        so that callers acquiring them one after the other cannot deadlock each other.
+
+        :param keys: for which to retrieve the locks
+        :returns: the lock for each distinct key, to be acquired in the order given
+        """
+        return [self.get(key) for key in sorted(set(keys), key=repr)]
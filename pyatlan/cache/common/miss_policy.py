@@ -0,0 +1,92 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2025 Atlan Pte. Ltd.
+"""
+Shared logic for deciding when a cache miss should refresh a fully-loaded cache.
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Dict, Optional, Tuple
+
+
+class CacheMissPolicy:
+    """
+    Decides when a miss on a cache that is loaded in full (users, groups, roles) should
+    trigger a refresh of the whole cache, so that repeated misses do not each reload it:
+
+    - concurrent misses share a single refresh (single-flight): a miss only refreshes the
+      cache if no other refresh has completed since the miss was observed
+    - the cache is refreshed at most once every min_refresh_interval seconds
+    - keys that are still unknown after a refresh are remembered for negative_ttl seconds,
+      during which a lookup for them neither refreshes the cache nor makes any other request
+    """
+
+    def __init__(
+        self,
+        negative_ttl: float = 120.0,
+        min_refresh_interval: float = 5.0,
+        max_misses: int = 10_000,
+    ):
+        """
+        :param negative_ttl: number of seconds for which a key that could not be found is remembered as unknown
+        :param min_refresh_interval: minimum number of seconds between refreshes triggered by misses
+        :param max_misses: maximum number of unknown keys to remember (the oldest are forgotten first)
+        """
+        self.negative_ttl = negative_ttl
+        self.min_refresh_interval = min_refresh_interval
+        self.max_misses = max_misses
+        self.generation = 0
+        self.refreshed_at: Optional[float] = None
+        self._misses: Dict[Tuple[str, str], float] = {}
+
+    def is_known_miss(self, index: str, key: str) -> bool:
+        """
+        Determine whether a key was recently found not to exist.
+
+        :param index: name of the index (lookup map) in which the key was looked up
+        :param key: key that was looked up
+        :returns: True if the key is (still) remembered as unknown
+        """
+        expires_at = self._misses.get((index, key))
+        if expires_at is None:
+            return False
+        if expires_at > time.monotonic():
+            return True
+        self._misses.pop((index, key), None)
+        return False
+
+    def should_refresh(self, generation: int) -> bool:
+        """
+        Determine whether a miss should refresh the cache. To be called while holding
+        the cache's lock.
+
+        :param generation: refresh generation that was current when the miss was observed
+        :returns: True if the cache should be refreshed
+        """
+        if generation != self.generation:
+            # Another caller refreshed the cache since the miss was observed
+            return False
+        return (
+            self.refreshed_at is None
+            or time.monotonic() - self.refreshed_at >= self.min_refresh_interval
+        )
+
+    def refreshed(self) -> None:
+        """
+        Record that the cache has been refreshed, forgetting all unknown keys.
+        """
+        self.generation += 1
+        self.refreshed_at = time.monotonic()
+        self._misses.clear()
+
+    def record_miss(self, index: str, key: str) -> None:
+        """
+        Remember that a key could not be found, even after a refresh.
+
+        :param index: name of the index (lookup map) in which the key was looked up
+        :param key: key that was looked up
+        """
+        if len(self._misses) >= self.max_misses:
+            self._misses.pop(next(iter(self._misses)), None)
+        self._misses[(index, key)] = time.monotonic() + self.negative_ttl
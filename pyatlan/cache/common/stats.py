@@ -0,0 +1,181 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2025 Atlan Pte. Ltd.
+"""
+Shared logic for instrumenting caches, so that every cache reports the same statistics.
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Generator, List, Mapping, TypeVar, Union
+
+T = TypeVar("T")
+
+# Upper bounds (in seconds) of the buckets of the refresh duration histogram,
+# with a final bucket for any refreshes that took longer than the last bound
+REFRESH_DURATION_BUCKETS = (0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, 30.0, 60.0)
+
+# Caches of a client (their properties on the client) that report statistics
+CLIENT_CACHES = [
+    "atlan_tag_cache",
+    "custom_metadata_cache",
+    "enum_cache",
+    "user_cache",
+    "group_cache",
+    "role_cache",
+    "dq_template_config_cache",
+    "connection_cache",
+    "source_tag_cache",
+]
+
+
+class CacheStats:
+    """
+    Counters describing the use of a cache: lookups that were answered from the cache (hits)
+    or not (misses), and the number and duration of refreshes (requests to Atlan to load the
+    cache, or entries of it). Counters are cumulative from when the cache was created.
+    """
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.refreshes = 0
+        self.refresh_seconds_total = 0.0
+        self.refresh_seconds_max = 0.0
+        self.refresh_durations: List[int] = [0] * (len(REFRESH_DURATION_BUCKETS) + 1)
+
+    def record_lookup(self, found: bool) -> None:
+        """
+        Count a lookup against the cache.
+
+        :param found: whether the lookup was answered from the cache (hit) or not (miss)
+        """
+        if found:
+            self.hits += 1
+        else:
+            self.misses += 1
+
+    def observe(self, value: T) -> T:
+        """
+        Count a lookup against the cache, as a hit if it found a value or a miss otherwise.
+
+        :param value: found in the cache (if any)
+        :returns: the value, unchanged
+        """
+        self.record_lookup(found=bool(value))
+        return value
+
+    def record_refresh(self, elapsed: float) -> None:
+        """
+        Count a refresh of the cache.
+
+        :param elapsed: number of seconds the refresh took
+        """
+        self.refreshes += 1
+        self.refresh_seconds_total += elapsed
+        self.refresh_seconds_max = max(self.refresh_seconds_max, elapsed)
+        bucket = next(
+            (
+                index
+                for index, bound in enumerate(REFRESH_DURATION_BUCKETS)
+                if elapsed <= bound
+            ),
+            len(REFRESH_DURATION_BUCKETS),
+        )
+        self.refresh_durations[bucket] += 1
+
+    @contextmanager
+    def timed_refresh(self) -> Generator[None, None, None]:
+        """
+        Count a refresh of the cache, taking as long as the body of the with-statement
+        (whether or not it succeeds).
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record_refresh(time.perf_counter() - start)
+
+    def snapshot(self, entries: int, *contents: Any) -> Dict[str, Any]:
+        """
+        :param entries: number of entries currently cached
+        :param contents: data structures holding the cache's entries, whose size to estimate
+        :returns: the statistics of the cache, as a plain dict
+        """
+        bounds = [str(bound) for bound in REFRESH_DURATION_BUCKETS] + ["inf"]
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "refreshes": self.refreshes,
+            "refresh_seconds_total": self.refresh_seconds_total,
+            "refresh_seconds_max": self.refresh_seconds_max,
+            "refresh_duration_buckets": dict(zip(bounds, self.refresh_durations)),
+            "entries": entries,
+            "bytes": estimate_size(*contents),
+        }
+
+
+def flatten_stats(
+    stats: Mapping[str, Any], prefix: str = "pyatlan.cache"
+) -> Dict[str, Union[int, float]]:
+    """
+    Flatten (nested) statistics into a single level, for example to attach them as the
+    attributes of a log record or metric, such as: pyatlan.cache.user_cache.hits
+
+    :param stats: statistics to flatten, such as those of a client's caches keyed by cache name
+    :param prefix: with which to start the name of each statistic
+    :returns: the value of each statistic, keyed by its dotted name
+    """
+    flattened: Dict[str, Union[int, float]] = {}
+    for key, value in stats.items():
+        name = f"{prefix}.{key}" if prefix else str(key)
+        if isinstance(value, Mapping):
+            flattened.update(flatten_stats(value, name))
+        else:
+            flattened[name] = value
+    return flattened
+
+
+def estimate_size(*objects: Any) -> int:
+    """
+    Estimate the memory used by objects, including everything they (transitively) refer to.
+    Objects referred to more than once are only counted once.
+
+    :param objects: whose memory use to estimate
+    :returns: estimated number of bytes used by the objects
+    """
+    seen = set()
+    size = 0
+    pending = list(objects)
+    while pending:
+        obj = pending.pop()
+        if id(obj) in seen or isinstance(obj, type):
+            continue
+        seen.add(id(obj))
+        size += sys.getsizeof(obj, 0)
+        if isinstance(obj, (str, bytes, int, float, bool)) or obj is None:
+            continue
+        if isinstance(obj, dict):
+            pending.extend(obj.keys())
+            pending.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            pending.extend(obj)
+        else:
+            pending.extend(_referents(obj))
+    return size
+
+
+def _referents(obj: Any) -> List[Any]:
+    # Attributes of an object, whether kept in its __dict__ or in __slots__
+    referents: List[Any] = []
+    if (attributes := getattr(obj, "__dict__", None)) is not None:
+        referents.append(attributes)
+    for cls in type(obj).__mro__:
+        slots = getattr(cls, "__slots__", ())
+        for slot in (slots,) if isinstance(slots, str) else slots:
+            value = getattr(obj, slot, None)
+            if value is not None:
+                referents.append(value)
+    return referents
@@ -0,0 +1,378 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2025 Atlan Pte. Ltd.
+"""
+Snapshots of the type definitions used by typedef-backed caches, in memory and on disk.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+from threading import Lock
+from typing import Any, Dict, Iterator, List, Mapping, Tuple, Type, TypeVar
+
+from pyatlan.cache.common.backend import CacheBackend, acquire_refresh_lock
+from pyatlan.model.enums import AtlanTypeCategory
+from pyatlan.model.typedef import AtlanTagDef, CustomMetadataDef, EnumDef, StructDef
+
+LOGGER = logging.getLogger(__name__)
+
+# Key under which each category of type definitions is returned by the typedefs API
+CATEGORY_KEYS: Dict[AtlanTypeCategory, str] = {
+    AtlanTypeCategory.ENUM: "enumDefs",
+    AtlanTypeCategory.STRUCT: "structDefs",
+    AtlanTypeCategory.CLASSIFICATION: "classificationDefs",
+    AtlanTypeCategory.ENTITY: "entityDefs",
+    AtlanTypeCategory.RELATIONSHIP: "relationshipDefs",
+    AtlanTypeCategory.CUSTOM_METADATA: "businessMetadataDefs",
+}
+
+# Model of each category of type definitions held in a TypeDefSnapshot
+CATEGORY_MODELS: Dict[AtlanTypeCategory, type] = {
+    AtlanTypeCategory.ENUM: EnumDef,
+    AtlanTypeCategory.STRUCT: StructDef,
+    AtlanTypeCategory.CLASSIFICATION: AtlanTagDef,
+    AtlanTypeCategory.CUSTOM_METADATA: CustomMetadataDef,
+}
+
+M = TypeVar("M")
+
+
+class LazyModels(Mapping[str, M]):
+    """
+    Read-only mapping of raw (JSON) definitions by name, each of which is only
+    parsed into its model the first time it is accessed.
+    """
+
+    def __init__(self, raw_by_name: Dict[str, Dict[str, Any]], model: Type[M]):
+        self._raw_by_name = raw_by_name
+        self._model = model
+        self._parsed: Dict[str, M] = {}
+
+    def __getitem__(self, name: str) -> M:
+        if (parsed := self._parsed.get(name)) is None:
+            parsed = self._model.parse_obj(self._raw_by_name[name])  # type: ignore[attr-defined]
+            self._parsed[name] = parsed
+        return parsed
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._raw_by_name)
+
+    def __len__(self) -> int:
+        return len(self._raw_by_name)
+
+    def merged(self, raw_by_name: Dict[str, Dict[str, Any]]) -> LazyModels[M]:
+        """
+        :param raw_by_name: raw (JSON) definitions to add to, or replace in, the mapping
+        :returns: a new mapping holding the definitions of this mapping and the given ones,
+                  reusing the models already parsed for any definitions that were not replaced
+        """
+        merged: LazyModels[M] = LazyModels(
+            {**self._raw_by_name, **raw_by_name}, self._model
+        )
+        merged._parsed = {
+            name: parsed
+            for name, parsed in self._parsed.items()
+            if name not in raw_by_name
+        }
+        return merged
+
+
+def merge_models(
+    models: Mapping[str, M], raw_by_name: Dict[str, Dict[str, Any]], model: Type[M]
+) -> Mapping[str, M]:
+    """
+    Merge individually-retrieved type definitions into the models of a cache.
+
+    :param models: models of the cache, keyed by (internal) name
+    :param raw_by_name: raw (JSON) definitions to add to, or replace in, the models
+    :param model: of the type definitions
+    :returns: a new mapping holding the models and the given definitions
+    """
+    if isinstance(models, LazyModels):
+        return models.merged(raw_by_name)
+    parsed = {name: model.parse_obj(raw) for name, raw in raw_by_name.items()}  # type: ignore[attr-defined]
+    return {**models, **parsed}
+
+
+def to_raw(typedef: Any) -> Dict[str, Any]:
+    """
+    :param typedef: model of a type definition (for example, as retrieved by name)
+    :returns: the type definition as raw JSON, in the same form as the typedefs API returns it
+    """
+    return json.loads(typedef.json(by_alias=True, exclude_unset=True))
+
+
+class TypeDefSnapshot:
+    """
+    Type definitions behind the Atlan tag, custom metadata and enumeration caches,
+    retrieved in a single request and shared by all of them. Definitions are kept as
+    raw JSON, from which the caches build their lookups directly, and are only parsed
+    into models (once) when a full definition is needed.
+    """
+
+    CATEGORIES: List[AtlanTypeCategory] = [
+        AtlanTypeCategory.CLASSIFICATION,
+        AtlanTypeCategory.STRUCT,
+        AtlanTypeCategory.CUSTOM_METADATA,
+        AtlanTypeCategory.ENUM,
+    ]
+
+    def __init__(self, raw_json: Dict[str, Any]):
+        """
+        :param raw_json: typedefs response containing (at least) the snapshot's categories
+        """
+        self.raw_json = raw_json
+        self._models: Dict[AtlanTypeCategory, LazyModels] = {}
+        self._lock = Lock()
+
+    def defs(self, category: AtlanTypeCategory) -> List[Dict[str, Any]]:
+        """
+        Retrieve the raw (JSON) type definitions of a category.
+
+        :param category: category of type definitions to retrieve
+        :returns: list of the raw type definitions in that category
+        """
+        return self.raw_json.get(CATEGORY_KEYS[category]) or []
+
+    def models(self, category: AtlanTypeCategory) -> LazyModels:
+        """
+        Retrieve the type definitions of a category as models, keyed by their
+        (internal) name. The same (lazily-parsed) models are shared by every caller.
+
+        :param category: category of type definitions to retrieve
+        :returns: read-only mapping from name to the model of each type definition
+        """
+        with self._lock:
+            if category not in self._models:
+                self._models[category] = LazyModels(
+                    {typedef["name"]: typedef for typedef in self.defs(category)},
+                    CATEGORY_MODELS[category],
+                )
+            return self._models[category]
+
+
+class TypeDefSnapshotFile:
+    """
+    Opt-in local file holding the raw type definitions of a tenant, by category, so that new
+    processes can populate typedef-backed caches without requesting the type definitions again.
+    Each category is only used until it is older than the TTL, after which it is requested from
+    Atlan (and saved) again.
+    """
+
+    def __init__(self, base_url: str, directory: str, ttl: float):
+        """
+        :param base_url: URL of the tenant whose type definitions are kept in the snapshot
+        :param directory: directory in which to keep the snapshot file
+        :param ttl: number of seconds for which a saved category of type definitions is used
+        """
+        digest = hashlib.sha256(base_url.encode("utf-8")).hexdigest()[:16]
+        self.base_url = base_url
+        self.path = os.path.join(directory, f"typedefs-{digest}.json")
+        self.ttl = ttl
+        self.lock = Lock()
+
+    def load(
+        self, type_category: List[AtlanTypeCategory]
+    ) -> Tuple[Dict[str, Any], List[AtlanTypeCategory]]:
+        """
+        Load the type definitions of the requested categories that are in the snapshot and
+        not yet stale.
+
+        :param type_category: categories of type definitions to load
+        :returns: tuple of (type definitions keyed as in a typedefs response, categories that could not be loaded)
+        """
+        categories = self._read()
+        now = time.time()
+        raw_json: Dict[str, Any] = {}
+        missing: List[AtlanTypeCategory] = []
+        for category in type_category:
+            entry = categories.get(category.value)
+            if entry and now - entry.get("savedAt", 0) < self.ttl:
+                raw_json[CATEGORY_KEYS[category]] = entry.get("defs", [])
+            else:
+                missing.append(category)
+        return raw_json, missing
+
+    def save(
+        self, type_category: List[AtlanTypeCategory], raw_json: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Save the type definitions of the given categories from a typedefs response into the
+        snapshot, keeping any other categories already saved.
+
+        :param type_category: categories of type definitions that were requested
+        :param raw_json: typedefs response containing (at least) those categories
+        :returns: the saved type definitions, keyed as in a typedefs response
+        """
+        saved = {
+            CATEGORY_KEYS[category]: raw_json.get(CATEGORY_KEYS[category]) or []
+            for category in type_category
+        }
+        with self.lock:
+            categories = self._read()
+            now = time.time()
+            for category in type_category:
+                # Categories without any type definitions (for example, in a response
+                # to an expired token) are not saved, so they are always requested
+                if defs := saved[CATEGORY_KEYS[category]]:
+                    categories[category.value] = {"savedAt": now, "defs": defs}
+            self._write({"baseUrl": self.base_url, "categories": categories})
+        return saved
+
+    def release(self) -> None:
+        """
+        Nothing to release: the snapshot file is replaced atomically, without
+        preventing other processes from requesting type definitions at the same time.
+        """
+
+    def invalidate(self) -> None:
+        """
+        Remove the snapshot, so that type definitions are next requested from Atlan.
+        """
+        with self.lock:
+            try:
+                os.remove(self.path)
+            except FileNotFoundError:
+                pass
+            except OSError as err:
+                LOGGER.warning(
+                    "Unable to remove typedef snapshot %s: %s", self.path, err
+                )
+
+    def _read(self) -> Dict[str, Any]:
+        try:
+            with open(self.path, encoding="utf-8") as snapshot:
+                content = json.load(snapshot)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as err:
+            LOGGER.debug("Ignoring unreadable typedef snapshot %s: %s", self.path, err)
+            return {}
+        if not isinstance(content, dict) or content.get("baseUrl") != self.base_url:
+            return {}
+        return content.get("categories") or {}
+
+    def _write(self, content: Dict[str, Any]) -> None:
+        # Write to a temporary file and rename it over the snapshot, so that
+        # other processes never read a partially-written snapshot
+        directory = os.path.dirname(self.path)
+        tmp_path = None
+        try:
+            os.makedirs(directory, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                "w", encoding="utf-8", dir=directory, suffix=".tmp", delete=False
+            ) as tmp:
+                tmp_path = tmp.name
+                json.dump(content, tmp)
+            os.replace(tmp_path, self.path)
+        except OSError as err:
+            LOGGER.warning("Unable to save typedef snapshot %s: %s", self.path, err)
+            if tmp_path and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+
+class SharedTypeDefSnapshot:
+    """
+    Raw type definitions of a tenant, by category, kept in a cache backend shared with other
+    clients (and processes), so that they can populate typedef-backed caches without requesting
+    the type definitions again. Only one of them at a time requests any categories that are not
+    in the backend, while the others wait to load them once they are saved.
+    """
+
+    NAMESPACE = "typedefs"
+
+    def __init__(self, backend: CacheBackend):
+        """
+        :param backend: shared with the other clients (of the same tenant)
+        """
+        self.backend = backend
+        self._locked = False
+
+    def load(
+        self, type_category: List[AtlanTypeCategory]
+    ) -> Tuple[Dict[str, Any], List[AtlanTypeCategory]]:
+        """
+        Load the type definitions of the requested categories that are in the backend. If any
+        are not, waits until another client saves them, or until this client is the one that
+        should request them (in which case it must then save or release them).
+
+        :param type_category: categories of type definitions to load
+        :returns: tuple of (type definitions keyed as in a typedefs response, categories that could not be loaded)
+        """
+        raw_json, missing = self._load(type_category)
+        if missing:
+            self._locked = acquire_refresh_lock(
+                self.backend, self.NAMESPACE, lambda: not self._load(missing)[1]
+            )
+            # Another client may have saved them just before releasing the lock
+            loaded, missing = self._load(missing)
+            raw_json.update(loaded)
+            if not missing:
+                self.release()
+        return raw_json, missing
+
+    def save(
+        self, type_category: List[AtlanTypeCategory], raw_json: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Save the type definitions of the given categories from a typedefs response
+        into the backend, and release them for other clients to load.
+
+        :param type_category: categories of type definitions that were requested
+        :param raw_json: typedefs response containing (at least) those categories
+        :returns: the saved type definitions, keyed as in a typedefs response
+        """
+        saved = {
+            CATEGORY_KEYS[category]: raw_json.get(CATEGORY_KEYS[category]) or []
+            for category in type_category
+        }
+        try:
+            # Categories without any type definitions (for example, in a response
+            # to an expired token) are not saved, so they are always requested
+            self.backend.put_many(
+                self.NAMESPACE,
+                {
+                    category.value: defs
+                    for category in type_category
+                    if (defs := saved[CATEGORY_KEYS[category]])
+                },
+            )
+        finally:
+            self.release()
+        return saved
+
+    def release(self) -> None:
+        """
+        Let other clients request the categories this client was to request (if any),
+        for example because it was unable to request them.
+        """
+        if self._locked:
+            self._locked = False
+            self.backend.unlock(self.NAMESPACE)
+
+    def invalidate(self) -> None:
+        """
+        Remove the type definitions from the backend, so that they are next requested from Atlan.
+        """
+        self.backend.clear(self.NAMESPACE)
+
+    def _load(
+        self, type_category: List[AtlanTypeCategory]
+    ) -> Tuple[Dict[str, Any], List[AtlanTypeCategory]]:
+        saved = self.backend.get_many(
+            self.NAMESPACE, [category.value for category in type_category]
+        )
+        raw_json = {
+            CATEGORY_KEYS[category]: saved[category.value]
+            for category in type_category
+            if category.value in saved
+        }
+        missing = [
+            category for category in type_category if category.value not in saved
+        ]
+        return raw_json, missing
@@ -0,0 +1,76 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2025 Atlan Pte. Ltd.
+"""
+Shared logic for warming up (pre-loading) a client's caches.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Iterable, List, Optional
+
+from pyatlan.errors import ErrorCode
+
+# Caches that are loaded in full, and can therefore be warmed up ahead of use
+WARMABLE_CACHES = [
+    "atlan_tag_cache",
+    "custom_metadata_cache",
+    "enum_cache",
+    "user_cache",
+    "group_cache",
+    "role_cache",
+    "dq_template_config_cache",
+]
+
+
+@dataclass(frozen=True)
+class CacheWarmup:
+    """
+    Outcome of warming up one of a client's caches.
+    """
+
+    cache: str
+    """Name of the cache (its property on the client), for example: atlan_tag_cache"""
+    elapsed: float
+    """Number of seconds spent warming up the cache (until the deadline, if it was not warmed up in time)"""
+    error: Optional[BaseException] = None
+    """Error that prevented the cache from being warmed up, if any (TimeoutError if it missed the deadline)"""
+
+    @property
+    def succeeded(self) -> bool:
+        """
+        :returns: whether the cache was warmed up
+        """
+        return self.error is None
+
+
+def validate_cache_names(caches: Optional[Iterable[str]]) -> List[str]:
+    """
+    Validate the names of the caches to warm up.
+
+    :param caches: names of the caches to warm up, or None for all of them
+    :returns: the (distinct) names of the caches to warm up
+    :raises InvalidRequestError: if any of the names is not that of a cache that can be warmed up
+    """
+    if caches is None:
+        return list(WARMABLE_CACHES)
+    names = list(dict.fromkeys(caches))
+    unknown = [name for name in names if name not in WARMABLE_CACHES]
+    if unknown:
+        raise ErrorCode.UNKNOWN_CACHE.exception_with_parameters(
+            ", ".join(unknown), ", ".join(WARMABLE_CACHES)
+        )
+    return names
+
+
+def timed_out(cache: str, elapsed: float) -> CacheWarmup:
+    """
+    :param cache: name of the cache that was not warmed up in time
+    :param elapsed: number of seconds until the deadline
+    :returns: the outcome of a cache that was not warmed up before the deadline
+    """
+    return CacheWarmup(
+        cache=cache,
+        elapsed=elapsed,
+        error=TimeoutError(f"{cache} was not warmed up within {elapsed:.2f}s"),
+    )
@@ -3,9 +3,11 @@
 from __future__ import annotations
 
 from threading import Lock
-from typing import TYPE_CHECKING, Dict, List, Optional, Set
+from typing import TYPE_CHECKING, Any, Dict, List, Mapping, Optional, Set
 
-from pyatlan.errors import ErrorCode
+from pyatlan.cache.common import CustomMetadataCacheCommon
+from pyatlan.cache.common.stats import CacheStats
+from pyatlan.errors import ErrorCode, NotFoundError
 from pyatlan.model.enums import AtlanTypeCategory
 from pyatlan.model.typedef import AttributeDef, CustomMetadataDef
 
@@ -23,14 +25,16 @@ class CustomMetadataCache:
 
     def __init__(self, client: AtlanClient):
         self.client: AtlanClient = client
-        self.cache_by_id: Dict[str, CustomMetadataDef] = {}
-        self.attr_cache_by_id: Dict[str, AttributeDef] = {}
+        self.cache_by_id: Mapping[str, CustomMetadataDef] = {}
+        self.attr_cache_by_id: Mapping[str, AttributeDef] = {}
         self.map_id_to_name: Dict[str, str] = {}
         self.map_name_to_id: Dict[str, str] = {}
         self.map_attr_id_to_name: Dict[str, Dict[str, str]] = {}
         self.map_attr_name_to_id: Dict[str, Dict[str, str]] = {}
         self.archived_attr_ids: Dict[str, str] = {}
         self.types_by_asset: Dict[str, Set[type]] = {}
+        self.loaded: bool = False
+        self.stats: CacheStats = CacheStats()
         self.lock: Lock = Lock()
 
     def refresh_cache(self) -> None:
@@ -39,7 +43,24 @@ class CustomMetadataCache:
         structures from Atlan.
         :raises LogicError: if duplicate custom attributes are detected
         """
-        self._refresh_cache()
+        self._refresh_cache(force=True)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Retrieve statistics describing the use of the cache.
+
+        :returns: the statistics of the cache (as in CacheStats.snapshot)
+        """
+        return self.stats.snapshot(
+            len(self.cache_by_id),
+            self.cache_by_id,
+            self.attr_cache_by_id,
+            self.map_id_to_name,
+            self.map_name_to_id,
+            self.map_attr_id_to_name,
+            self.map_attr_name_to_id,
+            self.archived_attr_ids,
+        )
 
     def get_id_for_name(self, name: str) -> str:
         """
@@ -160,51 +181,73 @@ class CustomMetadataCache:
         """
         return self._get_attribute_def(attr_id=attr_id)
 
-    def _refresh_cache(self) -> None:
+    def _refresh_cache(self, force: bool = False) -> None:
         """
         Refreshes the cache of custom metadata structures by requesting the full set of custom metadata
         structures from Atlan.
+        :param force: if True, request the type definitions from Atlan again even if this
+                      cache has not yet been loaded
         :raises LogicError: if duplicate custom attributes are detected
         """
+        with self.lock, self.stats.timed_refresh():
+            # Build from the typedef snapshot shared by all typedef-backed caches
+            # (requesting it again if forced, or if this cache has already been loaded)
+            snapshot = self.client.typedef._get_snapshot(refresh=force or self.loaded)
+
+            if not snapshot.defs(AtlanTypeCategory.STRUCT):
+                raise ErrorCode.EXPIRED_API_TOKEN.exception_with_parameters()
+
+            # Process snapshot using shared logic
+            (
+                self.cache_by_id,
+                self.attr_cache_by_id,
+                self.map_id_to_name,
+                self.map_name_to_id,
+                self.map_attr_id_to_name,
+                self.map_attr_name_to_id,
+                self.archived_attr_ids,
+                self.types_by_asset,
+            ) = CustomMetadataCacheCommon.refresh_cache_data(snapshot)
+            self.loaded = True
+
+    def _refresh_set(self, set_id: str, attr_id: Optional[str] = None) -> None:
+        """
+        Retrieve only the given custom metadata set, and add it to (or replace it in) the cache,
+        rather than refreshing the full set of custom metadata structures (for example, when an
+        asset refers to a custom metadata set created since the cache was loaded).
+
+        :param set_id: Atlan-internal ID string of the custom metadata set
+        :param attr_id: Atlan-internal ID string of an attribute of the set that is not cached, if any
+        """
         with self.lock:
-            response = self.client.typedef.get(
-                type_category=[
-                    AtlanTypeCategory.CUSTOM_METADATA,
-                    AtlanTypeCategory.STRUCT,
-                ]
+            # Another caller may have retrieved the set while waiting for the lock
+            cached = (
+                self.map_attr_id_to_name.get(set_id, {})
+                if attr_id
+                else self.map_id_to_name
             )
-            if not response or not response.struct_defs:
-                raise ErrorCode.EXPIRED_API_TOKEN.exception_with_parameters()
-            if response is not None:
-                self.map_id_to_name = {}
-                self.map_name_to_id = {}
-                self.map_attr_id_to_name = {}
-                self.map_attr_name_to_id = {}
-                self.archived_attr_ids = {}
-                self.cache_by_id = {}
-                self.attr_cache_by_id = {}
-                for cm in response.custom_metadata_defs:
-                    type_id = cm.name
-                    type_name = cm.display_name
-                    self.cache_by_id[type_id] = cm
-                    self.map_id_to_name[type_id] = type_name
-                    self.map_name_to_id[type_name] = type_id
-                    self.map_attr_id_to_name[type_id] = {}
-                    self.map_attr_name_to_id[type_id] = {}
-                    if cm.attribute_defs:
-                        for attr in cm.attribute_defs:
-                            attr_id = str(attr.name)
-                            attr_name = str(attr.display_name)
-                            self.map_attr_id_to_name[type_id][attr_id] = attr_name
-                            self.attr_cache_by_id[attr_id] = attr
-                            if attr.options and attr.options.is_archived:
-                                self.archived_attr_ids[attr_id] = attr_name
-                            elif attr_name in self.map_attr_name_to_id[type_id]:
-                                raise ErrorCode.DUPLICATE_CUSTOM_ATTRIBUTES.exception_with_parameters(
-                                    attr_name, type_name
-                                )
-                            else:
-                                self.map_attr_name_to_id[type_id][attr_name] = attr_id
+            if (attr_id or set_id) in cached:
+                return
+            with self.stats.timed_refresh():
+                try:
+                    cm = self.client.typedef.get_by_name(set_id)
+                except NotFoundError:
+                    return
+                if not isinstance(cm, CustomMetadataDef):
+                    return
+                (
+                    self.cache_by_id,
+                    self.attr_cache_by_id,
+                ) = CustomMetadataCacheCommon.merge_custom_metadata(
+                    [cm],
+                    self.cache_by_id,
+                    self.attr_cache_by_id,
+                    self.map_id_to_name,
+                    self.map_name_to_id,
+                    self.map_attr_id_to_name,
+                    self.map_attr_name_to_id,
+                    self.archived_attr_ids,
+                )
 
     def _get_id_for_name(self, name: str) -> str:
         """
@@ -217,7 +260,9 @@ class CustomMetadataCache:
         """
         if name is None or not name.strip():
             raise ErrorCode.MISSING_CM_NAME.exception_with_parameters()
-        if cm_id := self.map_name_to_id.get(name):
+        if not self.cache_by_id:
+            self._refresh_cache()
+        if cm_id := self.stats.observe(self.map_name_to_id.get(name)):
             return cm_id
         # If not found, refresh the cache and look again (could be stale)
         self._refresh_cache()
@@ -236,10 +281,12 @@ class CustomMetadataCache:
         """
         if idstr is None or not idstr.strip():
             raise ErrorCode.MISSING_CM_ID.exception_with_parameters()
-        if cm_name := self.map_id_to_name.get(idstr):
+        if not self.cache_by_id:
+            self._refresh_cache()
+        if cm_name := self.stats.observe(self.map_id_to_name.get(idstr)):
             return cm_name
-        # If not found, refresh the cache and look again (could be stale)
-        self._refresh_cache()
+        # If not found, retrieve (only) that set and look again (could be new)
+        self._refresh_set(idstr)
         if cm_name := self.map_id_to_name.get(idstr):
             return cm_name
         raise ErrorCode.CM_NOT_FOUND_BY_ID.exception_with_parameters(idstr)
@@ -294,8 +341,10 @@ class CustomMetadataCache:
         if sub_map := self.map_attr_name_to_id.get(set_id):
             if attr_id := sub_map.get(attr_name):
                 # If found, return straight away
+                self.stats.record_lookup(found=True)
                 return attr_id
         # Otherwise, refresh the cache and look again (could be stale)
+        self.stats.record_lookup(found=False)
         self._refresh_cache()
         if sub_map := self.map_attr_name_to_id.get(set_id):
             if attr_id := sub_map.get(attr_name):
@@ -316,13 +365,16 @@ class CustomMetadataCache:
         :returns: human-readable name of the attribute
         :raises NotFoundError: if the custom metadata attribute cannot be found
         """
-        if sub_map := self.map_attr_id_to_name.get(set_id):
-            if attr_name := sub_map.get(attr_id):
-                return attr_name
+        if not self.cache_by_id:
             self._refresh_cache()
-            if sub_map := self.map_attr_id_to_name.get(set_id):
-                if attr_name := sub_map.get(attr_id):
-                    return attr_name
+        if attr_name := self.stats.observe(
+            self.map_attr_id_to_name.get(set_id, {}).get(attr_id)
+        ):
+            return attr_name
+        # If not found, retrieve (only) that set and look again (could be new, or stale)
+        self._refresh_set(set_id, attr_id)
+        if attr_name := self.map_attr_id_to_name.get(set_id, {}).get(attr_id):
+            return attr_name
         raise ErrorCode.CM_ATTR_NOT_FOUND_BY_ID.exception_with_parameters(
             attr_id, set_id
         )
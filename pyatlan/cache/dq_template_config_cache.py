@@ -3,9 +3,10 @@
 from __future__ import annotations
 
 import threading
-from typing import TYPE_CHECKING, Dict, Optional
+from typing import TYPE_CHECKING, Any, Dict, Optional
 
 from pyatlan.cache.common.dq_template_config_cache import DQTemplateConfigCacheCommon
+from pyatlan.cache.common.stats import CacheStats
 
 if TYPE_CHECKING:
     from pyatlan.client.atlan import AtlanClient
@@ -21,6 +22,7 @@ class DQTemplateConfigCache:
         self._cache: Dict[str, Dict] = {}
         self._lock: threading.Lock = threading.Lock()
         self._initialized: bool = False
+        self.stats: CacheStats = CacheStats()
 
     def refresh_cache(self) -> None:
         """
@@ -28,6 +30,14 @@ class DQTemplateConfigCache:
         """
         self._refresh_cache()
 
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Retrieve statistics describing the use of the cache.
+
+        :returns: the statistics of the cache (as in CacheStats.snapshot)
+        """
+        return self.stats.snapshot(len(self._cache), self._cache)
+
     def get_template_config(self, rule_type: str) -> Optional[Dict]:
         """
         Get template configuration for a specific rule type.
@@ -38,7 +48,7 @@ class DQTemplateConfigCache:
         if not self._initialized:
             self._refresh_cache()
 
-        return self._cache.get(rule_type)
+        return self.stats.observe(self._cache.get(rule_type))
 
     def _refresh_cache(self) -> None:
         """Refresh the cache by fetching all template configurations."""
@@ -46,23 +56,26 @@ class DQTemplateConfigCache:
             if self._initialized:
                 return
 
-            try:
-                search_request = DQTemplateConfigCacheCommon.prepare_search_request()
-                request = search_request.to_request()
-                results = self.client.asset.search(request)
+            with self.stats.timed_refresh():
+                try:
+                    search_request = (
+                        DQTemplateConfigCacheCommon.prepare_search_request()
+                    )
+                    request = search_request.to_request()
+                    results = self.client.asset.search(request)
 
-                success, error = DQTemplateConfigCacheCommon.process_search_results(
-                    results, self._cache
-                )
+                    success, error = DQTemplateConfigCacheCommon.process_search_results(
+                        results, self._cache
+                    )
 
-                if success:
-                    self._initialized = True
-                else:
+                    if success:
+                        self._initialized = True
+                    else:
+                        # If cache refresh fails, mark as initialized to prevent infinite retries
+                        self._initialized = True
+                        if error:
+                            raise error
+                except Exception:
                     # If cache refresh fails, mark as initialized to prevent infinite retries
                     self._initialized = True
-                    if error:
-                        raise error
-            except Exception:
-                # If cache refresh fails, mark as initialized to prevent infinite retries
-                self._initialized = True
-                raise
+                    raise
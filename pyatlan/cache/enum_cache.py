@@ -3,9 +3,10 @@
 from __future__ import annotations
 
 from threading import Lock
-from typing import TYPE_CHECKING, Dict, Optional
+from typing import TYPE_CHECKING, Any, Dict, Mapping, Optional
 
 from pyatlan.cache.common import EnumCacheCommon
+from pyatlan.cache.common.stats import CacheStats
 from pyatlan.errors import ErrorCode
 from pyatlan.model.enums import AtlanTypeCategory
 from pyatlan.model.typedef import EnumDef
@@ -23,7 +24,9 @@ class EnumCache:
 
     def __init__(self, client: AtlanClient):
         self.client: AtlanClient = client
-        self.cache_by_name: Dict[str, EnumDef] = {}
+        self.cache_by_name: Mapping[str, EnumDef] = {}
+        self.loaded: bool = False
+        self.stats: CacheStats = CacheStats()
         self.lock: Lock = Lock()
 
     def get_by_name(self, name: str) -> EnumDef:
@@ -38,18 +41,37 @@ class EnumCache:
             raise ErrorCode.ENUM_NOT_FOUND.exception_with_parameters(name)
         return enum
 
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Retrieve statistics describing the use of the cache.
+
+        :returns: the statistics of the cache (as in CacheStats.snapshot)
+        """
+        return self.stats.snapshot(len(self.cache_by_name), self.cache_by_name)
+
     def refresh_cache(self) -> None:
         """
         Refreshes the cache of enumerations by requesting the full set of enumerations from Atlan.
         """
-        with self.lock:
-            # Make API call directly
-            response = self.client.typedef.get(type_category=AtlanTypeCategory.ENUM)
-            if not response or not response.enum_defs:
+        self._refresh_cache(force=True)
+
+    def _refresh_cache(self, force: bool = False) -> None:
+        """
+        Refreshes the cache of enumerations by requesting the full set of enumerations from Atlan.
+
+        :param force: if True, request the type definitions from Atlan again even if this
+                      cache has not yet been loaded
+        """
+        with self.lock, self.stats.timed_refresh():
+            # Build from the typedef snapshot shared by all typedef-backed caches
+            # (requesting it again if forced, or if this cache has already been loaded)
+            snapshot = self.client.typedef._get_snapshot(refresh=force or self.loaded)
+            if not snapshot.defs(AtlanTypeCategory.ENUM):
                 raise ErrorCode.EXPIRED_API_TOKEN.exception_with_parameters()
 
-            # Process response using shared logic
-            self.cache_by_name = EnumCacheCommon.refresh_cache_data(response)
+            # Process snapshot using shared logic
+            self.cache_by_name = EnumCacheCommon.refresh_cache_data(snapshot)
+            self.loaded = True
 
     def _get_by_name(self, name: str) -> Optional[EnumDef]:
         """
@@ -59,10 +81,10 @@ class EnumCache:
         :returns: enumeration definition or None if not found
         """
         if not self.cache_by_name:
-            self.refresh_cache()
+            self._refresh_cache()
 
-        enum_def = self.cache_by_name.get(name)
+        enum_def = self.stats.observe(self.cache_by_name.get(name))
         if not enum_def:
-            self.refresh_cache()
+            self._refresh_cache()
             enum_def = self.cache_by_name.get(name)
         return enum_def
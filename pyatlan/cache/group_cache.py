@@ -2,10 +2,13 @@
 # Copyright 2025 Atlan Pte. Ltd.
 from __future__ import annotations
 
+import time
 from threading import Lock
-from typing import TYPE_CHECKING, Dict, Iterable, Optional
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional
 
-from pyatlan.cache.common import GroupCacheCommon
+from pyatlan.cache.common import CacheMissPolicy, GroupCacheCommon
+from pyatlan.cache.common.backend import CacheBackend, refresh_snapshot
+from pyatlan.cache.common.stats import CacheStats
 
 if TYPE_CHECKING:
     from pyatlan.client.atlan import AtlanClient
@@ -20,12 +23,22 @@ class GroupCache:
 
     caches: Dict[int, "GroupCache"] = {}
 
-    def __init__(self, client: AtlanClient):
+    BACKEND_NAMESPACE = "group_cache"
+
+    def __init__(self, client: AtlanClient, backend: Optional[CacheBackend] = None):
+        """
+        :param client: connectivity to an Atlan tenant
+        :param backend: through which to share the groups with other clients, or None to keep them in this cache only
+        """
         self.client: AtlanClient = client
+        self.backend: Optional[CacheBackend] = backend
+        self.snapshot_saved_at: float = 0.0
         self.map_id_to_name: Dict[str, str] = {}
         self.map_name_to_id: Dict[str, str] = {}
         self.map_alias_to_id: Dict[str, str] = {}
         self.lock: Lock = Lock()
+        self.miss_policy: CacheMissPolicy = CacheMissPolicy()
+        self.stats: CacheStats = CacheStats()
 
     def get_id_for_name(self, name: str) -> Optional[str]:
         """
@@ -62,14 +75,77 @@ class GroupCache:
         """
         return self._validate_aliases(aliases)
 
-    def _refresh_cache(self) -> None:
+    def refresh_cache(self) -> None:
+        """
+        Refreshes the cache of groups by requesting the full set of groups from Atlan.
+        """
+        self._refresh_cache()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Retrieve statistics describing the use of the cache.
+
+        :returns: the statistics of the cache (as in CacheStats.snapshot)
+        """
+        return self.stats.snapshot(
+            len(self.map_id_to_name),
+            self.map_id_to_name,
+            self.map_name_to_id,
+            self.map_alias_to_id,
+        )
+
+    def _refresh_cache(self, generation: Optional[int] = None) -> None:
+        """
+        Refreshes the cache of groups by requesting the full set of groups from Atlan.
+
+        :param generation: refresh generation observed on a cache miss, when refreshing due to one
+                           (in which case the miss policy decides whether to actually refresh)
+        """
         with self.lock:
-            groups = [group for group in self.client.group.get_all()]
-            if not groups:
+            if generation is not None and not self.miss_policy.should_refresh(
+                generation
+            ):
                 return
-            (self.map_id_to_name, self.map_name_to_id, self.map_alias_to_id) = (
-                GroupCacheCommon.refresh_cache_data(groups)
-            )
+            with self.stats.timed_refresh():
+                # An explicit refresh only uses groups that another client saved after it was requested
+                newer_than = (
+                    time.time() if generation is None else self.snapshot_saved_at
+                )
+                snapshot = refresh_snapshot(
+                    self.backend, self.BACKEND_NAMESPACE, self._fetch_maps, newer_than
+                )
+                if not snapshot:
+                    return
+                maps, self.snapshot_saved_at = snapshot
+                (self.map_id_to_name, self.map_name_to_id, self.map_alias_to_id) = maps
+                self.miss_policy.refreshed()
+
+    def _fetch_maps(self) -> Optional[List[Dict[str, str]]]:
+        """
+        Request the full set of groups from Atlan.
+
+        :returns: lookup maps of the groups (as in GroupCacheCommon.refresh_cache_data), or None if there are no groups
+        """
+        groups = [group for group in self.client.group.get_all()]
+        return list(GroupCacheCommon.refresh_cache_data(groups)) if groups else None
+
+    def _refresh_on_miss(self, index: str, key: str) -> Optional[str]:
+        """
+        Look up a key that was not found in one of the cache's indexes, after refreshing the
+        cache if the miss policy calls for it. Keys that are still not found are remembered
+        (for a while) as unknown, so that looking them up again does not refresh the cache.
+
+        :param index: name of the index (lookup map) in which the key was not found
+        :param key: key that was not found
+        :returns: value of the key in the index, or None if it is (still) unknown
+        """
+        if self.miss_policy.is_known_miss(index, key):
+            return None
+        self._refresh_cache(self.miss_policy.generation)
+        if value := getattr(self, index).get(key):
+            return value
+        self.miss_policy.record_miss(index, key)
+        return None
 
     def _get_id_for_name(self, name: str) -> Optional[str]:
         """
@@ -78,10 +154,9 @@ class GroupCache:
         :param name: internal name of the group
         :returns: unique identifier (GUID) of the group
         """
-        if group_id := self.map_name_to_id.get(name):
+        if group_id := self.stats.observe(self.map_name_to_id.get(name)):
             return group_id
-        self._refresh_cache()
-        return self.map_name_to_id.get(name)
+        return self._refresh_on_miss("map_name_to_id", name)
 
     def _get_id_for_alias(self, alias: str) -> Optional[str]:
         """
@@ -90,10 +165,9 @@ class GroupCache:
         :param alias: name of the group as it appears in the UI
         :returns: unique identifier (GUID) of the group
         """
-        if group_id := self.map_alias_to_id.get(alias):
+        if group_id := self.stats.observe(self.map_alias_to_id.get(alias)):
             return group_id
-        self._refresh_cache()
-        return self.map_alias_to_id.get(alias)
+        return self._refresh_on_miss("map_alias_to_id", alias)
 
     def _get_name_for_id(self, idstr: str) -> Optional[str]:
         """
@@ -102,10 +176,9 @@ class GroupCache:
         :param idstr: unique identifier (GUID) of the group
         :returns: internal name of the group
         """
-        if group_name := self.map_id_to_name.get(idstr):
+        if group_name := self.stats.observe(self.map_id_to_name.get(idstr)):
             return group_name
-        self._refresh_cache()
-        return self.map_id_to_name.get(idstr)
+        return self._refresh_on_miss("map_id_to_name", idstr)
 
     def _validate_aliases(self, aliases: Iterable[str]):
         """
@@ -3,9 +3,10 @@
 from __future__ import annotations
 
 from threading import Lock
-from typing import TYPE_CHECKING, Dict, Iterable, Optional
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Optional
 
-from pyatlan.cache.common import RoleCacheCommon
+from pyatlan.cache.common import CacheMissPolicy, RoleCacheCommon
+from pyatlan.cache.common.stats import CacheStats
 from pyatlan.client.constants import GET_WHOAMI_USER
 from pyatlan.model.role import AtlanRole
 
@@ -26,6 +27,8 @@ class RoleCache:
         self.map_id_to_name: Dict[str, str] = {}
         self.map_name_to_id: Dict[str, str] = {}
         self.lock: Lock = Lock()
+        self.miss_policy: CacheMissPolicy = CacheMissPolicy()
+        self.stats: CacheStats = CacheStats()
         self._is_api_token_user: Optional[bool] = None
 
     def get_id_for_name(self, name: str) -> Optional[str]:
@@ -54,18 +57,67 @@ class RoleCache:
         """
         return self._validate_idstrs(idstrs=idstrs)
 
-    def _refresh_cache(self) -> None:
+    def refresh_cache(self) -> None:
+        """
+        Refreshes the cache of roles by requesting the full set of roles from Atlan.
+        """
+        self._refresh_cache()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Retrieve statistics describing the use of the cache.
+
+        :returns: the statistics of the cache (as in CacheStats.snapshot)
+        """
+        return self.stats.snapshot(
+            len(self.cache_by_id),
+            self.cache_by_id,
+            self.map_id_to_name,
+            self.map_name_to_id,
+        )
+
+    def _refresh_cache(self, generation: Optional[int] = None) -> None:
+        """
+        Refreshes the cache of roles by requesting the full set of roles from Atlan.
+
+        :param generation: refresh generation observed on a cache miss, when refreshing due to one
+                           (in which case the miss policy decides whether to actually refresh)
+        """
         with self.lock:
-            response = self.client.role.get(
-                limit=100, post_filter='{"name":{"$ilike":"$%"}}'
-            )
-            if not response:
+            if generation is not None and not self.miss_policy.should_refresh(
+                generation
+            ):
                 return
+            with self.stats.timed_refresh():
+                response = self.client.role.get(
+                    limit=100, post_filter='{"name":{"$ilike":"$%"}}'
+                )
+                if not response:
+                    return
+
+                # Process response using shared logic
+                (self.cache_by_id, self.map_id_to_name, self.map_name_to_id) = (
+                    RoleCacheCommon.refresh_cache_data(response.records)
+                )
+                self.miss_policy.refreshed()
+
+    def _refresh_on_miss(self, index: str, key: str) -> Optional[str]:
+        """
+        Look up a key that was not found in one of the cache's indexes, after refreshing the
+        cache if the miss policy calls for it. Keys that are still not found are remembered
+        (for a while) as unknown, so that looking them up again does not refresh the cache.
 
-            # Process response using shared logic
-            (self.cache_by_id, self.map_id_to_name, self.map_name_to_id) = (
-                RoleCacheCommon.refresh_cache_data(response.records)
-            )
+        :param index: name of the index (lookup map) in which the key was not found
+        :param key: key that was not found
+        :returns: value of the key in the index, or None if it is (still) unknown
+        """
+        if self.miss_policy.is_known_miss(index, key):
+            return None
+        self._refresh_cache(self.miss_policy.generation)
+        if value := getattr(self, index).get(key):
+            return value
+        self.miss_policy.record_miss(index, key)
+        return None
 
     def _get_id_for_name(self, name: str) -> Optional[str]:
         """
@@ -74,10 +126,9 @@ class RoleCache:
         :param name: human-readable name of the role
         :returns: unique identifier (GUID) of the role
         """
-        if role_id := self.map_name_to_id.get(name):
+        if role_id := self.stats.observe(self.map_name_to_id.get(name)):
             return role_id
-        self._refresh_cache()
-        return self.map_name_to_id.get(name)
+        return self._refresh_on_miss("map_name_to_id", name)
 
     def _get_name_for_id(self, idstr: str) -> Optional[str]:
         """
@@ -86,10 +137,9 @@ class RoleCache:
         :param idstr: unique identifier (GUID) of the role
         :returns: human-readable name of the role
         """
-        if role_name := self.map_id_to_name.get(idstr):
+        if role_name := self.stats.observe(self.map_id_to_name.get(idstr)):
             return role_name
-        self._refresh_cache()
-        return self.map_id_to_name.get(idstr)
+        return self._refresh_on_miss("map_id_to_name", idstr)
 
     def _validate_idstrs(self, idstrs: Iterable[str]):
         """
@@ -4,14 +4,16 @@ from __future__ import annotations
 
 import logging
 import threading
-from typing import TYPE_CHECKING, Union
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Union
 
 from pyatlan.cache.abstract_asset_cache import AbstractAssetCache, AbstractAssetName
+from pyatlan.cache.common.asset_cache_store import DEFAULT_MAX_ENTRIES
+from pyatlan.cache.common.backend import CacheBackend
 from pyatlan.cache.connection_cache import ConnectionName
 from pyatlan.errors import AtlanError
 from pyatlan.model.assets import Asset, Tag
 from pyatlan.model.fluent_search import FluentSearch
-from pyatlan.model.search import Term
+from pyatlan.model.search import Query, Term
 
 if TYPE_CHECKING:
     from pyatlan.client.atlan import AtlanClient
@@ -35,9 +37,16 @@ class SourceTagCache(AbstractAssetCache):
 
     _SEARCH_FIELDS = [Asset.NAME]
     SEARCH_ATTRIBUTES = [field.atlan_field_name for field in _SEARCH_FIELDS]
+    BACKEND_NAMESPACE = "source_tag_cache"
 
-    def __init__(self, client: AtlanClient):
-        super().__init__(client)
+    def __init__(
+        self,
+        client: AtlanClient,
+        max_entries: Optional[int] = DEFAULT_MAX_ENTRIES,
+        ttl: Optional[float] = None,
+        backend: Optional[CacheBackend] = None,
+    ):
+        super().__init__(client, max_entries=max_entries, ttl=ttl, backend=backend)
 
     def get_by_guid(self, guid: str, allow_refresh: bool = True) -> Tag:
         """
@@ -87,41 +96,50 @@ class SourceTagCache(AbstractAssetCache):
         """
         return self._get_by_name(name=name, allow_refresh=allow_refresh)
 
+    def get_by_guids(
+        self, guids: Iterable[str], allow_refresh: bool = True
+    ) -> Dict[str, Tag]:
+        """
+        Retrieve several source tags from the cache by their UUIDs.
+        Any source tags that are not yet cached are looked up in batches, rather than one-by-one.
+
+        :param guids: UUIDs of the source tags in Atlan
+        :param allow_refresh: whether to allow a refresh of the cache (`True`) or not (`False`)
+        :returns: source tags that were found, keyed by UUID (any not found are omitted)
+        :raises AtlanError: on any API communication problem if the cache needs to be refreshed
+        """
+        return self._get_by_guids(guids=guids, allow_refresh=allow_refresh)  # type: ignore[return-value]
+
+    def get_by_qualified_names(
+        self, qualified_names: Iterable[str], allow_refresh: bool = True
+    ) -> Dict[str, Tag]:
+        """
+        Retrieve several source tags from the cache by their unique Atlan-internal names.
+        Any source tags that are not yet cached are looked up in batches, rather than one-by-one.
+
+        :param qualified_names: unique Atlan-internal names of the source tags
+            for eg: [default/snowflake/1234567890/DB/SCHEMA/TAG_NAME]
+        :param allow_refresh: whether to allow a refresh of the cache (`True`) or not (`False`)
+        :returns: source tags that were found, keyed by qualified name (any not found are omitted)
+        :raises AtlanError: on any API communication problem if the cache needs to be refreshed
+        """
+        return self._get_by_qualified_names(  # type: ignore[return-value]
+            qualified_names=qualified_names, allow_refresh=allow_refresh
+        )
+
     def lookup_by_guid(self, guid: str) -> None:
-        if not guid:
-            return
-        with self.lock:
-            response = (
-                FluentSearch(_includes_on_results=self.SEARCH_ATTRIBUTES)
-                .where(Term.with_state("ACTIVE"))
-                .where(Asset.SUPER_TYPE_NAMES.eq(Tag.__name__))
-                .where(Asset.GUID.eq(guid))
-                .execute(self.client)
-            )
-            candidate = (response.current_page() and response.current_page()[0]) or None
-            # NOTE: Checking if the first result is an "Asset" since in pyatlan,
-            # "DbtTag" extends "Dbt" (unlike other tags like "SnowflakeTag" that extend the "Tag" model),
-            # preventing Dbt tags from being excluded from caching:
-            if candidate and isinstance(candidate, Asset):
-                self.cache(candidate)
+        self.lookup_by_guids([guid])
 
     def lookup_by_qualified_name(self, source_tag_qn: str) -> None:
-        if not source_tag_qn:
-            return
-        with self.lock:
-            response = (
-                FluentSearch(_includes_on_results=self.SEARCH_ATTRIBUTES)
-                .where(Term.with_state("ACTIVE"))
-                .where(Asset.SUPER_TYPE_NAMES.eq(Tag.__name__))
-                .where(Asset.QUALIFIED_NAME.eq(source_tag_qn))
-                .execute(self.client)
-            )
-            candidate = (response.current_page() and response.current_page()[0]) or None
-            # NOTE: Checking if the first result is an "Asset" since in pyatlan,
-            # "DbtTag" extends "Dbt" (unlike other tags like "SnowflakeTag" that extend the "Tag" model),
-            # preventing Dbt tags from being excluded from caching:
-            if candidate and isinstance(candidate, Asset):
-                self.cache(candidate)
+        self.lookup_by_qualified_names([source_tag_qn])
+
+    def lookup_by_guids(self, guids: List[str]) -> None:
+        with self._locked_misses("guid_to_asset", guids) as missing:
+            self._lookup(Asset.GUID.within(missing), len(missing))
+
+    def lookup_by_qualified_names(self, qualified_names: List[str]) -> None:
+        with self._locked_misses("qualified_name_to_guid", qualified_names) as missing:
+            self._lookup(Asset.QUALIFIED_NAME.within(missing), len(missing))
 
     def lookup_by_name(self, stn: SourceTagName) -> None:
         if not isinstance(stn, SourceTagName):
@@ -130,22 +148,31 @@ class SourceTagCache(AbstractAssetCache):
         connection_qn = self.client.connection_cache.get_by_name(
             connection_name  # type: ignore[arg-type]
         ).qualified_name
-        source_tag_qn = f"{connection_qn}/{stn.partial_tag_name}"
-
-        with self.lock:
-            response = (
-                FluentSearch(_includes_on_results=self.SEARCH_ATTRIBUTES)
-                .where(Term.with_state("ACTIVE"))
-                .where(Asset.SUPER_TYPE_NAMES.eq(Tag.__name__))
-                .where(Asset.QUALIFIED_NAME.eq(source_tag_qn))
-                .execute(self.client)
-            )
-            candidate = (response.current_page() and response.current_page()[0]) or None
-            # NOTE: Checking if the first result is an "Asset" since in pyatlan,
-            # "DbtTag" extends "Dbt" (unlike other tags like "SnowflakeTag" that extend the "Tag" model),
-            # preventing Dbt tags from being excluded from caching:
-            if candidate and isinstance(candidate, Asset):
-                self.cache(candidate)
+        self.lookup_by_qualified_name(f"{connection_qn}/{stn.partial_tag_name}")
+
+    def _lookup(self, condition: Query, count: int) -> None:
+        if not count:
+            return
+        response = (
+            FluentSearch(_includes_on_results=self.SEARCH_ATTRIBUTES)
+            .where(Term.with_state("ACTIVE"))
+            .where(Asset.SUPER_TYPE_NAMES.eq(Tag.__name__))
+            .where(condition)
+            .page_size(count)
+            .execute(self.client)
+        )
+        # NOTE: Checking if each result is an "Asset" since in pyatlan,
+        # "DbtTag" extends "Dbt" (unlike other tags like "SnowflakeTag" that extend the "Tag" model),
+        # preventing Dbt tags from being excluded from caching:
+        candidates = [
+            candidate for candidate in response if isinstance(candidate, Asset)
+        ]
+        # Resolve the connections of all the source tags at once, rather than one-by-one
+        self.client.connection_cache.get_by_qualified_names(
+            _connection_qualified_name(candidate) for candidate in candidates
+        )
+        for candidate in candidates:
+            self.cache(candidate)
 
     def get_name(self, asset: Asset):
         # NOTE: Checking if the first result is an "Asset" since in pyatlan,
@@ -183,8 +210,7 @@ class SourceTagName(AbstractAssetName):
         # preventing Dbt tags from being excluded from caching:
         if isinstance(tag, Asset):
             source_tag_qn = tag.qualified_name or ""
-            tokens = source_tag_qn.split("/")
-            connection_qn = "/".join(tokens[:3]) if len(tokens) >= 3 else ""
+            connection_qn = _connection_qualified_name(tag)
             conn = client.connection_cache.get_by_qualified_name(connection_qn)
             self.connection = ConnectionName(conn)
             self.partial_tag_name = source_tag_qn[len(connection_qn) + 1 :]  # noqa
@@ -197,3 +223,8 @@ class SourceTagName(AbstractAssetName):
 
     def __str__(self):
         return f"{self.connection}{self._CONNECTION_DELIMITER}{self.partial_tag_name}"
+
+
+def _connection_qualified_name(tag: Asset) -> str:
+    tokens = (tag.qualified_name or "").split("/")
+    return "/".join(tokens[:3]) if len(tokens) >= 3 else ""
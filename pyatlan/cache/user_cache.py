@@ -2,10 +2,13 @@
 # Copyright 2025 Atlan Pte. Ltd.
 from __future__ import annotations
 
+import time
 from threading import Lock
-from typing import TYPE_CHECKING, Dict, Iterable, Optional
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional
 
-from pyatlan.cache.common import UserCacheCommon
+from pyatlan.cache.common import CacheMissPolicy, UserCacheCommon
+from pyatlan.cache.common.backend import CacheBackend, refresh_snapshot
+from pyatlan.cache.common.stats import CacheStats
 from pyatlan.errors import ErrorCode
 from pyatlan.model.constants import SERVICE_ACCOUNT_
 
@@ -20,12 +23,22 @@ class UserCache:
     Lazily-loaded cache for translating Atlan-internal users into their various IDs.
     """
 
-    def __init__(self, client: AtlanClient):
+    BACKEND_NAMESPACE = "user_cache"
+
+    def __init__(self, client: AtlanClient, backend: Optional[CacheBackend] = None):
+        """
+        :param client: connectivity to an Atlan tenant
+        :param backend: through which to share the users with other clients, or None to keep them in this cache only
+        """
         self.client: AtlanClient = client
+        self.backend: Optional[CacheBackend] = backend
+        self.snapshot_saved_at: float = 0.0
         self.map_id_to_name: Dict[str, str] = {}
         self.map_name_to_id: Dict[str, str] = {}
         self.map_email_to_id: Dict[str, str] = {}
         self.lock: Lock = Lock()
+        self.miss_policy: CacheMissPolicy = CacheMissPolicy()
+        self.stats: CacheStats = CacheStats()
 
     def get_id_for_name(self, name: str) -> Optional[str]:
         """
@@ -62,14 +75,77 @@ class UserCache:
         """
         return self._validate_names(names)
 
-    def _refresh_cache(self) -> None:
+    def refresh_cache(self) -> None:
+        """
+        Refreshes the cache of users by requesting the full set of users from Atlan.
+        """
+        self._refresh_cache()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Retrieve statistics describing the use of the cache.
+
+        :returns: the statistics of the cache (as in CacheStats.snapshot)
+        """
+        return self.stats.snapshot(
+            len(self.map_id_to_name),
+            self.map_id_to_name,
+            self.map_name_to_id,
+            self.map_email_to_id,
+        )
+
+    def _refresh_cache(self, generation: Optional[int] = None) -> None:
+        """
+        Refreshes the cache of users by requesting the full set of users from Atlan.
+
+        :param generation: refresh generation observed on a cache miss, when refreshing due to one
+                           (in which case the miss policy decides whether to actually refresh)
+        """
         with self.lock:
-            users = [user for user in self.client.user.get_all()]
-            if not users:
+            if generation is not None and not self.miss_policy.should_refresh(
+                generation
+            ):
                 return
-            (self.map_id_to_name, self.map_name_to_id, self.map_email_to_id) = (
-                UserCacheCommon.refresh_cache_data(users)
-            )
+            with self.stats.timed_refresh():
+                # An explicit refresh only uses users that another client saved after it was requested
+                newer_than = (
+                    time.time() if generation is None else self.snapshot_saved_at
+                )
+                snapshot = refresh_snapshot(
+                    self.backend, self.BACKEND_NAMESPACE, self._fetch_maps, newer_than
+                )
+                if not snapshot:
+                    return
+                maps, self.snapshot_saved_at = snapshot
+                (self.map_id_to_name, self.map_name_to_id, self.map_email_to_id) = maps
+                self.miss_policy.refreshed()
+
+    def _fetch_maps(self) -> Optional[List[Dict[str, str]]]:
+        """
+        Request the full set of users from Atlan.
+
+        :returns: lookup maps of the users (as in UserCacheCommon.refresh_cache_data), or None if there are no users
+        """
+        users = [user for user in self.client.user.get_all()]
+        return list(UserCacheCommon.refresh_cache_data(users)) if users else None
+
+    def _refresh_on_miss(self, index: str, key: str) -> Optional[str]:
+        """
+        Look up a key that was not found in one of the cache's indexes, after refreshing the
+        cache if the miss policy calls for it. Keys that are still not found are remembered
+        (for a while) as unknown, so that looking them up again does not refresh the cache.
+
+        :param index: name of the index (lookup map) in which the key was not found
+        :param key: key that was not found
+        :returns: value of the key in the index, or None if it is (still) unknown
+        """
+        if self.miss_policy.is_known_miss(index, key):
+            return None
+        self._refresh_cache(self.miss_policy.generation)
+        if value := getattr(self, index).get(key):
+            return value
+        self.miss_policy.record_miss(index, key)
+        return None
 
     def _get_id_for_name(self, name: str) -> Optional[str]:
         """
@@ -78,7 +154,7 @@ class UserCache:
         :param name: human-readable name of the user
         :returns: unique identifier (GUID) of the user
         """
-        if user_id := self.map_name_to_id.get(name):
+        if user_id := self.stats.observe(self.map_name_to_id.get(name)):
             return user_id
         # If we are translating an API token,
         # short-circuit any further cache refresh
@@ -91,8 +167,7 @@ class UserCache:
                 raise ErrorCode.API_TOKEN_NOT_FOUND_BY_NAME.exception_with_parameters(
                     name
                 )
-        self._refresh_cache()
-        return self.map_name_to_id.get(name)
+        return self._refresh_on_miss("map_name_to_id", name)
 
     def _get_id_for_email(self, email: str) -> Optional[str]:
         """
@@ -101,10 +176,9 @@ class UserCache:
         :param email: email address of the user
         :returns: unique identifier (GUID) of the user
         """
-        if user_id := self.map_email_to_id.get(email):
+        if user_id := self.stats.observe(self.map_email_to_id.get(email)):
             return user_id
-        self._refresh_cache()
-        return self.map_email_to_id.get(email)
+        return self._refresh_on_miss("map_email_to_id", email)
 
     def _get_name_for_id(self, idstr: str) -> Optional[str]:
         """
@@ -113,15 +187,16 @@ class UserCache:
         :param idstr: unique identifier (GUID) of the user
         :returns: username of the user
         """
-        if username := self.map_id_to_name.get(idstr):
+        if username := self.stats.observe(self.map_id_to_name.get(idstr)):
             return username
+        if self.miss_policy.is_known_miss("map_id_to_name", idstr):
+            return None
         # If the username isn't found, check if it is an API token
         token = self.client.token.get_by_guid(guid=idstr)
         if token and token.client_id:
             return token.username
         else:
-            self._refresh_cache()
-            return self.map_id_to_name.get(idstr)
+            return self._refresh_on_miss("map_id_to_name", idstr)
 
     def _validate_names(self, names: Iterable[str]):
         """
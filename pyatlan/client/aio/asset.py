@@ -6,6 +6,7 @@ import asyncio
 import logging
 from typing import (
     TYPE_CHECKING,
+    AsyncGenerator,
     Awaitable,
     Callable,
     List,
@@ -43,6 +44,7 @@ from pyatlan.client.common import (
     ManageCustomMetadata,
     ManageTerms,
     ModifyAtlanTags,
+    ParallelSearch,
     PurgeByGuid,
     RemoveAnnouncement,
     RemoveCertificate,
@@ -56,7 +58,11 @@ from pyatlan.client.common import (
     UpdateAssetByAttribute,
     UpdateCertificate,
 )
-from pyatlan.client.constants import BULK_UPDATE, DELETE_ENTITIES_BY_GUIDS
+from pyatlan.client.constants import (
+    BULK_UPDATE,
+    DELETE_ENTITIES_BY_GUIDS,
+    INDEX_SEARCH,
+)
 from pyatlan.errors import ErrorCode, NotFoundError, PermissionError
 from pyatlan.model.aio import AsyncIndexSearchResults, AsyncLineageListResults
 from pyatlan.model.aio.custom_metadata import (
@@ -117,22 +123,45 @@ class AsyncAssetClient:
         self,
         criteria: IndexSearchRequest,
         bulk=False,
+        stream=False,
+        prefetch=0,
     ) -> AsyncIndexSearchResults:
         """
         Async search that reuses shared business logic via Search.
 
         :param criteria: search criteria
         :param bulk: whether to use bulk search mode
+        :param stream: whether to stream each page of results, yielding each asset as soon as it is received
+        :param prefetch: number of upcoming pages of results to fetch concurrently while iterating through them
         :returns: AsyncIndexSearchResults
         """
         INDEX_SEARCH, request_obj = Search.prepare_request(criteria, bulk)
+        if stream:
+            raw_json = await self._client._call_api(
+                INDEX_SEARCH, request_obj=Search.prepare_count_request(request_obj)
+            )
+            response = Search.process_response(raw_json, criteria)
+            Search._check_for_bulk_search(
+                criteria, response["count"], bulk, AsyncIndexSearchResults
+            )
+            return AsyncIndexSearchResults(
+                self._client,  # type: ignore[arg-type]
+                criteria,
+                criteria.dsl.from_,
+                criteria.dsl.size,
+                response["count"],
+                [],
+                response.get("aggregations"),
+                bulk,
+                stream=True,
+            )
         raw_json = await self._client._call_api(INDEX_SEARCH, request_obj=request_obj)
         response = Search.process_response(raw_json, criteria)
 
         if Search._check_for_bulk_search(
             criteria, response["count"], bulk, AsyncIndexSearchResults
         ):
-            return await self.search(criteria)
+            return await self.search(criteria, prefetch=prefetch)
 
         return AsyncIndexSearchResults(
             self._client,  # type: ignore[arg-type]
@@ -143,8 +172,66 @@ class AsyncAssetClient:
             response["assets"],
             response.get("aggregations"),
             bulk,
+            prefetch=prefetch,
         )
 
+    async def search_parallel(
+        self, criteria: IndexSearchRequest, partitions: int = 4, bulk=False
+    ) -> AsyncGenerator[Asset, None]:
+        """
+        Async search that splits the search into a number of disjoint partitions
+        (by the creation time of the assets) that are each run concurrently.
+        Every matching asset is returned exactly once, though the results of the
+        partitions are interleaved.
+
+        :param criteria: search criteria
+        :param partitions: maximum number of partitions to split the search into (and run concurrently)
+        :param bulk: whether to run each partition as a bulk search
+        :returns: async generator of the assets that match the criteria
+        """
+        raw_json = await self._client._call_api(
+            INDEX_SEARCH, request_obj=ParallelSearch.prepare_bounds_request(criteria)
+        )
+        requests = ParallelSearch.prepare_partition_requests(
+            criteria, raw_json, partitions
+        )
+        return self._iter_partitions(requests, bulk)
+
+    async def _iter_partitions(
+        self, requests: List[IndexSearchRequest], bulk: bool
+    ) -> AsyncGenerator[Asset, None]:
+        if not requests:
+            return
+        # Bound the assets held in memory, in case the caller
+        # handles them more slowly than they are retrieved
+        results: asyncio.Queue = asyncio.Queue(
+            maxsize=len(requests) * 2 * requests[0].dsl.size
+        )
+        finished = object()
+
+        async def run(request: IndexSearchRequest):
+            try:
+                async for asset in await self.search(request, bulk=bulk):
+                    await results.put(asset)
+            except Exception as err:
+                await results.put(err)
+            await results.put(finished)
+
+        tasks = [asyncio.create_task(run(request)) for request in requests]
+        try:
+            remaining = len(tasks)
+            while remaining:
+                item = await results.get()
+                if item is finished:
+                    remaining -= 1
+                elif isinstance(item, Exception):
+                    raise item
+                else:
+                    yield item
+        finally:
+            for task in tasks:
+                task.cancel()
+
     async def get_lineage_list(self, lineage_request) -> AsyncLineageListResults:
         """
         Async lineage retrieval using shared business logic.
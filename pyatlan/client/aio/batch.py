@@ -2,13 +2,18 @@
 # Copyright 2025 Atlan Pte. Ltd.
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Dict, List, Optional, Set, cast
+import asyncio
+from collections import deque
+from contextlib import nullcontext
+from typing import TYPE_CHECKING, Deque, Dict, List, Optional, Set, Tuple, Union, cast
 
 from pydantic.v1 import validate_arguments
 
 from pyatlan.client.asset import (
+    AdaptiveBatchSizer,
     AssetCreationHandling,
     AssetIdentity,
+    AssetIdentityIndex,
     CustomMetadataHandling,
     FailedBatch,
 )
@@ -37,6 +42,12 @@ class AsyncBatch:
         View.__name__,
         MaterialisedView.__name__,
     }
+    # Order in which to match table-level assets of a different type
+    _TABLE_LEVEL_FALLBACKS = (
+        Table.__name__,
+        View.__name__,
+        MaterialisedView.__name__,
+    )
 
     def __init__(
         self,
@@ -50,6 +61,11 @@ class AsyncBatch:
         case_insensitive: bool = False,
         table_view_agnostic: bool = False,
         creation_handling: AssetCreationHandling = AssetCreationHandling.FULL,
+        adaptive: bool = False,
+        max_bytes: int = 4 * 1024 * 1024,
+        target_latency: float = 10.0,
+        connection_qualified_name: Optional[str] = None,
+        max_in_flight: int = 1,
     ):
         """
         Create a new async batch of assets to be bulk-saved.
@@ -75,6 +91,20 @@ class AsyncBatch:
             view if not found as a table, and vice versa)
         :param creation_handling: when allowing assets to be created,
             how to handle those creations (full assets or partial assets).
+        :param adaptive: whether to adapt the number of assets sent in each batch (up to `max_size`)
+            to the latency and outcome of each request (True), or always send `max_size` assets (False)
+        :param max_bytes: when adaptive, the maximum size (in bytes) of the request for each batch,
+            as estimated from the size of the requests sent for previous batches
+        :param target_latency: when adaptive, the number of seconds within which each request
+            should complete (the batch size is reduced for any request that takes longer)
+        :param connection_qualified_name: qualifiedName of the connection containing the assets to
+            be saved, when they must be matched against existing assets (for `update_only`, partial
+            creation or `table_view_agnostic`). Every asset in the connection is then looked up once
+            (in bulk) up front, instead of searching for the assets in each batch as it is flushed
+        :param max_in_flight: maximum number of batches to flush concurrently (in the background)
+            while further assets continue to be added, defaults to 1 (each batch is flushed in turn, by the
+            call that fills it). Assets in a batch should not depend on any assets in other batches
+            that may still be in flight (for example, flush a batch of tables before adding their columns).
         """
         self._client: AsyncAtlanClient = client
         self._max_size: int = max_size
@@ -102,6 +132,22 @@ class AsyncBatch:
         self._restored: List[Asset] = []
         self._skipped: List[Asset] = []
         self._resolved_qualified_names: Dict[str, str] = {}
+        self._sizer: Optional[AdaptiveBatchSizer] = (
+            AdaptiveBatchSizer(max_size, max_bytes, target_latency)
+            if adaptive
+            else None
+        )
+        # Only index the existing assets if the assets in the batch will be matched against them
+        self._connection_qualified_name: Optional[str] = (
+            connection_qualified_name
+            if update_only
+            or creation_handling != AssetCreationHandling.FULL
+            or table_view_agnostic
+            else None
+        )
+        self._identities: Optional[AssetIdentityIndex] = None
+        self._max_in_flight: int = max_in_flight
+        self._in_flight: Deque[Tuple[List[Asset], asyncio.Task]] = deque()
 
     @property
     def failures(self) -> List[FailedBatch]:
@@ -158,6 +204,15 @@ class AsyncBatch:
         """
         return self._skipped
 
+    @property
+    def batch_sizes(self) -> List[int]:
+        """Get the number of assets sent in each request, when adapting the size of each batch
+
+        :returns: the number of assets sent in each request (in the order they completed),
+        or an empty list if the batch sizes are not adaptive
+        """
+        return self._sizer.sizes if self._sizer else []
+
     @property
     def num_created(self) -> int:
         """
@@ -201,39 +256,126 @@ class AsyncBatch:
         :param single: the asset to add to a batch
         :returns: an AssetMutationResponse containing the results of the save or None if the batch is still queued.
         """
+        if self._identities is None and self._connection_qualified_name:
+            self._identities = await self._index_identities(
+                self._connection_qualified_name
+            )
         self._batch.append(single)
         return await self._process()
 
+    async def _index_identities(
+        self, connection_qualified_name: str
+    ) -> AssetIdentityIndex:
+        """
+        Look up every existing asset in the connection (in bulk).
+
+        :param connection_qualified_name: of the connection containing the assets
+        :returns: an index of the existing assets in the connection
+        """
+        identities = AssetIdentityIndex(
+            case_insensitive=self._case_insensitive,
+            connection_qualified_name=connection_qualified_name,
+        )
+        results = await (
+            FluentSearch()
+            .select(include_archived=True)
+            .where(
+                Asset.CONNECTION_QUALIFIED_NAME.eq(
+                    connection_qualified_name, case_insensitive=self._case_insensitive
+                )
+            )
+            .page_size(
+                max(self._max_size * 2, DSL.__fields__.get("size").default)  # type: ignore[union-attr]
+            )
+            .execute_async(client=self._client, bulk=True)  # type: ignore[arg-type]
+        )
+        async for asset in results:
+            identities.add(asset.type_name, asset.qualified_name or "")
+        return identities
+
     async def _process(self) -> Optional[AssetMutationResponse]:
         """If the number of entities we have queued up is equal to the batch size, process them and reset our queue;
         otherwise do nothing.
 
         :returns: an AssetMutationResponse containing the results of the save or None if the batch is still queued.
+        When flushing batches concurrently, the results are those of the earliest batch still in flight, if it
+        had to be waited for (to keep within the maximum in flight), or None otherwise.
         """
-        return await self.flush() if len(self._batch) == self._max_size else None
+        if not self._is_full():
+            return None
+        return await self._submit() if self._max_in_flight > 1 else await self.flush()
+
+    def _is_full(self) -> bool:
+        if self._sizer:
+            return self._sizer.is_full(len(self._batch))
+        return len(self._batch) == self._max_size
 
     async def flush(self) -> Optional[AssetMutationResponse]:
         """Flush any remaining assets in the batch.
 
         :returns: an AssetMutationResponse containing the results of the saving any assets that were flushed
+        (when flushing batches concurrently, the results of saving the last batch that was flushed)
         """
-        revised: list = []
         response: Optional[AssetMutationResponse] = None
+        if self._max_in_flight > 1:
+            try:
+                if self._batch:
+                    response = await self._submit()
+                while self._in_flight:
+                    response = await self._complete(*self._in_flight.popleft())
+            finally:
+                # Even when a batch failed, wait for (and track) every other batch
+                # still in flight, so that none is left running in the background
+                while self._in_flight:
+                    try:
+                        await self._complete(*self._in_flight.popleft())
+                    except Exception:
+                        # Only the first failure is raised
+                        pass
+            return response
         if self._batch:
-            fuzzy_match: bool = False
-            if self._table_view_agnostic:
-                types_in_batch = {asset.type_name for asset in self._batch}
-                fuzzy_match = any(
-                    type_name in types_in_batch
-                    for type_name in self._TABLE_LEVEL_ASSETS
-                )
-            if (
-                self._update_only
-                or self._creation_handling != AssetCreationHandling.FULL
-                or fuzzy_match
-            ):
-                found: Dict[str, str] = {}
-                qualified_names = [asset.qualified_name or "" for asset in self._batch]
+            revised, skipped = await self._revise(self._batch)
+            self._track_skipped(skipped)
+            if revised:
+                try:
+                    response = await self._save(revised)
+                except AtlanError as er:
+                    self._capture_failure(self._batch, er)
+                response and self._track_response(response, revised)
+            # Reset the batch even if every asset in it was skipped
+            self._batch = []
+        return response
+
+    async def _revise(self, batch: List[Asset]) -> Tuple[List[Asset], List[Asset]]:
+        """
+        Revise the assets in a batch ahead of saving them, by looking up any
+        that must already exist (or may need to be matched more loosely).
+
+        :param batch: assets to be saved
+        :returns: the (revised) assets to save, and the assets to skip instead
+        """
+        revised: list = []
+        skipped: List[Asset] = []
+        fuzzy_match: bool = False
+        if self._table_view_agnostic:
+            types_in_batch = {asset.type_name for asset in batch}
+            fuzzy_match = any(
+                type_name in types_in_batch for type_name in self._TABLE_LEVEL_ASSETS
+            )
+        if (
+            self._update_only
+            or self._creation_handling != AssetCreationHandling.FULL
+            or fuzzy_match
+        ):
+            found = AssetIdentityIndex(case_insensitive=self._case_insensitive)
+            identities = self._identities
+            qualified_names = [
+                asset.qualified_name or ""
+                for asset in batch
+                if not (identities and identities.covers(asset.qualified_name or ""))
+            ]
+            # Only search for assets that are not already indexed
+            if qualified_names:
                 if self._case_insensitive:
                     search = FluentSearch().select(include_archived=True).min_somes(1)
                     for qn in qualified_names:
@@ -253,72 +395,41 @@ class AsyncBatch:
                 ).execute_async(client=self._client)  # type: ignore[arg-type]
 
                 async for asset in results:
-                    asset_id = AssetIdentity(
-                        type_name=asset.type_name,
-                        qualified_name=asset.qualified_name or "",
-                        case_insensitive=self._case_insensitive,
-                    )
-                    found[str(asset_id)] = asset.qualified_name or ""
-
-                for asset in self._batch:
-                    asset_id = AssetIdentity(
-                        type_name=asset.type_name,
-                        qualified_name=asset.qualified_name or "",
-                        case_insensitive=self._case_insensitive,
+                    found.add(asset.type_name, asset.qualified_name or "")
+
+            for asset in batch:
+                qualified_name = asset.qualified_name or ""
+                existing = (
+                    identities
+                    if identities and identities.covers(qualified_name)
+                    else found
+                )
+                actual_qn = existing.find(asset.type_name, qualified_name)
+                # If found, with a type match, go ahead and update it
+                if actual_qn is not None:
+                    # Replace the actual qualifiedName on the asset before adding it to the batch
+                    # in case it matched case-insensitively, we need the proper case-sensitive name we
+                    # found to ensure it's an update, not a create)
+                    self.add_fuzzy_matched(
+                        asset=asset, actual_qn=actual_qn, revised=revised
                     )
-                    # If found, with a type match, go ahead and update it
-                    if str(asset_id) in found:
-                        # Replace the actual qualifiedName on the asset before adding it to the batch
-                        # in case it matched case-insensitively, we need the proper case-sensitive name we
-                        # found to ensure it's an update, not a create)
-                        self.add_fuzzy_matched(
-                            asset=asset,
-                            actual_qn=found.get(str(asset_id), ""),
-                            revised=revised,
-                        )
-                    elif (
-                        self._table_view_agnostic
-                        and asset.type_name in self._TABLE_LEVEL_ASSETS
-                    ):
-                        # If found as a different (but acceptable) type, update that instead
-                        as_table = AssetIdentity(
-                            type_name=Table.__name__,
-                            qualified_name=asset.qualified_name or "",
-                            case_insensitive=self._case_insensitive,
-                        )
-                        as_view = AssetIdentity(
-                            type_name=View.__name__,
-                            qualified_name=asset.qualified_name or "",
-                            case_insensitive=self._case_insensitive,
-                        )
-                        as_materialized_view = AssetIdentity(
-                            type_name=MaterialisedView.__name__,
-                            qualified_name=asset.qualified_name or "",
-                            case_insensitive=self._case_insensitive,
-                        )
-
-                        if str(as_table) in found:
+                elif (
+                    self._table_view_agnostic
+                    and asset.type_name in self._TABLE_LEVEL_ASSETS
+                ):
+                    # If found as a different (but acceptable) type, update that instead
+                    for type_name in self._TABLE_LEVEL_FALLBACKS:
+                        actual_qn = existing.find(type_name, qualified_name)
+                        if actual_qn is not None:
                             self.add_fuzzy_matched(
                                 asset=asset,
-                                actual_qn=found.get(str(as_table), ""),
+                                actual_qn=actual_qn,
                                 revised=revised,
-                                type_name=Table.__name__,
+                                type_name=type_name,
                             )
-                        elif str(as_view) in found:
-                            self.add_fuzzy_matched(
-                                asset=asset,
-                                actual_qn=found.get(str(as_view), ""),
-                                revised=revised,
-                                type_name=View.__name__,
-                            )
-                        elif str(as_materialized_view) in found:
-                            self.add_fuzzy_matched(
-                                asset=asset,
-                                actual_qn=found.get(str(as_materialized_view), ""),
-                                revised=revised,
-                                type_name=MaterialisedView.__name__,
-                            )
-                        elif self._creation_handling == AssetCreationHandling.PARTIAL:
+                            break
+                    else:
+                        if self._creation_handling == AssetCreationHandling.PARTIAL:
                             # Still create it (partial), if not found
                             # and partial asset creation is allowed
                             self.add_partial_asset(asset, revised)
@@ -329,54 +440,90 @@ class AsyncBatch:
                         else:
                             # Otherwise, if it still does not match any
                             # fallback and cannot be created, skip it
-                            self.__track(self._skipped, asset)
-                            self._num_skipped += 1
-                    elif self._creation_handling == AssetCreationHandling.PARTIAL:
-                        # Append `is_partial=True` onto the asset
-                        # before adding it to the batch, to ensure only
-                        # a partial (and not a full) asset is created
-                        self.add_partial_asset(asset, revised)
-                    else:
-                        self.__track(self._skipped, asset)
-                        self._num_skipped += 1
-            else:
-                # Otherwise create it (full)
-                revised = self._batch.copy()
+                            skipped.append(asset)
+                elif self._creation_handling == AssetCreationHandling.PARTIAL:
+                    # Append `is_partial=True` onto the asset
+                    # before adding it to the batch, to ensure only
+                    # a partial (and not a full) asset is created
+                    self.add_partial_asset(asset, revised)
+                else:
+                    skipped.append(asset)
+        else:
+            # Otherwise create it (full)
+            revised = batch.copy()
+
+        return revised, skipped
+
+    async def _save(self, revised: List[Asset]) -> AssetMutationResponse:
+        with self._sizer.measure(len(revised)) if self._sizer else nullcontext():
+            return await self._send_revised(revised)
+
+    async def _send_revised(self, revised: List[Asset]) -> AssetMutationResponse:
+        if self._custom_metadata_handling == CustomMetadataHandling.IGNORE:
+            return await self._client.asset.save(
+                revised, replace_atlan_tags=self._replace_atlan_tags
+            )
+        elif self._custom_metadata_handling == CustomMetadataHandling.OVERWRITE:
+            return await self._client.asset.save_replacing_cm(
+                revised, replace_atlan_tags=self._replace_atlan_tags
+            )
+        elif self._custom_metadata_handling == CustomMetadataHandling.MERGE:
+            return await self._client.asset.save_merging_cm(
+                revised, replace_atlan_tags=self._replace_atlan_tags
+            )
+        else:
+            raise ErrorCode.INVALID_PARAMETER_TYPE.exception_with_parameters(
+                self._custom_metadata_handling,
+                "CustomMetadataHandling.IGNORE, CustomMetadataHandling.OVERWRITE "
+                "or CustomMetadataHandling.MERGE",
+            )
 
-            if revised:
-                try:
-                    if self._custom_metadata_handling == CustomMetadataHandling.IGNORE:
-                        response = await self._client.asset.save(
-                            revised, replace_atlan_tags=self._replace_atlan_tags
-                        )
-                    elif (
-                        self._custom_metadata_handling
-                        == CustomMetadataHandling.OVERWRITE
-                    ):
-                        response = await self._client.asset.save_replacing_cm(
-                            revised, replace_atlan_tags=self._replace_atlan_tags
-                        )
-                    elif self._custom_metadata_handling == CustomMetadataHandling.MERGE:
-                        response = await self._client.asset.save_merging_cm(
-                            revised, replace_atlan_tags=self._replace_atlan_tags
-                        )
-                    else:
-                        raise ErrorCode.INVALID_PARAMETER_TYPE.exception_with_parameters(
-                            self._custom_metadata_handling,
-                            "CustomMetadataHandling.IGNORE, CustomMetadataHandling.OVERWRITE "
-                            "or CustomMetadataHandling.MERGE",
-                        )
-                except AtlanError as er:
-                    if self._capture_failures:
-                        self._failures.append(
-                            FailedBatch(failed_assets=self._batch, failure_reason=er)
-                        )
-                    else:
-                        raise er
-                self._batch = []
-                response and self._track_response(response, revised)
+    async def _submit(self) -> Optional[AssetMutationResponse]:
+        response: Optional[AssetMutationResponse] = None
+        if len(self._in_flight) >= self._max_in_flight:
+            response = await self._complete(*self._in_flight.popleft())
+        batch, self._batch = self._batch, []
+        self._in_flight.append((batch, asyncio.create_task(self._send(batch))))
         return response
 
+    async def _send(
+        self, batch: List[Asset]
+    ) -> Tuple[
+        List[Asset], List[Asset], Union[AssetMutationResponse, AtlanError, None]
+    ]:
+        # Only the requests are made in the background, so that all tracking
+        # is done by the caller (in the order the batches were added)
+        revised, skipped = await self._revise(batch)
+        outcome: Union[AssetMutationResponse, AtlanError, None] = None
+        if revised:
+            try:
+                outcome = await self._save(revised)
+            except AtlanError as er:
+                outcome = er
+        return revised, skipped, outcome
+
+    async def _complete(
+        self, batch: List[Asset], sent: asyncio.Task
+    ) -> Optional[AssetMutationResponse]:
+        revised, skipped, outcome = await sent
+        self._track_skipped(skipped)
+        if isinstance(outcome, AtlanError):
+            self._capture_failure(batch, outcome)
+            return None
+        outcome and self._track_response(outcome, revised)
+        return outcome
+
+    def _track_skipped(self, skipped: List[Asset]):
+        for asset in skipped:
+            self.__track(self._skipped, asset)
+            self._num_skipped += 1
+
+    def _capture_failure(self, batch: List[Asset], er: AtlanError):
+        if self._capture_failures:
+            self._failures.append(FailedBatch(failed_assets=batch, failure_reason=er))
+        else:
+            raise er
+
     def _track_response(self, response: AssetMutationResponse, sent: list[Asset]):
         if response:
             # Atlan reports partial updates (primitive-only attribute changes, or
@@ -407,6 +554,12 @@ class AsyncBatch:
 
             if response.guid_assignments:
                 self._resolved_guids.update(response.guid_assignments)
+            if self._identities is not None and response.mutated_entities:
+                # Keep the index up-to-date with any assets that now exist
+                for asset in response.mutated_entities.CREATE or []:
+                    qualified_name = asset.qualified_name or ""
+                    if self._identities.covers(qualified_name):
+                        self._identities.add(asset.type_name, qualified_name)
             if sent:
                 created_guids, updated_guids = set(), set()
                 partial_guids = {asset.guid for asset in partial_assets}
@@ -13,10 +13,20 @@ import copy
 import json
 import logging
 import os
+import time
 from contextlib import _AsyncGeneratorContextManager
+from functools import partial
 from http import HTTPStatus
 from types import SimpleNamespace
-from typing import Any, Dict, Optional
+from typing import (
+    Any,
+    AsyncGenerator,
+    AsyncIterator,
+    Dict,
+    Iterable,
+    Optional,
+    cast,
+)
 
 import httpx
 from httpx_retries.retry import Retry
@@ -33,6 +43,9 @@ from pyatlan.cache.aio import (
     AsyncSourceTagCache,
     AsyncUserCache,
 )
+from pyatlan.cache.common import CacheWarmup
+from pyatlan.cache.common.stats import CLIENT_CACHES
+from pyatlan.cache.common.warmup import timed_out, validate_cache_names
 from pyatlan.client.aio.admin import AsyncAdminClient
 from pyatlan.client.aio.asset import AsyncAssetClient
 from pyatlan.client.aio.audit import AsyncAuditClient
@@ -59,10 +72,15 @@ from pyatlan.client.atlan import (
     VERSION,
     AtlanClient,
     get_python_version,
+    response_translation_var,
 )
 from pyatlan.client.common import ImpersonateUser
+from pyatlan.client.common.transport import mark_auth_policy_create
 from pyatlan.client.constants import EVENT_STREAM, GET_TOKEN, UPLOAD_IMAGE
-from pyatlan.client.transport import PyatlanAsyncTransport  # type: ignore
+from pyatlan.client.transport import (  # type: ignore
+    PyatlanAsyncTransport,
+    _record_request_body_size,
+)
 from pyatlan.errors import ERROR_CODE_FOR_HTTP_STATUS, AtlanError, ErrorCode
 from pyatlan.model.aio.core import AsyncAtlanRequest, AsyncAtlanResponse
 from pyatlan.model.atlan_image import AtlanImage
@@ -171,7 +189,11 @@ class AsyncAtlanClient(AtlanClient):
         # Create async session with custom transport that supports retry and proxy
         self._async_session = httpx.AsyncClient(
             transport=PyatlanAsyncTransport(
-                retry=self.retry, client=self, **transport_kwargs
+                retry=self.retry,
+                client=self,
+                rate_limiter=self._rate_limiter,
+                **self._build_transport_pool_config(),
+                **transport_kwargs,
             ),
             headers={
                 "x-atlan-agent": "sdk",
@@ -414,7 +436,12 @@ class AsyncAtlanClient(AtlanClient):
     def connection_cache(self) -> AsyncConnectionCache:  # type: ignore[override]
         """Get async connection cache with same API as sync"""
         if self._async_connection_cache is None:
-            self._async_connection_cache = AsyncConnectionCache(client=self)
+            self._async_connection_cache = AsyncConnectionCache(
+                client=self,
+                max_entries=self.asset_cache_max_entries,
+                ttl=self.asset_cache_ttl,
+                backend=self._cache_backend,
+            )
         return self._async_connection_cache
 
     @property
@@ -433,6 +460,66 @@ class AsyncAtlanClient(AtlanClient):
             )
         return self._async_dq_template_config_cache
 
+    async def warm_caches(  # type: ignore[override]
+        self,
+        caches: Optional[Iterable[str]] = None,
+        timeout: Optional[float] = 60.0,
+    ) -> Dict[str, CacheWarmup]:
+        """
+        Warm up (load) the given caches concurrently, for example while an application starts up,
+        so that the first request needing them does not wait for each of them to load one after
+        the other. Caches that fail to load, or do not load before the deadline, are reported
+        (rather than raised) and will be loaded again on first use.
+
+        :param caches: names of the caches to warm up (their properties on this client, for example
+            atlan_tag_cache), or None to warm up all of: atlan_tag_cache, custom_metadata_cache,
+            enum_cache, user_cache, group_cache, role_cache and dq_template_config_cache
+        :param timeout: number of seconds within which to warm up all the caches, or None to wait
+            for all of them to load. Caches still loading at the deadline are cancelled.
+        :returns: the outcome of warming up each cache, keyed by the name of the cache
+        :raises InvalidRequestError: if any of the names is not that of a cache that can be warmed up
+        """
+        names = validate_cache_names(caches)
+        if not names:
+            return {}
+
+        async def warm(name: str) -> CacheWarmup:
+            started = time.perf_counter()
+            try:
+                await getattr(self, name).refresh_cache()
+            except Exception as e:
+                LOGGER.warning("Unable to warm up %s: %s", name, e)
+                return CacheWarmup(name, time.perf_counter() - started, e)
+            elapsed = time.perf_counter() - started
+            LOGGER.debug("Warmed up %s in %.3fs", name, elapsed)
+            return CacheWarmup(name, elapsed)
+
+        started = time.perf_counter()
+        tasks = {name: asyncio.ensure_future(warm(name)) for name in names}
+        _, pending = await asyncio.wait(tasks.values(), timeout=timeout)
+        for task in pending:
+            task.cancel()
+        elapsed = time.perf_counter() - started
+        return {
+            name: timed_out(name, elapsed) if task in pending else task.result()
+            for name, task in tasks.items()
+        }
+
+    def get_cache_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Retrieve statistics describing the use of this client's caches (hits, misses,
+        refresh count and durations, entry count and an estimate of their memory use).
+        Caches that have not been used yet are omitted.
+
+        :returns: the statistics of each cache (as in CacheStats.snapshot), keyed by the name of the cache
+        """
+        caches = {name: getattr(self, f"_async_{name}") for name in CLIENT_CACHES}
+        return {
+            name: cache.get_stats()
+            for name, cache in caches.items()
+            if cache is not None
+        }
+
     @property
     def enum_cache(self) -> AsyncEnumCache:  # type: ignore[override]
         """Get async enum cache with same API as sync"""
@@ -444,7 +531,9 @@ class AsyncAtlanClient(AtlanClient):
     def group_cache(self) -> AsyncGroupCache:  # type: ignore[override]
         """Get async group cache with same API as sync"""
         if self._async_group_cache is None:
-            self._async_group_cache = AsyncGroupCache(client=self)
+            self._async_group_cache = AsyncGroupCache(
+                client=self, backend=self._cache_backend
+            )
         return self._async_group_cache
 
     @property
@@ -458,14 +547,21 @@ class AsyncAtlanClient(AtlanClient):
     def source_tag_cache(self) -> AsyncSourceTagCache:  # type: ignore[override]
         """Get async source tag cache with same API as sync"""
         if self._async_source_tag_cache is None:
-            self._async_source_tag_cache = AsyncSourceTagCache(client=self)
+            self._async_source_tag_cache = AsyncSourceTagCache(
+                client=self,
+                max_entries=self.asset_cache_max_entries,
+                ttl=self.asset_cache_ttl,
+                backend=self._cache_backend,
+            )
         return self._async_source_tag_cache
 
     @property
     def user_cache(self) -> AsyncUserCache:  # type: ignore[override]
         """Get async user cache with same API as sync"""
         if self._async_user_cache is None:
-            self._async_user_cache = AsyncUserCache(client=self)
+            self._async_user_cache = AsyncUserCache(
+                client=self, backend=self._cache_backend
+            )
         return self._async_user_cache
 
     def _api_logger(self, api, path):
@@ -496,11 +592,13 @@ class AsyncAtlanClient(AtlanClient):
             if isinstance(request_obj, AtlanObject):
                 # Use AsyncAtlanRequest for async retranslation
                 async_request = AsyncAtlanRequest(instance=request_obj, client=self)
-                params["data"] = await async_request.json()
+                params["content"] = await async_request.to_bytes()
+                _record_request_body_size(len(params["content"]))
             elif api.consumes == APPLICATION_ENCODED_FORM:
                 params["data"] = request_obj
             else:
                 params["data"] = json.dumps(request_obj)
+            mark_auth_policy_create(params, request_obj)
         return params
 
     async def _call_api(
@@ -523,10 +621,85 @@ class AsyncAtlanClient(AtlanClient):
             params["headers"].update(extra_headers)
         if LOGGER.isEnabledFor(logging.DEBUG):
             self._api_logger(api, path)
+        body = self._request_compression.body_to_compress(params)
+        if body is not None:
+            return await self._call_api_compressed(
+                api, path, params, body, text_response
+            )
         return await self._call_api_internal(
             api, path, params, text_response=text_response
         )
 
+    async def _call_api_compressed(  # type: ignore[override]
+        self, api, path, params, body, text_response=False
+    ):
+        """
+        Async version of _call_api_compressed, compressing the request body
+        in a worker thread so as not to block the event loop.
+        """
+        compression = self._request_compression
+        compressed = await asyncio.to_thread(compression.compress, body)
+        compressed_params = compression.apply(params, compressed)
+        if compression.verified:
+            return await self._call_api_internal(
+                api, path, compressed_params, text_response=text_response
+            )
+        try:
+            response = await self._call_api_internal(
+                api, path, compressed_params, text_response=text_response
+            )
+        except AtlanError as err:
+            if not compression.is_rejection(err):
+                raise
+            response = await self._call_api_internal(
+                api, path, params, text_response=text_response
+            )
+            compression.disable()
+            return response
+        compression.verified = True
+        return response
+
+    @contextlib.asynccontextmanager
+    async def _stream_api(  # type: ignore[override]
+        self, api, query_params=None, request_obj=None
+    ) -> AsyncGenerator[AsyncIterator[bytes], None]:
+        """
+        Async version of _stream_api - mirrors sync client structure.
+        """
+        path = self._create_path(api)
+        params = await self._create_params(api, query_params, request_obj)
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            self._api_logger(api, path)
+        # Only compress once the server is known to accept compressed request bodies
+        compression = self._request_compression
+        body = compression.body_to_compress(params)
+        if body is not None and compression.verified:
+            compressed = await asyncio.to_thread(compression.compress, body)
+            params = compression.apply(params, compressed)
+        timeout = httpx.Timeout(
+            None,
+            connect=self.connect_timeout,
+            read=self.read_timeout,
+            pool=self.pool_timeout,
+        )
+        async with self._async_session.stream(  # type: ignore[union-attr]
+            api.method.value, path, **params, timeout=timeout
+        ) as response:
+            LOGGER.debug("HTTP Status: %s", response.status_code)
+            streamed = response.status_code == api.expected_status
+            if streamed:
+                self._401_has_retried.set(False)
+                yield response.aiter_bytes()
+        if not streamed:
+            with self.disable_response_translation():
+                raw_json = await self._call_api_internal(api, path, params)
+            yield self._iter_json_bytes(raw_json)
+
+    @staticmethod
+    async def _iter_json_bytes(raw_json) -> AsyncIterator[bytes]:
+        if raw_json:
+            yield json.dumps(raw_json).encode("utf-8")
+
     async def _call_api_internal(
         self,
         api,
@@ -586,7 +759,10 @@ class AsyncAtlanClient(AtlanClient):
         """Make HTTP request - matches sync client structure exactly."""
         try:
             timeout = httpx.Timeout(
-                None, connect=self.connect_timeout, read=self.read_timeout
+                None,
+                connect=self.connect_timeout,
+                read=self.read_timeout,
+                pool=self.pool_timeout,
             )
             if api.consumes == EVENT_STREAM and api.produces == EVENT_STREAM:
                 async with session.stream(
@@ -620,8 +796,11 @@ class AsyncAtlanClient(AtlanClient):
                     else:
                         # It's already bytes data (e.g., from MultipartDataGenerator)
                         request_kwargs["data"] = binary_data
-
-                response = await session.request(**request_kwargs)
+                    response = await session.request(**request_kwargs)
+                else:
+                    response = await self._hedged_request(
+                        api, partial(session.request, **request_kwargs)
+                    )
 
             LOGGER.debug("HTTP Status: %s", response.status_code)
             return response
@@ -630,6 +809,56 @@ class AsyncAtlanClient(AtlanClient):
             LOGGER.error("HTTP request failed: %s", e)
             raise
 
+    async def _hedged_request(self, api, send):  # type: ignore[override]
+        """
+        Async version of _hedged_request, sending the requests as concurrent tasks
+        and cancelling whichever does not complete first.
+        """
+        hedging = self._hedging
+        if hedging is None or not hedging.is_hedgeable(api):
+            return await send()
+        delay = hedging.start_request()
+        started = time.perf_counter()
+        if delay is None:
+            response = await send()
+            hedging.record_latency(time.perf_counter() - started)
+            return response
+        tasks = [asyncio.ensure_future(send())]
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=delay)
+            if not done and hedging.try_hedge():
+                LOGGER.debug("Hedging request to %s after %.3fs", api.path, delay)
+                tasks.append(asyncio.ensure_future(send()))
+                winner = await self._first_successful(*tasks)
+                hedging.record_latency(
+                    time.perf_counter() - started, winner is tasks[1]
+                )
+                return winner.result()
+            response = await tasks[0]
+            hedging.record_latency(time.perf_counter() - started)
+            return response
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+    @staticmethod
+    async def _first_successful(  # type: ignore[override]
+        primary: asyncio.Future, hedge: asyncio.Future
+    ) -> asyncio.Future:
+        # Wait for the first request to succeed (or, if both fail, for the first to fail)
+        pending = {primary, hedge}
+        failed: Optional[asyncio.Future] = None
+        while pending:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                if task.exception() is None:
+                    return task
+                failed = failed or task
+        return cast(asyncio.Future, failed)
+
     async def _create_stream_response(self, stream_response, expected_status):
         """Create mock response object for event streams."""
         content = await stream_response.aread()
@@ -684,7 +913,9 @@ class AsyncAtlanClient(AtlanClient):
                     events
                     if events
                     else await AsyncAtlanResponse(
-                        raw_json=response.json(), client=self
+                        raw_json=response.json(),
+                        client=self,
+                        translate=response_translation_var.get(),
                     ).to_dict()
                 )
 
@@ -996,7 +1227,11 @@ class AsyncAtlanClient(AtlanClient):
             transport_kwargs["verify"] = self.verify
 
         new_transport = PyatlanAsyncTransport(
-            retry=max_retries, client=self, **transport_kwargs
+            retry=max_retries,
+            client=self,
+            rate_limiter=self._rate_limiter,
+            **self._build_transport_pool_config(),
+            **transport_kwargs,
         )
         session._transport = new_transport
 
@@ -3,11 +3,98 @@
 
 from __future__ import annotations
 
+from json import JSONDecodeError
+from typing import Any, AsyncGenerator, Dict, List
+
 from pydantic.v1 import validate_arguments
 
 from pyatlan.client.common import AsyncApiCaller, QueryStream
 from pyatlan.errors import ErrorCode
 from pyatlan.model.query import QueryRequest, QueryResponse
+from pyatlan.utils import EventStreamParser
+
+
+class AsyncQueryResults:
+    """
+    Async version of QueryResults: captures the results of a query, which are streamed
+    (in batches of rows) as they are received, so that only one batch of rows is held
+    in memory at a time. The query is run each time the results are iterated through.
+    """
+
+    def __init__(self, client: AsyncApiCaller, request: QueryRequest):
+        self._client = client
+        self._request = request
+        self._response = QueryResponse()
+
+    @property
+    def response(self) -> QueryResponse:
+        """
+        Details of the query (its columns, and any error), without any of its rows.
+        These are complete once all the results have been iterated through.
+        """
+        return self._response
+
+    def __aiter__(self) -> AsyncGenerator[List[str], None]:
+        """
+        Iterates through each row of the results, as it is received.
+
+        :returns: an async iterable form of each row of the results
+        :raises AtlanError: on any issues with API communication
+        """
+        return self.iter_rows()
+
+    async def iter_rows(self) -> AsyncGenerator[List[str], None]:
+        """
+        Iterates through each row of the results, as it is received.
+
+        :returns: an async iterable form of each row of the results
+        :raises AtlanError: on any issues with API communication
+        """
+        async for batch in self.iter_batches():
+            for row in batch:
+                yield row
+
+    async def iter_batches(
+        self, batch_size: int = 1000, columnar: bool = False
+    ) -> AsyncGenerator[List[Any], None]:
+        """
+        Iterates through the results in batches of rows, as they are received.
+
+        :param batch_size: maximum number of rows in each batch
+        :param columnar: whether to arrange each batch by column, as a list of the
+            values of each column (in the order of the `columns` of the response),
+            which can be loaded directly into columnar structures (such as Arrow
+            arrays or NumPy arrays), or by row (as a list of rows), defaults to by row
+        :returns: an async iterable form of each batch of rows of the results
+        :raises AtlanError: on any issues with API communication
+        """
+        batch: List[Any] = []
+        async for event in self._stream_events():
+            for row in QueryStream.process_event(self._response, event):
+                batch.append(row)
+                if len(batch) == batch_size:
+                    yield QueryStream.to_batch(batch, columnar)
+                    batch = []
+        if batch:
+            yield QueryStream.to_batch(batch, columnar)
+
+    async def _stream_events(self) -> AsyncGenerator[Dict[str, Any], None]:
+        self._response = QueryResponse()
+        endpoint, request_obj = QueryStream.prepare_request(self._request)
+        parser = EventStreamParser()
+        try:
+            async with self._client._stream_api(
+                endpoint, request_obj=request_obj
+            ) as chunks:
+                async for chunk in chunks:
+                    for event in parser.feed(chunk):
+                        yield event
+                for event in parser.close():
+                    yield event
+        except JSONDecodeError as err:
+            raise ErrorCode.JSON_ERROR.exception_with_parameters(
+                err.doc, 200, str(err)
+            ) from err
 
 
 class AsyncQueryClient:
@@ -39,3 +126,14 @@ class AsyncQueryClient:
 
         # Process response using shared logic
         return QueryStream.process_response(raw_json)
+
+    @validate_arguments
+    def stream_results(self, request: QueryRequest) -> AsyncQueryResults:
+        """
+        Runs the provided query, streaming its results as they are received
+        (rather than holding all of them in memory at once).
+
+        :param: request query to run.
+        :returns: results of the query, which run the query as they are iterated through.
+        """
+        return AsyncQueryResults(client=self._client, request=request)
@@ -3,10 +3,12 @@
 
 from __future__ import annotations
 
-from typing import List, Union
+import asyncio
+from typing import List, Optional, Union
 
 from pydantic.v1 import validate_arguments
 
+from pyatlan.cache.common import TypeDefSnapshot
 from pyatlan.client.common import (
     AsyncApiCaller,
     TypeDefCreate,
@@ -37,9 +39,12 @@ class AsyncTypeDefClient:
                 "client", "AsyncApiCaller"
             )
         self._client = client
+        self._snapshot: Optional[TypeDefSnapshot] = None
+        self._snapshot_lock = asyncio.Lock()
 
     async def _refresh_caches(self, typedef: TypeDef) -> None:
         """Refresh appropriate caches after creating or updating a type definition."""
+        await self._invalidate_snapshot()
         if isinstance(typedef, AtlanTagDef):
             await self._client.atlan_tag_cache.refresh_cache()  # type: ignore[attr-defined]
         if isinstance(typedef, CustomMetadataDef):
@@ -47,6 +52,74 @@ class AsyncTypeDefClient:
         if isinstance(typedef, EnumDef):
             await self._client.enum_cache.refresh_cache()  # type: ignore[attr-defined]
 
+    async def _invalidate_snapshot(self) -> None:
+        """Discard the typedef snapshot (in memory and on disk), after a type definition has changed."""
+        async with self._snapshot_lock:
+            self._snapshot = None
+            if snapshot_file := getattr(self._client, "_typedef_snapshot_file", None):
+                await asyncio.to_thread(snapshot_file.invalidate)
+
+    async def _get_snapshot(self, refresh: bool = False) -> TypeDefSnapshot:
+        """
+        Retrieves the snapshot of type definitions from which the typedef-backed caches
+        (Atlan tags, custom metadata and enumerations) are built. It is requested once and
+        shared by all of those caches, and concurrent refreshes share a single request.
+        A snapshot without any struct definitions is returned, but not kept.
+
+        :param refresh: if True, request the type definitions from Atlan again rather than
+                        reuse the current snapshot
+        :returns: snapshot of the type definitions
+        :raises AtlanError: on any API communication issue
+        """
+        current = self._snapshot
+        async with self._snapshot_lock:
+            # Only refresh if no other caller has refreshed the snapshot in the meantime
+            if self._snapshot is not None and not (
+                refresh and self._snapshot is current
+            ):
+                return self._snapshot
+            snapshot = TypeDefSnapshot(
+                await self._get_snapshot_json(use_snapshot_file=not refresh)
+            )
+            # A snapshot without any struct definitions (for example, in a response to a
+            # failed request or an expired token) is not kept, so it is requested again
+            if snapshot.defs(AtlanTypeCategory.STRUCT):
+                self._snapshot = snapshot
+            return snapshot
+
+    async def _get_snapshot_json(self, use_snapshot_file: bool) -> dict:
+        """
+        Retrieves the raw type definitions of a snapshot. When the client has a typedef
+        snapshot file, the categories it holds that are not yet stale are loaded from it
+        (if use_snapshot_file is True), and only the others are requested from Atlan and
+        then saved to it.
+
+        :param use_snapshot_file: whether type definitions can be loaded from the client's typedef snapshot file
+        :returns: raw type definitions, keyed as in a typedefs response
+        :raises AtlanError: on any API communication issue
+        """
+        categories = TypeDefSnapshot.CATEGORIES
+        snapshot_file = getattr(self._client, "_typedef_snapshot_file", None)
+        if not snapshot_file:
+            endpoint, query_params = TypeDefGet.prepare_request_by_category(categories)
+            return await self._client._call_api(endpoint, query_params) or {}
+        # Loading may wait for another process to request the type definitions
+        raw_json, missing = (
+            await asyncio.to_thread(snapshot_file.load, categories)
+            if use_snapshot_file
+            else ({}, categories)
+        )
+        if missing:
+            try:
+                endpoint, query_params = TypeDefGet.prepare_request_by_category(missing)
+                fetched = await self._client._call_api(endpoint, query_params)
+                raw_json.update(
+                    await asyncio.to_thread(snapshot_file.save, missing, fetched or {})
+                )
+            finally:
+                await asyncio.to_thread(snapshot_file.release)
+        return raw_json
+
     async def get_all(self) -> TypeDefResponse:
         """
         Retrieves a TypeDefResponse object that contains a list of all the type definitions in Atlan.
@@ -148,4 +221,5 @@ class AsyncTypeDefClient:
             name, typedef_type, self._client
         )
         await self._client._call_api(endpoint, request_obj)
+        await self._invalidate_snapshot()
         await TypeDefPurge.refresh_caches_async(typedef_type, self._client)
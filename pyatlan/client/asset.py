@@ -6,10 +6,19 @@ import abc
 import logging
 import time
 from abc import ABC
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager, nullcontext
+from contextvars import copy_context
 from enum import Enum
+from json import JSONDecodeError
+from queue import Full, Queue
+from threading import Event, Lock
 from typing import (
     TYPE_CHECKING,
+    Any,
     Callable,
+    Deque,
     Dict,
     Generator,
     Iterable,
@@ -17,6 +26,7 @@ from typing import (
     Optional,
     Protocol,
     Set,
+    Tuple,
     Type,
     TypeVar,
     Union,
@@ -59,6 +69,7 @@ from pyatlan.client.common import (
     ManageCustomMetadata,
     ManageTerms,
     ModifyAtlanTags,
+    ParallelSearch,
     PurgeByGuid,
     RemoveAnnouncement,
     RemoveCertificate,
@@ -80,6 +91,10 @@ from pyatlan.client.constants import (
     GET_LINEAGE_LIST,
     INDEX_SEARCH,
 )
+from pyatlan.client.transport import (
+    record_request_body_sizes,
+    record_retried_status_codes,
+)
 from pyatlan.errors import AtlanError, ErrorCode, NotFoundError, PermissionError
 from pyatlan.model.aggregation import Aggregations
 from pyatlan.model.assets import (
@@ -99,7 +114,12 @@ from pyatlan.model.assets import (
     Table,
     View,
 )
-from pyatlan.model.core import Announcement, AtlanObject, SearchRequest
+from pyatlan.model.core import (
+    Announcement,
+    AtlanObject,
+    AtlanResponse,
+    SearchRequest,
+)
 from pyatlan.model.custom_metadata import CustomMetadataDict
 from pyatlan.model.enums import (
     AssetCreationHandling,
@@ -115,7 +135,10 @@ from pyatlan.model.fields.atlan_fields import AtlanField
 from pyatlan.model.lineage import LineageListRequest
 from pyatlan.model.response import AssetMutationResponse
 from pyatlan.model.search import DSL, Bool, IndexSearchRequest, Query, Range, SortItem
-from pyatlan.utils import API, unflatten_custom_metadata_for_entity
+from pyatlan.utils import (
+    API,
+    JsonArrayStreamParser,
+)
 
 if TYPE_CHECKING:
     from pyatlan.client.atlan import AtlanClient
@@ -169,7 +192,9 @@ class AssetClient:
     # TODO: Try adding @validate_arguments to this method once
     # the issue below is fixed or when we switch to pydantic v2
     # https://github.com/atlanhq/atlan-python/pull/88#discussion_r1260892704
-    def search(self, criteria: IndexSearchRequest, bulk=False) -> IndexSearchResults:
+    def search(
+        self, criteria: IndexSearchRequest, bulk=False, stream=False, prefetch=0
+    ) -> IndexSearchResults:
         """
         Search for assets using the provided criteria.
         `Note:` if the number of results exceeds the predefined threshold
@@ -179,6 +204,14 @@ class AssetClient:
         :param bulk: whether to run the search to retrieve assets that match the supplied criteria,
         for large numbers of results (> `100,000`), defaults to `False`. Note: this will reorder the results
         (based on creation timestamp) in order to iterate through a large number (more than `100,000`) results.
+        :param stream: whether to stream each page of results, defaults to `False`. When streaming, each asset
+        is built and yielded (by iterating through the results) as soon as it is received, rather than once its
+        whole page has been received, and is not retained afterwards (so `current_page()` is always empty).
+        Only the count and any aggregations of the results are retrieved up-front.
+        :param prefetch: number of upcoming pages of results to fetch in the background while iterating through
+        the results, defaults to `0` (each page is only fetched once the previous page has been handled).
+        For a `bulk` search, only the next page can be fetched ahead, as each page depends on the one before it.
+        Not applicable when streaming.
         :raises InvalidRequestError:
 
             - if bulk search is enabled (`bulk=True`) and any
@@ -191,13 +224,33 @@ class AssetClient:
         :returns: the results of the search
         """
         endpoint, request_obj = Search.prepare_request(criteria, bulk)
+        if stream:
+            raw_json = self._client._call_api(
+                endpoint,
+                request_obj=Search.prepare_count_request(request_obj),
+            )
+            response = Search.process_response(raw_json, criteria)
+            # Applies any timestamp-based sorting to the criteria up-front,
+            # as there is no first page of results to re-fetch
+            Search._check_for_bulk_search(criteria, response["count"], bulk)
+            return IndexSearchResults(
+                client=self._client,
+                criteria=criteria,
+                start=criteria.dsl.from_,
+                size=criteria.dsl.size,
+                count=response["count"],
+                assets=[],
+                aggregations=response["aggregations"],
+                bulk=bulk,
+                stream=True,
+            )
         raw_json = self._client._call_api(
             endpoint,
             request_obj=request_obj,
         )
         response = Search.process_response(raw_json, criteria)
         if Search._check_for_bulk_search(criteria, response["count"], bulk):
-            return self.search(criteria)
+            return self.search(criteria, prefetch=prefetch)
         return IndexSearchResults(
             client=self._client,
             criteria=criteria,
@@ -207,7 +260,86 @@ class AssetClient:
             assets=response["assets"],
             aggregations=response["aggregations"],
             bulk=bulk,
+            prefetch=prefetch,
+        )
+
+    def search_parallel(
+        self, criteria: IndexSearchRequest, partitions: int = 4, bulk=False
+    ) -> Generator[Asset, None, None]:
+        """
+        Search for assets using the provided criteria, by splitting the search into
+        a number of disjoint partitions (by the creation time of the assets) that
+        are each run concurrently. Every asset that matches the criteria is
+        returned exactly once, though the results of the partitions are interleaved
+        (so any sorting in the criteria only applies within each partition).
+
+        :param criteria: detailing the search query, parameters, and so on to run
+        :param partitions: maximum number of partitions to split the search into
+        (and run concurrently), defaults to `4`
+        :param bulk: whether to run each partition as a `bulk` search, defaults to `False`
+        :raises InvalidRequestError: if bulk search is enabled (`bulk=True`)
+        and any user-specified sorting options are found in the search request
+        :raises AtlanError: on any API communication issue
+        :returns: a generator of the assets that match the criteria
+        """
+        raw_json = self._client._call_api(
+            INDEX_SEARCH, request_obj=ParallelSearch.prepare_bounds_request(criteria)
+        )
+        requests = ParallelSearch.prepare_partition_requests(
+            criteria, raw_json, partitions
+        )
+        return self._iter_partitions(requests, bulk)
+
+    def _iter_partitions(
+        self, requests: List[IndexSearchRequest], bulk: bool
+    ) -> Generator[Asset, None, None]:
+        if not requests:
+            return
+        # Bound the assets held in memory, in case the caller
+        # handles them more slowly than they are retrieved
+        results: Queue = Queue(maxsize=len(requests) * 2 * requests[0].dsl.size)
+        stopped = Event()
+        finished = object()
+
+        def put(item) -> bool:
+            while not stopped.is_set():
+                try:
+                    results.put(item, timeout=0.1)
+                    return True
+                except Full:
+                    continue
+            return False
+
+        def run(request: IndexSearchRequest):
+            try:
+                for asset in self.search(request, bulk=bulk):
+                    if not put(asset):
+                        return
+            except Exception as err:
+                put(err)
+            finally:
+                put(finished)
+
+        executor = ThreadPoolExecutor(
+            max_workers=len(requests), thread_name_prefix="pyatlan-partition"
         )
+        try:
+            for request in requests:
+                # Run in a copy of the current context, so that context-specific
+                # settings (like disabled response translation) also apply
+                executor.submit(copy_context().run, run, request)
+            remaining = len(requests)
+            while remaining:
+                item = results.get()
+                if item is finished:
+                    remaining -= 1
+                elif isinstance(item, Exception):
+                    raise item
+                else:
+                    yield item
+        finally:
+            stopped.set()
+            executor.shutdown(wait=False)
 
     # TODO: Try adding @validate_arguments to this method once
     # the issue below is fixed or when we switch to pydantic v2
@@ -1831,8 +1963,6 @@ class SearchResults(ABC, Iterable):
         self._size = size
         self._assets = assets
         self._processed_guids: Set[str] = set()
-        self._first_record_creation_time = -2
-        self._last_record_creation_time = -2
 
     def current_page(self) -> List[Asset]:
         """
@@ -1871,6 +2001,15 @@ class SearchResults(ABC, Iterable):
             self._endpoint,
             request_obj=self._criteria,
         )
+        return self._process_page_json(raw_json, is_bulk_search)
+
+    def _process_page_json(self, raw_json, is_bulk_search: bool = False):
+        """
+        Processes the raw JSON of a page of results into the current page.
+        :param raw_json: JSON of the page of results, as-is
+        :param is_bulk_search: whether the results were retrieved for a bulk search.
+        :returns: JSON for the page of results, as-is (or None if it has no results)
+        """
         if "entities" not in raw_json:
             self._assets = []
             return
@@ -1878,7 +2017,6 @@ class SearchResults(ABC, Iterable):
             self._process_entities(raw_json["entities"])
             if is_bulk_search:
                 self._filter_processed_assets()
-                self._update_first_last_record_creation_times()
             return raw_json
 
         except ValidationError as err:
@@ -1887,26 +2025,11 @@ class SearchResults(ABC, Iterable):
             ) from err
 
     def _process_entities(self, entities):
+        plan = self._criteria.custom_metadata_plan
         for entity in entities:
-            unflatten_custom_metadata_for_entity(
-                entity=entity, attributes=self._criteria.attributes
-            )
+            plan.unflatten_for_entity(entity)
         self._assets = parse_obj_as(List[Asset], entities)
 
-    def _update_first_last_record_creation_times(self):
-        self._first_record_creation_time = self._last_record_creation_time = -2
-
-        if not isinstance(self._assets, list) or len(self._assets) <= 1:
-            return
-
-        first_asset, last_asset = self._assets[0], self._assets[-1]
-
-        if first_asset:
-            self._first_record_creation_time = first_asset.create_time
-
-        if last_asset:
-            self._last_record_creation_time = last_asset.create_time
-
     def _filter_processed_assets(self):
         self._assets = [
             asset
@@ -1947,6 +2070,8 @@ class IndexSearchResults(SearchResults, Iterable):
         assets: List[Asset],
         aggregations: Optional[Aggregations],
         bulk: bool = False,
+        stream: bool = False,
+        prefetch: int = 0,
     ):
         super().__init__(
             client,
@@ -1960,6 +2085,10 @@ class IndexSearchResults(SearchResults, Iterable):
         self._approximate_count = count
         self._aggregations = aggregations
         self._bulk = bulk
+        self._stream = stream
+        self._paging_timestamp: Optional[int] = None
+        self._streamed_page: List[Tuple[str, Optional[int]]] = []
+        self._prefetch = prefetch
 
     @property
     def aggregations(self) -> Optional[Aggregations]:
@@ -1973,9 +2102,9 @@ class IndexSearchResults(SearchResults, Iterable):
                     continue
                 rewritten_filters.append(filter_)
 
-        if self._first_record_creation_time != self._last_record_creation_time:
+        if isinstance(self._paging_timestamp, int) and self._paging_timestamp > 0:
             rewritten_filters.append(
-                self.get_paging_timestamp_query(self._last_record_creation_time)
+                self.get_paging_timestamp_query(self._paging_timestamp)
             )
             if isinstance(query, Bool):
                 rewritten_query = Bool(
@@ -1991,23 +2120,35 @@ class IndexSearchResults(SearchResults, Iterable):
                 # in the DSL, append it to the Bool `filter`.
                 rewritten_filters.append(query)
                 rewritten_query = Bool(filter=rewritten_filters)
-            self._criteria.dsl.from_ = 0  # type: ignore[attr-defined]
+            # Results are sorted by creation time and then by GUID (which the DSL
+            # always includes), so skip past the assets already processed at the
+            # latest creation time rather than re-fetching them, even when they
+            # span more than a whole page of results
+            self._criteria.dsl.from_ = len(self._processed_guids)  # type: ignore[attr-defined]
             self._criteria.dsl.query = rewritten_query  # type: ignore[attr-defined]
         else:
-            # Ensure that when switching to offset-based paging, if the first and last record timestamps are the same,
-            # we do not include a created timestamp filter (ie: Range(field='__timestamp', gte=VALUE)) in the query.
-            # Instead, ensure the search runs with only SortItem(field='__timestamp', order=<SortOrder.ASCENDING>).
-            # Failing to do so can lead to incomplete results (less than the approximate count) when running the search
-            # with a small page size.
+            # Without any creation time to page from, ensure the search runs
+            # with no created timestamp filter (ie: Range(field='__timestamp', gte=VALUE))
+            # and falls back to offset-based paging.
             if isinstance(query, Bool):
                 for filter_ in query.filter:
                     if self.is_paging_timestamp_query(filter_):
                         query.filter.remove(filter_)
 
-            # Always ensure that the offset is set to the length of the processed assets
-            # instead of the default (start + size), as the default may skip some assets
-            # and result in incomplete results (less than the approximate count)
-            self._criteria.dsl.from_ = len(self._processed_guids)  # type: ignore[attr-defined]
+    def _update_processed_window(self, processed: Iterable[Tuple[str, Optional[int]]]):
+        """
+        Tracks the assets that have been processed through timestamp-based paging.
+        As results are sorted by creation time, only the assets that share the latest
+        creation time can be returned again by the request for the next page, so only
+        their GUIDs are retained (rather than those of every asset processed so far).
+
+        :param processed: GUID and creation time of each processed asset, in order
+        """
+        for guid, create_time in processed:
+            if create_time != self._paging_timestamp:
+                self._paging_timestamp = create_time
+                self._processed_guids = set()
+            self._processed_guids.add(guid)
 
     def next_page(self, start=None, size=None) -> bool:
         """
@@ -2027,8 +2168,10 @@ class IndexSearchResults(SearchResults, Iterable):
             # in a previous page of results.
             # If it has,then exclude it from the current results;
             # otherwise, we may encounter duplicate asset records.
-            self._processed_guids.update(
-                asset.guid for asset in self._assets if asset is not None
+            self._update_processed_window(
+                (asset.guid, asset.create_time)
+                for asset in self._assets
+                if asset is not None
             )
         return self._get_next_page() if self._assets else False
 
@@ -2038,19 +2181,205 @@ class IndexSearchResults(SearchResults, Iterable):
 
         :returns: True if the next page of results was fetched, False if there was no next page
         """
-        query = self._criteria.dsl.query
-        self._criteria.dsl.size = self._size
-        self._criteria.dsl.from_ = self._start
+        is_bulk_search = self._prepare_next_page_request()
+        if raw_json := super()._get_next_page_json(is_bulk_search):
+            self._count = raw_json.get("approximateCount", 0)
+            return True
+        return False
+
+    def _prepare_next_page_request(self) -> bool:
+        """
+        Updates the search criteria to request the next page of results.
+
+        :returns: True if the next page is to be retrieved through a bulk search
+        """
+        query = self._criteria.dsl.query  # type: ignore[attr-defined]
+        self._criteria.dsl.size = self._size  # type: ignore[attr-defined]
+        self._criteria.dsl.from_ = self._start  # type: ignore[attr-defined]
         is_bulk_search = (
             self._bulk or self._approximate_count > self._MASS_EXTRACT_THRESHOLD
         )
 
         if is_bulk_search:
             self._prepare_query_for_timestamp_paging(query)
-        if raw_json := super()._get_next_page_json(is_bulk_search):
-            self._count = raw_json.get("approximateCount", 0)
-            return True
-        return False
+        return is_bulk_search
+
+    def _stream_entities(self) -> Generator[Dict[str, Any], None, None]:
+        """
+        Streams the raw JSON of each entity on the page of results for the current
+        search criteria, as soon as it has been received.
+
+        :returns: an iterable form of the raw JSON of each entity on the page
+        """
+        parser = JsonArrayStreamParser("entities")
+        try:
+            with self._client._stream_api(
+                self._endpoint, request_obj=self._criteria
+            ) as chunks:
+                for chunk in chunks:
+                    yield from parser.feed(chunk)
+                yield from parser.close()
+        except JSONDecodeError as err:
+            raise ErrorCode.JSON_ERROR.exception_with_parameters(
+                err.doc, 200, str(err)
+            ) from err
+        if "approximateCount" in parser.fields:
+            self._count = parser.fields["approximateCount"]
+
+    def _stream_page(self, is_bulk_search: bool) -> Generator[Asset, None, None]:
+        """
+        Streams the page of results for the current search criteria, building and
+        yielding each asset as soon as its entity has been received.
+
+        :param is_bulk_search: whether the page is being retrieved for a bulk search
+        :returns: an iterable form of each result on the page
+        """
+        # Local import to avoid circular dependency
+        from pyatlan.client.atlan import response_translation_var
+
+        translate = response_translation_var.get()
+        self._streamed_page = []
+        for entity in self._stream_entities():
+            translated = AtlanResponse(
+                raw_json=entity,
+                client=self._client,  # type: ignore[arg-type]
+                translate=translate,
+            ).to_dict()
+            asset = Search.process_streamed_entity(translated, self._criteria)
+            if is_bulk_search and asset.guid in self._processed_guids:
+                continue
+            # Streamed assets are not retained once they are yielded
+            self._streamed_page.append((asset.guid, asset.create_time))
+            yield asset
+
+    def _iter_streamed(self) -> Generator[Asset, None, None]:
+        # The first page is retrieved in the same way as a non-streamed search
+        is_bulk_search = False
+        while True:
+            yield from self._stream_page(is_bulk_search)
+            # Mirror next_page(), using only the GUIDs (and creation times)
+            # of the streamed page
+            self._start = self._start + self._size
+            if not self._streamed_page:
+                break
+            if self._bulk or self._approximate_count > self._MASS_EXTRACT_THRESHOLD:
+                self._update_processed_window(self._streamed_page)
+            is_bulk_search = self._prepare_next_page_request()
+
+    def _submit_page_request(
+        self, executor: ThreadPoolExecutor, request: SearchRequest
+    ) -> Future:
+        # Run in a copy of the current context, so that context-specific settings
+        # (like disabled response translation) also apply to prefetched pages
+        return executor.submit(
+            copy_context().run, self._client._call_api, self._endpoint, None, request
+        )
+
+    def _iter_prefetched(self) -> Generator[Asset, None, None]:
+        executor = ThreadPoolExecutor(
+            max_workers=self._prefetch, thread_name_prefix="pyatlan-prefetch"
+        )
+        pages: Deque[Future] = deque()
+        try:
+            if self._bulk or self._approximate_count > self._MASS_EXTRACT_THRESHOLD:
+                yield from self._iter_pipelined(executor, pages)
+            else:
+                yield from self._iter_offset_prefetched(executor, pages)
+        finally:
+            for page in pages:
+                page.cancel()
+            executor.shutdown(wait=False)
+
+    def _iter_offset_prefetched(
+        self, executor: ThreadPoolExecutor, pages: Deque[Future]
+    ) -> Generator[Asset, None, None]:
+        # Each page of offset-based paging is independent of the others,
+        # so up to `prefetch` upcoming pages can be requested at any time
+        requested_from = self._start
+        while True:
+            # Always request the next page (as next_page() would), but only
+            # request pages beyond it within the (approximate) count of results
+            while (
+                self._assets
+                and len(pages) < self._prefetch
+                and (not pages or requested_from + self._size < self._count)
+            ):
+                requested_from += self._size
+                request = self._criteria.copy(
+                    update={
+                        "dsl": self._criteria.dsl.copy(  # type: ignore[attr-defined]
+                            update={"from_": requested_from, "size": self._size}
+                        )
+                    }
+                )
+                pages.append(self._submit_page_request(executor, request))
+            yield from self.current_page()
+            if not self._assets:
+                break
+            self._start = self._start + self._size
+            self._criteria.dsl.from_ = self._start  # type: ignore[attr-defined]
+            self._criteria.dsl.size = self._size  # type: ignore[attr-defined]
+            if raw_json := self._process_page_json(pages.popleft().result()):
+                self._count = raw_json.get("approximateCount", 0)
+
+    def _iter_pipelined(
+        self, executor: ThreadPoolExecutor, pages: Deque[Future]
+    ) -> Generator[Asset, None, None]:
+        # Each page of timestamp-based paging depends on the page before it, so
+        # (only) the next page is requested as soon as the previous page's raw
+        # JSON has been received, while that page is parsed and then handled
+        page = [
+            (asset.guid, asset.create_time)
+            for asset in self._assets
+            if asset is not None
+        ]
+        raw_json: Dict[str, Any] = {}
+        entities: Optional[List[Dict[str, Any]]] = None
+        while True:
+            if page:
+                # Mirror next_page(), using only the GUIDs (and creation times)
+                # of the page
+                self._start = self._start + self._size
+                self._update_processed_window(page)
+                self._prepare_next_page_request()
+                pages.append(self._submit_page_request(executor, self._criteria))
+            if entities is not None:
+                try:
+                    self._process_entities(entities)
+                except ValidationError as err:
+                    raise ErrorCode.JSON_ERROR.exception_with_parameters(
+                        raw_json, 200, str(err)
+                    ) from err
+            yield from self.current_page()
+            if not pages:
+                break
+            raw_json = pages.popleft().result() or {}
+            # Equivalent of _filter_processed_assets(), on the raw JSON
+            entities = [
+                entity
+                for entity in raw_json.get("entities") or []
+                if entity.get("guid") not in self._processed_guids
+            ]
+            page = [(entity["guid"], entity.get("createTime")) for entity in entities]
+            if "entities" in raw_json:
+                self._count = raw_json.get("approximateCount", 0)
+
+    def __iter__(self) -> Generator[Asset, None, None]:
+        """
+        Iterates through the results, lazily-fetching each next page until there
+        are no more results. When streaming, each page is parsed incrementally as
+        it is received, and each asset is yielded as soon as it has been built.
+        When prefetching, upcoming pages are fetched in the background while the
+        current page is being handled.
+
+        :returns: an iterable form of each result, across all pages
+        """
+        if self._stream:
+            yield from self._iter_streamed()
+        elif self._prefetch:
+            yield from self._iter_prefetched()
+        else:
+            yield from super().__iter__()
 
     @property
     def count(self) -> int:
@@ -2180,6 +2509,148 @@ class FailedBatch:
         self.failure_reason = failure_reason
 
 
+class AdaptiveBatchSizer:
+    """
+    Internal class to choose the number of assets to send in each batch, by
+    adapting it to the observed latency and outcome of each request: the number
+    grows additively while requests complete within the target latency, and is
+    halved whenever a request is slower, throttled (429), too large (413) or
+    fails on the server (5xx), including any such responses that were retried.
+    Every batch is also limited to a maximum size in bytes, estimated from the
+    size per asset of the request bodies actually sent for previous batches.
+    """
+
+    def __init__(self, max_size: int, max_bytes: int, target_latency: float):
+        self.max_size = max_size
+        self.max_bytes = max_bytes
+        self.target_latency = target_latency
+        self.size = max(1, max_size // 4)
+        self.sizes: List[int] = []
+        self._bytes_per_asset = 0.0
+        self._lock = Lock()
+
+    def is_full(self, count: int) -> bool:
+        """
+        Indicates whether a batch has reached the size to send it.
+
+        :param count: number of assets in the batch
+        :returns: True if the batch should be sent, otherwise False
+        """
+        return count >= self.size or count * self._bytes_per_asset >= self.max_bytes
+
+    @contextmanager
+    def measure(self, count: int) -> Generator[None, None, None]:
+        """
+        Measures the request that saves a batch, adapting the size of subsequent batches to it.
+
+        :param count: number of assets in the batch
+        """
+        started = time.perf_counter()
+        with record_retried_status_codes() as status_codes:
+            with record_request_body_sizes() as body_sizes:
+                try:
+                    yield
+                except AtlanError as err:
+                    status_codes.append(err.error_code.http_error_code)
+                    raise
+                finally:
+                    self._adapt(
+                        count, time.perf_counter() - started, status_codes, body_sizes
+                    )
+
+    def _adapt(
+        self,
+        count: int,
+        latency: float,
+        status_codes: List[int],
+        body_sizes: List[int],
+    ):
+        back_off = latency > self.target_latency or any(
+            code in (413, 429) or code >= 500 for code in status_codes
+        )
+        # Batches may be sent concurrently (by a ParallelBatch)
+        with self._lock:
+            self.sizes.append(count)
+            if body_sizes:
+                self._bytes_per_asset = max(body_sizes) / count
+            if back_off:
+                self.size = max(1, min(self.size, count) // 2)
+            else:
+                self.size = min(self.max_size, self.size + max(1, self.max_size // 10))
+
+
+class AssetIdentityIndex:
+    """
+    Internal class to hold the identities (type and qualifiedName) of existing assets
+    in memory, so that assets can be matched against them without searching.
+    Identities are held as a set of keys, with the actual qualifiedName of an asset only
+    retained where it differs from its key (when matching case-insensitively).
+    """
+
+    def __init__(
+        self,
+        case_insensitive: bool = False,
+        connection_qualified_name: Optional[str] = None,
+    ):
+        """
+        :param case_insensitive: whether to match qualifiedNames ignoring case
+        :param connection_qualified_name: qualifiedName of the connection to which the index
+            is limited (every asset within it is expected to be added), or None for no limit
+        """
+        self._case_insensitive = case_insensitive
+        self._prefix = (
+            self._normalize(f"{connection_qualified_name}/")
+            if connection_qualified_name
+            else None
+        )
+        self._keys: Set[str] = set()
+        self._actual_qualified_names: Dict[str, str] = {}
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def _normalize(self, qualified_name: str) -> str:
+        return qualified_name.lower() if self._case_insensitive else qualified_name
+
+    def covers(self, qualified_name: str) -> bool:
+        """
+        Indicates whether an asset would be found in the index, if it exists.
+
+        :param qualified_name: of the asset
+        :returns: True if the asset is within the connection the index is limited to
+        """
+        return self._prefix is None or self._normalize(qualified_name).startswith(
+            self._prefix
+        )
+
+    def add(self, type_name: str, qualified_name: str):
+        """
+        Add the identity of an existing asset to the index.
+
+        :param type_name: of the existing asset
+        :param qualified_name: (actual) qualifiedName of the existing asset
+        """
+        normalized = self._normalize(qualified_name)
+        key = f"{type_name}::{normalized}"
+        self._keys.add(key)
+        if normalized != qualified_name:
+            self._actual_qualified_names[key] = qualified_name
+
+    def find(self, type_name: str, qualified_name: str) -> Optional[str]:
+        """
+        Find an existing asset in the index.
+
+        :param type_name: of the asset to find
+        :param qualified_name: of the asset to find
+        :returns: the actual qualifiedName of the existing asset, or None if it does not exist
+        """
+        normalized = self._normalize(qualified_name)
+        key = f"{type_name}::{normalized}"
+        if key not in self._keys:
+            return None
+        return self._actual_qualified_names.get(key, normalized)
+
+
 class Batch:
     """Utility class for managing bulk updates in batches."""
 
@@ -2188,6 +2659,12 @@ class Batch:
         View.__name__,
         MaterialisedView.__name__,
     }
+    # Order in which to match table-level assets of a different type
+    _TABLE_LEVEL_FALLBACKS = (
+        Table.__name__,
+        View.__name__,
+        MaterialisedView.__name__,
+    )
 
     def __init__(
         self,
@@ -2201,6 +2678,10 @@ class Batch:
         case_insensitive: bool = False,
         table_view_agnostic: bool = False,
         creation_handling: AssetCreationHandling = AssetCreationHandling.FULL,
+        adaptive: bool = False,
+        max_bytes: int = 4 * 1024 * 1024,
+        target_latency: float = 10.0,
+        connection_qualified_name: Optional[str] = None,
     ):
         """
         Create a new batch of assets to be bulk-saved.
@@ -2226,6 +2707,16 @@ class Batch:
             view if not found as a table, and vice versa)
         :param creation_handling: when allowing assets to be created,
             how to handle those creations (full assets or partial assets).
+        :param adaptive: whether to adapt the number of assets sent in each batch (up to `max_size`)
+            to the latency and outcome of each request (True), or always send `max_size` assets (False)
+        :param max_bytes: when adaptive, the maximum size (in bytes) of the request for each batch,
+            as estimated from the size of the requests sent for previous batches
+        :param target_latency: when adaptive, the number of seconds within which each request
+            should complete (the batch size is reduced for any request that takes longer)
+        :param connection_qualified_name: qualifiedName of the connection containing the assets to
+            be saved, when they must be matched against existing assets (for `update_only`, partial
+            creation or `table_view_agnostic`). Every asset in the connection is then looked up once
+            (in bulk) up front, instead of searching for the assets in each batch as it is flushed
         """
         self._client: AtlanClient = client
         self._max_size: int = max_size
@@ -2253,6 +2744,20 @@ class Batch:
         self._restored: List[Asset] = []
         self._skipped: List[Asset] = []
         self._resolved_qualified_names: Dict[str, str] = {}
+        self._sizer: Optional[AdaptiveBatchSizer] = (
+            AdaptiveBatchSizer(max_size, max_bytes, target_latency)
+            if adaptive
+            else None
+        )
+        # Only index the existing assets if the assets in the batch will be matched against them
+        self._connection_qualified_name: Optional[str] = (
+            connection_qualified_name
+            if update_only
+            or creation_handling != AssetCreationHandling.FULL
+            or table_view_agnostic
+            else None
+        )
+        self._identities: Optional[AssetIdentityIndex] = None
 
     @property
     def failures(self) -> List[FailedBatch]:
@@ -2309,6 +2814,15 @@ class Batch:
         """
         return self._skipped
 
+    @property
+    def batch_sizes(self) -> List[int]:
+        """Get the number of assets sent in each request, when adapting the size of each batch
+
+        :returns: the number of assets sent in each request (in the order they completed),
+        or an empty list if the batch sizes are not adaptive
+        """
+        return self._sizer.sizes if self._sizer else []
+
     @property
     def num_created(self) -> int:
         """
@@ -2352,41 +2866,105 @@ class Batch:
         :param single: the asset to add to a batch
         :returns: an AssetMutationResponse containing the results of the save or None if the batch is still queued.
         """
+        if self._identities is None and self._connection_qualified_name:
+            self._identities = self._index_identities(self._connection_qualified_name)
         self._batch.append(single)
         return self._process()
 
+    def _index_identities(self, connection_qualified_name: str) -> AssetIdentityIndex:
+        """
+        Look up every existing asset in the connection (in bulk).
+
+        :param connection_qualified_name: of the connection containing the assets
+        :returns: an index of the existing assets in the connection
+        """
+        from pyatlan.model.fluent_search import FluentSearch
+
+        identities = AssetIdentityIndex(
+            case_insensitive=self._case_insensitive,
+            connection_qualified_name=connection_qualified_name,
+        )
+        results = (
+            FluentSearch()
+            .select(include_archived=True)
+            .where(
+                Asset.CONNECTION_QUALIFIED_NAME.eq(
+                    connection_qualified_name, case_insensitive=self._case_insensitive
+                )
+            )
+            .page_size(
+                max(self._max_size * 2, DSL.__fields__.get("size").default)  # type: ignore[union-attr]
+            )
+            .execute(client=self._client, bulk=True)  # type: ignore[arg-type]
+        )
+        for asset in results:
+            identities.add(asset.type_name, asset.qualified_name or "")
+        return identities
+
     def _process(self) -> Optional[AssetMutationResponse]:
         """If the number of entities we have queued up is equal to the batch size, process them and reset our queue;
         otherwise do nothing.
 
         :returns: an AssetMutationResponse containing the results of the save or None if the batch is still queued.
         """
-        return self.flush() if len(self._batch) == self._max_size else None
+        return self.flush() if self._is_full() else None
+
+    def _is_full(self) -> bool:
+        if self._sizer:
+            return self._sizer.is_full(len(self._batch))
+        return len(self._batch) == self._max_size
 
     def flush(self) -> Optional[AssetMutationResponse]:
         """Flush any remaining assets in the batch.
 
         :returns: n AssetMutationResponse containing the results of the saving any assets that were flushed
         """
+        response: Optional[AssetMutationResponse] = None
+        if self._batch:
+            revised, skipped = self._revise(self._batch)
+            self._track_skipped(skipped)
+            if revised:
+                try:
+                    response = self._save(revised)
+                except AtlanError as er:
+                    self._capture_failure(self._batch, er)
+                response and self._track_response(response, revised)
+            # Reset the batch even if every asset in it was skipped
+            self._batch = []
+        return response
+
+    def _revise(self, batch: List[Asset]) -> Tuple[List[Asset], List[Asset]]:
+        """
+        Revise the assets in a batch ahead of saving them, by looking up any
+        that must already exist (or may need to be matched more loosely).
+
+        :param batch: assets to be saved
+        :returns: the (revised) assets to save, and the assets to skip instead
+        """
         from pyatlan.model.fluent_search import FluentSearch
 
         revised: list = []
-        response: Optional[AssetMutationResponse] = None
-        if self._batch:
-            fuzzy_match: bool = False
-            if self._table_view_agnostic:
-                types_in_batch = {asset.type_name for asset in self._batch}
-                fuzzy_match = any(
-                    type_name in types_in_batch
-                    for type_name in self._TABLE_LEVEL_ASSETS
-                )
-            if (
-                self._update_only
-                or self._creation_handling != AssetCreationHandling.FULL
-                or fuzzy_match
-            ):
-                found: Dict[str, str] = {}
-                qualified_names = [asset.qualified_name or "" for asset in self._batch]
+        skipped: List[Asset] = []
+        fuzzy_match: bool = False
+        if self._table_view_agnostic:
+            types_in_batch = {asset.type_name for asset in batch}
+            fuzzy_match = any(
+                type_name in types_in_batch for type_name in self._TABLE_LEVEL_ASSETS
+            )
+        if (
+            self._update_only
+            or self._creation_handling != AssetCreationHandling.FULL
+            or fuzzy_match
+        ):
+            found = AssetIdentityIndex(case_insensitive=self._case_insensitive)
+            identities = self._identities
+            qualified_names = [
+                asset.qualified_name or ""
+                for asset in batch
+                if not (identities and identities.covers(asset.qualified_name or ""))
+            ]
+            # Only search for assets that are not already indexed
+            if qualified_names:
                 if self._case_insensitive:
                     search = FluentSearch().select(include_archived=True).min_somes(1)
                     for qn in qualified_names:
@@ -2406,72 +2984,41 @@ class Batch:
                 ).execute(client=self._client)  # type: ignore[arg-type]
 
                 for asset in results:
-                    asset_id = AssetIdentity(
-                        type_name=asset.type_name,
-                        qualified_name=asset.qualified_name or "",
-                        case_insensitive=self._case_insensitive,
-                    )
-                    found[str(asset_id)] = asset.qualified_name or ""
-
-                for asset in self._batch:
-                    asset_id = AssetIdentity(
-                        type_name=asset.type_name,
-                        qualified_name=asset.qualified_name or "",
-                        case_insensitive=self._case_insensitive,
+                    found.add(asset.type_name, asset.qualified_name or "")
+
+            for asset in batch:
+                qualified_name = asset.qualified_name or ""
+                existing = (
+                    identities
+                    if identities and identities.covers(qualified_name)
+                    else found
+                )
+                actual_qn = existing.find(asset.type_name, qualified_name)
+                # If found, with a type match, go ahead and update it
+                if actual_qn is not None:
+                    # Replace the actual qualifiedName on the asset before adding it to the batch
+                    # in case it matched case-insensitively, we need the proper case-sensitive name we
+                    # found to ensure it's an update, not a create)
+                    self.add_fuzzy_matched(
+                        asset=asset, actual_qn=actual_qn, revised=revised
                     )
-                    # If found, with a type match, go ahead and update it
-                    if str(asset_id) in found:
-                        # Replace the actual qualifiedName on the asset before adding it to the batch
-                        # in case it matched case-insensitively, we need the proper case-sensitive name we
-                        # found to ensure it's an update, not a create)
-                        self.add_fuzzy_matched(
-                            asset=asset,
-                            actual_qn=found.get(str(asset_id), ""),
-                            revised=revised,
-                        )
-                    elif (
-                        self._table_view_agnostic
-                        and asset.type_name in self._TABLE_LEVEL_ASSETS
-                    ):
-                        # If found as a different (but acceptable) type, update that instead
-                        as_table = AssetIdentity(
-                            type_name=Table.__name__,
-                            qualified_name=asset.qualified_name or "",
-                            case_insensitive=self._case_insensitive,
-                        )
-                        as_view = AssetIdentity(
-                            type_name=View.__name__,
-                            qualified_name=asset.qualified_name or "",
-                            case_insensitive=self._case_insensitive,
-                        )
-                        as_materialized_view = AssetIdentity(
-                            type_name=MaterialisedView.__name__,
-                            qualified_name=asset.qualified_name or "",
-                            case_insensitive=self._case_insensitive,
-                        )
-
-                        if str(as_table) in found:
-                            self.add_fuzzy_matched(
-                                asset=asset,
-                                actual_qn=found.get(str(as_table), ""),
-                                revised=revised,
-                                type_name=Table.__name__,
-                            )
-                        elif str(as_view) in found:
-                            self.add_fuzzy_matched(
-                                asset=asset,
-                                actual_qn=found.get(str(as_view), ""),
-                                revised=revised,
-                                type_name=View.__name__,
-                            )
-                        elif str(as_materialized_view) in found:
+                elif (
+                    self._table_view_agnostic
+                    and asset.type_name in self._TABLE_LEVEL_ASSETS
+                ):
+                    # If found as a different (but acceptable) type, update that instead
+                    for type_name in self._TABLE_LEVEL_FALLBACKS:
+                        actual_qn = existing.find(type_name, qualified_name)
+                        if actual_qn is not None:
                             self.add_fuzzy_matched(
                                 asset=asset,
-                                actual_qn=found.get(str(as_materialized_view), ""),
+                                actual_qn=actual_qn,
                                 revised=revised,
-                                type_name=MaterialisedView.__name__,
+                                type_name=type_name,
                             )
-                        elif self._creation_handling == AssetCreationHandling.PARTIAL:
+                            break
+                    else:
+                        if self._creation_handling == AssetCreationHandling.PARTIAL:
                             # Still create it (partial), if not found
                             # and partial asset creation is allowed
                             self.add_partial_asset(asset, revised)
@@ -2482,53 +3029,54 @@ class Batch:
                         else:
                             # Otherwise, if it still does not match any
                             # fallback and cannot be created, skip it
-                            self.__track(self._skipped, asset)
-                            self._num_skipped += 1
-                    elif self._creation_handling == AssetCreationHandling.PARTIAL:
-                        # Append `is_partial=True` onto the asset
-                        # before adding it to the batch, to ensure only
-                        # a partial (and not a full) asset is created
-                        self.add_partial_asset(asset, revised)
-                    else:
-                        self.__track(self._skipped, asset)
-                        self._num_skipped += 1
-            else:
-                # Otherwise create it (full)
-                revised = self._batch.copy()
+                            skipped.append(asset)
+                elif self._creation_handling == AssetCreationHandling.PARTIAL:
+                    # Append `is_partial=True` onto the asset
+                    # before adding it to the batch, to ensure only
+                    # a partial (and not a full) asset is created
+                    self.add_partial_asset(asset, revised)
+                else:
+                    skipped.append(asset)
+        else:
+            # Otherwise create it (full)
+            revised = batch.copy()
 
-            if revised:
-                try:
-                    if self._custom_metadata_handling == CustomMetadataHandling.IGNORE:
-                        response = self._client.asset.save(
-                            revised, replace_atlan_tags=self._replace_atlan_tags
-                        )
-                    elif (
-                        self._custom_metadata_handling
-                        == CustomMetadataHandling.OVERWRITE
-                    ):
-                        response = self._client.asset.save_replacing_cm(
-                            revised, replace_atlan_tags=self._replace_atlan_tags
-                        )
-                    elif self._custom_metadata_handling == CustomMetadataHandling.MERGE:
-                        response = self._client.asset.save_merging_cm(
-                            revised, replace_atlan_tags=self._replace_atlan_tags
-                        )
-                    else:
-                        raise ErrorCode.INVALID_PARAMETER_TYPE.exception_with_parameters(
-                            self._custom_metadata_handling,
-                            "CustomMetadataHandling.IGNORE, CustomMetadataHandling.OVERWRITE "
-                            "or CustomMetadataHandling.MERGE",
-                        )
-                except AtlanError as er:
-                    if self._capture_failures:
-                        self._failures.append(
-                            FailedBatch(failed_assets=self._batch, failure_reason=er)
-                        )
-                    else:
-                        raise er
-                self._batch = []
-                response and self._track_response(response, revised)
-        return response
+        return revised, skipped
+
+    def _save(self, revised: List[Asset]) -> AssetMutationResponse:
+        with self._sizer.measure(len(revised)) if self._sizer else nullcontext():
+            return self._send_revised(revised)
+
+    def _send_revised(self, revised: List[Asset]) -> AssetMutationResponse:
+        if self._custom_metadata_handling == CustomMetadataHandling.IGNORE:
+            return self._client.asset.save(
+                revised, replace_atlan_tags=self._replace_atlan_tags
+            )
+        elif self._custom_metadata_handling == CustomMetadataHandling.OVERWRITE:
+            return self._client.asset.save_replacing_cm(
+                revised, replace_atlan_tags=self._replace_atlan_tags
+            )
+        elif self._custom_metadata_handling == CustomMetadataHandling.MERGE:
+            return self._client.asset.save_merging_cm(
+                revised, replace_atlan_tags=self._replace_atlan_tags
+            )
+        else:
+            raise ErrorCode.INVALID_PARAMETER_TYPE.exception_with_parameters(
+                self._custom_metadata_handling,
+                "CustomMetadataHandling.IGNORE, CustomMetadataHandling.OVERWRITE "
+                "or CustomMetadataHandling.MERGE",
+            )
+
+    def _track_skipped(self, skipped: List[Asset]):
+        for asset in skipped:
+            self.__track(self._skipped, asset)
+            self._num_skipped += 1
+
+    def _capture_failure(self, batch: List[Asset], er: AtlanError):
+        if self._capture_failures:
+            self._failures.append(FailedBatch(failed_assets=batch, failure_reason=er))
+        else:
+            raise er
 
     def _track_response(self, response: AssetMutationResponse, sent: list[Asset]):
         if response:
@@ -2560,6 +3108,12 @@ class Batch:
 
             if response.guid_assignments:
                 self._resolved_guids.update(response.guid_assignments)
+            if self._identities is not None and response.mutated_entities:
+                # Keep the index up-to-date with any assets that now exist
+                for asset in response.mutated_entities.CREATE or []:
+                    qualified_name = asset.qualified_name or ""
+                    if self._identities.covers(qualified_name):
+                        self._identities.add(asset.type_name, qualified_name)
             if sent:
                 created_guids, updated_guids = set(), set()
                 partial_guids = {asset.guid for asset in partial_assets}
@@ -2665,6 +3219,167 @@ class Batch:
         revised.append(asset)
 
 
+class ParallelBatch(Batch):
+    """
+    Utility class for managing bulk updates in batches, where up to a number of
+    batches are flushed concurrently (in the background) while further assets
+    continue to be added.
+    """
+
+    def __init__(
+        self,
+        client: AtlanClient,
+        max_size: int,
+        replace_atlan_tags: bool = False,
+        custom_metadata_handling: CustomMetadataHandling = CustomMetadataHandling.IGNORE,
+        capture_failures: bool = False,
+        update_only: bool = False,
+        track: bool = False,
+        case_insensitive: bool = False,
+        table_view_agnostic: bool = False,
+        creation_handling: AssetCreationHandling = AssetCreationHandling.FULL,
+        adaptive: bool = False,
+        max_bytes: int = 4 * 1024 * 1024,
+        target_latency: float = 10.0,
+        connection_qualified_name: Optional[str] = None,
+        max_in_flight: int = 4,
+    ):
+        """
+        Create a new batch of assets to be bulk-saved, with concurrent flushes.
+
+        :param client: AtlanClient to use
+        :param max_size: maximum size of each batch
+            that should be processed (per API call)
+        :param replace_atlan_tags: if True, all Atlan tags on an existing
+            asset will be overwritten; if False, all Atlan tags will be ignored
+        :param custom_metadata_handling: how to handle custom metadata
+            (ignore it, replace it (wiping out anything pre-existing), or merge it)
+        :param capture_failures: when True, any failed batches will be
+            captured and retained rather than exceptions being raised
+            (for large amounts of processing this could cause memory issues!)
+        :param update_only: whether to allow assets to be created (False)
+            or only allow existing assets to be updated (True)
+        :param track: whether to track the basic information about
+            every asset that is created or updated (True) or only track counts (False)
+        :param case_insensitive: when running with `update_only` as True,
+            whether to consider only exact matches (False) or ignore case (True).
+        :param table_view_agnostic: whether tables and views should be treated interchangeably
+            (an asset in the batch marked as a table will attempt to match a
+            view if not found as a table, and vice versa)
+        :param creation_handling: when allowing assets to be created,
+            how to handle those creations (full assets or partial assets).
+        :param adaptive: whether to adapt the number of assets sent in each batch (up to `max_size`)
+            to the latency and outcome of each request (True), or always send `max_size` assets (False)
+        :param max_bytes: when adaptive, the maximum size (in bytes) of the request for each batch,
+            as estimated from the size of the requests sent for previous batches
+        :param target_latency: when adaptive, the number of seconds within which each request
+            should complete (the batch size is reduced for any request that takes longer)
+        :param connection_qualified_name: qualifiedName of the connection containing the assets to
+            be saved, when they must be matched against existing assets (for `update_only`, partial
+            creation or `table_view_agnostic`). Every asset in the connection is then looked up once
+            (in bulk) up front, instead of searching for the assets in each batch as it is flushed
+        :param max_in_flight: maximum number of batches to flush concurrently. Assets in a batch
+            should not depend on any assets in other batches that may still be in flight (for example,
+            flush a batch of tables before adding their columns).
+        """
+        super().__init__(
+            client=client,
+            max_size=max_size,
+            replace_atlan_tags=replace_atlan_tags,
+            custom_metadata_handling=custom_metadata_handling,
+            capture_failures=capture_failures,
+            update_only=update_only,
+            track=track,
+            case_insensitive=case_insensitive,
+            table_view_agnostic=table_view_agnostic,
+            creation_handling=creation_handling,
+            adaptive=adaptive,
+            max_bytes=max_bytes,
+            target_latency=target_latency,
+            connection_qualified_name=connection_qualified_name,
+        )
+        self._max_in_flight: int = max_in_flight
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._in_flight: Deque[Tuple[List[Asset], Future]] = deque()
+
+    def _process(self) -> Optional[AssetMutationResponse]:
+        """If the number of entities we have queued up is equal to the batch size, start flushing them
+        (in the background) and reset our queue; otherwise do nothing.
+
+        :returns: an AssetMutationResponse containing the results of the earliest batch still in flight,
+        if it had to be waited for (to keep within the maximum in flight), or None otherwise.
+        """
+        return self._submit() if self._is_full() else None
+
+    def flush(self) -> Optional[AssetMutationResponse]:
+        """Flush any remaining assets in the batch, and wait for every batch still in flight.
+
+        :returns: an AssetMutationResponse containing the results of saving the last batch that was flushed
+        """
+        response: Optional[AssetMutationResponse] = None
+        try:
+            if self._batch:
+                response = self._submit()
+            while self._in_flight:
+                response = self._complete(*self._in_flight.popleft())
+        finally:
+            # Even when a batch failed, wait for (and track) every other batch
+            # still in flight, so that none is left running in the background
+            while self._in_flight:
+                try:
+                    self._complete(*self._in_flight.popleft())
+                except Exception:
+                    # Only the first failure is raised
+                    pass
+            if self._executor:
+                self._executor.shutdown()
+                self._executor = None
+        return response
+
+    def _submit(self) -> Optional[AssetMutationResponse]:
+        response: Optional[AssetMutationResponse] = None
+        if len(self._in_flight) >= self._max_in_flight:
+            response = self._complete(*self._in_flight.popleft())
+        if not self._executor:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self._max_in_flight, thread_name_prefix="pyatlan-batch"
+            )
+        batch, self._batch = self._batch, []
+        # Run in a copy of the current context, so that context-specific
+        # settings (like disabled response translation) also apply
+        self._in_flight.append(
+            (batch, self._executor.submit(copy_context().run, self._send, batch))
+        )
+        return response
+
+    def _send(
+        self, batch: List[Asset]
+    ) -> Tuple[
+        List[Asset], List[Asset], Union[AssetMutationResponse, AtlanError, None]
+    ]:
+        # Only the requests are made in the background, so that all tracking
+        # is done by the caller (in the order the batches were added)
+        revised, skipped = self._revise(batch)
+        outcome: Union[AssetMutationResponse, AtlanError, None] = None
+        if revised:
+            try:
+                outcome = self._save(revised)
+            except AtlanError as er:
+                outcome = er
+        return revised, skipped, outcome
+
+    def _complete(
+        self, batch: List[Asset], sent: Future
+    ) -> Optional[AssetMutationResponse]:
+        revised, skipped, outcome = sent.result()
+        self._track_skipped(skipped)
+        if isinstance(outcome, AtlanError):
+            self._capture_failure(batch, outcome)
+            return None
+        outcome and self._track_response(outcome, revised)
+        return outcome
+
+
 class AssetIdentity(AtlanObject):
     """
     Class to uniquely identify an asset by its type and qualifiedName.
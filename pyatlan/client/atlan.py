@@ -4,16 +4,34 @@ from __future__ import annotations
 
 import contextlib
 import copy
+import importlib.util
 import json
 import logging
 import os
+import time
 import uuid
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from contextlib import _GeneratorContextManager
-from contextvars import ContextVar
+from contextvars import ContextVar, copy_context
+from functools import partial
 from http import HTTPStatus
 from importlib.resources import read_text
 from types import SimpleNamespace
-from typing import Any, Dict, Generator, List, Literal, Optional, Set, Type, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generator,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Set,
+    Type,
+    Union,
+    cast,
+)
 from urllib.parse import urljoin
 from warnings import warn
 
@@ -30,6 +48,17 @@ from pydantic.v1 import (
 )
 
 from pyatlan.cache.atlan_tag_cache import AtlanTagCache
+from pyatlan.cache.common import (
+    CacheBackend,
+    CacheWarmup,
+    SharedTypeDefSnapshot,
+    SQLiteCacheBackend,
+    TypeDefSnapshotFile,
+)
+from pyatlan.cache.common.backend import DEFAULT_BACKEND_TTL
+from pyatlan.cache.common.asset_cache_store import DEFAULT_MAX_ENTRIES
+from pyatlan.cache.common.stats import CLIENT_CACHES
+from pyatlan.cache.common.warmup import timed_out, validate_cache_names
 from pyatlan.cache.connection_cache import ConnectionCache
 from pyatlan.cache.custom_metadata_cache import CustomMetadataCache
 from pyatlan.cache.dq_template_config_cache import DQTemplateConfigCache
@@ -42,6 +71,13 @@ from pyatlan.client.admin import AdminClient
 from pyatlan.client.asset import A, AssetClient, IndexSearchResults, LineageListResults
 from pyatlan.client.audit import AuditClient
 from pyatlan.client.common import CONNECTION_RETRY, ImpersonateUser
+from pyatlan.client.common.compression import (
+    DEFAULT_COMPRESSION_THRESHOLD,
+    RequestCompression,
+)
+from pyatlan.client.common.hedging import DEFAULT_HEDGE_BUDGET, HedgingPolicy
+from pyatlan.client.common.rate_limit import RateLimiter
+from pyatlan.client.common.transport import mark_auth_policy_create
 from pyatlan.client.constants import EVENT_STREAM, GET_TOKEN, PARSE_QUERY, UPLOAD_IMAGE
 from pyatlan.client.contract import ContractClient
 from pyatlan.client.credential import CredentialClient
@@ -57,12 +93,20 @@ from pyatlan.client.search_log import SearchLogClient
 from pyatlan.client.sso import SSOClient
 from pyatlan.client.task import TaskClient
 from pyatlan.client.token import TokenClient
-from pyatlan.client.transport import PyatlanSyncTransport  # type: ignore
+from pyatlan.client.transport import (  # type: ignore
+    PyatlanSyncTransport,
+    _record_request_body_size,
+)
 from pyatlan.client.typedef import TypeDefClient
 from pyatlan.client.app import AppClient
 from pyatlan.client.user import UserClient
 from pyatlan.client.workflow import WorkflowClient
-from pyatlan.errors import ERROR_CODE_FOR_HTTP_STATUS, AtlanError, ErrorCode
+from pyatlan.errors import (
+    ERROR_CODE_FOR_HTTP_STATUS,
+    AtlanError,
+    DependencyNotFoundError,
+    ErrorCode,
+)
 from pyatlan.model.api_tokens import ApiToken, ApiTokenResponse
 from pyatlan.model.assets import (
     Asset,
@@ -95,6 +139,11 @@ from pyatlan.utils import (
 )
 
 request_id_var = ContextVar("request_id", default=None)
+# Whether API responses are translated (e.g: Atlan tag hashed IDs into human-readable names)
+# in the current thread / task, see AtlanClient.disable_response_translation()
+response_translation_var: ContextVar[bool] = ContextVar(
+    "response_translation", default=True
+)
 
 
 def get_adapter() -> logging.LoggerAdapter:
@@ -122,7 +171,7 @@ DEFAULT_RETRY = Retry(
 
 VERSION = read_text("pyatlan", "version.txt").strip()
 
-# Connection pool configuration (GOVFOUN-408).
+# Default connection pool configuration (GOVFOUN-408), overridable per client.
 # keepalive_expiry=30s < nginx keepalive_timeout=75s → client retires idle
 # connections before nginx sends FIN, preventing CLOSE_WAIT accumulation.
 # pool timeout=30s → threads raise PoolTimeout instead of blocking forever.
@@ -147,8 +196,30 @@ class AtlanClient(BaseSettings):
     connect_timeout: float = 30.0  # 30 secs
     read_timeout: float = 900.0  # 15 mins
     retry: Retry = DEFAULT_RETRY
+    max_connections: Optional[int] = _DEFAULT_POOL_LIMITS.max_connections
+    max_keepalive_connections: Optional[int] = (
+        _DEFAULT_POOL_LIMITS.max_keepalive_connections
+    )
+    keepalive_expiry: Optional[float] = _DEFAULT_POOL_LIMITS.keepalive_expiry
+    pool_timeout: Optional[float] = _DEFAULT_POOL_TIMEOUT_SECONDS
+    http2: bool = False
+    request_compression: Optional[Literal["gzip", "zstd", "auto"]] = None
+    request_compression_threshold: int = DEFAULT_COMPRESSION_THRESHOLD
+    request_compression_verify: bool = True
+    rate_limit: Optional[float] = None  # requests per second, per class of endpoint
+    rate_limit_min: float = 1.0
+    hedge_requests: bool = False
+    hedge_delay: Optional[float] = None  # secs, or the observed p95 latency if None
+    hedge_budget: float = DEFAULT_HEDGE_BUDGET
     proxy: Optional[Any] = Field(default=None, exclude=True)
     verify: Optional[Any] = Field(default=True, exclude=True)
+    typedef_snapshot_dir: Optional[str] = None
+    typedef_snapshot_ttl: float = 900.0  # 15 mins
+    asset_cache_max_entries: Optional[int] = DEFAULT_MAX_ENTRIES
+    asset_cache_ttl: Optional[float] = None
+    cache_backend: Optional[Any] = Field(default=None, exclude=True)
+    cache_backend_dir: Optional[str] = None
+    cache_backend_ttl: float = DEFAULT_BACKEND_TTL
     _401_has_retried: ContextVar[bool] = ContextVar("_401_has_retried", default=False)
     _session: httpx.Client = PrivateAttr()
     _request_params: dict = PrivateAttr()
@@ -185,6 +256,14 @@ class AtlanClient(BaseSettings):
     _dq_template_config_cache: Optional[DQTemplateConfigCache] = PrivateAttr(
         default=None
     )
+    _typedef_snapshot_file: Optional[
+        Union[TypeDefSnapshotFile, SharedTypeDefSnapshot]
+    ] = PrivateAttr(default=None)
+    _cache_backend: Optional[CacheBackend] = PrivateAttr(default=None)
+    _request_compression: RequestCompression = PrivateAttr()
+    _rate_limiter: Optional[RateLimiter] = PrivateAttr(default=None)
+    _hedging: Optional[HedgingPolicy] = PrivateAttr(default=None)
+    _hedge_executor: Optional[ThreadPoolExecutor] = PrivateAttr(default=None)
 
     class Config:
         env_prefix = "atlan_"
@@ -219,6 +298,22 @@ class AtlanClient(BaseSettings):
                 else {"headers": {}}
             )
 
+        # Requests from all threads are paced by a single (adaptive) rate limiter
+        if self.rate_limit:
+            self._rate_limiter = RateLimiter(
+                max_rate=self.rate_limit, min_rate=self.rate_limit_min
+            )
+        # Slow searches and GETs are hedged (within a budget) by a second request
+        if self.hedge_requests:
+            self._hedging = HedgingPolicy(
+                delay=self.hedge_delay, budget=self.hedge_budget
+            )
+            # Each hedged request (and its hedge) uses a connection from the pool
+            self._hedge_executor = ThreadPoolExecutor(
+                max_workers=2
+                * (self.max_connections or _DEFAULT_POOL_LIMITS.max_connections),
+                thread_name_prefix="pyatlan-hedge",
+            )
         # Build proxy/SSL configuration with environment variable fallback
         transport_kwargs = self._build_transport_proxy_config(data)
         # Configure httpx client with custom transport that supports retry and proxy
@@ -229,7 +324,8 @@ class AtlanClient(BaseSettings):
             transport=PyatlanSyncTransport(
                 retry=self.retry,
                 client=self,
-                limits=_DEFAULT_POOL_LIMITS,
+                rate_limiter=self._rate_limiter,
+                **self._build_transport_pool_config(),
                 **transport_kwargs,
             ),
             headers={
@@ -243,6 +339,28 @@ class AtlanClient(BaseSettings):
             event_hooks={"response": [log_response]},
         )
         self._401_has_retried.set(False)
+        self._request_compression = RequestCompression(
+            encoding=self.request_compression,
+            threshold=self.request_compression_threshold,
+            verify=self.request_compression_verify,
+        )
+        # Caches share their entries with other clients (and processes) through
+        # the cache backend, if any, rather than each requesting them from Atlan
+        self._cache_backend = self.cache_backend
+        if self._cache_backend is None and self.cache_backend_dir:
+            self._cache_backend = SQLiteCacheBackend.for_tenant(
+                base_url=str(self.base_url),
+                directory=self.cache_backend_dir,
+                ttl=self.cache_backend_ttl,
+            )
+        if self.typedef_snapshot_dir:
+            self._typedef_snapshot_file = TypeDefSnapshotFile(
+                base_url=str(self.base_url),
+                directory=self.typedef_snapshot_dir,
+                ttl=self.typedef_snapshot_ttl,
+            )
+        elif self._cache_backend is not None:
+            self._typedef_snapshot_file = SharedTypeDefSnapshot(self._cache_backend)
 
     def _build_transport_proxy_config(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -298,6 +416,29 @@ class AtlanClient(BaseSettings):
                 transport_kwargs["verify"] = ssl_cert_file
         return transport_kwargs
 
+    def _build_transport_pool_config(self) -> Dict[str, Any]:
+        """
+        Build connection pool configuration for the transport. With HTTP/2, concurrent
+        requests are multiplexed as streams over the pooled connections (each request
+        is still retried, and checked for duplicate policies, on its own).
+
+        :returns: Dictionary of pool kwargs for PyatlanSyncTransport or PyatlanAsyncTransport
+        :raises DependencyNotFoundError: if HTTP/2 is enabled but its optional dependency is not installed
+        """
+        if self.http2 and importlib.util.find_spec("h2") is None:
+            raise DependencyNotFoundError(
+                "HTTP/2 support requires the 'h2' package, "
+                "install it with: pip install 'httpx[http2]'"
+            )
+        return {
+            "limits": httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_keepalive_connections,
+                keepalive_expiry=self.keepalive_expiry,
+            ),
+            "http2": self.http2,
+        }
+
     def reset_http_session(self) -> None:
         """Close and rebuild the HTTP session to recover from a degraded connection pool."""
         try:
@@ -313,7 +454,8 @@ class AtlanClient(BaseSettings):
             transport=PyatlanSyncTransport(
                 retry=self.retry,
                 client=self,
-                limits=_DEFAULT_POOL_LIMITS,
+                rate_limiter=self._rate_limiter,
+                **self._build_transport_pool_config(),
                 **transport_kwargs,
             ),
             headers={
@@ -464,7 +606,7 @@ class AtlanClient(BaseSettings):
     @property
     def group_cache(self) -> GroupCache:
         if self._group_cache is None:
-            self._group_cache = GroupCache(client=self)
+            self._group_cache = GroupCache(client=self, backend=self._cache_backend)
         return self._group_cache
 
     @property
@@ -476,7 +618,7 @@ class AtlanClient(BaseSettings):
     @property
     def user_cache(self) -> UserCache:
         if self._user_cache is None:
-            self._user_cache = UserCache(client=self)
+            self._user_cache = UserCache(client=self, backend=self._cache_backend)
         return self._user_cache
 
     @property
@@ -488,13 +630,23 @@ class AtlanClient(BaseSettings):
     @property
     def connection_cache(self) -> ConnectionCache:
         if self._connection_cache is None:
-            self._connection_cache = ConnectionCache(client=self)
+            self._connection_cache = ConnectionCache(
+                client=self,
+                max_entries=self.asset_cache_max_entries,
+                ttl=self.asset_cache_ttl,
+                backend=self._cache_backend,
+            )
         return self._connection_cache
 
     @property
     def source_tag_cache(self) -> SourceTagCache:
         if self._source_tag_cache is None:
-            self._source_tag_cache = SourceTagCache(client=self)
+            self._source_tag_cache = SourceTagCache(
+                client=self,
+                max_entries=self.asset_cache_max_entries,
+                ttl=self.asset_cache_ttl,
+                backend=self._cache_backend,
+            )
         return self._source_tag_cache
 
     @property
@@ -503,6 +655,72 @@ class AtlanClient(BaseSettings):
             self._dq_template_config_cache = DQTemplateConfigCache(client=self)
         return self._dq_template_config_cache
 
+    def warm_caches(
+        self,
+        caches: Optional[Iterable[str]] = None,
+        timeout: Optional[float] = 60.0,
+    ) -> Dict[str, CacheWarmup]:
+        """
+        Warm up (load) the given caches concurrently, for example while an application starts up,
+        so that the first request needing them does not wait for each of them to load one after
+        the other. Caches that fail to load, or do not load before the deadline, are reported
+        (rather than raised) and will be loaded again on first use.
+
+        :param caches: names of the caches to warm up (their properties on this client, for example
+            atlan_tag_cache), or None to warm up all of: atlan_tag_cache, custom_metadata_cache,
+            enum_cache, user_cache, group_cache, role_cache and dq_template_config_cache
+        :param timeout: number of seconds within which to warm up all the caches, or None to wait
+            for all of them to load. Caches still loading at the deadline continue to load in the background.
+        :returns: the outcome of warming up each cache, keyed by the name of the cache
+        :raises InvalidRequestError: if any of the names is not that of a cache that can be warmed up
+        """
+        names = validate_cache_names(caches)
+        if not names:
+            return {}
+        # Create the caches and the shared typedef client up front, so that concurrent
+        # refreshes do not race to create them (and load the typedefs only once)
+        to_warm = {name: getattr(self, name) for name in names}
+        _ = self.typedef
+
+        def warm(name: str) -> CacheWarmup:
+            started = time.perf_counter()
+            try:
+                to_warm[name].refresh_cache()
+            except Exception as e:
+                LOGGER.warning("Unable to warm up %s: %s", name, e)
+                return CacheWarmup(name, time.perf_counter() - started, e)
+            elapsed = time.perf_counter() - started
+            LOGGER.debug("Warmed up %s in %.3fs", name, elapsed)
+            return CacheWarmup(name, elapsed)
+
+        started = time.perf_counter()
+        executor = ThreadPoolExecutor(
+            max_workers=len(names), thread_name_prefix="pyatlan-warm-caches"
+        )
+        futures = {name: executor.submit(warm, name) for name in names}
+        wait(futures.values(), timeout=timeout)
+        executor.shutdown(wait=False)
+        elapsed = time.perf_counter() - started
+        return {
+            name: future.result() if future.done() else timed_out(name, elapsed)
+            for name, future in futures.items()
+        }
+
+    def get_cache_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Retrieve statistics describing the use of this client's caches (hits, misses,
+        refresh count and durations, entry count and an estimate of their memory use).
+        Caches that have not been used yet are omitted.
+
+        :returns: the statistics of each cache (as in CacheStats.snapshot), keyed by the name of the cache
+        """
+        caches = {name: getattr(self, f"_{name}") for name in CLIENT_CACHES}
+        return {
+            name: cache.get_stats()
+            for name, cache in caches.items()
+            if cache is not None
+        }
+
     @classmethod
     def from_token_guid(
         cls,
@@ -610,7 +828,7 @@ class AtlanClient(BaseSettings):
                 None,
                 connect=self.connect_timeout,
                 read=self.read_timeout,
-                pool=_DEFAULT_POOL_TIMEOUT_SECONDS,
+                pool=self.pool_timeout,
             )
             if binary_data:
                 response = self._session.request(
@@ -667,11 +885,15 @@ class AtlanClient(BaseSettings):
                         ),
                     )
             else:
-                response = self._session.request(
-                    api.method.value,
-                    path,
-                    **params,
-                    timeout=timeout,
+                response = self._hedged_request(
+                    api,
+                    partial(
+                        self._session.request,
+                        api.method.value,
+                        path,
+                        **params,
+                        timeout=timeout,
+                    ),
                 )
             if response is not None:
                 LOGGER.debug("HTTP Status: %s", response.status_code)
@@ -734,7 +956,9 @@ class AtlanClient(BaseSettings):
                             events
                             if events
                             else AtlanResponse(
-                                raw_json=response.json(), client=self
+                                raw_json=response.json(),
+                                client=self,
+                                translate=response_translation_var.get(),
                             ).to_dict()
                         )
                     LOGGER.debug("response: %s", response_)
@@ -832,6 +1056,53 @@ class AtlanClient(BaseSettings):
         finally:
             request_id_var.reset(token)
 
+    def _hedged_request(self, api: API, send: Callable[[], httpx.Response]):
+        """
+        Send a request, hedging it (if enabled and the request is idempotent): when no
+        response has been received within the hedging delay, an identical request is
+        sent and the response to whichever completes first is used. The other request
+        is cancelled if it has not started yet, otherwise its response is discarded.
+
+        :param api: endpoint being called
+        :param send: sends the request (in whichever thread calls it)
+        :returns: the response to the request
+        """
+        hedging = self._hedging
+        if hedging is None or not hedging.is_hedgeable(api):
+            return send()
+        delay = hedging.start_request()
+        started = time.perf_counter()
+        if delay is None or self._hedge_executor is None:
+            response = send()
+            hedging.record_latency(time.perf_counter() - started)
+            return response
+        # Each request runs in (a copy of) the caller's context, as if sent directly
+        primary = self._hedge_executor.submit(copy_context().run, send)
+        if not wait([primary], timeout=delay).done and hedging.try_hedge():
+            LOGGER.debug("Hedging request to %s after %.3fs", api.path, delay)
+            hedge = self._hedge_executor.submit(copy_context().run, send)
+            winner = self._first_successful(primary, hedge)
+            hedging.record_latency(time.perf_counter() - started, winner is hedge)
+            return winner.result()
+        response = primary.result()
+        hedging.record_latency(time.perf_counter() - started)
+        return response
+
+    @staticmethod
+    def _first_successful(primary: Future, hedge: Future) -> Future:
+        # Wait for the first request to succeed (or, if both fail, for the first to fail)
+        pending = {primary, hedge}
+        failed: Optional[Future] = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    for other in pending:
+                        other.cancel()
+                    return future
+                failed = failed or future
+        return cast(Future, failed)
+
     def _api_logger(self, api: API, path: str):
         LOGGER.debug("------------------------------------------------------")
         LOGGER.debug("Call         : %s %s", api.method, path)
@@ -856,8 +1127,86 @@ class AtlanClient(BaseSettings):
             params["headers"].update(extra_headers)
         if LOGGER.isEnabledFor(logging.DEBUG):
             self._api_logger(api, path)
+        body = self._request_compression.body_to_compress(params)
+        if body is not None:
+            return self._call_api_compressed(api, path, params, body, text_response)
         return self._call_api_internal(api, path, params, text_response=text_response)
 
+    def _call_api_compressed(self, api, path, params, body, text_response=False):
+        """
+        Make an API call with a compressed request body. If the server has not yet
+        been verified to accept compressed request bodies and rejects this one, the
+        request is re-issued uncompressed, and (if that succeeds) request bodies are
+        no longer compressed.
+        """
+        compression = self._request_compression
+        compressed_params = compression.apply(params, compression.compress(body))
+        if compression.verified:
+            return self._call_api_internal(
+                api, path, compressed_params, text_response=text_response
+            )
+        try:
+            response = self._call_api_internal(
+                api, path, compressed_params, text_response=text_response
+            )
+        except AtlanError as err:
+            if not compression.is_rejection(err):
+                raise
+            response = self._call_api_internal(
+                api, path, params, text_response=text_response
+            )
+            compression.disable()
+            return response
+        compression.verified = True
+        return response
+
+    @contextlib.contextmanager
+    def _stream_api(
+        self, api, query_params=None, request_obj=None
+    ) -> Generator[Iterator[bytes], None, None]:
+        """
+        Make an API call whose successful response body is consumed as it arrives,
+        rather than being read into memory in full before it is processed.
+
+        Yields an iterator over the raw (untranslated) bytes of the response body.
+        Any unsuccessful response is instead re-issued through the standard request
+        handling, so that errors are raised (and expired tokens refreshed) exactly as
+        for any other call. In that case, the iterator is over the (untranslated)
+        JSON of the re-issued call's response.
+        """
+        path = self._create_path(api)
+        params = self._create_params(api, query_params, request_obj)
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            self._api_logger(api, path)
+        # Only compress once the server is known to accept compressed request bodies
+        compression = self._request_compression
+        body = compression.body_to_compress(params)
+        if body is not None and compression.verified:
+            params = compression.apply(params, compression.compress(body))
+        timeout = httpx.Timeout(
+            None,
+            connect=self.connect_timeout,
+            read=self.read_timeout,
+            pool=self.pool_timeout,
+        )
+        token = request_id_var.set(str(uuid.uuid4()))  # type: ignore[arg-type]
+        try:
+            params["headers"]["X-Atlan-Request-Id"] = request_id_var.get()
+            with self._session.stream(
+                api.method.value, path, **params, timeout=timeout
+            ) as response:
+                LOGGER.debug("HTTP Status: %s", response.status_code)
+                streamed = response.status_code == api.expected_status
+                if streamed:
+                    self._401_has_retried.set(False)
+                    yield response.iter_bytes()
+        finally:
+            request_id_var.reset(token)
+        if not streamed:
+            with self.disable_response_translation():
+                raw_json = self._call_api_internal(api, path, params)
+            yield iter([json.dumps(raw_json).encode("utf-8")] if raw_json else [])
+
     def _create_path(self, api: API):
         if self.base_url == "INTERNAL":
             return urljoin(api.endpoint.service, api.path)
@@ -923,11 +1272,16 @@ class AtlanClient(BaseSettings):
                 # Always use AtlanRequest, which accepts a Pydantic model instance and the client
                 # Behind the scenes, it handles retranslation tasks—such as converting
                 # human-readable Atlan tag names back into hashed IDs as required by the backend
-                params["data"] = AtlanRequest(instance=request_obj, client=self).json()
+                # (the encoded bytes are used directly as the request body)
+                params["content"] = AtlanRequest(
+                    instance=request_obj, client=self
+                ).to_bytes()
+                _record_request_body_size(len(params["content"]))
             elif api.consumes == APPLICATION_ENCODED_FORM:
                 params["data"] = request_obj
             else:
                 params["data"] = json.dumps(request_obj)
+            mark_auth_policy_create(params, request_obj)
         return params
 
     def _handle_401_token_refresh(
@@ -2053,6 +2407,21 @@ class AtlanClient(BaseSettings):
             name=name, glossary_name=glossary_name, attributes=attributes
         )
 
+    @contextlib.contextmanager
+    def disable_response_translation(self) -> Generator[None, None, None]:
+        """
+        Creates a context manager within which API responses are not translated:
+        Atlan tags are left as their hashed IDs rather than being resolved into
+        human-readable names. This avoids the cost of translation for processing
+        that never reads tag names. Applies only to calls made (and pages of
+        results retrieved) in the current thread or task, while in the context.
+        """
+        token = response_translation_var.set(False)
+        try:
+            yield None
+        finally:
+            response_translation_var.reset(token)
+
     @contextlib.contextmanager  # type: ignore[misc,arg-type]
     def max_retries(  # type: ignore[misc]
         self, max_retries: Retry = CONNECTION_RETRY
@@ -2072,7 +2441,8 @@ class AtlanClient(BaseSettings):
         new_transport = PyatlanSyncTransport(
             retry=max_retries,
             client=self,
-            limits=_DEFAULT_POOL_LIMITS,
+            rate_limiter=self._rate_limiter,
+            **self._build_transport_pool_config(),
             **transport_kwargs,
         )
         self._session._transport = new_transport
@@ -44,6 +44,7 @@ from .asset import (
     ManageCustomMetadata,
     ManageTerms,
     ModifyAtlanTags,
+    ParallelSearch,
     PurgeByGuid,
     RemoveAnnouncement,
     RemoveCertificate,
@@ -223,6 +224,7 @@ __all__ = [
     "ManageCustomMetadata",
     "ManageTerms",
     "ModifyAtlanTags",
+    "ParallelSearch",
     "PurgeByGuid",
     "RemoveAnnouncement",
     "RemoveCertificate",
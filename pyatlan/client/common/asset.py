@@ -16,7 +16,7 @@ from pyatlan.client.constants import (
     PARTIAL_UPDATE_ENTITY_BY_ATTRIBUTE,
 )
 from pyatlan.errors import ErrorCode
-from pyatlan.model.aggregation import Aggregations
+from pyatlan.model.aggregation import AggregationMetricResult, Aggregations
 from pyatlan.model.assets import (
     Asset,
     AtlasGlossary,
@@ -51,6 +51,7 @@ from pyatlan.model.search import (
     Bool,
     IndexSearchRequest,
     Query,
+    Range,
     SortItem,
     Term,
     Terms,
@@ -58,7 +59,6 @@ from pyatlan.model.search import (
     with_active_glossary,
     with_active_term,
 )
-from pyatlan.utils import unflatten_custom_metadata_for_entity
 
 if TYPE_CHECKING:
     from pyatlan.client.aio import AsyncAtlanClient
@@ -194,14 +194,44 @@ class Search:
             cls._ensure_type_filter_present(criteria)
         return INDEX_SEARCH, criteria
 
+    @staticmethod
+    def prepare_count_request(criteria: IndexSearchRequest) -> IndexSearchRequest:
+        """
+        Prepares a minimal request for only the count (and any aggregations)
+        of the results of a search, leaving the search criteria untouched.
+
+        :param criteria: search criteria to count the results of
+        :returns: request that retrieves no results themselves
+        """
+        return criteria.copy(
+            update={"dsl": criteria.dsl.copy(update={"from_": 0, "size": 0})}
+        )
+
+    @staticmethod
+    def process_streamed_entity(entity, criteria) -> Asset:
+        """
+        Processes a single (translated) entity streamed from a search response.
+
+        :param entity: raw JSON of the entity
+        :param criteria: search criteria that produced the entity
+        :returns: the asset represented by the entity
+        :raises AtlanError: on JSON validation errors
+        """
+        criteria.custom_metadata_plan.unflatten_for_entity(entity)
+        try:
+            return parse_obj_as(Asset, entity)
+        except ValidationError as err:
+            raise ErrorCode.JSON_ERROR.exception_with_parameters(
+                entity, 200, str(err)
+            ) from err
+
     @classmethod
     def process_response(cls, raw_json, criteria) -> Dict[str, Any]:
         if "entities" in raw_json:
             try:
+                plan = criteria.custom_metadata_plan
                 for entity in raw_json["entities"]:
-                    unflatten_custom_metadata_for_entity(
-                        entity=entity, attributes=criteria.attributes
-                    )
+                    plan.unflatten_for_entity(entity)
                 assets = parse_obj_as(List[Asset], raw_json["entities"])
             except ValidationError as err:
                 raise ErrorCode.JSON_ERROR.exception_with_parameters(
@@ -218,6 +248,89 @@ class Search:
         }
 
 
+class ParallelSearch:
+    """
+    Shared logic for running a search as a number of disjoint partitions,
+    each covering a separate range of the creation times of the results.
+    """
+
+    MIN_CREATE_TIME = "min_create_time"
+    MAX_CREATE_TIME = "max_create_time"
+
+    @classmethod
+    def prepare_bounds_request(cls, criteria: IndexSearchRequest) -> IndexSearchRequest:
+        """
+        Prepares a minimal request for only the count and the range of
+        creation times of the results of a search.
+
+        :param criteria: search criteria to partition
+        :returns: request that retrieves no results themselves
+        """
+        return criteria.copy(
+            update={
+                "dsl": criteria.dsl.copy(
+                    update={
+                        "from_": 0,
+                        "size": 0,
+                        "aggregations": {
+                            cls.MIN_CREATE_TIME: Asset.CREATE_TIME.min(),
+                            cls.MAX_CREATE_TIME: Asset.CREATE_TIME.max(),
+                        },
+                    }
+                )
+            }
+        )
+
+    @classmethod
+    def prepare_partition_requests(
+        cls, criteria: IndexSearchRequest, raw_json, partitions: int
+    ) -> List[IndexSearchRequest]:
+        """
+        Splits a search into (at most) the requested number of partitions, each
+        limited to an equal-width, non-overlapping range of creation times.
+
+        :param criteria: search criteria to partition
+        :param raw_json: response to the bounds request for the search
+        :param partitions: maximum number of partitions to split the search into
+        :returns: a request for each partition (none if there are no results)
+        """
+        if not raw_json or not raw_json.get("approximateCount"):
+            return []
+        aggregations = Search._get_aggregations(raw_json)
+        lowest = aggregations and aggregations.get(cls.MIN_CREATE_TIME)
+        highest = aggregations and aggregations.get(cls.MAX_CREATE_TIME)
+        if not (
+            isinstance(lowest, AggregationMetricResult)
+            and isinstance(highest, AggregationMetricResult)
+        ):
+            return [criteria]
+        lower, width = int(lowest.value), int(highest.value - lowest.value) + 1
+        boundaries = sorted(
+            {lower + width * i // partitions for i in range(1, partitions)} - {lower}
+        )
+        requests = []
+        for start, end in zip([None, *boundaries], [*boundaries, None]):
+            # Bound each partition with `gt` rather than `gte`, so that
+            # its lower bound is never mistaken for (and replaced by) the
+            # creation time filter used by timestamp-based paging
+            partition = Range.with_create_time_as_timestamp(
+                gt=None if start is None else start - 1, lt=end
+            )
+            requests.append(
+                criteria.copy(
+                    update={
+                        "dsl": criteria.dsl.copy(
+                            update={
+                                "query": criteria.dsl.query + Bool(filter=[partition]),
+                                "aggregations": {},
+                            }
+                        )
+                    }
+                )
+            )
+        return requests
+
+
 class GetLineageList:
     """
     Shared business logic for get_lineage_list operations.
@@ -254,10 +367,9 @@ class GetLineageList:
         """
         if "entities" in raw_json:
             try:
+                plan = lineage_request.custom_metadata_plan
                 for entity in raw_json["entities"]:
-                    unflatten_custom_metadata_for_entity(
-                        entity=entity, attributes=lineage_request.attributes
-                    )
+                    plan.unflatten_for_entity(entity)
                 assets = parse_obj_as(List[Asset], raw_json["entities"])
                 has_more = parse_obj_as(bool, raw_json["hasMore"])
             except ValidationError as err:
@@ -0,0 +1,156 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2025 Atlan Pte. Ltd.
+"""
+Shared request body compression for sync and async Atlan clients.
+
+Large request bodies (such as bulk mutations and searches with many values)
+can be compressed before they are sent, to reduce the time spent uploading them.
+"""
+
+from __future__ import annotations
+
+import gzip
+import logging
+from typing import Any, Callable, Dict, Optional
+
+from pyatlan.client.common.transport import AUTH_POLICY_CREATE_EXTENSION
+from pyatlan.errors import AtlanError, DependencyNotFoundError
+
+logger = logging.getLogger(__name__)
+
+GZIP = "gzip"
+ZSTD = "zstd"
+AUTO = "auto"
+
+# Minimum size (in bytes) of request bodies to compress, by default
+DEFAULT_COMPRESSION_THRESHOLD = 64 * 1024
+
+# Status codes with which a server may reject a request body it cannot decode
+_REJECTION_STATUS_CODES = (400, 415)
+
+
+def _zstd_compressor() -> Optional[Callable[[bytes], bytes]]:
+    # Python 3.14+ has zstd built in, otherwise it needs the zstandard package
+    try:
+        from compression import zstd  # type: ignore[import-not-found]
+
+        return zstd.compress
+    except ImportError:
+        pass
+    try:
+        import zstandard  # type: ignore[import-not-found]
+
+        return zstandard.compress
+    except ImportError:
+        return None
+
+
+def _gzip_compress(body: bytes) -> bytes:
+    return gzip.compress(body, compresslevel=6, mtime=0)
+
+
+class RequestCompression:
+    """
+    Compression of request bodies above a size threshold, as configured for a client.
+    Unless disabled, the first compressed request is used to verify that the server
+    accepts compressed bodies: if it rejects that request but accepts the same request
+    uncompressed, compression is turned off for the rest of the client's lifetime.
+    """
+
+    def __init__(
+        self,
+        encoding: Optional[str] = None,
+        threshold: int = DEFAULT_COMPRESSION_THRESHOLD,
+        verify: bool = True,
+    ):
+        """
+        :param encoding: with which to compress request bodies: gzip, zstd or auto (zstd,
+        if available, otherwise gzip), or None to send all request bodies uncompressed
+        :param threshold: minimum size (in bytes) of request bodies to compress
+        :param verify: whether to verify the server accepts compressed request bodies
+        on first use (and stop compressing them if not)
+        :raises DependencyNotFoundError: if zstd is requested but not available
+        """
+        self.encoding: Optional[str] = None
+        self._compress: Optional[Callable[[bytes], bytes]] = None
+        self.threshold = threshold
+        self.verified = not verify
+        if encoding == GZIP:
+            self.encoding, self._compress = GZIP, _gzip_compress
+        elif encoding in (ZSTD, AUTO):
+            zstd_compress = _zstd_compressor()
+            if zstd_compress:
+                self.encoding, self._compress = ZSTD, zstd_compress
+            elif encoding == AUTO:
+                self.encoding, self._compress = GZIP, _gzip_compress
+            else:
+                raise DependencyNotFoundError(
+                    "zstd request compression requires Python 3.14+ or the "
+                    "'zstandard' package, install it with: pip install zstandard"
+                )
+
+    @property
+    def enabled(self) -> bool:
+        """Whether request bodies are (currently) compressed."""
+        return self._compress is not None
+
+    def body_to_compress(self, params: Dict[str, Any]) -> Optional[bytes]:
+        """
+        :param params: keyword arguments for the request
+        :returns: the body of the request, if it should be compressed (it is large
+        enough, and does not create any AuthPolicy), otherwise None
+        """
+        if not self.enabled:
+            return None
+        # The transports parse the body of a request that creates an AuthPolicy
+        # (to check for a duplicate policy), so it is sent uncompressed
+        if params.get("extensions", {}).get(AUTH_POLICY_CREATE_EXTENSION):
+            return None
+        body = params.get("content")
+        if body is None and isinstance(params.get("data"), str):
+            body = params["data"].encode("utf-8")
+        if not isinstance(body, bytes) or len(body) < self.threshold:
+            return None
+        return body
+
+    def compress(self, body: bytes) -> bytes:
+        """
+        :param body: of the request to compress
+        :returns: the compressed body
+        """
+        assert self._compress is not None
+        return self._compress(body)
+
+    def apply(self, params: Dict[str, Any], compressed: bytes) -> Dict[str, Any]:
+        """
+        :param params: keyword arguments for the request (left unchanged)
+        :param compressed: body of the request, compressed
+        :returns: keyword arguments for the request, with its compressed body
+        """
+        compressed_params = {
+            key: value for key, value in params.items() if key != "data"
+        }
+        compressed_params["headers"] = {
+            **params["headers"],
+            "Content-Encoding": self.encoding,
+        }
+        compressed_params["content"] = compressed
+        return compressed_params
+
+    def is_rejection(self, error: AtlanError) -> bool:
+        """
+        :param error: raised by a request with a compressed body
+        :returns: whether the server may have rejected the request because it was compressed
+        """
+        return error.error_code.http_error_code in _REJECTION_STATUS_CODES
+
+    def disable(self) -> None:
+        """Stop compressing request bodies, as the server does not accept them."""
+        if self.enabled:
+            logger.warning(
+                "Server did not accept %s-compressed request bodies, "
+                "sending request bodies uncompressed from now on.",
+                self.encoding,
+            )
+        self._compress = None
+        self.verified = True
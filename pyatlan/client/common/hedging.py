@@ -0,0 +1,117 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2025 Atlan Pte. Ltd.
+"""
+Shared request hedging policy for sync and async Atlan clients.
+
+A hedged request sends a second, identical request when the first has not completed
+within a delay, and uses whichever response arrives first, to cut the tail latency
+caused by the occasional slow backend node.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import deque
+from typing import Any, Deque, Dict, Optional
+
+from pyatlan.client.constants import INDEX_API
+from pyatlan.utils import HTTPMethod
+
+# Default maximum additional load from hedged requests, as a fraction of all requests
+DEFAULT_HEDGE_BUDGET = 0.05
+# Most hedged requests that unused budget can be saved up for, to limit bursts of them
+MAX_HEDGE_CREDIT = 10.0
+# Percentile of observed latencies after which to hedge, when no delay is configured
+HEDGE_PERCENTILE = 0.95
+# Fewest (and most) recent latencies from which to determine the percentile
+MIN_LATENCY_SAMPLES = 20
+MAX_LATENCY_SAMPLES = 1000
+
+
+class HedgingPolicy:
+    """
+    Decides which requests to hedge and when, within a budget that caps the additional
+    load hedging puts on the tenant. Only idempotent requests are hedged: GETs and searches.
+    A single policy is shared by every thread (or task) sending requests through a client.
+    """
+
+    def __init__(
+        self, delay: Optional[float] = None, budget: float = DEFAULT_HEDGE_BUDGET
+    ):
+        """
+        :param delay: number of seconds after which to hedge a request, or None to use the
+        95th percentile of the latencies observed (once there are enough of them)
+        :param budget: maximum additional load from hedged requests, as a fraction of all
+        (hedgeable) requests, for example 0.05 for at most 5% more requests
+        """
+        self.delay = delay
+        self.budget = budget
+        self.requests = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+        self._credit = 0.0
+        self._latencies: Deque[float] = deque(maxlen=MAX_LATENCY_SAMPLES)
+        self._observed_delay: Optional[float] = None
+        self._unsampled = 0
+        self._lock = threading.Lock()
+
+    def is_hedgeable(self, api: Any) -> bool:
+        """
+        :param api: endpoint to be called
+        :returns: whether requests to the endpoint are idempotent, and so can be hedged
+        """
+        return api.method == HTTPMethod.GET or api.path == INDEX_API
+
+    def start_request(self) -> Optional[float]:
+        """
+        Count a hedgeable request, adding to the budget for hedged requests.
+
+        :returns: number of seconds after which to hedge the request, or None to not hedge it
+        """
+        with self._lock:
+            self.requests += 1
+            self._credit = min(MAX_HEDGE_CREDIT, self._credit + self.budget)
+            return self.delay if self.delay is not None else self._observed_delay
+
+    def try_hedge(self) -> bool:
+        """
+        :returns: whether the budget allows a request to be hedged now (using up part of it, if so)
+        """
+        with self._lock:
+            if self._credit < 1.0:
+                return False
+            self._credit -= 1.0
+            self.hedges += 1
+            return True
+
+    def record_latency(self, seconds: float, hedge_won: bool = False) -> None:
+        """
+        Record how long a hedgeable request took to complete.
+
+        :param seconds: from sending the (first) request until a response was received
+        :param hedge_won: whether the response was to the hedged request
+        """
+        with self._lock:
+            if hedge_won:
+                self.hedge_wins += 1
+            self._latencies.append(seconds)
+            self._unsampled += 1
+            # Periodically (rather than on every request) recalculate the percentile
+            if self._unsampled >= MIN_LATENCY_SAMPLES:
+                self._unsampled = 0
+                ordered = sorted(self._latencies)
+                index = min(len(ordered) - 1, int(len(ordered) * HEDGE_PERCENTILE))
+                self._observed_delay = ordered[index]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        :returns: number of hedgeable requests, of those hedged and of hedged requests whose
+        response arrived first, and the current delay after which requests are hedged
+        """
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "hedges": self.hedges,
+                "hedge_wins": self.hedge_wins,
+                "delay": self.delay if self.delay is not None else self._observed_delay,
+            }
@@ -1,7 +1,7 @@
 # SPDX-License-Identifier: Apache-2.0
 # Copyright 2025 Atlan Pte. Ltd.
 
-from typing import Any
+from typing import Any, Dict, List
 
 from pyatlan.client.constants import API, RUN_QUERY
 from pyatlan.model.query import QueryRequest, QueryResponse
@@ -29,3 +29,35 @@ class QueryStream:
         :returns: QueryResponse with query results
         """
         return QueryResponse(events=raw_json)
+
+    @staticmethod
+    def process_event(response: QueryResponse, event: Dict[str, Any]) -> List[Any]:
+        """
+        Process a single (streamed) event into a QueryResponse, without retaining its rows.
+
+        :param response: QueryResponse in which to capture the details of the event
+        :param event: raw event received for the query
+        :returns: rows of results included in the event
+        """
+        if not response.columns and event.get("columns"):
+            # Only need to do this once
+            response.columns = event.get("columns")
+        # Populate the remainder from the latest event
+        response.request_id = event.get("requestId")
+        response.error_name = event.get("errorName")
+        response.error_message = event.get("errorMessage")
+        response.error_code = event.get("errorCode")
+        response.query_id = event.get("queryId")
+        response.details = event.get("details")
+        return event.get("rows") or []
+
+    @staticmethod
+    def to_batch(rows: List[Any], columnar: bool) -> List[Any]:
+        """
+        Arrange a batch of rows of results.
+
+        :param rows: rows of results in the batch
+        :param columnar: whether to arrange the batch by column (True) or by row (False)
+        :returns: the batch, as a list of rows or as a list of columns (each a list of values)
+        """
+        return [list(column) for column in zip(*rows)] if columnar else rows
@@ -0,0 +1,186 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2025 Atlan Pte. Ltd.
+"""
+Shared client-side rate limiting for sync and async Atlan HTTP transports.
+
+Paces requests before they are sent, rather than only reacting (with retries)
+once the tenant has been overloaded, adapting the pace to the capacity the
+tenant signals through throttling (429) and unavailable (503) responses.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Callable, Dict, Optional
+
+import httpx
+
+from pyatlan.client.constants import ENTITY_BULK_API, INDEX_API, TYPES_API
+
+SEARCH = "search"
+BULK = "bulk"
+TYPEDEF = "typedef"
+DEFAULT = "default"
+
+# Endpoint classes, each with its own rate, by a fragment of their path
+_ENDPOINT_CLASSES = {
+    INDEX_API: SEARCH,
+    ENTITY_BULK_API.rstrip("/"): BULK,
+    TYPES_API: TYPEDEF,
+}
+
+# Responses through which the tenant signals it is overloaded
+_THROTTLED_STATUS_CODES = (429, 503)
+
+# Increase in rate (requests per second) after each successful request
+ADDITIVE_INCREASE = 0.5
+# Factor by which to reduce the rate after each throttled request
+MULTIPLICATIVE_DECREASE = 0.5
+# Minimum number of seconds between reductions in rate, so that the many requests
+# throttled in a single burst only reduce the rate once
+DECREASE_INTERVAL = 1.0
+
+
+def endpoint_class(request: httpx.Request) -> str:
+    """
+    :param request: to be sent
+    :returns: class of endpoint the request is for: search, bulk, typedef or default
+    """
+    path = request.url.path
+    return next(
+        (name for fragment, name in _ENDPOINT_CLASSES.items() if fragment in path),
+        DEFAULT,
+    )
+
+
+def parse_retry_after(response: httpx.Response) -> Optional[float]:
+    """
+    :param response: received from the tenant
+    :returns: number of seconds the response asks to wait before retrying, if any
+    """
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class TokenBucket:
+    """
+    Token bucket for a single class of endpoint, refilled at a rate adapted through
+    additive increase and multiplicative decrease (AIMD) to the responses received.
+    Requests reserve a token before they are sent, waiting until it is available.
+    """
+
+    def __init__(
+        self,
+        max_rate: float,
+        min_rate: float,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_rate = max_rate
+        self.min_rate = min_rate
+        self.rate = max_rate
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._tokens = max_rate
+        # When the tokens were last counted (in the future while paused)
+        self._updated = clock()
+        self._last_decrease = float("-inf")
+
+    @property
+    def _capacity(self) -> float:
+        # Allow bursts of up to a second's worth of requests
+        return max(1.0, self.rate)
+
+    def reserve(self) -> float:
+        """
+        Reserve a token for a request.
+
+        :returns: number of seconds to wait before sending the request
+        """
+        with self._lock:
+            now = self._clock()
+            if now > self._updated:
+                elapsed = now - self._updated
+                self._tokens = min(self._capacity, self._tokens + elapsed * self.rate)
+                self._updated = now
+            self._tokens -= 1
+            wait = self._updated - now
+            if self._tokens < 0:
+                wait += -self._tokens / self.rate
+            return max(0.0, wait)
+
+    def record(self, status_code: int, retry_after: Optional[float] = None) -> None:
+        """
+        Adapt the rate to the response to a request.
+
+        :param status_code: of the response
+        :param retry_after: number of seconds the response asks to wait, if any
+        """
+        with self._lock:
+            now = self._clock()
+            if status_code not in _THROTTLED_STATUS_CODES:
+                self.rate = min(self.max_rate, self.rate + ADDITIVE_INCREASE)
+                return
+            if now - self._last_decrease >= DECREASE_INTERVAL:
+                self._last_decrease = now
+                self.rate = max(self.min_rate, self.rate * MULTIPLICATIVE_DECREASE)
+                self._tokens = min(self._tokens, self._capacity)
+            if retry_after:
+                # Pause all requests until the tenant is ready, then resume at the new rate
+                self._updated = max(self._updated, now + retry_after)
+                self._tokens = min(self._tokens, 0.0)
+
+
+class RateLimiter:
+    """
+    Adaptive rate limiter, with a token bucket per class of endpoint (search, bulk,
+    typedef and everything else). A single limiter is shared by every thread (or task)
+    sending requests through a client, so that they are paced together.
+    """
+
+    def __init__(
+        self,
+        max_rate: float,
+        min_rate: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        :param max_rate: maximum (and initial) number of requests per second, for each class of endpoint
+        :param min_rate: minimum number of requests per second, however much requests are throttled
+        :param clock: source of the current time, in seconds
+        """
+        self.max_rate = max_rate
+        self.min_rate = min(min_rate, max_rate)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._buckets: Dict[str, TokenBucket] = {}
+
+    def bucket(self, request: httpx.Request) -> TokenBucket:
+        """
+        :param request: to be sent
+        :returns: token bucket for the class of endpoint the request is for
+        """
+        name = endpoint_class(request)
+        with self._lock:
+            if name not in self._buckets:
+                self._buckets[name] = TokenBucket(
+                    self.max_rate, self.min_rate, self._clock
+                )
+            return self._buckets[name]
+
+    def get_rates(self) -> Dict[str, float]:
+        """
+        :returns: current number of requests per second allowed, by class of endpoint
+        """
+        with self._lock:
+            return {name: bucket.rate for name, bucket in self._buckets.items()}
@@ -21,6 +21,41 @@ from pyatlan.model.search import DSL, Bool, IndexSearchRequest, Prefix, Term
 
 logger = logging.getLogger(__name__)
 
+# Request extension recording (when the request body was serialized) whether
+# the request creates any AuthPolicy, so the body need not be parsed to find out
+AUTH_POLICY_CREATE_EXTENSION = "pyatlan_auth_policy_create"
+
+
+def _is_auth_policy_create(entity: Any) -> bool:
+    if isinstance(entity, dict):
+        type_name, guid = entity.get("typeName"), entity.get("guid", "-1")
+    else:
+        # A model without a GUID is serialized without one, so is created too
+        type_name = getattr(entity, "type_name", None)
+        guid = getattr(entity, "guid", None) or "-1"
+    return type_name == "AuthPolicy" and isinstance(guid, str) and guid.startswith("-")
+
+
+def mark_auth_policy_create(params: dict, request_obj: Any) -> None:
+    """
+    Record (as a request extension) whether the entities in a request body include the
+    creation of any AuthPolicy, so that the transports only parse the (potentially very
+    large) body of a bulk request to check for a duplicate policy when it does.
+    Request bodies without entities are left unmarked, and are parsed as before.
+
+    :param params: keyword arguments for the request, to which to add the extension
+    :param request_obj: object (or dict) from which the request body is serialized
+    """
+    if isinstance(request_obj, dict):
+        entities = request_obj.get("entities")
+    else:
+        entities = getattr(request_obj, "entities", None)
+    if not isinstance(entities, list):
+        return
+    params.setdefault("extensions", {})[AUTH_POLICY_CREATE_EXTENSION] = any(
+        _is_auth_policy_create(entity) for entity in entities
+    )
+
 
 def build_policy_search_request(
     policy_name: str, persona_qualified_name: str
@@ -70,6 +105,9 @@ def parse_auth_policy_entity(request: httpx.Request) -> Optional[tuple[str, str,
     """
     if request.method != "POST" or BULK_UPDATE.path not in str(request.url):
         return None
+    # Skip parsing the body of requests marked as not creating any AuthPolicy
+    if request.extensions.get(AUTH_POLICY_CREATE_EXTENSION) is False:
+        return None
     if not request.content:
         return None
 
@@ -3,7 +3,15 @@
 from __future__ import annotations
 
 from contextlib import _AsyncGeneratorContextManager, _GeneratorContextManager
-from typing import Any, Dict, Optional, Protocol, runtime_checkable
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    Iterator,
+    Optional,
+    Protocol,
+    runtime_checkable,
+)
 
 from httpx_retries import Retry
 
@@ -30,6 +38,11 @@ class ApiCaller(Protocol):
     ):
         pass
 
+    def _stream_api(
+        self, api, query_params=None, request_obj=None
+    ) -> _GeneratorContextManager[Iterator[bytes]]:
+        pass
+
     def max_retries(
         self, max_retries: Retry = CONNECTION_RETRY
     ) -> _GeneratorContextManager[None]:
@@ -61,6 +74,11 @@ class AsyncApiCaller(Protocol):
     ) -> Any:
         pass
 
+    def _stream_api(
+        self, api, query_params=None, request_obj=None
+    ) -> _AsyncGeneratorContextManager[AsyncIterator[bytes]]:
+        pass
+
     async def max_retries(
         self, max_retries: Retry = CONNECTION_RETRY
     ) -> _AsyncGeneratorContextManager[None]:
@@ -1,8 +1,90 @@
+from json import JSONDecodeError
+from typing import Any, Dict, Generator, List
+
 from pydantic.v1 import validate_arguments
 
 from pyatlan.client.common import ApiCaller, QueryStream
 from pyatlan.errors import ErrorCode
 from pyatlan.model.query import QueryRequest, QueryResponse
+from pyatlan.utils import EventStreamParser
+
+
+class QueryResults:
+    """
+    Captures the results of a query, which are streamed (in batches of rows) as they
+    are received, so that only one batch of rows is held in memory at a time. The query
+    is run each time the results are iterated through.
+    """
+
+    def __init__(self, client: ApiCaller, request: QueryRequest):
+        self._client = client
+        self._request = request
+        self._response = QueryResponse()
+
+    @property
+    def response(self) -> QueryResponse:
+        """
+        Details of the query (its columns, and any error), without any of its rows.
+        These are complete once all the results have been iterated through.
+        """
+        return self._response
+
+    def __iter__(self) -> Generator[List[str], None, None]:
+        """
+        Iterates through each row of the results, as it is received.
+
+        :returns: an iterable form of each row of the results
+        :raises AtlanError: on any issues with API communication
+        """
+        return self.iter_rows()
+
+    def iter_rows(self) -> Generator[List[str], None, None]:
+        """
+        Iterates through each row of the results, as it is received.
+
+        :returns: an iterable form of each row of the results
+        :raises AtlanError: on any issues with API communication
+        """
+        for batch in self.iter_batches():
+            yield from batch
+
+    def iter_batches(
+        self, batch_size: int = 1000, columnar: bool = False
+    ) -> Generator[List[Any], None, None]:
+        """
+        Iterates through the results in batches of rows, as they are received.
+
+        :param batch_size: maximum number of rows in each batch
+        :param columnar: whether to arrange each batch by column, as a list of the
+            values of each column (in the order of the `columns` of the response),
+            which can be loaded directly into columnar structures (such as Arrow
+            arrays or NumPy arrays), or by row (as a list of rows), defaults to by row
+        :returns: an iterable form of each batch of rows of the results
+        :raises AtlanError: on any issues with API communication
+        """
+        batch: List[Any] = []
+        for event in self._stream_events():
+            for row in QueryStream.process_event(self._response, event):
+                batch.append(row)
+                if len(batch) == batch_size:
+                    yield QueryStream.to_batch(batch, columnar)
+                    batch = []
+        if batch:
+            yield QueryStream.to_batch(batch, columnar)
+
+    def _stream_events(self) -> Generator[Dict[str, Any], None, None]:
+        self._response = QueryResponse()
+        endpoint, request_obj = QueryStream.prepare_request(self._request)
+        parser = EventStreamParser()
+        try:
+            with self._client._stream_api(endpoint, request_obj=request_obj) as chunks:
+                for chunk in chunks:
+                    yield from parser.feed(chunk)
+                yield from parser.close()
+        except JSONDecodeError as err:
+            raise ErrorCode.JSON_ERROR.exception_with_parameters(
+                err.doc, 200, str(err)
+            ) from err
 
 
 class QueryClient:
@@ -34,3 +116,14 @@ class QueryClient:
 
         # Process response using shared logic
         return QueryStream.process_response(raw_json)
+
+    @validate_arguments
+    def stream_results(self, request: QueryRequest) -> QueryResults:
+        """
+        Runs the provided query, streaming its results as they are received
+        (rather than holding all of them in memory at once).
+
+        :param: request query to run.
+        :returns: results of the query, which run the query as they are iterated through.
+        """
+        return QueryResults(client=self._client, request=request)
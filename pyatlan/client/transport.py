@@ -5,13 +5,18 @@ This module provides transport classes that properly integrate retry logic
 with httpx's HTTPTransport while respecting proxy and SSL configurations.
 """
 
+import asyncio
 import logging
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
 from functools import partial
-from typing import TYPE_CHECKING, Any, Optional, Union, cast
+from typing import TYPE_CHECKING, Any, Generator, List, Optional, Union, cast
 
 import httpx
 from httpx_retries import Retry
 
+from pyatlan.client.common.rate_limit import RateLimiter, parse_retry_after
 from pyatlan.client.common.transport import (
     check_for_duplicate_policy,
     check_for_duplicate_policy_async,
@@ -22,6 +27,63 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Status codes of the responses retried within the current context, when recorded
+_retried_status_codes: ContextVar[Optional[List[int]]] = ContextVar(
+    "_retried_status_codes", default=None
+)
+
+
+@contextmanager
+def record_retried_status_codes() -> Generator[List[int], None, None]:
+    """
+    Records the status code of every response that is retried by either transport
+    (within the current context) while the context manager is active, so that callers
+    can react to throttling (429) or server errors (5xx) that were retried successfully.
+
+    :returns: the status codes retried so far, in the order they were received
+    """
+    status_codes: List[int] = []
+    token = _retried_status_codes.set(status_codes)
+    try:
+        yield status_codes
+    finally:
+        _retried_status_codes.reset(token)
+
+
+def _record_retried_status_code(status_code: int) -> None:
+    status_codes = _retried_status_codes.get()
+    if status_codes is not None:
+        status_codes.append(status_code)
+
+
+# Sizes of the request bodies sent within the current context, when recorded
+_request_body_sizes: ContextVar[Optional[List[int]]] = ContextVar(
+    "_request_body_sizes", default=None
+)
+
+
+@contextmanager
+def record_request_body_sizes() -> Generator[List[int], None, None]:
+    """
+    Records the size (in bytes, before any compression) of the body of every request
+    sent by either client (within the current context) while the context manager is
+    active, so that callers can size subsequent requests by those actually sent.
+
+    :returns: the sizes of the request bodies sent so far, in the order they were sent
+    """
+    sizes: List[int] = []
+    token = _request_body_sizes.set(sizes)
+    try:
+        yield sizes
+    finally:
+        _request_body_sizes.reset(token)
+
+
+def _record_request_body_size(size: int) -> None:
+    sizes = _request_body_sizes.get()
+    if sizes is not None:
+        sizes.append(size)
+
 
 class PyatlanSyncTransport(httpx.BaseTransport):
     """
@@ -43,6 +105,7 @@ class PyatlanSyncTransport(httpx.BaseTransport):
 
     Args:
         retry: The retry configuration. Defaults to Retry() if not provided.
+        rate_limiter: Paces every attempt of every request, if provided.
         **kwargs: All other arguments are passed to httpx.HTTPTransport,
                  including proxy, verify, cert, trust_env, http1, http2, limits, etc.
     """
@@ -51,10 +114,12 @@ class PyatlanSyncTransport(httpx.BaseTransport):
         self,
         retry: Optional[Retry] = None,
         client: Optional["AtlanClient"] = None,
+        rate_limiter: Optional[RateLimiter] = None,
         **kwargs: Any,
     ) -> None:
         self.retry = retry or Retry()
         self._client = client  # Reference to AtlanClient for duplicate checking
+        self._rate_limiter = rate_limiter  # Shared by all transports of the client
         # Ensure trust_env is True by default to respect environment variables
         # unless explicitly overridden
         if "trust_env" not in kwargs:
@@ -82,16 +147,29 @@ class PyatlanSyncTransport(httpx.BaseTransport):
         logger.debug("handle_request started request=%s", request)
 
         if self.retry.is_retryable_method(request.method):
-            send_method = partial(self._transport.handle_request)
+            send_method = partial(self._send)
             response = self._retry_operation(request, send_method)
         else:
-            response = self._transport.handle_request(request)
+            response = self._send(request)
 
         logger.debug(
             "handle_request finished request=%s response=%s", request, response
         )
         return response
 
+    def _send(self, request: httpx.Request) -> httpx.Response:
+        """Send a single attempt of a request, paced by the rate limiter (if any)."""
+        if self._rate_limiter is None:
+            return self._transport.handle_request(request)
+        bucket = self._rate_limiter.bucket(request)
+        delay = bucket.reserve()
+        if delay > 0:
+            logger.debug("Rate limiter delaying request=%s by %.3fs", request, delay)
+            time.sleep(delay)
+        response = self._transport.handle_request(request)
+        bucket.record(response.status_code, parse_retry_after(response))
+        return response
+
     def _retry_operation(
         self,
         request: httpx.Request,
@@ -110,6 +188,7 @@ class PyatlanSyncTransport(httpx.BaseTransport):
                 # the connection back to the pool. Headers are already buffered
                 # in memory, so retry.sleep() can still read Retry-After.
                 if isinstance(response, httpx.Response):
+                    _record_retried_status_code(response.status_code)
                     response.close()
                 retry = retry.increment()
                 retry.sleep(response)
@@ -166,6 +245,7 @@ class PyatlanAsyncTransport(httpx.AsyncBaseTransport):
 
     Args:
         retry: The retry configuration. Defaults to Retry() if not provided.
+        rate_limiter: Paces every attempt of every request, if provided.
         **kwargs: All other arguments are passed to httpx.AsyncHTTPTransport,
                  including proxy, verify, cert, trust_env, http1, http2, limits, etc.
     """
@@ -174,10 +254,12 @@ class PyatlanAsyncTransport(httpx.AsyncBaseTransport):
         self,
         retry: Optional[Retry] = None,
         client: Optional["AtlanClient"] = None,
+        rate_limiter: Optional[RateLimiter] = None,
         **kwargs: Any,
     ) -> None:
         self.retry = retry or Retry()
         self._client = client  # Reference to AtlanClient for duplicate checking
+        self._rate_limiter = rate_limiter  # Shared by all transports of the client
         # Ensure trust_env is True by default to respect environment variables
         # unless explicitly overridden
         if "trust_env" not in kwargs:
@@ -205,16 +287,29 @@ class PyatlanAsyncTransport(httpx.AsyncBaseTransport):
         logger.debug("handle_async_request started request=%s", request)
 
         if self.retry.is_retryable_method(request.method):
-            send_method = partial(self._transport.handle_async_request)
+            send_method = partial(self._send_async)
             response = await self._retry_operation_async(request, send_method)
         else:
-            response = await self._transport.handle_async_request(request)
+            response = await self._send_async(request)
 
         logger.debug(
             "handle_async_request finished request=%s response=%s", request, response
         )
         return response
 
+    async def _send_async(self, request: httpx.Request) -> httpx.Response:
+        """Send a single attempt of a request, paced by the rate limiter (if any)."""
+        if self._rate_limiter is None:
+            return await self._transport.handle_async_request(request)
+        bucket = self._rate_limiter.bucket(request)
+        delay = bucket.reserve()
+        if delay > 0:
+            logger.debug("Rate limiter delaying request=%s by %.3fs", request, delay)
+            await asyncio.sleep(delay)
+        response = await self._transport.handle_async_request(request)
+        bucket.record(response.status_code, parse_retry_after(response))
+        return response
+
     async def _retry_operation_async(
         self,
         request: httpx.Request,
@@ -235,6 +330,7 @@ class PyatlanAsyncTransport(httpx.AsyncBaseTransport):
                 # the connection back to the pool. Headers are already buffered
                 # in memory, so retry.asleep() can still read Retry-After.
                 if isinstance(response, httpx.Response):
+                    _record_retried_status_code(response.status_code)
                     await response.aclose()
                 retry = retry.increment()
                 await retry.asleep(response)
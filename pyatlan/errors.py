@@ -696,6 +696,13 @@ class ErrorCode(Enum):
         "Replace any underscores with hyphens (e.g. 'dev_cmdr' -> 'dev-cmdr'). Underscores, dots, uppercase letters, whitespace, and other characters are not permitted because the Atlan platform's asset-import path rejects them at ingestion time, leaving phantom Connection rows in Atlas. Mirrors the Java SDK constraint (atlan-java ErrorCode.INVALID_CONNECTION_QN).",
         InvalidRequestError,
     )
+    UNKNOWN_CACHE = (
+        400,
+        "ATLAN-PYTHON-400-080",
+        "Unknown cache(s) to warm up: {0}. Expected any of: {1}.",
+        "Use the name of the cache's property on the client, for example: atlan_tag_cache.",
+        InvalidRequestError,
+    )
     AUTHENTICATION_PASSTHROUGH = (
         401,
         "ATLAN-PYTHON-401-000",
@@ -4,13 +4,29 @@
 from __future__ import annotations
 
 import abc
-from typing import TYPE_CHECKING, AsyncGenerator, List, Optional, Set
+import asyncio
+from collections import deque
+from json import JSONDecodeError
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncGenerator,
+    Deque,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
 
 from pydantic.v1 import ValidationError, parse_obj_as
 
+from pyatlan.client.common import Search
 from pyatlan.client.constants import INDEX_SEARCH
 from pyatlan.errors import ErrorCode
 from pyatlan.model.aggregation import Aggregations
+from pyatlan.model.aio.core import AsyncAtlanResponse
 from pyatlan.model.assets import Asset
 from pyatlan.model.search import (
     DSL,
@@ -22,7 +38,10 @@ from pyatlan.model.search import (
     SortItem,
     SortOrder,
 )
-from pyatlan.utils import API, unflatten_custom_metadata_for_entity
+from pyatlan.utils import (
+    API,
+    JsonArrayStreamParser,
+)
 
 if TYPE_CHECKING:
     from pyatlan.client.aio.client import AsyncAtlanClient
@@ -50,8 +69,6 @@ class AsyncSearchResults(abc.ABC):
         self._size = size
         self._assets = assets
         self._processed_guids: Set[str] = set()
-        self._first_record_creation_time = -2
-        self._last_record_creation_time = -2
 
     def current_page(self) -> List[Asset]:
         """
@@ -89,6 +106,15 @@ class AsyncSearchResults(abc.ABC):
             self._endpoint,
             request_obj=self._criteria,
         )
+        return self._process_page_json(raw_json, is_bulk_search)
+
+    def _process_page_json(self, raw_json, is_bulk_search: bool = False):
+        """
+        Processes the raw JSON of a page of results into the current page.
+        :param raw_json: JSON of the page of results, as-is
+        :param is_bulk_search: whether the results were retrieved for a bulk search.
+        :returns: JSON for the page of results, as-is (or None if it has no results)
+        """
         if "entities" not in raw_json:
             self._assets = []
             return
@@ -96,7 +122,6 @@ class AsyncSearchResults(abc.ABC):
             self._process_entities(raw_json["entities"])
             if is_bulk_search:
                 self._filter_processed_assets()
-                self._update_first_last_record_creation_times()
             return raw_json
 
         except ValidationError as err:
@@ -105,26 +130,11 @@ class AsyncSearchResults(abc.ABC):
             ) from err
 
     def _process_entities(self, entities):
+        plan = self._criteria.custom_metadata_plan
         for entity in entities:
-            unflatten_custom_metadata_for_entity(
-                entity=entity, attributes=self._criteria.attributes
-            )
+            plan.unflatten_for_entity(entity)
         self._assets = parse_obj_as(List[Asset], entities)
 
-    def _update_first_last_record_creation_times(self):
-        self._first_record_creation_time = self._last_record_creation_time = -2
-
-        if not isinstance(self._assets, list) or len(self._assets) <= 1:
-            return
-
-        first_asset, last_asset = self._assets[0], self._assets[-1]
-
-        if first_asset:
-            self._first_record_creation_time = first_asset.create_time
-
-        if last_asset:
-            self._last_record_creation_time = last_asset.create_time
-
     def _filter_processed_assets(self):
         self._assets = [
             asset
@@ -166,6 +176,8 @@ class AsyncIndexSearchResults(AsyncSearchResults):
         assets: List[Asset],
         aggregations: Optional[Aggregations],
         bulk: bool = False,
+        stream: bool = False,
+        prefetch: int = 0,
     ):
         super().__init__(
             client,  # type: ignore[arg-type]
@@ -179,6 +191,10 @@ class AsyncIndexSearchResults(AsyncSearchResults):
         self._approximate_count = count
         self._aggregations = aggregations
         self._bulk = bulk
+        self._stream = stream
+        self._paging_timestamp: Optional[int] = None
+        self._streamed_page: List[Tuple[str, Optional[int]]] = []
+        self._prefetch = prefetch
 
     @property
     def aggregations(self) -> Optional[Aggregations]:
@@ -192,9 +208,9 @@ class AsyncIndexSearchResults(AsyncSearchResults):
                     continue
                 rewritten_filters.append(filter_)
 
-        if self._first_record_creation_time != self._last_record_creation_time:
+        if isinstance(self._paging_timestamp, int) and self._paging_timestamp > 0:
             rewritten_filters.append(
-                self.get_paging_timestamp_query(self._last_record_creation_time)
+                self.get_paging_timestamp_query(self._paging_timestamp)
             )
             if isinstance(query, Bool):
                 rewritten_query = Bool(
@@ -210,23 +226,35 @@ class AsyncIndexSearchResults(AsyncSearchResults):
                 # in the DSL, append it to the Bool `filter`.
                 rewritten_filters.append(query)
                 rewritten_query = Bool(filter=rewritten_filters)
-            self._criteria.dsl.from_ = 0  # type: ignore[attr-defined]
+            # Results are sorted by creation time and then by GUID (which the DSL
+            # always includes), so skip past the assets already processed at the
+            # latest creation time rather than re-fetching them, even when they
+            # span more than a whole page of results
+            self._criteria.dsl.from_ = len(self._processed_guids)  # type: ignore[attr-defined]
             self._criteria.dsl.query = rewritten_query  # type: ignore[attr-defined]
         else:
-            # Ensure that when switching to offset-based paging, if the first and last record timestamps are the same,
-            # we do not include a created timestamp filter (ie: Range(field='__timestamp', gte=VALUE)) in the query.
-            # Instead, ensure the search runs with only SortItem(field='__timestamp', order=<SortOrder.ASCENDING>).
-            # Failing to do so can lead to incomplete results (less than the approximate count) when running the search
-            # with a small page size.
+            # Without any creation time to page from, ensure the search runs
+            # with no created timestamp filter (ie: Range(field='__timestamp', gte=VALUE))
+            # and falls back to offset-based paging.
             if isinstance(query, Bool):
                 for filter_ in query.filter:
                     if self.is_paging_timestamp_query(filter_):
                         query.filter.remove(filter_)
 
-            # Always ensure that the offset is set to the length of the processed assets
-            # instead of the default (start + size), as the default may skip some assets
-            # and result in incomplete results (less than the approximate count)
-            self._criteria.dsl.from_ = len(self._processed_guids)  # type: ignore[attr-defined]
+    def _update_processed_window(self, processed: Iterable[Tuple[str, Optional[int]]]):
+        """
+        Tracks the assets that have been processed through timestamp-based paging.
+        As results are sorted by creation time, only the assets that share the latest
+        creation time can be returned again by the request for the next page, so only
+        their GUIDs are retained (rather than those of every asset processed so far).
+
+        :param processed: GUID and creation time of each processed asset, in order
+        """
+        for guid, create_time in processed:
+            if create_time != self._paging_timestamp:
+                self._paging_timestamp = create_time
+                self._processed_guids = set()
+            self._processed_guids.add(guid)
 
     async def next_page(self, start=None, size=None) -> bool:
         """
@@ -246,8 +274,10 @@ class AsyncIndexSearchResults(AsyncSearchResults):
             # in a previous page of results.
             # If it has,then exclude it from the current results;
             # otherwise, we may encounter duplicate asset records.
-            self._processed_guids.update(
-                asset.guid for asset in self._assets if asset is not None
+            self._update_processed_window(
+                (asset.guid, asset.create_time)
+                for asset in self._assets
+                if asset is not None
             )
         return await self._get_next_page() if self._assets else False
 
@@ -257,19 +287,209 @@ class AsyncIndexSearchResults(AsyncSearchResults):
 
         :returns: True if the next page of results was fetched, False if there was no next page
         """
-        query = self._criteria.dsl.query
-        self._criteria.dsl.size = self._size
-        self._criteria.dsl.from_ = self._start
+        is_bulk_search = self._prepare_next_page_request()
+        if raw_json := await super()._get_next_page_json(is_bulk_search):
+            self._count = raw_json.get("approximateCount", 0)
+            return True
+        return False
+
+    def _prepare_next_page_request(self) -> bool:
+        """
+        Updates the search criteria to request the next page of results.
+
+        :returns: True if the next page is to be retrieved through a bulk search
+        """
+        query = self._criteria.dsl.query  # type: ignore[attr-defined]
+        self._criteria.dsl.size = self._size  # type: ignore[attr-defined]
+        self._criteria.dsl.from_ = self._start  # type: ignore[attr-defined]
         is_bulk_search = (
             self._bulk or self._approximate_count > self._MASS_EXTRACT_THRESHOLD
         )
 
         if is_bulk_search:
             self._prepare_query_for_timestamp_paging(query)
-        if raw_json := await super()._get_next_page_json(is_bulk_search):
-            self._count = raw_json.get("approximateCount", 0)
-            return True
-        return False
+        return is_bulk_search
+
+    async def _stream_entities(self) -> AsyncGenerator[Dict[str, Any], None]:
+        """
+        Streams the raw JSON of each entity on the page of results for the current
+        search criteria, as soon as it has been received.
+
+        :returns: an async iterable form of the raw JSON of each entity on the page
+        """
+        parser = JsonArrayStreamParser("entities")
+        try:
+            async with self._client._stream_api(
+                self._endpoint, request_obj=self._criteria
+            ) as chunks:
+                async for chunk in chunks:
+                    for entity in parser.feed(chunk):
+                        yield entity
+                for entity in parser.close():
+                    yield entity
+        except JSONDecodeError as err:
+            raise ErrorCode.JSON_ERROR.exception_with_parameters(
+                err.doc, 200, str(err)
+            ) from err
+        if "approximateCount" in parser.fields:
+            self._count = parser.fields["approximateCount"]
+
+    async def _stream_page(self, is_bulk_search: bool) -> AsyncGenerator[Asset, None]:
+        """
+        Streams the page of results for the current search criteria, building and
+        yielding each asset as soon as its entity has been received.
+
+        :param is_bulk_search: whether the page is being retrieved for a bulk search
+        :returns: an async iterable form of each result on the page
+        """
+        # Local import to avoid circular dependency
+        from pyatlan.client.atlan import response_translation_var
+
+        translate = response_translation_var.get()
+        self._streamed_page = []
+        async for entity in self._stream_entities():
+            translated = await AsyncAtlanResponse(
+                raw_json=entity,
+                client=self._client,  # type: ignore[arg-type]
+                translate=translate,
+            ).to_dict()
+            asset = Search.process_streamed_entity(translated, self._criteria)
+            if is_bulk_search and asset.guid in self._processed_guids:
+                continue
+            # Streamed assets are not retained once they are yielded
+            self._streamed_page.append((asset.guid, asset.create_time))
+            yield asset
+
+    async def _iter_streamed(self) -> AsyncGenerator[Asset, None]:
+        # The first page is retrieved in the same way as a non-streamed search
+        is_bulk_search = False
+        while True:
+            async for asset in self._stream_page(is_bulk_search):
+                yield asset
+            # Mirror next_page(), using only the GUIDs (and creation times)
+            # of the streamed page
+            self._start = self._start + self._size
+            if not self._streamed_page:
+                break
+            if self._bulk or self._approximate_count > self._MASS_EXTRACT_THRESHOLD:
+                self._update_processed_window(self._streamed_page)
+            is_bulk_search = self._prepare_next_page_request()
+
+    async def _request_page(self, request: SearchRequest) -> asyncio.Task:
+        page = asyncio.create_task(
+            self._client._call_api(self._endpoint, request_obj=request)
+        )
+        # Let the request get underway before the current page is handled
+        await asyncio.sleep(0)
+        return page
+
+    async def _iter_prefetched(self) -> AsyncGenerator[Asset, None]:
+        pages: Deque[asyncio.Task] = deque()
+        try:
+            if self._bulk or self._approximate_count > self._MASS_EXTRACT_THRESHOLD:
+                iterator = self._iter_pipelined(pages)
+            else:
+                iterator = self._iter_offset_prefetched(pages)
+            async for asset in iterator:
+                yield asset
+        finally:
+            for page in pages:
+                page.cancel()
+
+    async def _iter_offset_prefetched(
+        self, pages: Deque[asyncio.Task]
+    ) -> AsyncGenerator[Asset, None]:
+        # Each page of offset-based paging is independent of the others,
+        # so up to `prefetch` upcoming pages can be requested at any time
+        requested_from = self._start
+        while True:
+            # Always request the next page (as next_page() would), but only
+            # request pages beyond it within the (approximate) count of results
+            while (
+                self._assets
+                and len(pages) < self._prefetch
+                and (not pages or requested_from + self._size < self._count)
+            ):
+                requested_from += self._size
+                request = self._criteria.copy(
+                    update={
+                        "dsl": self._criteria.dsl.copy(  # type: ignore[attr-defined]
+                            update={"from_": requested_from, "size": self._size}
+                        )
+                    }
+                )
+                pages.append(await self._request_page(request))
+            for asset in self.current_page():
+                yield asset
+            if not self._assets:
+                break
+            self._start = self._start + self._size
+            self._criteria.dsl.from_ = self._start  # type: ignore[attr-defined]
+            self._criteria.dsl.size = self._size  # type: ignore[attr-defined]
+            if raw_json := self._process_page_json(await pages.popleft()):
+                self._count = raw_json.get("approximateCount", 0)
+
+    async def _iter_pipelined(
+        self, pages: Deque[asyncio.Task]
+    ) -> AsyncGenerator[Asset, None]:
+        # Each page of timestamp-based paging depends on the page before it, so
+        # (only) the next page is requested as soon as the previous page's raw
+        # JSON has been received, while that page is parsed and then handled
+        page = [
+            (asset.guid, asset.create_time)
+            for asset in self._assets
+            if asset is not None
+        ]
+        raw_json: Dict[str, Any] = {}
+        entities: Optional[List[Dict[str, Any]]] = None
+        while True:
+            if page:
+                # Mirror next_page(), using only the GUIDs (and creation times)
+                # of the page
+                self._start = self._start + self._size
+                self._update_processed_window(page)
+                self._prepare_next_page_request()
+                pages.append(await self._request_page(self._criteria))
+            if entities is not None:
+                try:
+                    self._process_entities(entities)
+                except ValidationError as err:
+                    raise ErrorCode.JSON_ERROR.exception_with_parameters(
+                        raw_json, 200, str(err)
+                    ) from err
+            for asset in self.current_page():
+                yield asset
+            if not pages:
+                break
+            raw_json = await pages.popleft() or {}
+            # Equivalent of _filter_processed_assets(), on the raw JSON
+            entities = [
+                entity
+                for entity in raw_json.get("entities") or []
+                if entity.get("guid") not in self._processed_guids
+            ]
+            page = [(entity["guid"], entity.get("createTime")) for entity in entities]
+            if "entities" in raw_json:
+                self._count = raw_json.get("approximateCount", 0)
+
+    async def __aiter__(self) -> AsyncGenerator[Asset, None]:
+        """
+        Async iterates through the results, lazily-fetching each next page until there
+        are no more results. When streaming, each page is parsed incrementally as
+        it is received, and each asset is yielded as soon as it has been built.
+        When prefetching, upcoming pages are fetched concurrently while the
+        current page is being handled.
+
+        :returns: an async iterable form of each result, across all pages
+        """
+        if self._stream:
+            iterator = self._iter_streamed()
+        elif self._prefetch:
+            iterator = self._iter_prefetched()
+        else:
+            iterator = super().__aiter__()
+        async for asset in iterator:
+            yield asset
 
     @property
     def count(self) -> int:
@@ -7,7 +7,12 @@ from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
 
 from pyatlan.model.aio.retranslators import AsyncAtlanTagRetranslator
 from pyatlan.model.aio.translators import AsyncAtlanTagTranslator
-from pyatlan.model.core import AtlanObject
+from pyatlan.model.core import (
+    UNTRANSLATED_RESPONSE_KEYS,
+    AtlanObject,
+    iter_nested_dicts,
+    to_request_dict,
+)
 
 if TYPE_CHECKING:
     from pyatlan.client.aio.client import AsyncAtlanClient
@@ -19,10 +24,19 @@ class AsyncAtlanResponse:
     from the Atlan API into human-readable formats using async translators.
     """
 
-    def __init__(self, raw_json: Dict[str, Any], client: AsyncAtlanClient):
+    def __init__(
+        self,
+        raw_json: Dict[str, Any],
+        client: AsyncAtlanClient,
+        translate: bool = True,
+    ):
         """
         Initialize the AsyncAtlanResponse with raw JSON and client.
         Translation must be done asynchronously via translate() method.
+
+        :param raw_json: decoded JSON of the response
+        :param client: async connectivity to the Atlan tenant
+        :param translate: whether to apply the translators (True) or leave the response as-is (False)
         """
         self.raw_json = raw_json
         self.client = client
@@ -30,7 +44,9 @@ class AsyncAtlanResponse:
             AsyncAtlanTagTranslator(client),
             # Register more async translators here
         ]
-        self.translated: Optional[Union[Dict[str, Any], List[Any], Any]] = None
+        self.translated: Optional[Union[Dict[str, Any], List[Any], Any]] = (
+            None if translate else raw_json
+        )
 
     async def translate(self) -> Union[Dict[str, Any], List[Any], Any]:
         """
@@ -45,24 +61,15 @@ class AsyncAtlanResponse:
         self, data: Union[Dict[str, Any], List[Any], Any]
     ) -> Union[Dict[str, Any], List[Any], Any]:
         """
-        Recursively translate fields in a JSON structure using registered async translators.
+        Translate, in place, every dict nested within a JSON structure to which
+        a registered async translator applies. Subtrees that never carry
+        translatable values are neither walked nor copied.
         """
-        if isinstance(data, dict):
-            # Apply translators to this dict if any apply
+        for node in iter_nested_dicts(data, skip_keys=UNTRANSLATED_RESPONSE_KEYS):
             for translator in self.translators:
-                if translator.applies_to(data):
-                    data = await translator.translate(data)
-
-            # Recursively apply to each value
-            return {
-                key: await self._deep_translate(value) for key, value in data.items()
-            }
-
-        elif isinstance(data, list):
-            return [await self._deep_translate(item) for item in data]
-
-        else:
-            return data
+                if translator.applies_to(node):
+                    node.update(await translator.translate(node))
+        return data
 
     async def to_dict(self) -> Union[Dict[str, Any], List[Any], Any]:
         """
@@ -99,39 +106,19 @@ class AsyncAtlanRequest:
 
         :returns: The retranslated JSON structure
         """
-        # Serialize the instance to JSON first
-        try:
-            # Use json_async if available for async clients
-            if hasattr(self.instance, "json_async"):
-                raw_json = await self.instance.json_async(
-                    by_alias=True, exclude_unset=True, client=self.client
-                )
-            else:
-                raw_json = self.instance.json(
-                    by_alias=True, exclude_unset=True, client=self.client
-                )
-        except (TypeError, AttributeError):
-            raw_json = self.instance.json(
-                by_alias=True,
-                exclude_unset=True,
-            )
-        parsed = json.loads(raw_json)
-        self.translated = await self._deep_retranslate(parsed)
+        if hasattr(self.instance, "prepare_for_request_async"):
+            await self.instance.prepare_for_request_async(self.client)
+        self.translated = await self._deep_retranslate(to_request_dict(self.instance))
         return self.translated
 
     async def _deep_retranslate(self, data: Any) -> Any:
         """
-        Recursively traverse and apply async retranslators to JSON-like data.
+        Apply async retranslators, in place, to every dict nested within JSON-like data.
         """
-        if isinstance(data, dict):
+        for node in iter_nested_dicts(data):
             for retranslator in self.retranslators:
-                if retranslator.applies_to(data):
-                    data = await retranslator.retranslate(data)
-            return {
-                key: await self._deep_retranslate(value) for key, value in data.items()
-            }
-        elif isinstance(data, list):
-            return [await self._deep_retranslate(item) for item in data]
+                if retranslator.applies_to(node):
+                    node.update(await retranslator.retranslate(node))
         return data
 
     async def json(self, **kwargs) -> str:
@@ -141,4 +128,15 @@ class AsyncAtlanRequest:
         """
         if self.translated is None:
             await self.retranslate()
-        return json.dumps(self.translated, **kwargs)
+        return json.dumps(
+            self.translated,
+            default=self.instance.__json_encoder__,  # type: ignore[arg-type]
+            **kwargs,
+        )
+
+    async def to_bytes(self) -> bytes:
+        """
+        Returns the fully retranslated (compact) JSON payload,
+        encoded in a single pass, for use directly as a request body.
+        """
+        return (await self.json(separators=(",", ":"))).encode("utf-8")
@@ -49,6 +49,7 @@ class AsyncAtlanTagRetranslator(AsyncBaseRetranslator):
         "addOrUpdateClassifications",
         "removeClassifications",
     }
+    _ALL_CLASSIFICATION_KEYS = frozenset(_CLASSIFICATION_NAMES | _CLASSIFICATION_KEYS)
 
     def __init__(self, client: AsyncAtlanClient):
         """
@@ -60,9 +61,7 @@ class AsyncAtlanTagRetranslator(AsyncBaseRetranslator):
         """
         Checks whether the input dictionary contains fields related to classifications or tags.
         """
-        return any(key in data for key in self._CLASSIFICATION_NAMES) or any(
-            key in data for key in self._CLASSIFICATION_KEYS
-        )
+        return not data.keys().isdisjoint(self._ALL_CLASSIFICATION_KEYS)
 
     async def retranslate(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -55,34 +55,52 @@ class Referenceable(AtlanObject):
         return values
 
     def json(self, *args, **kwargs) -> str:
-        client = kwargs.get("client")
+        self.prepare_for_request(kwargs.get("client"))
+        return super().json(**kwargs)
+
+    def prepare_for_request(self, client: Optional[AtlanClient]) -> None:
+        """
+        Resolves custom metadata (by name) into its business attributes
+        (by ID) so the asset can be serialized for an API request.
+
+        :param client: connectivity to the Atlan tenant
+        """
         if (
             not self._metadata_proxy
             and client
             and not hasattr(client, "_async_session")
         ):
-            # Only handle synchronous clients in the json() method
+            # Only handle synchronous clients here
             self._metadata_proxy = CustomMetadataProxy(
                 client=client,  # type: ignore[arg-type]
                 business_attributes=self.business_attributes,
             )
             self.business_attributes = self._metadata_proxy.business_attributes
-        return super().json(**kwargs)
 
     async def json_async(self, *args, **kwargs) -> str:
         """
         Async version of json() method for use with AsyncAtlanClient.
         This properly handles async metadata proxy and sets business_attributes.
         """
+        await self.prepare_for_request_async(kwargs.get("client"))
+        return super().json(**kwargs)
+
+    async def prepare_for_request_async(
+        self, client: Optional[AsyncAtlanClient]
+    ) -> None:
+        """
+        Async version of prepare_for_request() for use with AsyncAtlanClient.
+
+        :param client: async connectivity to the Atlan tenant
+        """
         from pyatlan.model.aio.custom_metadata import AsyncCustomMetadataProxy
 
-        client = kwargs.get("client")
         if (
             not self._async_metadata_proxy
             and client
             and hasattr(client, "_async_session")
         ):
-            # Only handle asynchronous clients in the json_async() method
+            # Only handle asynchronous clients here
             self._async_metadata_proxy = AsyncCustomMetadataProxy(
                 client=client,  # type: ignore[arg-type]
                 business_attributes=self.business_attributes,
@@ -90,7 +108,6 @@ class Referenceable(AtlanObject):
             # Get the business attributes asynchronously and set them
             business_attrs = await self._async_metadata_proxy.business_attributes()
             self.business_attributes = business_attrs
-        return super().json(**kwargs)
 
     def to_atlas_dict(self) -> "Dict[str, Any]":
         """Return an Atlas-compatible dict for use with application-sdk JsonFileWriter.
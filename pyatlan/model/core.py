@@ -7,9 +7,10 @@ from abc import ABC
 from typing import TYPE_CHECKING
 
 import yaml  # type: ignore[import-untyped]
-from pydantic.v1 import BaseModel, Extra, Field, root_validator, validator
+from pydantic.v1 import BaseModel, Extra, Field, PrivateAttr, root_validator, validator
 
 from pyatlan.model.utils import encoders, to_camel_case
+from pyatlan.utils import CustomMetadataPlan
 
 if TYPE_CHECKING:
     from dataclasses import dataclass
@@ -19,9 +20,21 @@ if TYPE_CHECKING:
 else:
     from pydantic.v1.dataclasses import dataclass
 
-from typing import Any, Dict, Generic, List, Optional, TypeVar, Union
+from typing import (
+    Any,
+    Dict,
+    FrozenSet,
+    Generator,
+    Generic,
+    List,
+    Optional,
+    Set,
+    TypeVar,
+    Union,
+)
 
 from pydantic.v1.generics import GenericModel
+from pydantic.v1.utils import ROOT_KEY
 
 from pyatlan.errors import ErrorCode
 from pyatlan.model.constants import DELETED_, DELETED_SENTINEL
@@ -154,16 +167,54 @@ class AtlanYamlModel(BaseModel):
         return cls(**data)
 
 
+# Keys of response payloads that never carry Atlan tags, so are never walked for translation
+# (for example, the echo of a search request's DSL and any aggregation results).
+UNTRANSLATED_RESPONSE_KEYS = frozenset({"searchParameters", "aggregations"})
+
+
+def iter_nested_dicts(
+    data: Any, skip_keys: Union[Set[str], FrozenSet[str]] = frozenset()
+) -> Generator[Dict[str, Any], None, None]:
+    """
+    Walk JSON-like data and yield every dict within it (parents before children),
+    without copying any of it. A dict may be modified in place by the consumer
+    before its (possibly replaced) values are walked.
+
+    :param data: JSON-like structure of dicts, lists and scalars
+    :param skip_keys: keys whose values should not be walked (in any dict)
+    :returns: generator of each dict in the structure
+    """
+    stack = [data]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            yield node
+            stack.extend(
+                value
+                for key, value in node.items()
+                if isinstance(value, (dict, list)) and key not in skip_keys
+            )
+        elif isinstance(node, list):
+            stack.extend(item for item in node if isinstance(item, (dict, list)))
+
+
 class AtlanResponse:
     """
     A wrapper class to handle and translate raw JSON responses
     from the Atlan API into human-readable formats using registered translators.
     """
 
-    def __init__(self, raw_json: Dict[str, Any], client: AtlanClient):
+    def __init__(
+        self, raw_json: Dict[str, Any], client: AtlanClient, translate: bool = True
+    ):
         """
         Initialize the AtlanResponse with raw JSON and client.
-        Automatically applies translations to the raw JSON.
+        Automatically applies translations to the raw JSON (in place),
+        unless translation is disabled.
+
+        :param raw_json: decoded JSON of the response
+        :param client: connectivity to the Atlan tenant
+        :param translate: whether to apply the translators (True) or leave the response as-is (False)
         """
         self.raw_json = raw_json
         self.client = client
@@ -171,28 +222,23 @@ class AtlanResponse:
             AtlanTagTranslator(client),
             # Register more translators here
         ]
-        self.translated = self._deep_translate(self.raw_json)
+        self.translated = (
+            self._deep_translate(self.raw_json) if translate else self.raw_json
+        )
 
     def _deep_translate(
         self, data: Union[Dict[str, Any], List[Any], Any]
     ) -> Union[Dict[str, Any], List[Any], Any]:
         """
-        Recursively translate fields in a JSON structure using registered translators.
+        Translate, in place, every dict nested within a JSON structure to which
+        a registered translator applies. Subtrees that never carry translatable
+        values are neither walked nor copied.
         """
-        if isinstance(data, dict):
-            # Apply translators to this dict if any apply
+        for node in iter_nested_dicts(data, skip_keys=UNTRANSLATED_RESPONSE_KEYS):
             for translator in self.translators:
-                if translator.applies_to(data):
-                    data = translator.translate(data)
-
-            # Recursively apply to each value
-            return {key: self._deep_translate(value) for key, value in data.items()}
-
-        elif isinstance(data, list):
-            return [self._deep_translate(item) for item in data]
-
-        else:
-            return data
+                if translator.applies_to(node):
+                    node.update(translator.translate(node))
+        return data
 
     def to_dict(self) -> Union[Dict[str, Any], List[Any], Any]:
         """
@@ -201,6 +247,22 @@ class AtlanResponse:
         return self.translated
 
 
+def to_request_dict(instance: AtlanObject) -> Any:
+    """
+    Convert a model into the (not yet encoded) structure of its request payload.
+    This mirrors ``instance.json(by_alias=True, exclude_unset=True)``, but leaves values
+    that need a custom encoder (datetimes, tag names, queries) to be encoded later,
+    so the payload is never encoded and decoded again just to be walked.
+
+    :param instance: model to convert
+    :returns: dict (or value of a custom root) for the request payload
+    """
+    data = instance.dict(by_alias=True, exclude_unset=True)
+    if instance.__custom_root_type__:
+        data = data[ROOT_KEY]
+    return data
+
+
 class AtlanRequest:
     """
     A wrapper class to handle and retranslate an AtlanObject instance
@@ -211,8 +273,9 @@ class AtlanRequest:
         """
         Initialize an AtlanRequest for a given asset/model instance.
 
-        Serializes the instance to JSON, applies retranslation logic, and prepares
-        a structure compatible with Atlan's API (e.g: converts tag names back to hashed IDs).
+        Converts the instance into a dict once, applies retranslation logic in place, and
+        prepares a structure compatible with Atlan's API (e.g: converts tag names back to hashed IDs).
+        Encoding happens only once, when the payload is requested through json() or to_bytes().
         """
         self.client = client
         self.instance = instance
@@ -220,37 +283,36 @@ class AtlanRequest:
             AtlanTagRetranslator(client),
             # add others...
         ]
-        # Do: instance.json() → parse → translate → store
-        try:
-            raw_json = self.instance.json(
-                by_alias=True, exclude_unset=True, client=self.client
-            )
-        except TypeError:
-            raw_json = self.instance.json(
-                by_alias=True,
-                exclude_unset=True,
-            )
-        parsed = json.loads(raw_json)
-        self.translated = self._deep_retranslate(parsed)
+        if hasattr(instance, "prepare_for_request"):
+            instance.prepare_for_request(client)
+        self.translated = self._deep_retranslate(to_request_dict(instance))
 
     def _deep_retranslate(self, data: Any) -> Any:
         """
-        Recursively traverse and apply retranslators to JSON-like data.
+        Apply retranslators, in place, to every dict nested within JSON-like data.
         """
-        if isinstance(data, dict):
+        for node in iter_nested_dicts(data):
             for retranslator in self.retranslators:
-                if retranslator.applies_to(data):
-                    data = retranslator.retranslate(data)
-            return {key: self._deep_retranslate(value) for key, value in data.items()}
-        elif isinstance(data, list):
-            return [self._deep_retranslate(item) for item in data]
+                if retranslator.applies_to(node):
+                    node.update(retranslator.retranslate(node))
         return data
 
     def json(self, **kwargs) -> str:
         """
         Returns the fully retranslated JSON string, suitable for API calls.
         """
-        return json.dumps(self.translated, **kwargs)
+        return json.dumps(
+            self.translated,
+            default=self.instance.__json_encoder__,  # type: ignore[arg-type]
+            **kwargs,
+        )
+
+    def to_bytes(self) -> bytes:
+        """
+        Returns the fully retranslated (compact) JSON payload,
+        encoded in a single pass, for use directly as a request body.
+        """
+        return self.json(separators=(",", ":")).encode("utf-8")
 
 
 class SearchRequest(AtlanObject, ABC):
@@ -264,6 +326,21 @@ class SearchRequest(AtlanObject, ABC):
     size: Optional[int] = Field(
         default=None, description="How many results to include in each page of results."
     )
+    _custom_metadata_plan: Optional[CustomMetadataPlan] = PrivateAttr(default=None)
+
+    @property
+    def custom_metadata_plan(self) -> CustomMetadataPlan:
+        """
+        Plan for unflattening the custom metadata attributes requested by this search
+        into each of its results, computed once (and again only if the attributes change).
+
+        :returns: the plan for the attributes currently requested
+        """
+        plan = self._custom_metadata_plan
+        if plan is None or plan.attributes != tuple(self.attributes or ()):
+            plan = CustomMetadataPlan(self.attributes)
+            self._custom_metadata_plan = plan
+        return plan
 
 
 @dataclass
@@ -3,12 +3,21 @@ from __future__ import annotations
 import copy
 import dataclasses
 import logging
-from typing import TYPE_CHECKING, Dict, List, Optional, TypeVar, Union
+from typing import (
+    TYPE_CHECKING,
+    AsyncGenerator,
+    Dict,
+    Generator,
+    List,
+    Optional,
+    TypeVar,
+    Union,
+)
 
 from pyatlan.client.asset import IndexSearchResults
 from pyatlan.errors import ErrorCode
 from pyatlan.model.aggregation import Aggregation
-from pyatlan.model.assets import Referenceable, Tag
+from pyatlan.model.assets import Asset, Referenceable, Tag
 from pyatlan.model.enums import EntityStatus
 from pyatlan.model.fields.atlan_fields import AtlanField
 from pyatlan.model.search import (
@@ -676,7 +685,13 @@ class FluentSearch(CompoundQuery):
         request = IndexSearchRequest(dsl=dsl)
         return client.asset.search(request).count
 
-    def execute(self, client: AtlanClient, bulk: bool = False) -> IndexSearchResults:
+    def execute(
+        self,
+        client: AtlanClient,
+        bulk: bool = False,
+        stream: bool = False,
+        prefetch: int = 0,
+    ) -> IndexSearchResults:
         """
         Run the fluent search to retrieve assets that match the supplied criteria.
         `Note:` if the number of results exceeds the predefined threshold
@@ -686,6 +701,10 @@ class FluentSearch(CompoundQuery):
         :param bulk: whether to run the search to retrieve assets that match the supplied criteria,
         for large numbers of results (> `100,000`), defaults to `False`. Note: this will reorder the results
         (based on creation timestamp) in order to iterate through a large number (more than `100,000`) results.
+        :param stream: whether to stream each page of results, building and yielding each asset as soon as it is
+        received rather than once its whole page has been received, defaults to `False`.
+        :param prefetch: number of upcoming pages of results to fetch in the background while iterating through
+        the results, defaults to `0`. For a `bulk` search, only the next page can be fetched ahead.
         :raises InvalidRequestError:
 
             - if bulk search is enabled (`bulk=True`) and any
@@ -697,10 +716,16 @@ class FluentSearch(CompoundQuery):
         :raises AtlanError: on any API communication issue
         :returns: an iterable list of assets that match the supplied criteria, lazily-fetched
         """
-        return client.asset.search(criteria=self.to_request(), bulk=bulk)
+        return client.asset.search(
+            criteria=self.to_request(), bulk=bulk, stream=stream, prefetch=prefetch
+        )
 
     async def execute_async(
-        self, client: AsyncAtlanClient, bulk: bool = False
+        self,
+        client: AsyncAtlanClient,
+        bulk: bool = False,
+        stream: bool = False,
+        prefetch: int = 0,
     ) -> AsyncIndexSearchResults:
         """
         Run the fluent search asynchronously to retrieve assets that match the supplied criteria.
@@ -711,6 +736,10 @@ class FluentSearch(CompoundQuery):
         :param bulk: whether to run the search to retrieve assets that match the supplied criteria,
         for large numbers of results (> `100,000`), defaults to `False`. Note: this will reorder the results
         (based on creation timestamp) in order to iterate through a large number (more than `100,000`) results.
+        :param stream: whether to stream each page of results, building and yielding each asset as soon as it is
+        received rather than once its whole page has been received, defaults to `False`.
+        :param prefetch: number of upcoming pages of results to fetch in the background while iterating through
+        the results, defaults to `0`. For a `bulk` search, only the next page can be fetched ahead.
         :raises InvalidRequestError:
 
             - if bulk search is enabled (`bulk=True`) and any
@@ -722,4 +751,56 @@ class FluentSearch(CompoundQuery):
         :raises AtlanError: on any API communication issue
         :returns: an async iterable list of assets that match the supplied criteria, lazily-fetched
         """
-        return await client.asset.search(criteria=self.to_request(), bulk=bulk)
+        return await client.asset.search(
+            criteria=self.to_request(), bulk=bulk, stream=stream, prefetch=prefetch
+        )
+
+    def execute_parallel(
+        self,
+        client: AtlanClient,
+        partitions: int = 4,
+        bulk: bool = False,
+    ) -> Generator[Asset, None, None]:
+        """
+        Run the fluent search to retrieve assets that match the supplied criteria, split into
+        a number of disjoint partitions (by the creation time of the assets) that are run concurrently.
+        Every matching asset is returned exactly once, but the results of the partitions are interleaved
+        (so any sorting only applies within each partition).
+
+        :param client: client through which to retrieve the assets.
+        :param partitions: maximum number of partitions to split the search into (and run concurrently),
+        defaults to `4`.
+        :param bulk: whether to run each partition as a `bulk` search, defaults to `False`.
+        :raises InvalidRequestError: if bulk search is enabled (`bulk=True`) and any
+        user-specified sorting options are found in the search request.
+        :raises AtlanError: on any API communication issue
+        :returns: a generator of the assets that match the supplied criteria, lazily-fetched
+        """
+        return client.asset.search_parallel(
+            criteria=self.to_request(), partitions=partitions, bulk=bulk
+        )
+
+    async def execute_parallel_async(
+        self,
+        client: AsyncAtlanClient,
+        partitions: int = 4,
+        bulk: bool = False,
+    ) -> AsyncGenerator[Asset, None]:
+        """
+        Run the fluent search asynchronously to retrieve assets that match the supplied criteria, split into
+        a number of disjoint partitions (by the creation time of the assets) that are run concurrently.
+        Every matching asset is returned exactly once, but the results of the partitions are interleaved
+        (so any sorting only applies within each partition).
+
+        :param client: async client through which to retrieve the assets.
+        :param partitions: maximum number of partitions to split the search into (and run concurrently),
+        defaults to `4`.
+        :param bulk: whether to run each partition as a `bulk` search, defaults to `False`.
+        :raises InvalidRequestError: if bulk search is enabled (`bulk=True`) and any
+        user-specified sorting options are found in the search request.
+        :raises AtlanError: on any API communication issue
+        :returns: an async generator of the assets that match the supplied criteria, lazily-fetched
+        """
+        return await client.asset.search_parallel(
+            criteria=self.to_request(), partitions=partitions, bulk=bulk
+        )
@@ -44,6 +44,7 @@ class AtlanTagRetranslator(BaseRetranslator):
         "addOrUpdateClassifications",
         "removeClassifications",
     }
+    _ALL_CLASSIFICATION_KEYS = frozenset(_CLASSIFICATION_NAMES | _CLASSIFICATION_KEYS)
 
     def __init__(self, client: AtlanClient):
         """
@@ -55,9 +56,7 @@ class AtlanTagRetranslator(BaseRetranslator):
         """
         Checks whether the input dictionary contains fields related to classifications or tags.
         """
-        return any(key in data for key in self._CLASSIFICATION_NAMES) or any(
-            key in data for key in self._CLASSIFICATION_KEYS
-        )
+        return not data.keys().isdisjoint(self._ALL_CLASSIFICATION_KEYS)
 
     def retranslate(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -45,6 +45,7 @@ class AtlanTagTranslator(BaseTranslator):
         "addOrUpdateClassifications",
         "removeClassifications",
     }
+    _ALL_CLASSIFICATION_KEYS = frozenset(_CLASSIFICATION_NAMES | _CLASSIFICATION_KEYS)
 
     def __init__(self, client: AtlanClient):
         """
@@ -56,9 +57,7 @@ class AtlanTagTranslator(BaseTranslator):
         """
         Checks if the input dictionary includes classification-related keys.
         """
-        return any(key in data for key in self._CLASSIFICATION_NAMES) or any(
-            key in data for key in self._CLASSIFICATION_KEYS
-        )
+        return not data.keys().isdisjoint(self._ALL_CLASSIFICATION_KEYS)
 
     def translate(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -8,6 +8,7 @@ from typing import Any, Dict, List, Mapping, Optional, Sequence, TypeVar, Union
 
 from pydantic.v1 import BaseModel, parse_obj_as, parse_raw_as
 
+from pyatlan.cache.common.stats import flatten_stats
 from pyatlan.client.aio import AsyncAtlanClient
 from pyatlan.client.atlan import AtlanClient
 from pyatlan.pkg.models import RuntimeConfig
@@ -356,6 +357,26 @@ def add_otel_handler(
     return None
 
 
+def log_cache_stats(
+    client: Union[AtlanClient, AsyncAtlanClient],
+    logger: logging.Logger = LOGGER,
+    level: int = logging.INFO,
+) -> Dict[str, Union[int, float]]:
+    """
+    Log the statistics of the client's caches as the attributes of a single log record
+    (for example, pyatlan.cache.user_cache.hits), so that a handler added through
+    add_otel_handler exports them to OpenTelemetry along with the package's other logs.
+
+    :param client: whose cache statistics to log
+    :param logger: through which to log the statistics
+    :param level: at which to log the statistics
+    :returns: the logged statistics, keyed by their (dotted) names
+    """
+    stats = flatten_stats(client.get_cache_stats())
+    logger.log(level, "Cache statistics: %s", stats, extra=stats)
+    return stats
+
+
 def handle_uncaught_exception(exc_type, exc_value, exc_traceback):
     if issubclass(exc_type, KeyboardInterrupt):
         # Ignore KeyboardInterrupt so a console python program can exit with Ctrl + C.
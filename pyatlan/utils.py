@@ -3,6 +3,7 @@
 # Based on original code from https://github.com/apache/atlas (under Apache-2.0 license)
 from __future__ import annotations
 
+import codecs
 import json
 import logging
 import random
@@ -255,21 +256,69 @@ class API:
         )
 
 
+_CUSTOM_METADATA_ATTRIBUTE = re.compile(r"(\w+)[.](\w+)")
+
+
+class CustomMetadataPlan:
+    """
+    Precomputed plan for unflattening the custom metadata attributes requested by a search
+    (in the form {set ID}.{attribute ID}) into the custom metadata of each of its results.
+    The requested attributes are parsed once, when the plan is created, so that each result
+    only needs to look up the (flattened) custom metadata attributes it actually contains.
+
+    :param attributes: names of the attributes requested by the search
+    """
+
+    __slots__ = ("attributes", "_targets")
+
+    def __init__(self, attributes: Optional[List[str]]):
+        self.attributes = tuple(attributes or ())
+        # (flattened attribute name, custom metadata set ID, attribute ID)
+        self._targets = tuple(
+            (attribute, matched[1], matched[2])
+            for attribute in self.attributes
+            if (matched := _CUSTOM_METADATA_ATTRIBUTE.match(attribute))
+        )
+
+    def __bool__(self) -> bool:
+        return bool(self._targets)
+
+    def unflatten(
+        self, asset_attributes: Optional[Dict[str, Any]]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        :param asset_attributes: (flattened) attributes of a single result
+        :returns: the custom metadata of the result, keyed by set ID and then attribute ID,
+                  or None if no attributes were requested or the result has no attributes
+        """
+        if not self.attributes or not asset_attributes:
+            return None
+        retval: Dict[str, Any] = {}
+        for attribute, set_id, attribute_id in self._targets:
+            if attribute in asset_attributes:
+                if set_id not in retval:
+                    retval[set_id] = {}
+                retval[set_id][attribute_id] = asset_attributes[attribute]
+        return retval
+
+    def unflatten_for_entity(self, entity: Dict[str, Any]):
+        """
+        Set the (unflattened) custom metadata of a single result, if it has any.
+
+        :param entity: raw JSON of the result
+        """
+        if self._targets and (
+            custom_metadata := self.unflatten(entity.get("attributes"))
+        ):
+            entity["businessAttributes"] = custom_metadata
+
+
 def unflatten_custom_metadata(
     attributes: Optional[List[str]], asset_attributes: Optional[Dict[str, Any]]
 ) -> Optional[Dict[str, Any]]:
     if not attributes or not asset_attributes:
         return None
-    retval: Dict[str, Any] = {}
-    metadata_attribute = re.compile(r"(\w+)[.](\w+)")
-    for attribute_of_interest in attributes:
-        if matched := metadata_attribute.match(attribute_of_interest):
-            if attribute_of_interest in asset_attributes:
-                key = matched[1]
-                if key not in retval:
-                    retval[key] = {}
-                retval[key][matched[2]] = asset_attributes[attribute_of_interest]
-    return retval
+    return CustomMetadataPlan(attributes).unflatten(asset_attributes)
 
 
 def unflatten_custom_metadata_for_entity(
@@ -281,6 +330,222 @@ def unflatten_custom_metadata_for_entity(
         entity["businessAttributes"] = custom_metadata
 
 
+class JsonArrayStreamParser:
+    """
+    Incrementally parses a JSON object as its bytes arrive, producing each element
+    of one of its top-level arrays as soon as that element is complete (rather than
+    only once the whole document has been received). All other top-level values are
+    captured in `fields`, and are complete once the whole document has been fed.
+
+    :param array_key: top-level key of the array whose elements should be streamed
+    """
+
+    _WHITESPACE = re.compile(r"[ \t\n\r]*")
+    _INCOMPLETE = object()
+    _NUMBER_CHARS = frozenset("0123456789.eE+-")
+
+    _START = "start"
+    _KEY = "key"
+    _KEY_OR_END = "key_or_end"
+    _COLON = "colon"
+    _VALUE = "value"
+    _NEXT_KEY = "next_key"
+    _ARRAY_START = "array_start"
+    _ELEMENT = "element"
+    _ELEMENT_OR_END = "element_or_end"
+    _NEXT_ELEMENT = "next_element"
+    _DONE = "done"
+
+    def __init__(self, array_key: str):
+        self.array_key = array_key
+        self.fields: Dict[str, Any] = {}
+        self._decoder = json.JSONDecoder()
+        self._text_decoder = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._pos = 0
+        self._retry_len = 0
+        self._key: Optional[str] = None
+        self._state = self._START
+
+    def feed(self, chunk: bytes) -> List[Any]:
+        """
+        Feed the next chunk of bytes of the document to the parser.
+
+        :param chunk: next chunk of bytes of the document
+        :returns: elements of the streamed array completed by this chunk (if any)
+        """
+        self._buffer = self._buffer[self._pos :] + self._text_decoder.decode(chunk)
+        self._pos = 0
+        return self._parse(final=False)
+
+    def close(self) -> List[Any]:
+        """
+        Indicate that the whole document has been fed to the parser.
+
+        :returns: any remaining elements of the streamed array
+        :raises JSONDecodeError: if the document is malformed or incomplete
+        """
+        self._buffer = self._buffer[self._pos :] + self._text_decoder.decode(
+            b"", final=True
+        )
+        self._pos = 0
+        elements = self._parse(final=True)
+        if self._state not in (self._START, self._DONE) or (
+            self._state == self._START and self._buffer.strip()
+        ):
+            raise json.JSONDecodeError(
+                "Unexpected end of document", self._buffer, len(self._buffer)
+            )
+        return elements
+
+    def _decode(self, final: bool) -> Any:
+        # Avoid re-parsing a partially-received value from scratch on every chunk:
+        # only retry once the pending text has (at least) doubled in length
+        pending = len(self._buffer) - self._pos
+        if not final and pending < self._retry_len:
+            return self._INCOMPLETE
+        try:
+            value, end = self._decoder.raw_decode(self._buffer, self._pos)
+        except json.JSONDecodeError:
+            if final:
+                raise
+            self._retry_len = 2 * pending
+            return self._INCOMPLETE
+        if not final and (
+            end == len(self._buffer) or self._buffer[end] in self._NUMBER_CHARS
+        ):
+            # A number at the very end of what has been received so far, or received
+            # only up to its fraction or exponent, may still continue in the next chunk
+            self._retry_len = pending + 1
+            return self._INCOMPLETE
+        self._pos = end
+        self._retry_len = 0
+        return value
+
+    def _expect(self, char: str, expected: str):
+        if char not in expected:
+            raise json.JSONDecodeError(
+                f"Expecting one of {expected!r}", self._buffer, self._pos
+            )
+
+    def _parse(self, final: bool) -> List[Any]:
+        elements: List[Any] = []
+        while self._state != self._DONE:
+            self._pos = self._WHITESPACE.match(self._buffer, self._pos).end()  # type: ignore[union-attr]
+            if self._pos == len(self._buffer):
+                break
+            char = self._buffer[self._pos]
+            if self._state == self._START:
+                self._expect(char, "{")
+                self._pos += 1
+                self._state = self._KEY_OR_END
+            elif self._state in (self._KEY, self._KEY_OR_END):
+                if char == "}" and self._state == self._KEY_OR_END:
+                    self._pos += 1
+                    self._state = self._DONE
+                    continue
+                self._expect(char, '"')
+                key = self._decode(final)
+                if key is self._INCOMPLETE:
+                    break
+                self._key = key
+                self._state = self._COLON
+            elif self._state == self._COLON:
+                self._expect(char, ":")
+                self._pos += 1
+                self._state = (
+                    self._ARRAY_START if self._key == self.array_key else self._VALUE
+                )
+            elif self._state == self._ARRAY_START:
+                if char == "[":
+                    self._pos += 1
+                    self._state = self._ELEMENT_OR_END
+                else:
+                    self._state = self._VALUE
+            elif self._state == self._VALUE:
+                value = self._decode(final)
+                if value is self._INCOMPLETE:
+                    break
+                self.fields[self._key] = value  # type: ignore[index]
+                self._state = self._NEXT_KEY
+            elif self._state == self._NEXT_KEY:
+                self._expect(char, ",}")
+                self._pos += 1
+                self._state = self._KEY if char == "," else self._DONE
+            elif self._state in (self._ELEMENT, self._ELEMENT_OR_END):
+                if char == "]" and self._state == self._ELEMENT_OR_END:
+                    self._pos += 1
+                    self._state = self._NEXT_KEY
+                    continue
+                element = self._decode(final)
+                if element is self._INCOMPLETE:
+                    break
+                elements.append(element)
+                self._state = self._NEXT_ELEMENT
+            elif self._state == self._NEXT_ELEMENT:
+                self._expect(char, ",]")
+                self._pos += 1
+                self._state = self._ELEMENT if char == "," else self._NEXT_KEY
+        return elements
+
+
+class EventStreamParser:
+    """
+    Incrementally parses a stream of server-sent events as its bytes arrive, producing
+    the (JSON) data of each event as soon as its line is complete (rather than only once
+    the whole stream has been received). A stream that is instead the JSON array of all
+    the events (as for a call that was re-issued without streaming) is parsed once complete.
+    """
+
+    _DATA_PREFIX = b"data: "
+
+    def __init__(self):
+        self._pending: List[bytes] = []
+        self._is_json: Optional[bool] = None
+
+    def feed(self, chunk: bytes) -> List[Any]:
+        """
+        Feed the next chunk of bytes of the stream to the parser.
+
+        :param chunk: next chunk of bytes of the stream
+        :returns: data of the events completed by this chunk (if any)
+        """
+        if self._is_json is None and chunk.strip():
+            self._is_json = chunk.lstrip().startswith(b"[")
+        self._pending.append(chunk)
+        if self._is_json or b"\n" not in chunk:
+            # Avoid re-joining a partially-received line on every chunk
+            return []
+        *lines, remainder = b"".join(self._pending).split(b"\n")
+        self._pending = [remainder]
+        return self._parse(lines)
+
+    def close(self) -> List[Any]:
+        """
+        Indicate that the whole stream has been fed to the parser.
+
+        :returns: data of any remaining events
+        :raises JSONDecodeError: if the data of any event is malformed
+        """
+        remainder, self._pending = b"".join(self._pending), []
+        if self._is_json:
+            return json.loads(remainder)
+        return self._parse([remainder])
+
+    def _parse(self, lines: List[bytes]) -> List[Any]:
+        events: List[Any] = []
+        for line in lines:
+            line = line.rstrip(b"\r")
+            if not line:
+                continue
+            if not line.startswith(self._DATA_PREFIX):
+                raise ErrorCode.UNABLE_TO_DESERIALIZE.exception_with_parameters(
+                    line.decode("utf-8", errors="replace")
+                )
+            events.append(json.loads(line[len(self._DATA_PREFIX) :]))
+        return events
+
+
 def init_guid(func):
     """Decorator function that can be used on the Create method of an asset to initialize the guid."""
 
@@ -0,0 +1,98 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2025 Atlan Pte. Ltd.
+import asyncio
+import threading
+from unittest.mock import ANY, AsyncMock, Mock, patch
+
+import pytest
+
+from pyatlan.cache.aio.connection_cache import AsyncConnectionCache
+from pyatlan.cache.aio.group_cache import AsyncGroupCache
+from pyatlan.cache.aio.user_cache import AsyncUserCache
+from pyatlan.cache.common import InProcessCacheBackend, SQLiteCacheBackend
+from tests.unit.test_connection_cache import build_connection
+from tests.unit.test_user_cache import GROUPS, USERS
+
+
+async def _iterate(items):
+    await asyncio.sleep(0.1)
+    for item in items:
+        yield item
+
+
+class ThreadRecordingBackend(SQLiteCacheBackend):
+    """SQLite backend that records the threads it is used from."""
+
+    def __init__(self, path: str):
+        super().__init__(path)
+        self.threads = set()
+
+    def get_many(self, namespace, keys):
+        self.threads.add(threading.get_ident())
+        return super().get_many(namespace, keys)
+
+    def put_many(self, namespace, entries):
+        self.threads.add(threading.get_ident())
+        super().put_many(namespace, entries)
+
+    def try_lock(self, namespace):
+        self.threads.add(threading.get_ident())
+        return super().try_lock(namespace)
+
+    def unlock(self, namespace):
+        self.threads.add(threading.get_ident())
+        super().unlock(namespace)
+
+
+@pytest.fixture()
+def client():
+    client = Mock()
+    client.user.get_all = AsyncMock(side_effect=lambda: _iterate(USERS))
+    client.group.get_all = AsyncMock(side_effect=lambda: _iterate(GROUPS))
+    client.token.get_by_guid = AsyncMock(return_value=None)
+    return client
+
+
+@pytest.mark.asyncio
+async def test_user_caches_share_a_single_refresh(client):
+    backend = InProcessCacheBackend()
+    caches = [AsyncUserCache(client, backend=backend) for _ in range(4)]
+    results = await asyncio.gather(
+        *(user_cache.get_id_for_name("jdoe") for user_cache in caches)
+    )
+    assert results == ["user-guid"] * len(caches)
+    assert client.user.get_all.call_count == 1
+
+    await caches[0].refresh_cache()
+    assert client.user.get_all.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_group_cache_uses_saved_groups(client, tmp_path):
+    path = str(tmp_path / "caches.sqlite")
+    group_cache = AsyncGroupCache(client, backend=SQLiteCacheBackend(path))
+    assert await group_cache.get_id_for_alias("Data Team") == "group-guid"
+
+    # A new cache (for example, in a new worker process) uses the saved groups
+    group_cache = AsyncGroupCache(client, backend=SQLiteCacheBackend(path))
+    assert await group_cache.get_name_for_id("group-guid") == "data_team"
+    assert client.group.get_all.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_backend_is_not_used_on_the_event_loop(client, tmp_path):
+    backend = ThreadRecordingBackend(str(tmp_path / "caches.sqlite"))
+    user_cache = AsyncUserCache(client, backend=backend)
+    assert await user_cache.get_id_for_name("jdoe") == "user-guid"
+
+    connection_cache = AsyncConnectionCache(client, backend=backend)
+    await connection_cache.cache(build_connection(1))
+    # Another cache loads the connection that was shared, rather than looking it up
+    connection_cache = AsyncConnectionCache(client, backend=backend)
+    with patch.object(AsyncConnectionCache, "_lookup") as lookup:
+        connection = await connection_cache.get_by_guid("guid-1")
+    assert connection.qualified_name == "default/snowflake/1"
+    lookup.assert_called_once_with(ANY, 0)
+
+    assert backend.threads
+    assert threading.get_ident() not in backend.threads
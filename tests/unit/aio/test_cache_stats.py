@@ -0,0 +1,47 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2025 Atlan Pte. Ltd.
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from pyatlan.cache.aio.user_cache import AsyncUserCache
+from pyatlan.client.aio import AsyncAtlanClient
+from tests.unit.test_user_cache import USERS
+
+
+async def _iterate(items):
+    for item in items:
+        yield item
+
+
+@pytest.fixture(autouse=True)
+def set_env(monkeypatch):
+    monkeypatch.setenv("ATLAN_BASE_URL", "https://test.atlan.com")
+    monkeypatch.setenv("ATLAN_API_KEY", "test-api-key")
+
+
+@pytest.mark.asyncio
+async def test_user_cache_stats():
+    client = Mock()
+    client.user.get_all = AsyncMock(side_effect=lambda: _iterate(USERS))
+    client.token.get_by_id = AsyncMock(return_value=None)
+    user_cache = AsyncUserCache(client)
+
+    assert await user_cache.get_id_for_name("jdoe") == "user-guid"
+    assert await user_cache.get_id_for_email("jdoe@example.com") == "user-guid"
+    stats = user_cache.get_stats()
+    assert (stats["hits"], stats["misses"], stats["refreshes"]) == (1, 1, 1)
+    assert stats["entries"] == 1
+    assert stats["bytes"] > 0
+
+
+@pytest.mark.asyncio
+async def test_client_cache_stats():
+    client = AsyncAtlanClient()
+    assert client.get_cache_stats() == {}
+
+    client.user_cache.stats.record_lookup(found=False)
+    _ = client.enum_cache
+    stats = client.get_cache_stats()
+    assert set(stats) == {"user_cache", "enum_cache"}
+    assert stats["user_cache"]["misses"] == 1
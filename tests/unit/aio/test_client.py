@@ -1,7 +1,9 @@
 # SPDX-License-Identifier: Apache-2.0
 # Copyright 2025 Atlan Pte. Ltd.
+import asyncio
+from contextlib import asynccontextmanager
 from importlib.resources import read_text
-from json import load, loads
+from json import dumps, load, loads
 from pathlib import Path
 from re import escape
 from unittest.mock import AsyncMock, Mock, call, patch
@@ -17,9 +19,10 @@ from pyatlan.client.aio.group import AsyncGroupClient
 from pyatlan.client.aio.search_log import AsyncSearchLogClient
 from pyatlan.client.aio.typedef import AsyncTypeDefClient
 from pyatlan.client.aio.user import AsyncUserClient
-from pyatlan.client.asset import CustomMetadataHandling
+from pyatlan.client.asset import AssetCreationHandling, CustomMetadataHandling
 from pyatlan.client.common import Search
 from pyatlan.client.common.asset import LOGGER as SHARED_LOGGER
+from pyatlan.client.transport import _record_retried_status_code
 from pyatlan.errors import (
     ERROR_CODE_FOR_HTTP_STATUS,
     ApiError,
@@ -53,7 +56,14 @@ from pyatlan.model.fluent_search import CompoundQuery, FluentSearch
 from pyatlan.model.group import GroupRequest
 from pyatlan.model.lineage import LineageListRequest
 from pyatlan.model.response import AssetMutationResponse
-from pyatlan.model.search import DSL, Bool, IndexSearchRequest, Term, TermAttributes
+from pyatlan.model.search import (
+    DSL,
+    Bool,
+    IndexSearchRequest,
+    Range,
+    Term,
+    TermAttributes,
+)
 from pyatlan.model.search_log import SearchLogRequest
 from pyatlan.model.typedef import EnumDef
 from pyatlan.model.user import AtlanUser, UserRequest
@@ -1953,6 +1963,167 @@ async def test_index_search_pagination(
         await client.search(criteria=request, bulk=True)
 
 
+@asynccontextmanager
+async def _streamed(response_json, chunk_size=16):
+    document = dumps(response_json).encode("utf-8")
+
+    async def chunks():
+        for i in range(0, len(document), chunk_size):
+            yield document[i : i + chunk_size]
+
+    yield chunks()
+
+
+@pytest.mark.asyncio
+async def test_index_search_streaming(mock_async_api_caller, index_search_paging_json):
+    client = AsyncAssetClient(mock_async_api_caller)
+    mock_async_api_caller._call_api.side_effect = [{"approximateCount": 2}]
+    mock_async_api_caller._stream_api.side_effect = [
+        _streamed(index_search_paging_json),
+        _streamed({"approximateCount": 2}),
+    ]
+    request = (
+        FluentSearch()
+        .where(CompoundQuery.active_assets())
+        .where(CompoundQuery.asset_type(AtlasGlossaryTerm))
+        .page_size(2)
+    ).to_request()
+    results = await client.search(criteria=request, stream=True)
+
+    # Only the count is retrieved up-front, leaving the criteria untouched
+    count_request = mock_async_api_caller._call_api.call_args.kwargs["request_obj"]
+    assert count_request.dsl.size == 0
+    assert request.dsl.size == 2
+    assert results.count == 2
+    assert results.current_page() == []
+
+    guids = [asset.guid async for asset in results]
+    assert guids == [entity["guid"] for entity in index_search_paging_json["entities"]]
+    assert results.current_page() == []
+    assert mock_async_api_caller._stream_api.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_index_search_bulk_retains_only_latest_timestamp_guids(
+    mock_async_api_caller, index_search_paging_json
+):
+    client = AsyncAssetClient(mock_async_api_caller)
+    entity = index_search_paging_json["entities"][0]
+    times = [1, 1, 1, 1, 1, 2, 3, 3, 4]
+    entities = [
+        {**entity, "guid": f"guid-{i}", "createTime": 1717514296590 + t}
+        for i, t in enumerate(times)
+    ]
+    requested = []
+
+    async def call_api(api, query_params=None, request_obj=None):
+        dsl = request_obj.dsl
+        (paging,) = [f for f in dsl.query.filter if isinstance(f, Range) and f.gte] or [
+            Range(field="__timestamp")
+        ]
+        requested.append((paging.gte, dsl.from_))
+        matches = [e for e in entities if e["createTime"] >= (paging.gte or 0)]
+        if page := matches[dsl.from_ : dsl.from_ + dsl.size]:
+            return {"entities": page, "approximateCount": len(matches)}
+        return {}
+
+    mock_async_api_caller._call_api.side_effect = call_api
+    request = (
+        FluentSearch().where(CompoundQuery.asset_type(AtlasGlossaryTerm)).page_size(2)
+    ).to_request()
+    results = await client.search(criteria=request, bulk=True)
+
+    assert [asset.guid async for asset in results] == [e["guid"] for e in entities]
+    assert requested == [
+        (None, 0),
+        (1717514296591, 2),
+        (1717514296591, 4),
+        (1717514296592, 1),
+        (1717514296593, 2),
+        (1717514296594, 1),
+    ]
+    assert results._processed_guids == {"guid-8"}
+
+
+@pytest.mark.asyncio
+async def test_index_search_prefetch(mock_async_api_caller, index_search_paging_json):
+    client = AsyncAssetClient(mock_async_api_caller)
+    entity = index_search_paging_json["entities"][0]
+    entities = [{**entity, "guid": f"guid-{i}"} for i in range(5)]
+    requested = []
+
+    async def call_api(api, query_params=None, request_obj=None):
+        start = request_obj.dsl.from_
+        requested.append(start)
+        if page := entities[start : start + 2]:
+            return {"entities": page, "approximateCount": len(entities)}
+        return {}
+
+    mock_async_api_caller._call_api.side_effect = call_api
+    request = (
+        FluentSearch()
+        .where(CompoundQuery.active_assets())
+        .where(CompoundQuery.asset_type(AtlasGlossaryTerm))
+        .page_size(2)
+    ).to_request()
+    results = await client.search(criteria=request, prefetch=2)
+
+    assert [asset.guid async for asset in results] == [e["guid"] for e in entities]
+    # Pages beyond the next one are only prefetched within the count of results
+    assert sorted(requested) == [0, 2, 4, 6]
+    assert results.count == 5
+
+
+@pytest.mark.asyncio
+async def test_search_parallel(mock_async_api_caller, index_search_paging_json):
+    client = AsyncAssetClient(mock_async_api_caller)
+    entity = index_search_paging_json["entities"][0]
+    entities = [
+        {**entity, "guid": f"guid-{i}", "createTime": 1717514296594 + i * 10}
+        for i in range(9)
+    ]
+    requested = []
+
+    async def call_api(api, query_params=None, request_obj=None):
+        dsl = request_obj.dsl
+        if dsl.aggregations:
+            times = [e["createTime"] for e in entities]
+            return {
+                "approximateCount": len(entities),
+                "aggregations": {
+                    "min_create_time": {"value": float(min(times))},
+                    "max_create_time": {"value": float(max(times))},
+                },
+            }
+        (partition,) = [f for f in dsl.query.filter if isinstance(f, Range)]
+        requested.append((partition.gt, partition.lt))
+        matches = [
+            e
+            for e in entities
+            if (partition.gt is None or e["createTime"] > partition.gt)
+            and (partition.lt is None or e["createTime"] < partition.lt)
+        ]
+        if page := matches[dsl.from_ : dsl.from_ + dsl.size]:
+            return {"entities": page, "approximateCount": len(matches)}
+        return {}
+
+    mock_async_api_caller._call_api.side_effect = call_api
+    request = (
+        FluentSearch().where(CompoundQuery.asset_type(AtlasGlossaryTerm)).page_size(2)
+    ).to_request()
+
+    results = await client.search_parallel(request, 3)
+
+    assert sorted([asset.guid async for asset in results]) == [
+        e["guid"] for e in entities
+    ]
+    assert set(requested) == {
+        (None, 1717514296621),
+        (1717514296620, 1717514296648),
+        (1717514296647, None),
+    }
+
+
 @pytest.mark.asyncio
 async def test_asset_get_by_guid_without_asset_type(
     mock_async_api_caller, get_by_guid_json
@@ -2685,6 +2856,172 @@ class TestBatch:
         assert batch.num_restored == 0
         assert batch.num_updated == 0
 
+    @staticmethod
+    def _concurrent_save(in_flight, fail_guid=None):
+        # Saves each batch slowly, recording how many are in flight at once
+        async def save(revised, replace_atlan_tags):
+            in_flight.append(in_flight[-1] + 1)
+            await asyncio.sleep(0.01)
+            in_flight.append(in_flight[-1] - 1)
+            if fail_guid in {asset.guid for asset in revised}:
+                raise ErrorCode.INVALID_REQUEST_PASSTHROUGH.exception_with_parameters(
+                    "bad", "stuff", ""
+                )
+            mutated_entities = Mock()
+            mutated_entities.CREATE = [
+                Table(guid=asset.guid.lstrip("-")) for asset in revised
+            ]
+            mutated_entities.UPDATE = None
+            mutated_entities.PARTIAL_UPDATE = None
+            response = Mock(spec=AssetMutationResponse)
+            response.guid_assignments = {
+                asset.guid: asset.guid.lstrip("-") for asset in revised
+            }
+            response.partial_updated_entities = None
+            response.attach_mock(mutated_entities, "mutated_entities")
+            return response
+
+        return save
+
+    @pytest.mark.asyncio
+    async def test_flushes_concurrently(self, mock_async_atlan_client):
+        in_flight = [0]
+        mock_async_atlan_client.asset.save = AsyncMock(
+            side_effect=self._concurrent_save(in_flight)
+        )
+        tables = [Table(guid=f"-{i}") for i in range(7)]
+
+        sut = AsyncBatch(client=mock_async_atlan_client, max_size=2, max_in_flight=2)
+        for table in tables:
+            await sut.add(table)
+        assert sut.num_created < len(tables)
+        await sut.flush()
+
+        assert max(in_flight) == 2
+        assert sut.num_created == len(tables)
+        assert sut.num_restored == 0
+        assert sut._resolved_guids == {f"-{i}": f"{i}" for i in range(7)}
+        mock_async_atlan_client.asset.save.assert_has_calls(
+            [
+                call(tables[0:2], replace_atlan_tags=False),
+                call(tables[2:4], replace_atlan_tags=False),
+                call(tables[4:6], replace_atlan_tags=False),
+                call(tables[6:], replace_atlan_tags=False),
+            ]
+        )
+
+    @pytest.mark.asyncio
+    async def test_concurrent_flush_failures(self, mock_async_atlan_client):
+        in_flight = [0]
+        mock_async_atlan_client.asset.save = AsyncMock(
+            side_effect=self._concurrent_save(in_flight, fail_guid="-2")
+        )
+        tables = [Table(guid=f"-{i}") for i in range(6)]
+
+        sut = AsyncBatch(
+            client=mock_async_atlan_client,
+            max_size=2,
+            capture_failures=True,
+            max_in_flight=2,
+        )
+        for table in tables:
+            await sut.add(table)
+        await sut.flush()
+
+        assert sut.num_created == 4
+        assert [failure.failed_assets for failure in sut.failures] == [tables[2:4]]
+
+        sut = AsyncBatch(client=mock_async_atlan_client, max_size=2, max_in_flight=2)
+        for table in tables:
+            await sut.add(table)
+        with pytest.raises(AtlanError):
+            await sut.flush()
+        # The batches after the failed one were still waited for (and tracked)
+        assert sut.num_created == 4
+        assert in_flight[-1] == 0
+        assert not sut._in_flight
+
+    @pytest.mark.asyncio
+    async def test_adaptive_batch_sizes(self, mock_async_atlan_client):
+        save = self._concurrent_save([0])
+
+        async def throttled_save(revised, replace_atlan_tags):
+            if "-12" in {asset.guid for asset in revised}:
+                # As the transport reports a throttled request it retried
+                _record_retried_status_code(429)
+            return await save(revised, replace_atlan_tags)
+
+        mock_async_atlan_client.asset.save = AsyncMock(side_effect=throttled_save)
+        tables = [Table(guid=f"-{i}") for i in range(30)]
+
+        sut = AsyncBatch(client=mock_async_atlan_client, max_size=20, adaptive=True)
+        for table in tables:
+            await sut.add(table)
+        await sut.flush()
+
+        # Additive increase, halved on throttling
+        assert sut.batch_sizes == [5, 7, 9, 4, 5]
+        assert sut.num_created == 30
+
+    @pytest.mark.asyncio
+    async def test_update_only_with_indexed_connection(self, mock_async_atlan_client):
+        connection_qn = "default/snowflake/123"
+
+        async def results(assets):
+            for asset in assets:
+                yield asset
+
+        mock_async_atlan_client.asset.search = AsyncMock(
+            side_effect=[
+                results(
+                    [
+                        Table.ref_by_qualified_name(f"{connection_qn}/DB/SCH/TBL"),
+                        View.ref_by_qualified_name(f"{connection_qn}/DB/SCH/VW"),
+                    ]
+                ),
+                results([]),
+            ]
+        )
+        mock_async_atlan_client.asset.save = AsyncMock(
+            side_effect=self._concurrent_save([0])
+        )
+        tables = [
+            Table.updater(qualified_name=qualified_name, name=qualified_name[-3:])
+            for qualified_name in (
+                f"{connection_qn}/db/sch/tbl",
+                f"{connection_qn}/db/sch/vw",
+                f"{connection_qn}/db/sch/missing",
+                f"{connection_qn}/db/sch/other",
+                "default/snowflake/456/db/sch/tbl",
+            )
+        ]
+
+        sut = AsyncBatch(
+            client=mock_async_atlan_client,
+            max_size=2,
+            update_only=True,
+            case_insensitive=True,
+            table_view_agnostic=True,
+            creation_handling=AssetCreationHandling.NONE,
+            connection_qualified_name=connection_qn,
+        )
+        for table in tables:
+            await sut.add(table)
+        await sut.flush()
+
+        # One bulk search of the connection up front, then only
+        # a search for the asset outside of that connection
+        assert mock_async_atlan_client.asset.search.await_count == 2
+        assert mock_async_atlan_client.asset.search.call_args_list[0].kwargs["bulk"]
+        assert sut.num_skipped == 3
+        assert [
+            (asset.type_name, asset.qualified_name)
+            for asset in mock_async_atlan_client.asset.save.call_args.args[0]
+        ] == [
+            ("Table", f"{connection_qn}/DB/SCH/TBL"),
+            ("View", f"{connection_qn}/DB/SCH/VW"),
+        ]
+
 
 class TestBulkRequest:
     SEE_ALSO = "seeAlso"
@@ -1,5 +1,6 @@
 # SPDX-License-Identifier: Apache-2.0
 # Copyright 2025 Atlan Pte. Ltd.
+import asyncio
 from unittest.mock import Mock, patch
 
 import pytest
@@ -9,6 +10,8 @@ from pyatlan.cache.connection_cache import ConnectionName
 from pyatlan.client.aio.client import AsyncAtlanClient
 from pyatlan.errors import ErrorCode, InvalidRequestError, NotFoundError
 from pyatlan.model.assets import Connection
+from pyatlan.model.fluent_search import FluentSearch
+from tests.unit.test_connection_cache import build_connection, fake_search
 
 
 @pytest.fixture(autouse=True)
@@ -264,3 +267,79 @@ async def test_get_by_name(
 
     # No call to guid lookup since the object is already in the cache
     assert mock_lookup_by_guid.call_count == 0
+
+
+@patch.object(AsyncConnectionCache, "lookup_by_guid")
+@pytest.mark.asyncio
+async def test_cache_evicts_least_recently_used(mock_lookup_by_guid, async_client):
+    connection_cache = AsyncConnectionCache(async_client, max_entries=2)
+    for index in range(1, 4):
+        await connection_cache.cache(build_connection(index))
+        if index == 2:
+            assert (await connection_cache.get_by_guid("guid-1")).name == "conn-1"
+
+    assert not connection_cache.is_guid_known("guid-2")
+    assert not connection_cache.is_name_known("snowflake/conn-2")
+    assert not connection_cache.is_qualified_name_known("default/snowflake/12")
+    connection = await connection_cache.get_by_name(ConnectionName("snowflake/conn-3"))
+    assert isinstance(connection, Connection)
+    assert connection.connector_name == "snowflake"
+    assert connection.description is None
+
+    with pytest.raises(NotFoundError):
+        await connection_cache.get_by_guid("guid-2")
+    mock_lookup_by_guid.assert_called_once_with("guid-2")
+    stats = connection_cache.get_stats()
+    assert {
+        key: stats[key] for key in ("hits", "misses", "evictions", "expirations")
+    } == {
+        "hits": 2,
+        "misses": 1,
+        "evictions": 1,
+        "expirations": 0,
+    }
+    assert stats["entries"] == 2
+
+
+class _AsyncResults:
+    def __init__(self, assets):
+        self._assets = assets
+
+    async def __aiter__(self):
+        for asset in self._assets:
+            yield asset
+
+
+@pytest.mark.asyncio
+async def test_get_by_guids_looks_up_misses_in_batches(async_client):
+    connections = [build_connection(index) for index in range(200)]
+    connection_cache = AsyncConnectionCache(async_client)
+    searches = []
+    execute = fake_search(connections, searches)
+
+    async def execute_async(search, client):
+        await asyncio.sleep(0)
+        return _AsyncResults(execute(search, client))
+
+    with patch.object(
+        FluentSearch, "execute_async", autospec=True, side_effect=execute_async
+    ):
+        guids = [f"guid-{index}" for index in range(150, 310)]
+        found = await connection_cache.get_by_guids(guids)
+        assert list(found) == guids[:50]
+        assert [len(values) for values in searches] == [100, 60]
+
+        # Concurrent misses on a key share one lookup
+        results = await asyncio.gather(
+            *(
+                connection_cache.get_by_qualified_name("default/snowflake/11")
+                for _ in range(3)
+            ),
+            connection_cache.get_by_qualified_names(["default/snowflake/12"]),
+        )
+        assert [result.guid for result in results[:3]] == ["guid-11"] * 3
+        assert list(results[3]) == ["default/snowflake/12"]
+        assert sorted(searches[2:]) == [
+            ["default/snowflake/11"],
+            ["default/snowflake/12"],
+        ]
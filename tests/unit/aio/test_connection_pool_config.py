@@ -0,0 +1,62 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2026 Atlan Pte. Ltd.
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from pyatlan.client.aio import AsyncAtlanClient
+from pyatlan.client.transport import PyatlanAsyncTransport
+from pyatlan.model.assets import AtlasGlossary
+
+
+@pytest.fixture(autouse=True)
+def set_env(monkeypatch):
+    monkeypatch.setenv("ATLAN_BASE_URL", "https://test.atlan.com")
+    monkeypatch.setenv("ATLAN_API_KEY", "test-api-key")
+
+
+def _get_httpcore_pool(client: AsyncAtlanClient):
+    assert client._async_session is not None
+    transport = client._async_session._transport
+    assert isinstance(transport, PyatlanAsyncTransport)
+    return transport._transport._pool
+
+
+@pytest.mark.asyncio
+async def test_pool_configuration_from_client(monkeypatch):
+    monkeypatch.setenv("ATLAN_POOL_TIMEOUT", "5")
+    client = AsyncAtlanClient(max_connections=100, max_keepalive_connections=20)
+    pool = _get_httpcore_pool(client)
+    assert pool._max_connections == 100
+    assert pool._max_keepalive_connections == 20
+    assert not pool._http2
+
+    response = Mock(status_code=500, text="internal server error")
+    with patch.object(client, "_async_session") as mock_session:
+        mock_session.request = AsyncMock(return_value=response)
+        with pytest.raises(Exception):
+            await client.asset.save(AtlasGlossary.creator(name="t"))
+    assert mock_session.request.call_args.kwargs["timeout"].pool == 5.0
+
+
+@pytest.mark.asyncio
+async def test_http2_is_passed_to_transport():
+    captured: list = []
+    original_init = PyatlanAsyncTransport.__init__
+
+    def capturing_init(self_t, retry=None, client=None, **kwargs):
+        captured.append(kwargs)
+        original_init(self_t, retry=retry, client=client, **kwargs)
+
+    with (
+        patch("importlib.util.find_spec", return_value=Mock()),
+        patch.object(PyatlanAsyncTransport, "__init__", capturing_init),
+        patch("httpx.HTTPTransport", Mock(return_value=Mock())),
+        patch("httpx.AsyncHTTPTransport", Mock(return_value=Mock())),
+    ):
+        client = AsyncAtlanClient(http2=True)
+        async with client.max_retries():
+            pass
+
+    assert len(captured) == 2
+    assert all(kwargs["http2"] for kwargs in captured)
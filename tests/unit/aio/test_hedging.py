@@ -0,0 +1,55 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2025 Atlan Pte. Ltd.
+import asyncio
+from unittest.mock import Mock
+
+import pytest
+
+from pyatlan.client.aio import AsyncAtlanClient
+from pyatlan.client.constants import BULK_UPDATE, INDEX_SEARCH
+from tests.unit.test_hedging import _response
+
+
+@pytest.fixture(autouse=True)
+def set_env(monkeypatch):
+    monkeypatch.setenv("ATLAN_BASE_URL", "https://test.atlan.com")
+    monkeypatch.setenv("ATLAN_API_KEY", "test-api-key")
+
+
+def _hedging_client(calls: list) -> AsyncAtlanClient:
+    client = AsyncAtlanClient(hedge_requests=True, hedge_delay=0.05, hedge_budget=1.0)
+
+    async def request(**kwargs):
+        calls.append(asyncio.current_task())
+        if len(calls) == 1:
+            await asyncio.sleep(5)
+            return _response({"from": "primary"})
+        return _response({"from": "hedge"})
+
+    client._async_session = Mock(headers={})
+    client._async_session.request = request
+    return client
+
+
+@pytest.mark.asyncio
+async def test_slow_search_is_hedged():
+    calls: list = []
+    client = _hedging_client(calls)
+
+    assert await client._call_api(INDEX_SEARCH, request_obj={}) == {"from": "hedge"}
+    assert len(calls) == 2
+    # The slower request is cancelled
+    await asyncio.sleep(0)
+    assert calls[0].cancelled()
+    assert client._hedging.get_stats()["hedge_wins"] == 1
+
+
+@pytest.mark.asyncio
+async def test_non_idempotent_request_is_not_hedged():
+    calls: list = []
+    client = _hedging_client(calls)
+    calls.append(None)
+
+    assert await client._call_api(BULK_UPDATE, request_obj={}) == {"from": "hedge"}
+    assert len(calls) == 2
+    assert client._hedging.get_stats()["requests"] == 0
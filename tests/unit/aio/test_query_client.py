@@ -1,5 +1,6 @@
 # SPDX-License-Identifier: Apache-2.0
 # Copyright 2025 Atlan Pte. Ltd.
+from contextlib import asynccontextmanager
 from pathlib import Path
 from unittest.mock import AsyncMock, Mock
 
@@ -104,3 +105,42 @@ async def test_stream_get_when_given_request(
     assert response.error_code
     assert response.error_message
     assert response.details
+
+
+@pytest.mark.asyncio
+async def test_stream_results_in_batches(
+    mock_async_api_caller,
+    query_request: QueryRequest,
+):
+    content = QUERY_RESPONSES.read_bytes()
+
+    @asynccontextmanager
+    async def stream_api(api, query_params=None, request_obj=None):
+        async def chunks():
+            # Events split arbitrarily across chunks
+            for i in range(0, len(content), 100):
+                yield content[i : i + 100]
+
+        yield chunks()
+
+    mock_async_api_caller._stream_api = stream_api
+    client = AsyncQueryClient(client=mock_async_api_caller)
+
+    results = client.stream_results(request=query_request)
+    batches = [batch async for batch in results.iter_batches(batch_size=5)]
+
+    assert [len(batch) for batch in batches] == [5, 5, 4]
+    assert [row for batch in batches for row in batch] == [row async for row in results]
+    response = results.response
+    assert response.rows is None
+    assert response.columns
+    assert len(response.columns) == 7
+    assert response.request_id
+    # Last event is an error
+    assert response.query_id is None
+    assert response.error_name
+    columns = [
+        batch async for batch in results.iter_batches(batch_size=5, columnar=True)
+    ][0]
+    assert len(columns) == 7
+    assert columns[0] == [row[0] for row in batches[0]]
@@ -0,0 +1,49 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2025 Atlan Pte. Ltd.
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+from httpx_retries import Retry
+
+from pyatlan.client.aio import AsyncAtlanClient
+from pyatlan.client.common.rate_limit import RateLimiter
+from pyatlan.client.transport import PyatlanAsyncTransport
+from tests.unit.test_rate_limit import BASE_URL, FakeClock
+
+
+@pytest.fixture(autouse=True)
+def set_env(monkeypatch):
+    monkeypatch.setenv("ATLAN_BASE_URL", "https://test.atlan.com")
+    monkeypatch.setenv("ATLAN_API_KEY", "test-api-key")
+
+
+@pytest.mark.asyncio
+async def test_transport_paces_every_attempt():
+    limiter = RateLimiter(max_rate=1.0, min_rate=0.5, clock=FakeClock())
+    transport = PyatlanAsyncTransport(
+        retry=Retry(total=3, backoff_factor=0, allowed_methods=["POST"]),
+        rate_limiter=limiter,
+        trust_env=False,
+    )
+    transport._transport.handle_async_request = AsyncMock(
+        side_effect=[httpx.Response(503), httpx.Response(200)]
+    )
+    request = httpx.Request("POST", BASE_URL + "search/indexsearch")
+    with patch(
+        "pyatlan.client.transport.asyncio.sleep", new_callable=AsyncMock
+    ) as sleep:
+        response = await transport.handle_async_request(request)
+    assert response.status_code == 200
+    sleep.assert_any_await(2.0)
+    assert limiter.get_rates() == {"search": 1.0}
+
+
+@pytest.mark.asyncio
+async def test_client_rate_limiter():
+    client = AsyncAtlanClient(rate_limit=20)
+    limiter = client._rate_limiter
+    assert limiter is not None
+    assert client._async_session._transport._rate_limiter is limiter
+    async with client.max_retries():
+        assert client._async_session._transport._rate_limiter is limiter
@@ -0,0 +1,56 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2025 Atlan Pte. Ltd.
+import gzip
+import json
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from pyatlan.client.aio import AsyncAtlanClient
+from pyatlan.client.constants import BULK_UPDATE
+from tests.unit.test_request_compression import REQUEST, _response
+
+
+@pytest.fixture(autouse=True)
+def set_env(monkeypatch):
+    monkeypatch.setenv("ATLAN_BASE_URL", "https://test.atlan.com")
+    monkeypatch.setenv("ATLAN_API_KEY", "test-api-key")
+
+
+@pytest.mark.asyncio
+async def test_client_compresses_large_requests():
+    client = AsyncAtlanClient(
+        request_compression="gzip", request_compression_threshold=10
+    )
+    with patch.object(client, "_async_session") as mock_session:
+        mock_session.request = AsyncMock(return_value=_response())
+        with patch(
+            "asyncio.to_thread", wraps=__import__("asyncio").to_thread
+        ) as to_thread:
+            await client._call_api(BULK_UPDATE, request_obj=REQUEST)
+        # Compression runs off the event loop
+        to_thread.assert_called_once()
+
+    kwargs = mock_session.request.call_args.kwargs
+    assert kwargs["headers"]["Content-Encoding"] == "gzip"
+    assert json.loads(gzip.decompress(kwargs["content"])) == REQUEST
+    assert client._request_compression.verified
+
+
+@pytest.mark.asyncio
+async def test_client_stops_compressing_when_rejected():
+    client = AsyncAtlanClient(
+        request_compression="gzip", request_compression_threshold=10
+    )
+    with patch.object(client, "_async_session") as mock_session:
+        mock_session.request = AsyncMock(
+            side_effect=[_response(415), _response(), _response()]
+        )
+        await client._call_api(BULK_UPDATE, request_obj=REQUEST)
+        await client._call_api(BULK_UPDATE, request_obj=REQUEST)
+
+    calls = mock_session.request.call_args_list
+    assert calls[0].kwargs["headers"]["Content-Encoding"] == "gzip"
+    assert "Content-Encoding" not in calls[1].kwargs["headers"]
+    assert "Content-Encoding" not in calls[2].kwargs["headers"]
+    assert not client._request_compression.enabled
@@ -0,0 +1,112 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2025 Atlan Pte. Ltd.
+import asyncio
+from unittest.mock import AsyncMock, call, patch
+
+import pytest
+
+from pyatlan.client.aio.client import AsyncAtlanClient
+from pyatlan.client.aio.typedef import AsyncTypeDefClient
+from tests.unit.test_typedef_snapshot import (
+    ALL_CATEGORIES,
+    BASE_URL,
+    TYPEDEFS,
+    get_by_name,
+)
+
+
+@pytest.fixture(autouse=True)
+def set_env(monkeypatch):
+    monkeypatch.setenv("ATLAN_BASE_URL", BASE_URL)
+    monkeypatch.setenv("ATLAN_API_KEY", "test-api-key")
+
+
+@pytest.fixture()
+def requested():
+    return []
+
+
+@pytest.fixture()
+def mock_call_api(requested):
+    async def call_api(api, query_params=None, *args, **kwargs):
+        await asyncio.sleep(0)
+        requested.append(query_params["type"])
+        raw_json = {}
+        for category in query_params["type"]:
+            raw_json.update(TYPEDEFS[category])
+        return raw_json
+
+    with patch.object(AsyncAtlanClient, "_call_api", side_effect=call_api) as mock:
+        yield mock
+
+
+@pytest.mark.asyncio
+async def test_caches_share_one_request(mock_call_api, requested):
+    client = AsyncAtlanClient()
+    assert await client.atlan_tag_cache.get_id_for_name("PII") == "tag1"
+    assert await client.custom_metadata_cache.get_id_for_name("Quality") == "cm1"
+    assert (await client.enum_cache.get_by_name("Colors")).name == "Colors"
+    assert await client.custom_metadata_cache.is_attr_archived("attr1")
+    assert requested == [ALL_CATEGORIES]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_refreshes_share_one_request(mock_call_api, requested):
+    client = AsyncAtlanClient()
+    await client.typedef._get_snapshot()
+    snapshots = await asyncio.gather(
+        *(client.typedef._get_snapshot(refresh=True) for _ in range(4))
+    )
+    assert len({id(snapshot) for snapshot in snapshots}) == 1
+    assert len(requested) == 2
+
+
+@pytest.mark.asyncio
+async def test_caches_load_from_snapshot_file(tmp_path, mock_call_api, requested):
+    client = AsyncAtlanClient(typedef_snapshot_dir=str(tmp_path))
+    assert await client.atlan_tag_cache.get_id_for_name("PII") == "tag1"
+    assert requested == [ALL_CATEGORIES]
+
+    # A new client loads every category from the snapshot file
+    client = AsyncAtlanClient(typedef_snapshot_dir=str(tmp_path))
+    assert await client.custom_metadata_cache.get_id_for_name("Quality") == "cm1"
+    assert (await client.enum_cache.get_by_name("Colors")).name == "Colors"
+    assert await client.atlan_tag_cache.get_name_for_id("tag1") == "PII"
+    assert len(requested) == 1
+
+
+@pytest.mark.asyncio
+async def test_cache_miss_after_snapshot_load_requests_typedefs(
+    tmp_path, mock_call_api, requested
+):
+    client = AsyncAtlanClient(typedef_snapshot_dir=str(tmp_path))
+    await client.atlan_tag_cache.refresh_cache()
+
+    client = AsyncAtlanClient(typedef_snapshot_dir=str(tmp_path))
+    assert await client.atlan_tag_cache.get_id_for_name("Unknown") is None
+    assert requested == [ALL_CATEGORIES, ALL_CATEGORIES]
+
+
+@pytest.mark.asyncio
+async def test_unknown_ids_are_retrieved_individually(mock_call_api, requested):
+    client = AsyncAtlanClient()
+    tag_cache, cm_cache = client.atlan_tag_cache, client.custom_metadata_cache
+    with patch.object(
+        AsyncTypeDefClient, "get_by_name", AsyncMock(side_effect=get_by_name)
+    ) as mock_get_by_name:
+        assert await tag_cache.get_name_for_id("tag2") == "Confidential"
+        assert await tag_cache.get_source_tags_attr_id("tag2") == "attr9"
+        assert await tag_cache.get_name_for_id("deleted") is None
+        assert await tag_cache.get_name_for_id("deleted") is None
+
+        assert await cm_cache.get_name_for_id("cm2") == "Ownership"
+        assert await cm_cache.get_attr_name_for_id("cm2", "attr3") == "Owner"
+        assert await cm_cache.get_attr_name_for_id("cm1", "attr4") == "Rating"
+        assert await cm_cache.get_attr_id_for_name("Quality", "Rating") == "attr4"
+    assert mock_get_by_name.call_args_list == [
+        call("tag2"),
+        call("deleted"),
+        call("cm2"),
+        call("cm1"),
+    ]
+    assert requested == [ALL_CATEGORIES]
@@ -0,0 +1,60 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2025 Atlan Pte. Ltd.
+import asyncio
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from pyatlan.cache.aio.group_cache import AsyncGroupCache
+from pyatlan.cache.aio.user_cache import AsyncUserCache
+from tests.unit.test_user_cache import GROUPS, USERS
+
+
+async def _iterate(items):
+    await asyncio.sleep(0)
+    for item in items:
+        yield item
+
+
+@pytest.fixture()
+def client():
+    client = Mock()
+    client.user.get_all = AsyncMock(side_effect=lambda: _iterate(USERS))
+    client.group.get_all = AsyncMock(side_effect=lambda: _iterate(GROUPS))
+    client.token.get_by_guid = AsyncMock(return_value=None)
+    return client
+
+
+@pytest.mark.asyncio
+async def test_repeated_misses_refresh_once(client):
+    user_cache = AsyncUserCache(client)
+    for _ in range(100):
+        assert await user_cache.get_id_for_name("departed") is None
+        assert await user_cache.get_name_for_id("unknown-guid") is None
+    assert await user_cache.get_id_for_email("jdoe@example.com") == "user-guid"
+    assert client.user.get_all.call_count == 1
+    assert client.token.get_by_guid.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_share_one_refresh(client):
+    user_cache = AsyncUserCache(client)
+    user_cache.miss_policy.min_refresh_interval = 0
+    results = await asyncio.gather(
+        *(user_cache.get_id_for_name(name) for name in ["jdoe", "a", "b", "c"])
+    )
+    assert results == ["user-guid", None, None, None]
+    assert client.user.get_all.call_count == 1
+
+    # An explicit refresh always requests the users again
+    await user_cache.refresh_cache()
+    assert client.user.get_all.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_group_cache_misses(client):
+    group_cache = AsyncGroupCache(client)
+    for _ in range(10):
+        assert await group_cache.get_id_for_alias("Unknown Team") is None
+    assert await group_cache.get_id_for_alias("Data Team") == "group-guid"
+    assert client.group.get_all.call_count == 1
@@ -0,0 +1,56 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2025 Atlan Pte. Ltd.
+import asyncio
+from time import perf_counter
+from unittest.mock import patch
+
+import pytest
+
+from pyatlan.cache.aio.atlan_tag_cache import AsyncAtlanTagCache
+from pyatlan.cache.aio.custom_metadata_cache import AsyncCustomMetadataCache
+from pyatlan.cache.aio.group_cache import AsyncGroupCache
+from pyatlan.client.aio.client import AsyncAtlanClient
+
+
+@pytest.fixture(autouse=True)
+def set_env(monkeypatch):
+    monkeypatch.setenv("ATLAN_BASE_URL", "https://test.atlan.com")
+    monkeypatch.setenv("ATLAN_API_KEY", "test-api-key")
+
+
+@pytest.mark.asyncio
+async def test_warm_caches_concurrently():
+    client = AsyncAtlanClient()
+    cancelled = []
+
+    async def load():
+        await asyncio.sleep(0.2)
+
+    async def hang():
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+
+    with (
+        patch.object(AsyncAtlanTagCache, "refresh_cache", side_effect=load),
+        patch.object(
+            AsyncCustomMetadataCache,
+            "refresh_cache",
+            side_effect=load,
+        ),
+        patch.object(AsyncGroupCache, "refresh_cache", side_effect=hang),
+    ):
+        started = perf_counter()
+        results = await client.warm_caches(
+            ["atlan_tag_cache", "custom_metadata_cache", "group_cache"], timeout=0.3
+        )
+        assert perf_counter() - started < 0.5
+        await asyncio.sleep(0)
+
+    assert results["atlan_tag_cache"].succeeded
+    assert results["custom_metadata_cache"].elapsed >= 0.2
+    assert isinstance(results["group_cache"].error, TimeoutError)
+    # Caches still loading at the deadline are cancelled
+    assert cancelled == [True]
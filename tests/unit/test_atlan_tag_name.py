@@ -6,7 +6,7 @@ import pytest
 from pydantic.v1 import parse_obj_as
 
 import pyatlan.cache.atlan_tag_cache
-from pyatlan.client.atlan import AtlanClient
+from pyatlan.client.atlan import AtlanClient, response_translation_var
 from pyatlan.errors import NotFoundError
 from pyatlan.model.assets import Purpose
 from pyatlan.model.constants import DELETED_
@@ -311,3 +311,87 @@ def test_retranslate_names_path_policy_serde_stays_tolerant():
     retranslator = _tag_retranslator({})
     out = retranslator.retranslate({"purposeClassifications": ["ghost-policy-tag"]})
     assert out["purposeClassifications"] == [DELETED_]
+
+
+# --- AtlanResponse: in-place translation of only the parts that can carry tags ---
+def _tag_translating_client(monkeypatch, client):
+    monkeypatch.setattr(
+        pyatlan.cache.atlan_tag_cache.AtlanTagCache,
+        "get_name_for_id",
+        lambda _, tag_id: {ATLAN_TAG_ID: GOOD_ATLAN_TAG_NAME}.get(tag_id),
+    )
+    monkeypatch.setattr(
+        pyatlan.cache.atlan_tag_cache.AtlanTagCache,
+        "get_source_tags_attr_id",
+        lambda _, __: None,
+    )
+    return client
+
+
+def _search_response():
+    return {
+        "approximateCount": 1,
+        "searchParameters": {
+            "dsl": {"query": {"classifications": [{"typeName": ATLAN_TAG_ID}]}}
+        },
+        "entities": [
+            {
+                "typeName": "Table",
+                "classificationNames": [ATLAN_TAG_ID],
+                "classifications": [{"typeName": ATLAN_TAG_ID}],
+                "attributes": {
+                    "columns": [
+                        {"typeName": "Column", "classificationNames": [ATLAN_TAG_ID]}
+                    ]
+                },
+            }
+        ],
+    }
+
+
+def test_atlan_response_translates_nested_tags_in_place(client, monkeypatch):
+    raw_json = _search_response()
+    entity = raw_json["entities"][0]
+
+    translated = AtlanResponse(
+        raw_json=raw_json, client=_tag_translating_client(monkeypatch, client)
+    ).to_dict()
+
+    assert translated is raw_json
+    assert translated["entities"][0] is entity
+    assert entity["classificationNames"] == [GOOD_ATLAN_TAG_NAME]
+    assert entity["classifications"][0] == {
+        "typeName": GOOD_ATLAN_TAG_NAME,
+        "tag_id": ATLAN_TAG_ID,
+    }
+    column = entity["attributes"]["columns"][0]
+    assert column["classificationNames"] == [GOOD_ATLAN_TAG_NAME]
+
+
+def test_atlan_response_does_not_walk_search_parameters(client, monkeypatch):
+    translated = AtlanResponse(
+        raw_json=_search_response(),
+        client=_tag_translating_client(monkeypatch, client),
+    ).to_dict()
+
+    dsl_query = translated["searchParameters"]["dsl"]["query"]
+    assert dsl_query["classifications"] == [{"typeName": ATLAN_TAG_ID}]
+
+
+def test_atlan_response_without_translation_is_as_is(client, monkeypatch):
+    raw_json = _search_response()
+
+    translated = AtlanResponse(
+        raw_json=raw_json,
+        client=_tag_translating_client(monkeypatch, client),
+        translate=False,
+    ).to_dict()
+
+    assert translated == _search_response()
+
+
+def test_disable_response_translation_is_scoped(client: AtlanClient):
+    assert response_translation_var.get()
+    with client.disable_response_translation():
+        assert not response_translation_var.get()
+    assert response_translation_var.get()
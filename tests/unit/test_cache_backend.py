@@ -0,0 +1,193 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2025 Atlan Pte. Ltd.
+from concurrent.futures import ThreadPoolExecutor
+from threading import Barrier
+from time import sleep
+from unittest.mock import Mock, patch
+
+import pytest
+
+from pyatlan.cache.common import (
+    InProcessCacheBackend,
+    SharedTypeDefSnapshot,
+    SQLiteCacheBackend,
+)
+from pyatlan.cache.connection_cache import ConnectionCache, ConnectionName
+from pyatlan.cache.user_cache import UserCache
+from pyatlan.client.atlan import AtlanClient
+from pyatlan.model.enums import AtlanTypeCategory
+from pyatlan.model.fluent_search import FluentSearch
+from tests.unit.test_connection_cache import build_connection, fake_search
+from tests.unit.test_user_cache import USERS
+
+
+@pytest.fixture(autouse=True)
+def set_env(monkeypatch):
+    monkeypatch.setenv("ATLAN_BASE_URL", "https://test.atlan.com")
+    monkeypatch.setenv("ATLAN_API_KEY", "test-api-key")
+
+
+@pytest.fixture()
+def db_path(tmp_path):
+    return str(tmp_path / "caches.sqlite")
+
+
+@pytest.fixture(params=["in_process", "sqlite"])
+def backend(request, db_path):
+    if request.param == "in_process":
+        return InProcessCacheBackend()
+    return SQLiteCacheBackend(db_path)
+
+
+def test_backend_entries(backend):
+    backend.put_many("users", {"a": {"id": 1}, "b": [1, 2]})
+    backend.put("groups", "a", "other")
+    assert backend.get_many("users", ["a", "b", "c"]) == {"a": {"id": 1}, "b": [1, 2]}
+    assert backend.get("groups", "a") == "other"
+    assert backend.get("groups", "b") is None
+
+    backend.clear("users")
+    assert backend.get_many("users", ["a", "b"]) == {}
+    assert backend.get("groups", "a") == "other"
+    backend.clear()
+    assert backend.get("groups", "a") is None
+
+
+def test_backend_lock(backend):
+    assert backend.try_lock("users")
+    assert not backend.try_lock("users")
+    assert backend.try_lock("groups")
+    backend.unlock("users")
+    assert backend.try_lock("users")
+
+
+def test_sqlite_backend_is_shared_between_connections(db_path):
+    # Each backend has its own connection (and lock owner), as in separate processes
+    first, second = SQLiteCacheBackend(db_path), SQLiteCacheBackend(db_path)
+    first.put("users", "a", {"id": 1})
+    assert second.get("users", "a") == {"id": 1}
+
+    assert first.try_lock("users")
+    assert not second.try_lock("users")
+    # Only the owner of a lock can release it
+    second.unlock("users")
+    assert not second.try_lock("users")
+    first.unlock("users")
+    assert second.try_lock("users")
+
+
+def test_sqlite_backend_expiry(db_path):
+    backend = SQLiteCacheBackend(db_path, ttl=0, lock_ttl=0)
+    backend.put("users", "a", {"id": 1})
+    assert backend.get("users", "a") is None
+    # A lock whose holder never released it is released after lock_ttl
+    assert backend.try_lock("users")
+    assert SQLiteCacheBackend(db_path).try_lock("users")
+
+
+def test_sqlite_backend_without_usable_database(tmp_path):
+    (tmp_path / "file").write_text("not a directory")
+    backend = SQLiteCacheBackend(str(tmp_path / "file" / "caches.sqlite"))
+    backend.put("users", "a", {"id": 1})
+    assert backend.get("users", "a") is None
+    assert backend.try_lock("users")
+
+
+def test_sqlite_backend_per_tenant(tmp_path):
+    first = SQLiteCacheBackend.for_tenant("https://a.atlan.com", str(tmp_path))
+    second = SQLiteCacheBackend.for_tenant("https://b.atlan.com", str(tmp_path))
+    assert first.path != second.path
+    first.put("users", "a", {"id": 1})
+    assert second.get("users", "a") is None
+
+
+def test_user_caches_share_a_single_refresh(db_path):
+    client = Mock()
+    client.user.get_all.side_effect = lambda: sleep(0.2) or USERS
+    caches = [UserCache(client, backend=SQLiteCacheBackend(db_path)) for _ in range(4)]
+    barrier = Barrier(len(caches))
+
+    def lookup(user_cache):
+        barrier.wait()
+        return user_cache.get_id_for_name("jdoe")
+
+    with ThreadPoolExecutor(max_workers=len(caches)) as executor:
+        assert list(executor.map(lookup, caches)) == ["user-guid"] * len(caches)
+    assert client.user.get_all.call_count == 1
+
+    # A new cache (for example, in a new worker process) uses the saved users
+    user_cache = UserCache(client, backend=SQLiteCacheBackend(db_path))
+    assert user_cache.get_id_for_email("jdoe@example.com") == "user-guid"
+    assert client.user.get_all.call_count == 1
+
+    # While an explicit refresh always requests the users again
+    user_cache.refresh_cache()
+    assert client.user.get_all.call_count == 2
+
+
+def test_connection_caches_share_looked_up_connections(db_path):
+    connections = [build_connection(index) for index in range(3)]
+    client = AtlanClient()
+    first = ConnectionCache(client, backend=SQLiteCacheBackend(db_path))
+    second = ConnectionCache(client, backend=SQLiteCacheBackend(db_path))
+    searches = []
+    with patch.object(
+        FluentSearch,
+        "execute",
+        autospec=True,
+        side_effect=fake_search(connections, searches),
+    ):
+        assert len(first.get_by_guids(["guid-0", "guid-1"])) == 2
+        assert len(searches) == 1
+
+        found = second.get_by_qualified_names(
+            ["default/snowflake/0", "default/snowflake/2"]
+        )
+        assert sorted(found) == ["default/snowflake/0", "default/snowflake/2"]
+        # Only the connection that no cache looked up before is searched for
+        assert searches[-1] == ["default/snowflake/2"]
+
+        connection = second.get_by_name(ConnectionName("snowflake/conn-1"))
+        assert connection.guid == "guid-1"
+        assert connection.connector_name == "snowflake"
+        assert len(searches) == 2
+
+
+def test_shared_typedef_snapshot(db_path):
+    categories = [AtlanTypeCategory.CLASSIFICATION, AtlanTypeCategory.ENUM]
+    first = SharedTypeDefSnapshot(SQLiteCacheBackend(db_path))
+    second = SharedTypeDefSnapshot(SQLiteCacheBackend(db_path))
+
+    assert first.load(categories) == ({}, categories)
+    first.save(categories, {"classificationDefs": [{"name": "tag"}], "enumDefs": []})
+
+    raw_json, missing = second.load(categories)
+    assert raw_json == {"classificationDefs": [{"name": "tag"}]}
+    # Categories without any definitions are not saved, so are requested again
+    assert missing == [AtlanTypeCategory.ENUM]
+    second.release()
+
+    first.invalidate()
+    assert second.load(categories)[1] == categories
+    second.release()
+
+
+def test_client_cache_backend(tmp_path):
+    client = AtlanClient(cache_backend_dir=str(tmp_path))
+    backend = client._cache_backend
+    assert isinstance(backend, SQLiteCacheBackend)
+    assert backend.path.startswith(str(tmp_path))
+    assert isinstance(client._typedef_snapshot_file, SharedTypeDefSnapshot)
+    assert client.user_cache.backend is backend
+    assert client.group_cache.backend is backend
+    assert client.connection_cache.store.backend is backend
+    assert client.source_tag_cache.store.backend is backend
+
+    shared = InProcessCacheBackend()
+    client = AtlanClient(cache_backend=shared, typedef_snapshot_dir=str(tmp_path))
+    assert client.user_cache.backend is shared
+    assert not isinstance(client._typedef_snapshot_file, SharedTypeDefSnapshot)
+
+    client = AtlanClient()
+    assert client.user_cache.backend is None
+    assert client._typedef_snapshot_file is None
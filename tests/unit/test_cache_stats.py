@@ -0,0 +1,130 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2025 Atlan Pte. Ltd.
+import logging
+from unittest.mock import Mock, patch
+
+import pytest
+
+from pyatlan.cache.common import CacheStats
+from pyatlan.cache.common.stats import estimate_size, flatten_stats
+from pyatlan.cache.connection_cache import ConnectionCache
+from pyatlan.cache.user_cache import UserCache
+from pyatlan.client.atlan import AtlanClient
+from pyatlan.model.fluent_search import FluentSearch
+from pyatlan.pkg.utils import log_cache_stats
+from tests.unit.test_connection_cache import build_connection, fake_search
+from tests.unit.test_user_cache import USERS
+
+STATS = {
+    "hits",
+    "misses",
+    "refreshes",
+    "refresh_seconds_total",
+    "refresh_seconds_max",
+    "refresh_duration_buckets",
+    "entries",
+    "bytes",
+}
+
+
+@pytest.fixture(autouse=True)
+def set_env(monkeypatch):
+    monkeypatch.setenv("ATLAN_BASE_URL", "https://test.atlan.com")
+    monkeypatch.setenv("ATLAN_API_KEY", "test-api-key")
+
+
+def test_cache_stats():
+    stats = CacheStats()
+    assert stats.observe("found") == "found"
+    assert stats.observe(None) is None
+    stats.record_lookup(found=False)
+    stats.record_refresh(0.02)
+    stats.record_refresh(120.0)
+    with pytest.raises(ValueError):
+        # Failed refreshes are counted too
+        with stats.timed_refresh():
+            raise ValueError("boom")
+
+    snapshot = stats.snapshot(1, {"a": "b"})
+    assert set(snapshot) == STATS
+    assert (snapshot["hits"], snapshot["misses"], snapshot["refreshes"]) == (1, 2, 3)
+    assert snapshot["refresh_seconds_max"] == 120.0
+    assert snapshot["refresh_seconds_total"] >= 120.02
+    buckets = snapshot["refresh_duration_buckets"]
+    assert (buckets["0.01"], buckets["0.05"], buckets["inf"]) == (1, 1, 1)
+    assert snapshot["entries"] == 1
+    assert snapshot["bytes"] > 0
+
+
+def test_estimate_size():
+    small = estimate_size({"a": "b"})
+    large = estimate_size({str(index): "x" * 100 for index in range(100)})
+    assert 0 < small < large
+
+    # Objects referred to more than once are counted once
+    shared = ["x" * 1000]
+    assert estimate_size(shared, shared) == estimate_size(shared)
+    # as are the attributes of objects (whether in slots or not)
+    assert estimate_size(USERS[0]) > estimate_size("jdoe@example.com")
+    assert estimate_size(build_connection(1)) > 0
+
+
+def test_flatten_stats():
+    assert flatten_stats({"user_cache": {"hits": 1, "buckets": {"0.1": 2}}}) == {
+        "pyatlan.cache.user_cache.hits": 1,
+        "pyatlan.cache.user_cache.buckets.0.1": 2,
+    }
+    assert flatten_stats({"hits": 1}, prefix="") == {"hits": 1}
+
+
+def test_user_cache_stats():
+    client = Mock()
+    client.user.get_all.return_value = USERS
+    client.token.get_by_id.return_value = None
+    user_cache = UserCache(client)
+
+    assert user_cache.get_id_for_name("jdoe") == "user-guid"
+    assert user_cache.get_id_for_email("jdoe@example.com") == "user-guid"
+    stats = user_cache.get_stats()
+    assert (stats["hits"], stats["misses"], stats["refreshes"]) == (1, 1, 1)
+    assert stats["entries"] == 1
+    assert stats["bytes"] > 0
+
+
+def test_connection_cache_stats():
+    connection_cache = ConnectionCache(AtlanClient())
+    with patch.object(
+        FluentSearch,
+        "execute",
+        autospec=True,
+        side_effect=fake_search([build_connection(1)], []),
+    ):
+        connection_cache.get_by_guid("guid-1")
+        connection_cache.get_by_guid("guid-1")
+
+    stats = connection_cache.get_stats()
+    assert set(stats) == STATS | {"evictions", "expirations"}
+    assert (stats["hits"], stats["misses"], stats["refreshes"]) == (1, 1, 1)
+    assert stats["refresh_seconds_total"] > 0
+    assert stats["entries"] == 1
+    assert stats["bytes"] > 0
+
+
+def test_client_cache_stats(caplog):
+    client = AtlanClient()
+    assert client.get_cache_stats() == {}
+
+    client.user_cache.stats.record_lookup(found=True)
+    _ = client.role_cache
+    stats = client.get_cache_stats()
+    assert set(stats) == {"user_cache", "role_cache"}
+    assert stats["user_cache"]["hits"] == 1
+
+    logger = logging.getLogger("pyatlan.test_cache_stats")
+    with caplog.at_level(logging.INFO, logger=logger.name):
+        logged = log_cache_stats(client, logger)
+    assert logged["pyatlan.cache.user_cache.hits"] == 1
+    assert logged["pyatlan.cache.role_cache.refresh_duration_buckets.inf"] == 0
+    # The statistics are attributes of the log record (as exported to OpenTelemetry)
+    record = caplog.records[-1]
+    assert getattr(record, "pyatlan.cache.user_cache.hits") == 1
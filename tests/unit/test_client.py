@@ -1,9 +1,12 @@
 # SPDX-License-Identifier: Apache-2.0
 # Copyright 2022 Atlan Pte. Ltd.
+from contextlib import nullcontext
 from importlib.resources import read_text
-from json import load, loads
+from json import dumps, load, loads
 from pathlib import Path
 from re import escape
+from threading import Lock
+from time import sleep
 from unittest.mock import DEFAULT, Mock, call, patch
 
 import httpx
@@ -12,15 +15,23 @@ from pydantic.v1 import ValidationError
 
 from pyatlan.client.asset import (
     AssetClient,
+    AssetCreationHandling,
     Batch,
     CustomMetadataHandling,
     IndexSearchResults,
+    ParallelBatch,
 )
 from pyatlan.client.atlan import AtlanClient
-from pyatlan.client.common import ApiCaller, Search
+from pyatlan.client.common import ApiCaller, ParallelSearch, Search
 from pyatlan.client.common.asset import LOGGER as SHARED_LOGGER
+from pyatlan.client.constants import BULK_UPDATE, GET_ENTITY_BY_GUID, INDEX_SEARCH
 from pyatlan.client.group import GroupClient
 from pyatlan.client.search_log import SearchLogClient
+from pyatlan.client.transport import (
+    _record_request_body_size,
+    _record_retried_status_code,
+    record_request_body_sizes,
+)
 from pyatlan.client.typedef import TypeDefClient
 from pyatlan.client.user import UserClient
 from pyatlan.errors import (
@@ -55,7 +66,14 @@ from pyatlan.model.fluent_search import CompoundQuery, FluentSearch
 from pyatlan.model.group import GroupRequest
 from pyatlan.model.lineage import LineageListRequest
 from pyatlan.model.response import AssetMutationResponse
-from pyatlan.model.search import DSL, Bool, IndexSearchRequest, Term, TermAttributes
+from pyatlan.model.search import (
+    DSL,
+    Bool,
+    IndexSearchRequest,
+    Range,
+    Term,
+    TermAttributes,
+)
 from pyatlan.model.search_log import SearchLogRequest
 from pyatlan.model.typedef import EnumDef
 from pyatlan.model.user import AtlanUser, UserRequest
@@ -1808,6 +1826,354 @@ def test_index_search_pagination(
         client.search(criteria=request, bulk=True)
 
 
+def _streamed(response_json, chunk_size=16):
+    document = dumps(response_json).encode("utf-8")
+    return nullcontext(
+        document[i : i + chunk_size] for i in range(0, len(document), chunk_size)
+    )
+
+
+def test_index_search_streaming(mock_api_caller, index_search_paging_json):
+    client = AssetClient(mock_api_caller)
+    mock_api_caller._call_api.side_effect = [{"approximateCount": 2}]
+    mock_api_caller._stream_api.side_effect = [
+        _streamed(index_search_paging_json),
+        _streamed({"approximateCount": 2}),
+    ]
+    request = (
+        FluentSearch()
+        .where(CompoundQuery.active_assets())
+        .where(CompoundQuery.asset_type(AtlasGlossaryTerm))
+        .page_size(2)
+    ).to_request()
+    results = client.search(criteria=request, stream=True)
+
+    # Only the count is retrieved up-front, leaving the criteria untouched
+    count_request = mock_api_caller._call_api.call_args.kwargs["request_obj"]
+    assert count_request.dsl.size == 0
+    assert request.dsl.size == 2
+    assert results.count == 2
+    assert results.current_page() == []
+    assert mock_api_caller._stream_api.call_count == 0
+
+    guids = [asset.guid for asset in results]
+    assert guids == [entity["guid"] for entity in index_search_paging_json["entities"]]
+    assert results.current_page() == []
+    assert mock_api_caller._stream_api.call_count == 2
+    assert request.dsl.from_ == 2
+
+
+def test_index_search_streaming_bulk_skips_processed_assets(
+    mock_api_caller, index_search_paging_json
+):
+    client = AssetClient(mock_api_caller)
+    first_page = index_search_paging_json["entities"]
+    next_page = {
+        "entities": [
+            first_page[1],
+            {**first_page[0], "guid": "new-guid", "createTime": 1717514296595},
+        ],
+        "approximateCount": 3,
+    }
+    mock_api_caller._call_api.side_effect = [{"approximateCount": 3}]
+    mock_api_caller._stream_api.side_effect = [
+        _streamed(index_search_paging_json),
+        _streamed(next_page),
+        _streamed({"approximateCount": 3}),
+    ]
+    request = (
+        FluentSearch()
+        .where(CompoundQuery.active_assets())
+        .where(CompoundQuery.asset_type(AtlasGlossaryTerm))
+        .page_size(2)
+    ).to_request()
+    results = client.search(criteria=request, bulk=True, stream=True)
+
+    guids = [asset.guid for asset in results]
+    assert guids == [first_page[0]["guid"], first_page[1]["guid"], "new-guid"]
+    assert results.count == 3
+    assert results._criteria.dsl.sort[0] == Asset.CREATE_TIME.order(SortOrder.ASCENDING)
+    assert mock_api_caller._stream_api.call_count == 3
+
+
+def test_index_search_streaming_invalid_response(mock_api_caller):
+    client = AssetClient(mock_api_caller)
+    mock_api_caller._call_api.side_effect = [{"approximateCount": 1}]
+    mock_api_caller._stream_api.side_effect = [
+        nullcontext(iter([b'{"entities": [{"guid": "1"'])),
+    ]
+    request = (FluentSearch().where(CompoundQuery.active_assets())).to_request()
+    results = client.search(criteria=request, stream=True)
+
+    with pytest.raises(AtlanError, match="ATLAN-PYTHON-400-019"):
+        list(results)
+
+
+def test_index_search_prefetch(mock_api_caller, index_search_paging_json):
+    client = AssetClient(mock_api_caller)
+    entity = index_search_paging_json["entities"][0]
+    entities = [{**entity, "guid": f"guid-{i}"} for i in range(5)]
+    requested = []
+
+    def call_api(api, query_params=None, request_obj=None):
+        start = request_obj.dsl.from_
+        requested.append(start)
+        if page := entities[start : start + 2]:
+            return {"entities": page, "approximateCount": len(entities)}
+        return {}
+
+    mock_api_caller._call_api.side_effect = call_api
+    request = (
+        FluentSearch()
+        .where(CompoundQuery.active_assets())
+        .where(CompoundQuery.asset_type(AtlasGlossaryTerm))
+        .page_size(2)
+    ).to_request()
+    results = client.search(criteria=request, prefetch=2)
+
+    assert [asset.guid for asset in results] == [e["guid"] for e in entities]
+    # Pages beyond the next one are only prefetched within the count of results
+    assert sorted(requested) == [0, 2, 4, 6]
+    assert results.count == 5
+
+
+def _partitioned_call_api(entities, requested):
+    # Mimics the search endpoint for creation time bounds and ranges
+    def call_api(api, query_params=None, request_obj=None):
+        dsl = request_obj.dsl
+        if dsl.aggregations:
+            times = [e["createTime"] for e in entities]
+            return {
+                "approximateCount": len(entities),
+                "aggregations": {
+                    "min_create_time": {"value": float(min(times))},
+                    "max_create_time": {"value": float(max(times))},
+                },
+            }
+        ranges = [
+            f
+            for f in dsl.query.filter
+            if isinstance(f, Range) and f.field == "__timestamp"
+        ]
+        # Any range used by timestamp-based paging follows that of the partition
+        requested.append((ranges[0].gt, ranges[0].lt))
+        matches = [
+            e
+            for e in entities
+            if all(
+                (r.gt is None or e["createTime"] > r.gt)
+                and (r.gte is None or e["createTime"] >= r.gte)
+                and (r.lt is None or e["createTime"] < r.lt)
+                for r in ranges
+            )
+        ]
+        if page := matches[dsl.from_ : dsl.from_ + dsl.size]:
+            return {"entities": page, "approximateCount": len(matches)}
+        return {}
+
+    return call_api
+
+
+def test_prepare_partition_requests():
+    request = (
+        FluentSearch().where(CompoundQuery.asset_type(AtlasGlossaryTerm))
+    ).to_request()
+    bounds = {
+        "approximateCount": 10,
+        "aggregations": {
+            "min_create_time": {"value": 100.0},
+            "max_create_time": {"value": 199.0},
+        },
+    }
+
+    requests = ParallelSearch.prepare_partition_requests(request, bounds, 4)
+
+    ranges = [
+        [f for f in r.dsl.query.filter if isinstance(f, Range)][0] for r in requests
+    ]
+    assert [(r.gt, r.gte, r.lt, r.lte) for r in ranges] == [
+        (None, None, 125, None),
+        (124, None, 150, None),
+        (149, None, 175, None),
+        (174, None, None, None),
+    ]
+    assert not any(isinstance(f, Range) for f in request.dsl.query.filter)
+    assert ParallelSearch.prepare_partition_requests(request, {}, 4) == []
+    assert ParallelSearch.prepare_partition_requests(
+        request, {"approximateCount": 1}, 4
+    ) == [request]
+    same_time = {
+        "approximateCount": 2,
+        "aggregations": {
+            "min_create_time": {"value": 100.0},
+            "max_create_time": {"value": 100.0},
+        },
+    }
+    assert len(ParallelSearch.prepare_partition_requests(request, same_time, 4)) == 1
+
+
+@pytest.mark.parametrize("bulk", [False, True])
+def test_search_parallel(mock_api_caller, index_search_paging_json, bulk):
+    client = AssetClient(mock_api_caller)
+    entity = index_search_paging_json["entities"][0]
+    entities = [
+        {**entity, "guid": f"guid-{i}", "createTime": 1717514296594 + i * 10}
+        for i in range(9)
+    ]
+    requested: list = []
+    mock_api_caller._call_api.side_effect = _partitioned_call_api(entities, requested)
+    request = (
+        FluentSearch().where(CompoundQuery.asset_type(AtlasGlossaryTerm)).page_size(2)
+    ).to_request()
+
+    guids = [asset.guid for asset in client.search_parallel(request, 3, bulk=bulk)]
+
+    assert sorted(guids) == [e["guid"] for e in entities]
+    assert {bounds for bounds in requested} == {
+        (None, 1717514296621),
+        (1717514296620, 1717514296648),
+        (1717514296647, None),
+    }
+
+
+def test_search_parallel_raises_partition_error(
+    mock_api_caller, index_search_paging_json
+):
+    client = AssetClient(mock_api_caller)
+    entity = index_search_paging_json["entities"][0]
+    entities = [{**entity, "createTime": 1717514296594 + i} for i in range(4)]
+    call_api = _partitioned_call_api(entities, [])
+
+    def failing_call_api(api, query_params=None, request_obj=None):
+        if request_obj.dsl.aggregations:
+            return call_api(api, query_params, request_obj)
+        raise ErrorCode.ASSET_NOT_FOUND_BY_GUID.exception_with_parameters("guid")
+
+    mock_api_caller._call_api.side_effect = failing_call_api
+    request = (FluentSearch().where(CompoundQuery.active_assets())).to_request()
+
+    with pytest.raises(NotFoundError):
+        list(client.search_parallel(request, 2))
+
+
+def _timestamp_paged_call_api(entities, requested):
+    # Mimics the search endpoint for results sorted by creation time and then GUID
+    def call_api(api, query_params=None, request_obj=None):
+        dsl = request_obj.dsl
+        (paging,) = [f for f in dsl.query.filter if isinstance(f, Range) and f.gte] or [
+            Range(field="__timestamp")
+        ]
+        requested.append((paging.gte, dsl.from_))
+        matches = [e for e in entities if e["createTime"] >= (paging.gte or 0)]
+        if page := matches[dsl.from_ : dsl.from_ + dsl.size]:
+            return {"entities": page, "approximateCount": len(matches)}
+        return {}
+
+    return call_api
+
+
+def test_index_search_bulk_retains_only_latest_timestamp_guids(
+    mock_api_caller, index_search_paging_json
+):
+    client = AssetClient(mock_api_caller)
+    entity = index_search_paging_json["entities"][0]
+    times = [1, 1, 1, 1, 1, 2, 3, 3, 4]
+    entities = [
+        {**entity, "guid": f"guid-{i}", "createTime": 1717514296590 + t}
+        for i, t in enumerate(times)
+    ]
+    requested: list = []
+    mock_api_caller._call_api.side_effect = _timestamp_paged_call_api(
+        entities, requested
+    )
+    request = (
+        FluentSearch().where(CompoundQuery.asset_type(AtlasGlossaryTerm)).page_size(2)
+    ).to_request()
+    results = client.search(criteria=request, bulk=True)
+
+    guids, window_sizes = [], []
+    for asset in results:
+        guids.append(asset.guid)
+        window_sizes.append(len(results._processed_guids))
+
+    assert guids == [e["guid"] for e in entities]
+    # Assets at the latest creation time are skipped (not re-fetched),
+    # even when they span more than a single page of results
+    assert requested == [
+        (None, 0),
+        (1717514296591, 2),
+        (1717514296591, 4),
+        (1717514296592, 1),
+        (1717514296593, 2),
+        (1717514296594, 1),
+    ]
+    assert max(window_sizes) == 4
+    assert results._processed_guids == {"guid-8"}
+
+
+def test_index_search_prefetch_bulk_matches_serial_paging(
+    mock_api_caller, index_search_paging_json
+):
+    entity = index_search_paging_json["entities"][0]
+    first, second, third, fourth = (
+        {**entity, "guid": f"guid-{i}", "createTime": 1717514296594 + i}
+        for i in range(4)
+    )
+    responses = [
+        {"entities": [first, second], "approximateCount": 4},
+        {"entities": [second, third], "approximateCount": 4},
+        {"entities": [third, fourth], "approximateCount": 4},
+        {},
+    ]
+
+    def run(prefetch):
+        sent = []
+
+        def call_api(api, query_params=None, request_obj=None):
+            sent.append((request_obj or query_params).json())
+            return responses[len(sent) - 1]
+
+        mock_api_caller.reset_mock()
+        mock_api_caller._call_api.side_effect = call_api
+        request = (
+            FluentSearch()
+            .where(CompoundQuery.active_assets())
+            .where(CompoundQuery.asset_type(AtlasGlossaryTerm))
+            .page_size(2)
+        ).to_request()
+        results = AssetClient(mock_api_caller).search(
+            criteria=request, bulk=True, prefetch=prefetch
+        )
+        return [asset.guid for asset in results], sent
+
+    guids, requests = run(prefetch=2)
+
+    assert guids == ["guid-0", "guid-1", "guid-2", "guid-3"]
+    assert (guids, requests) == run(prefetch=0)
+
+
+def test_stream_api(client):
+    def handler(request):
+        if request.url.path.endswith(INDEX_SEARCH.path):
+            return httpx.Response(
+                200, content=b'{"entities": [], "approximateCount": 0}'
+            )
+        return httpx.Response(
+            404, json={"errorCode": "ATLAS-404-00-005", "errorMessage": "Not found"}
+        )
+
+    client._session = httpx.Client(transport=httpx.MockTransport(handler))
+    request = (FluentSearch().where(CompoundQuery.active_assets())).to_request()
+
+    with client._stream_api(INDEX_SEARCH, request_obj=request) as chunks:
+        assert b"".join(chunks) == b'{"entities": [], "approximateCount": 0}'
+
+    # Unsuccessful responses are handled in the same way as for any other call
+    with pytest.raises(NotFoundError, match="Not found"):
+        with client._stream_api(GET_ENTITY_BY_GUID.format_path_with_params("x")):
+            pass
+
+
 def test_asset_get_by_guid_without_asset_type(mock_api_caller, get_by_guid_json):
     client = AssetClient(mock_api_caller)
     mock_api_caller._call_api.side_effect = [get_by_guid_json]
@@ -2492,6 +2858,189 @@ class TestBatch:
         assert batch.num_restored == 0
         assert batch.num_updated == 0
 
+    @staticmethod
+    def _concurrent_save(in_flight, fail_guid=None):
+        # Saves each batch slowly, recording how many are in flight at once
+        lock = Lock()
+
+        def save(revised, replace_atlan_tags):
+            with lock:
+                in_flight.append(in_flight[-1] + 1)
+            sleep(0.05)
+            with lock:
+                in_flight.append(in_flight[-1] - 1)
+            if fail_guid in {asset.guid for asset in revised}:
+                raise ErrorCode.INVALID_REQUEST_PASSTHROUGH.exception_with_parameters(
+                    "bad", "stuff", ""
+                )
+            mutated_entities = Mock()
+            mutated_entities.CREATE = [
+                Table(guid=asset.guid.lstrip("-")) for asset in revised
+            ]
+            mutated_entities.UPDATE = None
+            mutated_entities.PARTIAL_UPDATE = None
+            response = Mock(spec=AssetMutationResponse)
+            response.guid_assignments = {
+                asset.guid: asset.guid.lstrip("-") for asset in revised
+            }
+            response.partial_updated_entities = None
+            response.attach_mock(mutated_entities, "mutated_entities")
+            return response
+
+        return save
+
+    def test_parallel_batch_flushes_concurrently(self, mock_atlan_client):
+        in_flight = [0]
+        mock_atlan_client.asset.save.side_effect = self._concurrent_save(in_flight)
+        tables = [Table(guid=f"-{i}") for i in range(7)]
+
+        sut = ParallelBatch(client=mock_atlan_client, max_size=2, max_in_flight=2)
+        for table in tables:
+            sut.add(table)
+        assert sut.num_created < len(tables)
+        sut.flush()
+
+        assert max(in_flight) == 2
+        assert sut.num_created == len(tables)
+        assert sut.num_restored == 0
+        assert sut._resolved_guids == {f"-{i}": f"{i}" for i in range(7)}
+        mock_atlan_client.asset.save.assert_has_calls(
+            [
+                call(tables[0:2], replace_atlan_tags=False),
+                call(tables[2:4], replace_atlan_tags=False),
+                call(tables[4:6], replace_atlan_tags=False),
+                call(tables[6:], replace_atlan_tags=False),
+            ],
+            any_order=True,
+        )
+
+    def test_parallel_batch_failures(self, mock_atlan_client):
+        in_flight = [0]
+        mock_atlan_client.asset.save.side_effect = self._concurrent_save(
+            in_flight, fail_guid="-2"
+        )
+        tables = [Table(guid=f"-{i}") for i in range(6)]
+
+        sut = ParallelBatch(client=mock_atlan_client, max_size=2, capture_failures=True)
+        for table in tables:
+            sut.add(table)
+        sut.flush()
+
+        assert sut.num_created == 4
+        assert [failure.failed_assets for failure in sut.failures] == [tables[2:4]]
+
+        sut = ParallelBatch(client=mock_atlan_client, max_size=2)
+        for table in tables:
+            sut.add(table)
+        with pytest.raises(AtlanError):
+            sut.flush()
+        # The batches after the failed one were still waited for (and tracked)
+        assert sut.num_created == 4
+        assert in_flight[-1] == 0
+        assert not sut._in_flight
+        assert sut._executor is None
+
+    def test_adaptive_batch_sizes(self, mock_atlan_client):
+        save = self._concurrent_save([0])
+
+        def throttled_save(revised, replace_atlan_tags):
+            if "-12" in {asset.guid for asset in revised}:
+                # As the transport reports a throttled request it retried
+                _record_retried_status_code(429)
+            if "-30" in {asset.guid for asset in revised}:
+                raise ErrorCode.ERROR_PASSTHROUGH.exception_with_parameters(
+                    "bad", "stuff", ""
+                )
+            return save(revised, replace_atlan_tags)
+
+        mock_atlan_client.asset.save.side_effect = throttled_save
+        tables = [Table(guid=f"-{i}") for i in range(40)]
+
+        sut = Batch(
+            client=mock_atlan_client, max_size=20, capture_failures=True, adaptive=True
+        )
+        for table in tables:
+            sut.add(table)
+        sut.flush()
+
+        # Additive increase, halved on throttling (or failures on the server)
+        assert sut.batch_sizes == [5, 7, 9, 4, 6, 3, 5, 1]
+        assert sut.num_created == 34
+        assert [failure.failed_assets for failure in sut.failures] == [tables[25:31]]
+
+    def test_adaptive_batch_sizes_limited_by_bytes(self, mock_atlan_client):
+        save = self._concurrent_save([0])
+
+        def sized_save(revised, replace_atlan_tags):
+            # As the client reports the size of each request body it sends
+            _record_request_body_size(100 * len(revised))
+            return save(revised, replace_atlan_tags)
+
+        mock_atlan_client.asset.save.side_effect = sized_save
+        tables = [Table(guid=f"-{i}") for i in range(10)]
+
+        sut = Batch(client=mock_atlan_client, max_size=20, adaptive=True, max_bytes=300)
+        for table in tables:
+            sut.add(table)
+        sut.flush()
+
+        # Limited by the size per asset of the requests already sent
+        assert sut.batch_sizes == [5, 3, 2]
+        assert Batch(client=mock_atlan_client, max_size=20).batch_sizes == []
+
+    def test_request_body_sizes_are_recorded(self, client):
+        request = BulkRequest(entities=[Table(guid="-1")])
+        with record_request_body_sizes() as body_sizes:
+            params = client._create_params(BULK_UPDATE, None, request)
+        assert body_sizes == [len(params["content"])]
+
+    def test_update_only_with_indexed_connection(self, mock_atlan_client):
+        connection_qn = "default/snowflake/123"
+        mock_atlan_client.asset.search.side_effect = [
+            [
+                Table.ref_by_qualified_name(f"{connection_qn}/DB/SCH/TBL"),
+                View.ref_by_qualified_name(f"{connection_qn}/DB/SCH/VW"),
+            ],
+            [],
+        ]
+        mock_atlan_client.asset.save.side_effect = self._concurrent_save([0])
+        tables = [
+            Table.updater(qualified_name=qualified_name, name=qualified_name[-3:])
+            for qualified_name in (
+                f"{connection_qn}/db/sch/tbl",
+                f"{connection_qn}/db/sch/vw",
+                f"{connection_qn}/db/sch/missing",
+                f"{connection_qn}/db/sch/other",
+                "default/snowflake/456/db/sch/tbl",
+            )
+        ]
+
+        sut = Batch(
+            client=mock_atlan_client,
+            max_size=2,
+            update_only=True,
+            case_insensitive=True,
+            table_view_agnostic=True,
+            creation_handling=AssetCreationHandling.NONE,
+            connection_qualified_name=connection_qn,
+        )
+        for table in tables:
+            sut.add(table)
+        sut.flush()
+
+        # One bulk search of the connection up front, then only
+        # a search for the asset outside of that connection
+        assert mock_atlan_client.asset.search.call_count == 2
+        assert mock_atlan_client.asset.search.call_args_list[0].kwargs["bulk"]
+        assert sut.num_skipped == 3
+        assert [
+            (asset.type_name, asset.qualified_name)
+            for asset in mock_atlan_client.asset.save.call_args.args[0]
+        ] == [
+            ("Table", f"{connection_qn}/DB/SCH/TBL"),
+            ("View", f"{connection_qn}/DB/SCH/VW"),
+        ]
+
 
 class TestBulkRequest:
     SEE_ALSO = "seeAlso"
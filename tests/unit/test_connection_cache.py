@@ -1,5 +1,8 @@
 # SPDX-License-Identifier: Apache-2.0
 # Copyright 2025 Atlan Pte. Ltd.
+from concurrent.futures import ThreadPoolExecutor
+from threading import Barrier
+from time import sleep
 from unittest.mock import Mock, patch
 
 import pytest
@@ -8,6 +11,8 @@ from pyatlan.cache.connection_cache import ConnectionCache, ConnectionName
 from pyatlan.client.atlan import AtlanClient
 from pyatlan.errors import ErrorCode, InvalidRequestError, NotFoundError
 from pyatlan.model.assets import Connection
+from pyatlan.model.fluent_search import FluentSearch
+from pyatlan.model.search import Terms
 
 
 @pytest.fixture(autouse=True)
@@ -252,3 +257,176 @@ def test_get_by_name(mock_lookup_by_name, mock_lookup_by_guid, mock_connection_c
 
     # No call to guid lookup since the object is already in the cache
     assert mock_lookup_by_guid.call_count == 0
+
+
+def build_connection(index: int) -> Connection:
+    return Connection.parse_obj(
+        {
+            "typeName": "Connection",
+            "guid": f"guid-{index}",
+            "status": "ACTIVE",
+            "attributes": {
+                "qualifiedName": f"default/snowflake/{index}",
+                "name": f"conn-{index}",
+                "connectorName": "snowflake",
+                "description": "not cached",
+            },
+        }
+    )
+
+
+def test_cache_keeps_only_search_attributes(client):
+    connection_cache = ConnectionCache(client)
+    connection_cache.cache(build_connection(1))
+
+    connection = connection_cache.get_by_name(ConnectionName("snowflake/conn-1"))
+    assert isinstance(connection, Connection)
+    assert connection.guid == "guid-1"
+    assert connection.qualified_name == "default/snowflake/1"
+    assert connection.connector_name == "snowflake"
+    assert connection.status == "ACTIVE"
+    assert connection.description is None
+    assert connection.dict(by_alias=True, exclude_unset=True) == {
+        "typeName": "Connection",
+        "guid": "guid-1",
+        "status": "ACTIVE",
+        "attributes": {
+            "qualifiedName": "default/snowflake/1",
+            "name": "conn-1",
+            "connectorName": "snowflake",
+        },
+    }
+    # Each retrieval returns a new asset, so changes to it do not affect the cache
+    connection.name = "changed"
+    assert connection_cache.get_by_guid("guid-1").name == "conn-1"
+
+
+@patch.object(ConnectionCache, "lookup_by_guid")
+def test_cache_evicts_least_recently_used(mock_lookup_by_guid, client):
+    connection_cache = ConnectionCache(client, max_entries=2)
+    connection_cache.cache(build_connection(1))
+    connection_cache.cache(build_connection(2))
+    connection_cache.get_by_guid("guid-1")
+    connection_cache.cache(build_connection(3))
+
+    # All indexes forget the evicted connection at once
+    assert not connection_cache.is_guid_known("guid-2")
+    assert not connection_cache.is_name_known("snowflake/conn-2")
+    assert not connection_cache.is_qualified_name_known("default/snowflake/2")
+    assert connection_cache.is_name_known("snowflake/conn-1")
+    assert connection_cache.is_qualified_name_known("default/snowflake/3")
+    assert len(connection_cache.store) == 2
+
+    with pytest.raises(NotFoundError):
+        connection_cache.get_by_guid("guid-2")
+    mock_lookup_by_guid.assert_called_once_with("guid-2")
+    stats = connection_cache.get_stats()
+    assert {
+        key: stats[key] for key in ("hits", "misses", "evictions", "expirations")
+    } == {
+        "hits": 1,
+        "misses": 1,
+        "evictions": 1,
+        "expirations": 0,
+    }
+    assert stats["entries"] == 2
+
+
+@patch.object(ConnectionCache, "lookup_by_qualified_name")
+def test_cache_expires_entries(mock_lookup_by_qn, client):
+    connection_cache = ConnectionCache(client, ttl=0)
+    connection_cache.cache(build_connection(1))
+    with pytest.raises(NotFoundError):
+        connection_cache.get_by_qualified_name("default/snowflake/1")
+    mock_lookup_by_qn.assert_called_once()
+    assert not connection_cache.is_name_known("snowflake/conn-1")
+    assert connection_cache.get_stats()["expirations"] == 1
+
+
+def test_cache_replaces_renamed_connection(client):
+    connection_cache = ConnectionCache(client)
+    connection_cache.cache(build_connection(1))
+    renamed = build_connection(1)
+    renamed.name = "renamed"
+    connection_cache.cache(renamed)
+    assert not connection_cache.is_name_known("snowflake/conn-1")
+    assert connection_cache.get_by_name(ConnectionName("snowflake/renamed"), False)
+    assert len(connection_cache.store) == 1
+
+
+def test_client_configures_cache_bounds(monkeypatch):
+    monkeypatch.setenv("ATLAN_ASSET_CACHE_MAX_ENTRIES", "5")
+    monkeypatch.setenv("ATLAN_ASSET_CACHE_TTL", "60")
+    client = AtlanClient()
+    for cache in (client.connection_cache, client.source_tag_cache):
+        assert cache.store.max_entries == 5
+        assert cache.store.ttl == 60
+
+
+def fake_search(assets, searches):
+    """
+    :returns: a replacement for FluentSearch.execute that returns those of the
+              given assets matched by the search, and records the values searched
+    """
+
+    def execute(search, client):
+        terms = next(where for where in search.wheres if isinstance(where, Terms))
+        searches.append(terms.values)
+        sleep(0.01)
+        return [
+            asset
+            for asset in assets
+            if (asset.guid if terms.field == "__guid" else asset.qualified_name)
+            in terms.values
+        ]
+
+    return execute
+
+
+def test_get_by_guids_looks_up_misses_in_batches(client):
+    connections = [build_connection(index) for index in range(240)]
+    connection_cache = ConnectionCache(client)
+    connection_cache.cache(connections[0])
+    guids = [f"guid-{index}" for index in range(250)]
+    searches = []
+    with patch.object(
+        FluentSearch,
+        "execute",
+        autospec=True,
+        side_effect=fake_search(connections, searches),
+    ):
+        found = connection_cache.get_by_guids(guids + ["guid-1", ""])
+        assert list(found) == guids[:240]
+        assert found["guid-7"].qualified_name == "default/snowflake/7"
+        # Only misses are looked up, in batches of LOOKUP_BATCH_SIZE
+        assert [len(values) for values in searches] == [100, 100, 49]
+
+        found = connection_cache.get_by_qualified_names(
+            ["default/snowflake/3", "default/snowflake/999"]
+        )
+        assert list(found) == ["default/snowflake/3"]
+        assert searches[-1] == ["default/snowflake/999"]
+        assert connection_cache.get_by_guids(["guid-999"], allow_refresh=False) == {}
+        assert len(searches) == 4
+
+
+def test_concurrent_misses_on_a_key_share_one_lookup(client):
+    connection_cache = ConnectionCache(client)
+    connections = [build_connection(index) for index in range(2)]
+    searches = []
+    barrier = Barrier(6)
+
+    def lookup(guid):
+        barrier.wait()
+        return connection_cache.get_by_guid(guid).name
+
+    with patch.object(
+        FluentSearch,
+        "execute",
+        autospec=True,
+        side_effect=fake_search(connections, searches),
+    ):
+        with ThreadPoolExecutor(max_workers=6) as executor:
+            names = list(executor.map(lookup, ["guid-0", "guid-1"] * 3))
+    assert names == ["conn-0", "conn-1"] * 3
+    assert sorted(searches) == [["guid-0"], ["guid-1"]]
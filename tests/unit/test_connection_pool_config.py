@@ -27,6 +27,7 @@ from pyatlan.client.atlan import (
     AtlanClient,
 )
 from pyatlan.client.transport import PyatlanSyncTransport
+from pyatlan.errors import DependencyNotFoundError
 from pyatlan.model.assets import AtlasGlossary
 
 
@@ -274,3 +275,60 @@ class TestResetHttpSession:
 
         assert captured.get("proxy") == "http://proxy.example.com:8080"
         assert captured.get("verify") == "/path/to/cert.pem"
+
+
+# ---------------------------------------------------------------------------
+# Configurable pool and HTTP/2
+# ---------------------------------------------------------------------------
+
+
+def test_pool_configuration_from_client(monkeypatch):
+    """Pool limits and timeout can be set on the client, or from the environment."""
+    monkeypatch.setenv("ATLAN_MAX_KEEPALIVE_CONNECTIONS", "20")
+    monkeypatch.setenv("ATLAN_POOL_TIMEOUT", "5")
+    client = AtlanClient(max_connections=100, keepalive_expiry=10.0)
+    pool = _get_httpcore_pool(client)
+    assert pool._max_connections == 100
+    assert pool._max_keepalive_connections == 20
+    assert pool._keepalive_expiry == 10.0
+    assert not pool._http2
+
+    with patch.object(AtlanClient, "_session") as mock_session:
+        mock_session.request.return_value = _error_response()
+        _trigger_api_call(client)
+    assert mock_session.request.call_args.kwargs["timeout"].pool == 5.0
+
+    client.reset_http_session()
+    assert _get_httpcore_pool(client)._max_connections == 100
+    assert _capture_transport_limits(client).max_keepalive_connections == 20
+
+
+def test_http2_is_passed_to_transport(monkeypatch):
+    """HTTP/2 is opt-in, and enabled on every transport the client creates."""
+    monkeypatch.setenv("ATLAN_HTTP2", "true")
+    captured: list = []
+    original_init = PyatlanSyncTransport.__init__
+
+    def capturing_init(self_t, retry=None, client=None, **kwargs):
+        captured.append(kwargs)
+        original_init(self_t, retry=retry, client=client, **kwargs)
+
+    with (
+        patch("importlib.util.find_spec", return_value=Mock()),
+        patch.object(PyatlanSyncTransport, "__init__", capturing_init),
+        patch("httpx.HTTPTransport", Mock(return_value=Mock())),
+    ):
+        client = AtlanClient()
+        client.reset_http_session()
+        with client.max_retries():
+            pass
+
+    assert len(captured) == 3
+    assert all(kwargs["http2"] for kwargs in captured)
+
+
+def test_http2_without_h2_installed():
+    """Enabling HTTP/2 without its optional dependency fails clearly."""
+    with patch("importlib.util.find_spec", return_value=None):
+        with pytest.raises(DependencyNotFoundError, match="httpx\\[http2\\]"):
+            AtlanClient(http2=True)
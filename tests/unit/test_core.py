@@ -1,13 +1,24 @@
 from __future__ import annotations
 
-from typing import no_type_check
+import json
+from datetime import datetime, timezone
+from typing import List, no_type_check
 from unittest.mock import MagicMock
 
 import pytest
 from pydantic.v1 import Field
 
 from pyatlan.client.atlan import AtlanClient
-from pyatlan.model.core import AtlanObject, AtlanTag, AtlanTagName
+from pyatlan.model.assets import Column, Table
+from pyatlan.model.core import (
+    AtlanObject,
+    AtlanRequest,
+    AtlanTag,
+    AtlanTagName,
+    BulkRequest,
+    iter_nested_dicts,
+)
+from pyatlan.model.enums import CertificateStatus
 
 DISPLAY_TEXT = "Something"
 
@@ -154,6 +165,78 @@ class TestAtlanObjectExtraFields:
         assert response.attributes.__atlan_extra__ == {"newAttr": "newValueAttr"}
 
 
+class TestAtlanRequest:
+    @pytest.fixture()
+    def bulk_request(self):
+        column = Column.creator(
+            name="c1",
+            parent_qualified_name="default/snowflake/123/db/schema/table",
+            parent_type=Table,
+            order=1,
+        )
+        column.atlan_tags = [AtlanTag(type_name=AtlanTagName("PII"))]
+        column.certificate_status = CertificateStatus.VERIFIED
+        column.source_created_at = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        return BulkRequest[Column](entities=[column])
+
+    @pytest.fixture()
+    def request_client(self, client):
+        tag_cache = MagicMock()
+        tag_cache.get_id_for_name.side_effect = lambda name: f"ID_{name}"
+        tag_cache.get_source_tags_attr_id.return_value = None
+        client._atlan_tag_cache = tag_cache
+        return client
+
+    def test_payload_matches_model_json_with_retranslated_tags(
+        self, bulk_request, request_client
+    ):
+        expected = json.loads(bulk_request.json(by_alias=True, exclude_unset=True))
+        expected["entities"][0]["classifications"][0]["typeName"] = "ID_PII"
+
+        request = AtlanRequest(instance=bulk_request, client=request_client)
+
+        assert json.loads(request.json()) == expected
+        assert json.loads(request.to_bytes()) == expected
+        entity = expected["entities"][0]
+        assert entity["attributes"]["sourceCreatedAt"] == 1704067200000
+        assert entity["attributes"]["certificateStatus"] == "VERIFIED"
+
+    def test_to_bytes_is_compact(self, bulk_request, request_client):
+        body = AtlanRequest(instance=bulk_request, client=request_client).to_bytes()
+
+        assert isinstance(body, bytes)
+        assert b", " not in body
+        assert b'": ' not in body
+
+    def test_retranslation_does_not_modify_instance(self, bulk_request, request_client):
+        AtlanRequest(instance=bulk_request, client=request_client)
+
+        assert bulk_request.entities[0].atlan_tags[0].type_name == AtlanTagName("PII")
+
+    def test_custom_root_is_unwrapped(self, request_client):
+        class Names(AtlanObject):
+            __root__: List[str]
+
+        request = AtlanRequest(
+            instance=Names(__root__=["a", "b"]), client=request_client
+        )
+
+        assert request.translated == ["a", "b"]
+        assert request.to_bytes() == b'["a","b"]'
+
+    def test_iter_nested_dicts_allows_in_place_replacement(self):
+        data = {"a": [{"b": 1}, {"c": {"d": 2}}], "e": "f"}
+        seen = []
+        for node in iter_nested_dicts(data):
+            seen.append(dict(node))
+            if "c" in node:
+                node["c"] = {"replaced": True}
+
+        assert {"replaced": True} in seen
+        assert {"d": 2} not in seen
+        assert len(seen) == 4
+
+
 class TestPyatlanVersion:
     def test_pyatlan_has_version_attribute(self):
         """Test that pyatlan module has __version__ attribute"""
@@ -0,0 +1,143 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2025 Atlan Pte. Ltd.
+import json
+from threading import Event
+from unittest.mock import Mock
+
+import pytest
+
+from pyatlan.client.atlan import AtlanClient
+from pyatlan.client.common.hedging import HedgingPolicy
+from pyatlan.client.constants import BULK_UPDATE, GET_ENTITY_BY_GUID, INDEX_SEARCH
+
+
+@pytest.fixture(autouse=True)
+def set_env(monkeypatch):
+    monkeypatch.setenv("ATLAN_BASE_URL", "https://test.atlan.com")
+    monkeypatch.setenv("ATLAN_API_KEY", "test-api-key")
+
+
+@pytest.fixture()
+def release():
+    # Releases any (slow) requests still waiting at the end of a test
+    event = Event()
+    yield event
+    event.set()
+
+
+def _response(body: dict) -> Mock:
+    text = json.dumps(body)
+    return Mock(
+        status_code=200,
+        text=text,
+        content=text.encode("utf-8"),
+        json=lambda: json.loads(text),
+    )
+
+
+def _slow_then_fast(release: Event):
+    calls = []
+
+    def request(*args, **kwargs):
+        calls.append(kwargs)
+        if len(calls) == 1:
+            release.wait(5)
+            return _response({"from": "primary"})
+        return _response({"from": "hedge"})
+
+    return request
+
+
+def _hedging_client(**kwargs) -> AtlanClient:
+    client = AtlanClient(hedge_requests=True, **kwargs)
+    client._session = Mock()
+    return client
+
+
+def test_hedging_policy():
+    policy = HedgingPolicy(budget=0.5)
+    assert policy.is_hedgeable(INDEX_SEARCH)
+    assert policy.is_hedgeable(GET_ENTITY_BY_GUID)
+    assert not policy.is_hedgeable(BULK_UPDATE)
+
+    # Requests are only hedged within the budget
+    assert policy.start_request() is None
+    assert not policy.try_hedge()
+    policy.start_request()
+    assert policy.try_hedge()
+    assert not policy.try_hedge()
+
+    # Without a configured delay, hedge after the observed 95th percentile latency
+    for index in range(1, 21):
+        policy.record_latency(index / 100)
+    assert policy.start_request() == 0.2
+    assert policy.get_stats() == {
+        "requests": 3,
+        "hedges": 1,
+        "hedge_wins": 0,
+        "delay": 0.2,
+    }
+    assert HedgingPolicy(delay=1.0).start_request() == 1.0
+
+
+def test_hedging_policy_limits_saved_up_budget():
+    policy = HedgingPolicy(budget=1.0)
+    for _ in range(100):
+        policy.start_request()
+    assert sum(policy.try_hedge() for _ in range(100)) == 10
+
+
+def test_slow_search_is_hedged(release):
+    client = _hedging_client(hedge_delay=0.05, hedge_budget=1.0)
+    client._session.request.side_effect = _slow_then_fast(release)
+
+    assert client._call_api(INDEX_SEARCH, request_obj={}) == {"from": "hedge"}
+    assert client._session.request.call_count == 2
+    assert client._hedging.get_stats()["hedge_wins"] == 1
+
+
+def test_fast_search_is_not_hedged():
+    client = _hedging_client(hedge_delay=5.0, hedge_budget=1.0)
+    client._session.request.return_value = _response({"from": "primary"})
+
+    assert client._call_api(INDEX_SEARCH, request_obj={}) == {"from": "primary"}
+    assert client._session.request.call_count == 1
+    assert client._hedging.get_stats()["hedges"] == 0
+
+
+def test_slow_request_is_not_hedged(release):
+    client = _hedging_client(hedge_delay=0.05, hedge_budget=1.0)
+    client._session.request.side_effect = _slow_then_fast(release)
+    release.set()
+
+    # Neither non-idempotent requests
+    assert client._call_api(BULK_UPDATE, request_obj={}) == {"from": "primary"}
+    assert client._session.request.call_count == 1
+    # nor any requests beyond the budget are hedged
+    client = _hedging_client(hedge_delay=0.05, hedge_budget=0.5)
+    client._session.request.side_effect = _slow_then_fast(release)
+    assert client._call_api(INDEX_SEARCH, request_obj={}) == {"from": "primary"}
+    assert client._session.request.call_count == 1
+
+
+def test_failed_request_uses_hedge(release):
+    client = _hedging_client(hedge_delay=0.05, hedge_budget=1.0)
+    responses = iter([Event(), _response({"from": "hedge"})])
+
+    def request(*args, **kwargs):
+        response = next(responses)
+        if isinstance(response, Event):
+            release.wait(5)
+            raise ValueError("primary failed")
+        return response
+
+    client._session.request.side_effect = request
+    assert client._call_api(GET_ENTITY_BY_GUID) == {"from": "hedge"}
+
+
+def test_hedging_is_opt_in():
+    client = AtlanClient()
+    assert client._hedging is None
+    client._session = Mock()
+    client._session.request.return_value = _response({"from": "primary"})
+    assert client._call_api(INDEX_SEARCH, request_obj={}) == {"from": "primary"}
@@ -140,3 +140,53 @@ def test_stream_get_when_given_request(
     assert response.error_code
     assert response.error_message
     assert response.details
+
+
+def test_stream_results_in_batches(
+    client: AtlanClient,
+    query_request: QueryRequest,
+    mock_session,
+):
+    content = QUERY_RESPONSES.read_bytes()
+    mock_response = mock_session.stream.return_value.__enter__.return_value
+    # Events split arbitrarily across chunks
+    mock_response.iter_bytes.side_effect = lambda: (
+        content[i : i + 100] for i in range(0, len(content), 100)
+    )
+
+    results = client.queries.stream_results(request=query_request)
+    batches = list(results.iter_batches(batch_size=5))
+
+    assert [len(batch) for batch in batches] == [5, 5, 4]
+    assert [row for batch in batches for row in batch] == list(results)
+    assert list(results) == client.queries.stream(request=query_request).rows
+    response = results.response
+    assert response.rows is None
+    assert response.columns
+    assert len(response.columns) == 7
+    assert response.request_id
+    # Last event is an error
+    assert response.query_id is None
+    assert response.error_name
+    assert response.error_code
+    assert response.details
+    columns = next(results.iter_batches(batch_size=5, columnar=True))
+    assert len(columns) == 7
+    assert columns[0] == [row[0] for row in batches[0]]
+
+
+def test_stream_results_raises_error(
+    client: AtlanClient,
+    query_request: QueryRequest,
+    mock_session,
+):
+    mock_response = mock_session.stream.return_value.__enter__.return_value
+    mock_response.iter_bytes.return_value = [b"invalid data\n"]
+
+    with pytest.raises(LogicError, match="Unable to deserialize value"):
+        list(client.queries.stream_results(request=query_request))
+
+    mock_response.iter_bytes.return_value = [b"data: invalid data\n"]
+
+    with pytest.raises(ApiError, match="Invalid response object from API"):
+        list(client.queries.stream_results(request=query_request))
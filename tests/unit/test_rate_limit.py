@@ -0,0 +1,148 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2025 Atlan Pte. Ltd.
+from unittest.mock import MagicMock, patch
+
+import httpx
+import pytest
+from httpx_retries import Retry
+
+from pyatlan.client.atlan import AtlanClient
+from pyatlan.client.common.rate_limit import (
+    RateLimiter,
+    TokenBucket,
+    endpoint_class,
+    parse_retry_after,
+)
+from pyatlan.client.transport import PyatlanSyncTransport
+
+BASE_URL = "https://test.atlan.com/api/meta/"
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture(autouse=True)
+def set_env(monkeypatch):
+    monkeypatch.setenv("ATLAN_BASE_URL", "https://test.atlan.com")
+    monkeypatch.setenv("ATLAN_API_KEY", "test-api-key")
+
+
+@pytest.fixture()
+def clock():
+    return FakeClock()
+
+
+@pytest.mark.parametrize(
+    "path, expected",
+    [
+        ("search/indexsearch", "search"),
+        ("entity/bulk", "bulk"),
+        ("entity/bulk/", "bulk"),
+        ("types/typedefs/", "typedef"),
+        ("entity/guid/123", "default"),
+    ],
+)
+def test_endpoint_class(path, expected):
+    assert endpoint_class(httpx.Request("POST", BASE_URL + path)) == expected
+
+
+def test_parse_retry_after():
+    def response(headers):
+        return httpx.Response(429, headers=headers)
+
+    assert parse_retry_after(response({"Retry-After": "7"})) == 7.0
+    assert parse_retry_after(response({})) is None
+    assert parse_retry_after(response({"Retry-After": "soon"})) is None
+    # Dates in the past mean there is no need to wait
+    past = "Wed, 21 Oct 2015 07:28:00 GMT"
+    assert parse_retry_after(response({"Retry-After": past})) == 0.0
+
+
+def test_token_bucket_paces_requests(clock):
+    bucket = TokenBucket(max_rate=2.0, min_rate=0.5, clock=clock)
+    # Bursts of up to a second's worth of requests are sent straight away
+    assert [bucket.reserve() for _ in range(2)] == [0.0, 0.0]
+    # and the rest are spaced out at the rate
+    assert [bucket.reserve() for _ in range(2)] == [0.5, 1.0]
+    clock.now = 2.0
+    assert bucket.reserve() == 0.0
+
+
+def test_token_bucket_adapts_rate(clock):
+    bucket = TokenBucket(max_rate=8.0, min_rate=1.0, clock=clock)
+    bucket.record(429)
+    assert bucket.rate == 4.0
+    # Throttling of requests in the same burst only reduces the rate once
+    bucket.record(503)
+    assert bucket.rate == 4.0
+    for clock.now in (1.0, 2.0, 3.0, 4.0):
+        bucket.record(429)
+    assert bucket.rate == 1.0
+
+    bucket.record(200)
+    assert bucket.rate == 1.5
+    for _ in range(100):
+        bucket.record(200)
+    assert bucket.rate == 8.0
+
+
+def test_token_bucket_pauses_for_retry_after(clock):
+    bucket = TokenBucket(max_rate=4.0, min_rate=1.0, clock=clock)
+    bucket.record(429, retry_after=10.0)
+    assert bucket.reserve() == 10.5
+    assert bucket.reserve() == 11.0
+    clock.now = 20.0
+    assert bucket.reserve() == 0.0
+
+
+def test_rate_limiter_budget_per_endpoint_class(clock):
+    limiter = RateLimiter(max_rate=4.0, clock=clock)
+    search = httpx.Request("POST", BASE_URL + "search/indexsearch")
+    bulk = httpx.Request("POST", BASE_URL + "entity/bulk")
+    assert limiter.bucket(search) is limiter.bucket(search)
+    limiter.bucket(search).record(429)
+    assert limiter.get_rates() == {"search": 2.0}
+    assert limiter.bucket(bulk).reserve() == 0.0
+    assert limiter.get_rates() == {"search": 2.0, "bulk": 4.0}
+
+
+def test_transport_paces_every_attempt(clock):
+    limiter = RateLimiter(max_rate=1.0, min_rate=0.5, clock=clock)
+    transport = PyatlanSyncTransport(
+        retry=Retry(total=3, backoff_factor=0, allowed_methods=["POST"]),
+        rate_limiter=limiter,
+        trust_env=False,
+    )
+    transport._transport.handle_request = MagicMock(
+        side_effect=[
+            httpx.Response(429, headers={"Retry-After": "0"}),
+            httpx.Response(200),
+        ]
+    )
+    request = httpx.Request("POST", BASE_URL + "entity/bulk")
+    with patch("pyatlan.client.transport.time.sleep") as sleep:
+        response = transport.handle_request(request)
+    assert response.status_code == 200
+    # The retry waited for a token, at the rate reduced by the throttled attempt
+    sleep.assert_any_call(2.0)
+    assert limiter.get_rates() == {"bulk": 1.0}
+
+
+def test_client_rate_limiter(monkeypatch):
+    assert AtlanClient()._rate_limiter is None
+
+    monkeypatch.setenv("ATLAN_RATE_LIMIT", "20")
+    client = AtlanClient()
+    limiter = client._rate_limiter
+    assert limiter is not None and limiter.max_rate == 20.0
+    assert client._session._transport._rate_limiter is limiter
+    # The limiter is shared by every transport the client creates
+    with client.max_retries():
+        assert client._session._transport._rate_limiter is limiter
+    client.reset_http_session()
+    assert client._session._transport._rate_limiter is limiter
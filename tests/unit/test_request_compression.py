@@ -0,0 +1,154 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2025 Atlan Pte. Ltd.
+import gzip
+import json
+from unittest.mock import Mock, patch
+
+import httpx
+import pytest
+
+from pyatlan.client.atlan import AtlanClient
+from pyatlan.client.common.compression import RequestCompression
+from pyatlan.client.common.transport import parse_auth_policy_entity
+from pyatlan.client.constants import BULK_UPDATE, INDEX_SEARCH
+from pyatlan.errors import AtlanError, DependencyNotFoundError
+
+REQUEST = {"entities": [{"typeName": "Table", "guid": "-1"}] * 10}
+POLICY_REQUEST = {
+    "entities": REQUEST["entities"]
+    + [
+        {
+            "typeName": "AuthPolicy",
+            "guid": "-2",
+            "attributes": {"name": "policy", "accessControl": {"guid": "persona"}},
+        }
+    ]
+}
+
+
+@pytest.fixture(autouse=True)
+def set_env(monkeypatch):
+    monkeypatch.setenv("ATLAN_BASE_URL", "https://test.atlan.com")
+    monkeypatch.setenv("ATLAN_API_KEY", "test-api-key")
+
+
+def _response(status_code: int = 200) -> Mock:
+    text = "{}" if status_code == 200 else "Unsupported request"
+    return Mock(
+        status_code=status_code,
+        text=text,
+        content=text.encode("utf-8"),
+        json=lambda: json.loads(text),
+    )
+
+
+def test_request_compression():
+    compression = RequestCompression("gzip", threshold=10)
+    params = {"headers": {"Accept": "application/json"}, "data": json.dumps(REQUEST)}
+    body = compression.body_to_compress(params)
+    assert body == json.dumps(REQUEST).encode("utf-8")
+
+    compressed = compression.apply(params, compression.compress(body))
+    assert "data" not in compressed
+    assert gzip.decompress(compressed["content"]) == body
+    assert compressed["headers"]["Content-Encoding"] == "gzip"
+    # The original request is left unchanged
+    assert "Content-Encoding" not in params["headers"]
+
+    assert compression.body_to_compress({"headers": {}, "content": b"small"}) is None
+    assert RequestCompression().body_to_compress(params) is None
+
+
+def test_zstd_request_compression():
+    with patch("pyatlan.client.common.compression._zstd_compressor", return_value=None):
+        assert RequestCompression("auto").encoding == "gzip"
+        with pytest.raises(DependencyNotFoundError, match="zstandard"):
+            RequestCompression("zstd")
+
+    with patch(
+        "pyatlan.client.common.compression._zstd_compressor",
+        return_value=lambda body: b"zstd" + body,
+    ):
+        compression = RequestCompression("auto")
+        assert compression.encoding == "zstd"
+        assert compression.compress(b"body") == b"zstdbody"
+
+
+def test_client_request_compression_from_env(monkeypatch):
+    monkeypatch.setenv("ATLAN_REQUEST_COMPRESSION", "gzip")
+    monkeypatch.setenv("ATLAN_REQUEST_COMPRESSION_THRESHOLD", "100")
+    client = AtlanClient()
+    assert client._request_compression.encoding == "gzip"
+    assert client._request_compression.threshold == 100
+    assert not AtlanClient(request_compression=None)._request_compression.enabled
+
+
+def test_client_compresses_large_requests():
+    client = AtlanClient(request_compression="gzip", request_compression_threshold=10)
+    client._session = mock_session = Mock()
+    mock_session.request.return_value = _response()
+
+    client._call_api(BULK_UPDATE, request_obj=REQUEST)
+    kwargs = mock_session.request.call_args.kwargs
+    assert kwargs["headers"]["Content-Encoding"] == "gzip"
+    assert json.loads(gzip.decompress(kwargs["content"])) == REQUEST
+    assert client._request_compression.verified
+
+    client._call_api(INDEX_SEARCH, request_obj={})
+    kwargs = mock_session.request.call_args.kwargs
+    assert "Content-Encoding" not in kwargs["headers"]
+
+
+def test_client_stops_compressing_when_rejected():
+    client = AtlanClient(request_compression="gzip", request_compression_threshold=10)
+    client._session = mock_session = Mock()
+    mock_session.request.side_effect = [_response(415), _response(), _response()]
+
+    client._call_api(BULK_UPDATE, request_obj=REQUEST)
+    client._call_api(BULK_UPDATE, request_obj=REQUEST)
+    calls = mock_session.request.call_args_list
+    assert calls[0].kwargs["headers"]["Content-Encoding"] == "gzip"
+    assert "Content-Encoding" not in calls[1].kwargs["headers"]
+    assert "Content-Encoding" not in calls[2].kwargs["headers"]
+    assert not client._request_compression.enabled
+
+
+def test_client_keeps_compressing_on_other_errors():
+    client = AtlanClient(request_compression="gzip", request_compression_threshold=10)
+    client._session = mock_session = Mock()
+    # A request rejected whether or not it is compressed is not due to compression
+    mock_session.request.side_effect = [_response(400), _response(400)]
+    with pytest.raises(AtlanError):
+        client._call_api(BULK_UPDATE, request_obj=REQUEST)
+    assert client._request_compression.enabled
+    assert not client._request_compression.verified
+
+    # Nor is a request rejected for another reason, once verified
+    client._request_compression.verified = True
+    mock_session.request.side_effect = [_response(415)]
+    with pytest.raises(AtlanError):
+        client._call_api(BULK_UPDATE, request_obj=REQUEST)
+    assert mock_session.request.call_count == 3
+    assert client._request_compression.enabled
+
+
+def test_client_does_not_compress_auth_policy_creates():
+    client = AtlanClient(request_compression="gzip", request_compression_threshold=10)
+    client._session = mock_session = Mock()
+    mock_session.request.return_value = _response()
+
+    # So the transport can still parse the body, to check for a duplicate policy
+    client._call_api(BULK_UPDATE, request_obj=POLICY_REQUEST)
+    kwargs = mock_session.request.call_args.kwargs
+    assert "Content-Encoding" not in kwargs["headers"]
+    request = httpx.Request(
+        "POST",
+        f"https://test.atlan.com/api/meta/{BULK_UPDATE.path}",
+        content=kwargs["data"],
+        extensions=kwargs["extensions"],
+    )
+    assert parse_auth_policy_entity(request) == ("policy", "persona", "-2")
+
+    client._call_api(BULK_UPDATE, request_obj=REQUEST)
+    kwargs = mock_session.request.call_args.kwargs
+    assert kwargs["headers"]["Content-Encoding"] == "gzip"
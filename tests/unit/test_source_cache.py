@@ -7,7 +7,9 @@ import pytest
 from pyatlan.cache.source_tag_cache import SourceTagCache, SourceTagName
 from pyatlan.client.atlan import AtlanClient
 from pyatlan.errors import ErrorCode, InvalidRequestError, NotFoundError
-from pyatlan.model.assets import Connection
+from pyatlan.model.assets import Asset, Connection
+from pyatlan.model.fluent_search import FluentSearch
+from tests.unit.test_connection_cache import build_connection, fake_search
 
 
 @pytest.fixture(autouse=True)
@@ -258,3 +260,37 @@ def test_get_by_name(
 
     # No call to guid lookup since the object is already in the cache
     assert mock_lookup_by_guid.call_count == 0
+
+
+def test_get_by_qualified_names_resolves_connections_together(client):
+    tags = [
+        Asset._convert_to_real_type_(
+            {
+                "typeName": "SnowflakeTag",
+                "guid": f"tag-{index}",
+                "attributes": {
+                    "qualifiedName": f"default/snowflake/{index % 2}/DB/SCHEMA/TAG",
+                    "name": "TAG",
+                },
+            }
+        )
+        for index in range(2)
+    ]
+    connections = [build_connection(index) for index in range(2)]
+    searches = []
+    with patch.object(
+        FluentSearch,
+        "execute",
+        autospec=True,
+        side_effect=fake_search(tags + connections, searches),
+    ):
+        found = client.source_tag_cache.get_by_qualified_names(
+            [tag.qualified_name for tag in tags]
+        )
+        assert [tag.guid for tag in found.values()] == ["tag-0", "tag-1"]
+        # The connections of all source tags are looked up in one search
+        assert searches == [
+            ["default/snowflake/0/DB/SCHEMA/TAG", "default/snowflake/1/DB/SCHEMA/TAG"],
+            ["default/snowflake/0", "default/snowflake/1"],
+        ]
+        assert client.source_tag_cache.is_name_known("snowflake/conn-1@@DB/SCHEMA/TAG")
@@ -9,15 +9,24 @@ import pytest
 from httpx_retries import Retry
 
 from pyatlan.client.common.transport import (
+    AUTH_POLICY_CREATE_EXTENSION,
     check_for_duplicate_policy,
     check_for_duplicate_policy_async,
     create_mock_response,
     find_existing_policy,
     find_existing_policy_async,
+    mark_auth_policy_create,
     parse_auth_policy_entity,
 )
+from pyatlan.client.atlan import AtlanClient
 from pyatlan.client.constants import BULK_UPDATE
-from pyatlan.client.transport import PyatlanAsyncTransport, PyatlanSyncTransport
+from pyatlan.model.assets import Asset, AuthPolicy, Table
+from pyatlan.model.core import BulkRequest
+from pyatlan.client.transport import (
+    PyatlanAsyncTransport,
+    PyatlanSyncTransport,
+    record_retried_status_codes,
+)
 
 # ---------------------------------------------------------------------------
 # Helpers
@@ -162,6 +171,59 @@ class TestParseAuthPolicyEntity:
         assert parse_auth_policy_entity(req) is None
 
 
+# ---------------------------------------------------------------------------
+# mark_auth_policy_create
+# ---------------------------------------------------------------------------
+
+
+class TestMarkAuthPolicyCreate:
+    @staticmethod
+    def _mark(request_obj) -> dict:
+        params: dict = {"headers": {}}
+        mark_auth_policy_create(params, request_obj)
+        return params.get("extensions", {})
+
+    def test_marks_bulk_request_without_policy(self):
+        request_obj = BulkRequest[Asset](entities=[Table()])
+        assert self._mark(request_obj) == {AUTH_POLICY_CREATE_EXTENSION: False}
+
+    def test_marks_bulk_request_with_policy_create(self):
+        request_obj = BulkRequest[Asset](entities=[Table(), AuthPolicy()])
+        assert self._mark(request_obj) == {AUTH_POLICY_CREATE_EXTENSION: True}
+
+    def test_policy_update_is_not_a_create(self):
+        request_obj = BulkRequest[Asset](entities=[AuthPolicy(guid=EXISTING_GUID)])
+        assert self._mark(request_obj) == {AUTH_POLICY_CREATE_EXTENSION: False}
+
+    def test_marks_dict_request(self):
+        body = {"entities": [{"typeName": "AuthPolicy", "guid": TEMP_GUID}]}
+        assert self._mark(body) == {AUTH_POLICY_CREATE_EXTENSION: True}
+
+    def test_leaves_requests_without_entities_unmarked(self):
+        assert self._mark({"dsl": {}}) == {}
+        assert self._mark(EXISTING_POLICY) == {}
+
+    def test_client_marks_requests(self, monkeypatch):
+        monkeypatch.setenv("ATLAN_BASE_URL", "https://test.atlan.com")
+        monkeypatch.setenv("ATLAN_API_KEY", "test-api-key")
+        client = AtlanClient()
+        request_obj = BulkRequest[Asset](entities=[Table()])
+        params = client._create_params(BULK_UPDATE, None, request_obj)
+        request = client._session.build_request("POST", BULK_URL, **params)
+        assert request.extensions[AUTH_POLICY_CREATE_EXTENSION] is False
+
+    def test_unmarked_request_is_parsed(self):
+        req = _make_bulk_request()
+        assert parse_auth_policy_entity(req) is not None
+
+    def test_marked_request_is_not_parsed(self):
+        req = _make_bulk_request()
+        req.extensions[AUTH_POLICY_CREATE_EXTENSION] = False
+        with patch("pyatlan.client.common.transport.json.loads") as loads:
+            assert parse_auth_policy_entity(req) is None
+        loads.assert_not_called()
+
+
 # ---------------------------------------------------------------------------
 # create_mock_response
 # ---------------------------------------------------------------------------
@@ -580,6 +642,30 @@ class TestPyatlanSyncTransportRetry:
         assert resp.status_code == 200
         assert call_count == 2
 
+    def test_retried_status_codes_recorded(self):
+        transport = PyatlanSyncTransport(
+            retry=Retry(
+                total=3,
+                backoff_factor=0,
+                allowed_methods=["POST"],
+                status_forcelist=[429, 503],
+            ),
+            trust_env=False,
+        )
+        responses = iter(
+            [httpx.Response(429), httpx.Response(503), httpx.Response(200)] * 2
+        )
+        transport._transport.handle_request = lambda req: next(responses)
+        req = httpx.Request("POST", "https://example.com")
+
+        # Only recorded while requested (within the current context)
+        transport.handle_request(req)
+        with record_retried_status_codes() as status_codes:
+            resp = transport.handle_request(req)
+
+        assert resp.status_code == 200
+        assert status_codes == [429, 503]
+
 
 # ---------------------------------------------------------------------------
 # PyatlanAsyncTransport retry + duplicate prevention
@@ -711,3 +797,30 @@ class TestPyatlanAsyncTransportRetry:
             "response.aclose() must precede retry.asleep() "
             "to release the httpcore connection slot before the sleep"
         )
+
+    @pytest.mark.asyncio
+    async def test_retried_status_codes_recorded(self):
+        transport = PyatlanAsyncTransport(
+            retry=Retry(
+                total=3,
+                backoff_factor=0,
+                allowed_methods=["POST"],
+                status_forcelist=[429, 503],
+            ),
+            trust_env=False,
+        )
+        responses = iter(
+            [httpx.Response(429), httpx.Response(503), httpx.Response(200)]
+        )
+
+        async def handle_request(req):
+            return next(responses)
+
+        transport._transport.handle_async_request = handle_request
+        req = httpx.Request("POST", "https://example.com")
+
+        with record_retried_status_codes() as status_codes:
+            resp = await transport.handle_async_request(req)
+
+        assert resp.status_code == 200
+        assert status_codes == [429, 503]
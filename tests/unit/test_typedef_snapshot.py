@@ -0,0 +1,356 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2025 Atlan Pte. Ltd.
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from threading import Barrier
+from time import sleep
+from unittest.mock import call, patch
+
+import pytest
+
+from pyatlan.cache.common import TypeDefSnapshotFile
+from pyatlan.client.atlan import AtlanClient
+from pyatlan.client.common.typedef import TypeDefFactory
+from pyatlan.client.typedef import TypeDefClient
+from pyatlan.errors import AuthenticationError, ErrorCode, NotFoundError
+from pyatlan.model.enums import AtlanTypeCategory
+from pyatlan.model.typedef import AtlanTagDef
+
+BASE_URL = "https://test.atlan.com"
+ALL_CATEGORIES = ["CLASSIFICATION", "STRUCT", "BUSINESS_METADATA", "ENUM"]
+
+TYPEDEFS = {
+    "ENUM": {
+        "enumDefs": [
+            {
+                "category": "ENUM",
+                "name": "Colors",
+                "elementDefs": [{"value": "red", "ordinal": 0}],
+            }
+        ]
+    },
+    "STRUCT": {"structDefs": [{"category": "STRUCT", "name": "struct1"}]},
+    "CLASSIFICATION": {
+        "classificationDefs": [
+            {"category": "CLASSIFICATION", "name": "tag1", "displayName": "PII"}
+        ]
+    },
+    "BUSINESS_METADATA": {
+        "businessMetadataDefs": [
+            {
+                "category": "BUSINESS_METADATA",
+                "name": "cm1",
+                "displayName": "Quality",
+                "attributeDefs": [
+                    {
+                        "name": "attr1",
+                        "displayName": "Score",
+                        "typeName": "int",
+                        "options": {"isArchived": "true"},
+                    },
+                    {"name": "attr2", "displayName": "Score", "typeName": "int"},
+                ],
+            }
+        ]
+    },
+}
+
+
+# Type definitions created (or changed) since the typedefs were requested in full
+CREATED_TYPEDEFS = {
+    "tag2": {
+        "category": "CLASSIFICATION",
+        "name": "tag2",
+        "displayName": "Confidential",
+        "attributeDefs": [
+            {
+                "name": "attr9",
+                "displayName": "sourceTagAttachment",
+                "typeName": "array<SourceTagAttachment>",
+            }
+        ],
+    },
+    "cm2": {
+        "category": "BUSINESS_METADATA",
+        "name": "cm2",
+        "displayName": "Ownership",
+        "attributeDefs": [
+            {"name": "attr3", "displayName": "Owner", "typeName": "string"}
+        ],
+    },
+    "cm1": {
+        "category": "BUSINESS_METADATA",
+        "name": "cm1",
+        "displayName": "Quality",
+        "attributeDefs": [
+            {"name": "attr2", "displayName": "Score", "typeName": "int"},
+            {"name": "attr4", "displayName": "Rating", "typeName": "int"},
+        ],
+    },
+}
+
+
+def get_by_name(name):
+    if name not in CREATED_TYPEDEFS:
+        raise ErrorCode.ATLAN_TAG_NOT_FOUND_BY_NAME.exception_with_parameters(name)
+    return TypeDefFactory.create(CREATED_TYPEDEFS[name])
+
+
+@pytest.fixture(autouse=True)
+def set_env(monkeypatch):
+    monkeypatch.setenv("ATLAN_BASE_URL", BASE_URL)
+    monkeypatch.setenv("ATLAN_API_KEY", "test-api-key")
+
+
+@pytest.fixture()
+def requested():
+    return []
+
+
+@pytest.fixture()
+def mock_call_api(requested):
+    def call_api(api, query_params=None, *args, **kwargs):
+        requested.append(query_params["type"])
+        raw_json = {}
+        for category in query_params["type"]:
+            raw_json.update(TYPEDEFS[category])
+        return raw_json
+
+    with patch.object(AtlanClient, "_call_api", side_effect=call_api) as mock:
+        yield mock
+
+
+def test_snapshot_file_round_trip(tmp_path):
+    snapshot = TypeDefSnapshotFile(BASE_URL, str(tmp_path), ttl=60)
+    categories = [AtlanTypeCategory.CLASSIFICATION, AtlanTypeCategory.STRUCT]
+
+    assert snapshot.load(categories) == ({}, categories)
+
+    snapshot.save(categories, {**TYPEDEFS["CLASSIFICATION"], **TYPEDEFS["STRUCT"]})
+    raw_json, missing = snapshot.load(
+        [AtlanTypeCategory.STRUCT, AtlanTypeCategory.ENUM]
+    )
+    assert raw_json == TYPEDEFS["STRUCT"]
+    assert missing == [AtlanTypeCategory.ENUM]
+
+    # Another tenant's snapshot is kept in a different file
+    other = TypeDefSnapshotFile("https://other.atlan.com", str(tmp_path), ttl=60)
+    assert other.path != snapshot.path
+    assert other.load(categories) == ({}, categories)
+
+    snapshot.invalidate()
+    assert snapshot.load(categories) == ({}, categories)
+
+
+def test_snapshot_file_stale_and_empty_categories(tmp_path):
+    snapshot = TypeDefSnapshotFile(BASE_URL, str(tmp_path), ttl=0)
+    snapshot.save([AtlanTypeCategory.STRUCT], TYPEDEFS["STRUCT"])
+    assert snapshot.load([AtlanTypeCategory.STRUCT]) == (
+        {},
+        [AtlanTypeCategory.STRUCT],
+    )
+
+    snapshot = TypeDefSnapshotFile(BASE_URL, str(tmp_path), ttl=60)
+    saved = snapshot.save([AtlanTypeCategory.ENUM], {})
+    assert saved == {"enumDefs": []}
+    assert snapshot.load([AtlanTypeCategory.ENUM]) == ({}, [AtlanTypeCategory.ENUM])
+
+
+def test_snapshot_file_ignores_unreadable_file(tmp_path):
+    snapshot = TypeDefSnapshotFile(BASE_URL, str(tmp_path), ttl=60)
+    with open(snapshot.path, "w") as f:
+        f.write("{not json")
+    assert snapshot.load([AtlanTypeCategory.ENUM]) == ({}, [AtlanTypeCategory.ENUM])
+    snapshot.save([AtlanTypeCategory.ENUM], TYPEDEFS["ENUM"])
+    assert snapshot.load([AtlanTypeCategory.ENUM]) == (TYPEDEFS["ENUM"], [])
+
+
+def test_caches_share_one_request(mock_call_api, requested):
+    client = AtlanClient()
+    assert client._typedef_snapshot_file is None
+    assert client.atlan_tag_cache.get_id_for_name("PII") == "tag1"
+    assert client.custom_metadata_cache.get_id_for_name("Quality") == "cm1"
+    assert client.enum_cache.get_by_name("Colors").name == "Colors"
+    assert requested == [ALL_CATEGORIES]
+
+    assert AtlanClient().atlan_tag_cache.get_id_for_name("PII") == "tag1"
+    assert requested == [ALL_CATEGORIES, ALL_CATEGORIES]
+
+
+def test_caches_build_from_raw_typedefs(mock_call_api):
+    client = AtlanClient()
+    cm_cache = client.custom_metadata_cache
+    assert cm_cache.get_attr_id_for_name("Quality", "Score") == "attr2"
+    assert cm_cache.is_attr_archived("attr1")
+    assert not cm_cache.is_attr_archived("attr2")
+
+    # Full definitions are parsed once, when first needed, and shared
+    assert client.atlan_tag_cache.get_id_for_name("PII") == "tag1"
+    snapshot = client.typedef._get_snapshot()
+    atlan_tag = client.atlan_tag_cache.cache_by_id["tag1"]
+    assert isinstance(atlan_tag, AtlanTagDef)
+    assert atlan_tag.display_name == "PII"
+    assert atlan_tag is snapshot.models(AtlanTypeCategory.CLASSIFICATION)["tag1"]
+    assert cm_cache.get_attribute_def("attr2").display_name == "Score"
+    assert cm_cache.get_custom_metadata_def("Quality").name == "cm1"
+
+
+def test_concurrent_refreshes_share_one_request(mock_call_api, requested):
+    client = AtlanClient()
+    client.typedef._get_snapshot()
+    call_api = mock_call_api.side_effect
+    mock_call_api.side_effect = lambda *args: sleep(0.1) or call_api(*args)
+    barrier = Barrier(4)
+
+    def refresh():
+        barrier.wait()
+        return client.typedef._get_snapshot(refresh=True)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        snapshots = list(executor.map(lambda _: refresh(), range(4)))
+    assert len({id(snapshot) for snapshot in snapshots}) == 1
+    assert len(requested) == 2
+
+
+def test_caches_load_from_snapshot_file(tmp_path, mock_call_api, requested):
+    client = AtlanClient(typedef_snapshot_dir=str(tmp_path))
+    assert client.atlan_tag_cache.get_id_for_name("PII") == "tag1"
+    assert requested == [ALL_CATEGORIES]
+
+    # A new client loads every category from the snapshot file
+    client = AtlanClient(typedef_snapshot_dir=str(tmp_path))
+    assert client.custom_metadata_cache.get_id_for_name("Quality") == "cm1"
+    assert client.enum_cache.get_by_name("Colors").name == "Colors"
+    assert client.atlan_tag_cache.get_name_for_id("tag1") == "PII"
+    assert len(requested) == 1
+
+
+def test_only_missing_categories_are_requested(tmp_path, mock_call_api, requested):
+    snapshot_file = TypeDefSnapshotFile(BASE_URL, str(tmp_path), ttl=60)
+    snapshot_file.save([AtlanTypeCategory.STRUCT], TYPEDEFS["STRUCT"])
+
+    client = AtlanClient(typedef_snapshot_dir=str(tmp_path))
+    assert client.enum_cache.get_by_name("Colors").name == "Colors"
+    assert requested == [["CLASSIFICATION", "BUSINESS_METADATA", "ENUM"]]
+
+
+def test_cache_miss_after_snapshot_load_requests_typedefs(
+    tmp_path, mock_call_api, requested
+):
+    client = AtlanClient(typedef_snapshot_dir=str(tmp_path))
+    client.atlan_tag_cache.refresh_cache()
+    assert len(requested) == 1
+
+    client = AtlanClient(typedef_snapshot_dir=str(tmp_path))
+    assert client.atlan_tag_cache.get_id_for_name("Unknown") is None
+    assert requested == [ALL_CATEGORIES, ALL_CATEGORIES]
+
+
+def test_typedef_changes_invalidate_snapshot(tmp_path, mock_call_api, requested):
+    client = AtlanClient(typedef_snapshot_dir=str(tmp_path))
+    client.enum_cache.refresh_cache()
+    snapshot_file = client._typedef_snapshot_file
+    assert snapshot_file.load([AtlanTypeCategory.ENUM])[1] == []
+
+    client.typedef._invalidate_snapshot()
+    assert client.typedef._snapshot is None
+    assert snapshot_file.load([AtlanTypeCategory.ENUM])[1] == [AtlanTypeCategory.ENUM]
+    client.enum_cache.refresh_cache()
+    assert requested == [ALL_CATEGORIES, ALL_CATEGORIES]
+
+
+def test_unknown_tag_ids_are_retrieved_individually(mock_call_api, requested):
+    client = AtlanClient()
+    tag_cache = client.atlan_tag_cache
+    with patch.object(
+        TypeDefClient, "get_by_name", side_effect=get_by_name
+    ) as mock_get_by_name:
+        assert tag_cache.get_name_for_id("tag1") == "PII"
+        assert tag_cache.get_name_for_id("tag2") == "Confidential"
+        assert tag_cache.get_source_tags_attr_id("tag2") == "attr9"
+        assert tag_cache.get_id_for_name("Confidential") == "tag2"
+        # Atlan tags that do not exist are only requested once
+        assert tag_cache.get_name_for_id("deleted") is None
+        assert tag_cache.get_source_tags_attr_id("deleted") is None
+    assert mock_get_by_name.call_args_list == [call("tag2"), call("deleted")]
+    assert requested == [ALL_CATEGORIES]
+    assert tag_cache.cache_by_id["tag1"].display_name == "PII"
+    assert tag_cache.cache_by_id["tag2"].display_name == "Confidential"
+    assert tag_cache.get_stats()["refreshes"] == 3
+
+    # An explicit refresh still requests all Atlan tags
+    tag_cache.refresh_cache()
+    assert requested == [ALL_CATEGORIES, ALL_CATEGORIES]
+    assert "tag2" not in tag_cache.map_id_to_name
+
+
+def test_unknown_custom_metadata_ids_are_retrieved_individually(
+    mock_call_api, requested
+):
+    cm_cache = AtlanClient().custom_metadata_cache
+    with patch.object(
+        TypeDefClient, "get_by_name", side_effect=get_by_name
+    ) as mock_get_by_name:
+        assert cm_cache.get_attr_name_for_id("cm2", "attr3") == "Owner"
+        assert cm_cache.get_name_for_id("cm2") == "Ownership"
+        assert cm_cache.get_attr_id_for_name("Ownership", "Owner") == "attr3"
+        assert cm_cache.get_attribute_def("attr3").display_name == "Owner"
+        assert cm_cache.get_custom_metadata_def("Ownership").name == "cm2"
+
+        # An attribute added to a cached set retrieves (only) that set again
+        assert cm_cache.get_attr_name_for_id("cm1", "attr4") == "Rating"
+        assert cm_cache.get_attr_id_for_name("Quality", "Rating") == "attr4"
+        assert not cm_cache.is_attr_archived("attr1")
+
+        with pytest.raises(NotFoundError):
+            cm_cache.get_name_for_id("deleted")
+    assert mock_get_by_name.call_args_list == [
+        call("cm2"),
+        call("cm1"),
+        call("deleted"),
+    ]
+    assert requested == [ALL_CATEGORIES]
+
+
+def test_failed_request_is_not_kept(mock_call_api, requested):
+    client = AtlanClient()
+    call_api = mock_call_api.side_effect
+    mock_call_api.side_effect = lambda *args: requested.append(args[1]["type"])
+    with pytest.raises(AuthenticationError):
+        client.atlan_tag_cache.get_id_for_name("PII")
+    assert client.typedef._snapshot is None
+
+    mock_call_api.side_effect = call_api
+    assert client.atlan_tag_cache.get_id_for_name("PII") == "tag1"
+    assert client.enum_cache.get_by_name("Colors").name == "Colors"
+    assert requested == [ALL_CATEGORIES, ALL_CATEGORIES]
+
+
+def test_caches_without_definitions_are_refreshed(mock_call_api, requested):
+    client = AtlanClient()
+    with patch.dict(TYPEDEFS, {"CLASSIFICATION": {"classificationDefs": []}}):
+        assert client.atlan_tag_cache.get_id_for_name("PII") is None
+        assert requested == [ALL_CATEGORIES, ALL_CATEGORIES]
+        client.atlan_tag_cache.refresh_cache()
+        assert len(requested) == 3
+
+    # Atlan tags created since are found by the next lookup
+    assert client.atlan_tag_cache.get_id_for_name("PII") == "tag1"
+    assert len(requested) == 4
+
+
+@pytest.mark.parametrize(
+    "module",
+    [
+        "pyatlan.model.fluent_search",
+        "pyatlan.client.asset",
+        "pyatlan.client.transport",
+        "pyatlan.model.audit",
+        "pyatlan.cache.custom_metadata_cache",
+        "pyatlan.cache.aio.custom_metadata_cache",
+    ],
+)
+def test_modules_import_without_circular_imports(module):
+    # In a fresh interpreter, so that the module is the first one imported
+    subprocess.check_call([sys.executable, "-c", f"import {module}"])
@@ -0,0 +1,86 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2025 Atlan Pte. Ltd.
+from concurrent.futures import ThreadPoolExecutor
+from threading import Barrier
+from time import sleep
+from unittest.mock import Mock
+
+import pytest
+
+from pyatlan.cache.common import CacheMissPolicy
+from pyatlan.cache.group_cache import GroupCache
+from pyatlan.cache.user_cache import UserCache
+from pyatlan.model.group import AtlanGroup
+from pyatlan.model.user import AtlanUser
+
+USERS = [AtlanUser(id="user-guid", username="jdoe", email="jdoe@example.com")]
+GROUPS = [AtlanGroup(id="group-guid", name="data_team", alias="Data Team")]
+
+
+@pytest.fixture()
+def client():
+    client = Mock()
+    client.user.get_all.return_value = USERS
+    client.group.get_all.return_value = GROUPS
+    client.token.get_by_guid.return_value = None
+    return client
+
+
+def test_repeated_misses_refresh_once(client):
+    user_cache = UserCache(client)
+    for _ in range(100):
+        assert user_cache.get_id_for_name("departed") is None
+        assert user_cache.get_name_for_id("unknown-guid") is None
+    assert user_cache.get_id_for_email("jdoe@example.com") == "user-guid"
+    assert client.user.get_all.call_count == 1
+    # Known misses do not look for an API token either
+    assert client.token.get_by_guid.call_count == 1
+
+
+def test_misses_are_forgotten_after_ttl_or_refresh(client):
+    user_cache = UserCache(client)
+    user_cache.miss_policy = CacheMissPolicy(negative_ttl=0, min_refresh_interval=0)
+    assert user_cache.get_id_for_name("departed") is None
+    assert user_cache.get_id_for_name("departed") is None
+    assert client.user.get_all.call_count == 2
+
+    user_cache.miss_policy = CacheMissPolicy(min_refresh_interval=0)
+    assert user_cache.get_id_for_name("departed") is None
+    user_cache.miss_policy.refreshed()
+    assert not user_cache.miss_policy.is_known_miss("map_name_to_id", "departed")
+
+
+def test_min_refresh_interval(client):
+    user_cache = UserCache(client)
+    assert user_cache.get_id_for_name("first") is None
+    assert user_cache.get_id_for_name("second") is None
+    assert client.user.get_all.call_count == 1
+
+    user_cache.miss_policy.min_refresh_interval = 0
+    assert user_cache.get_id_for_name("third") is None
+    assert client.user.get_all.call_count == 2
+
+
+def test_concurrent_misses_share_one_refresh(client):
+    client.user.get_all.side_effect = lambda: sleep(0.1) or USERS
+    user_cache = UserCache(client)
+    user_cache.miss_policy.min_refresh_interval = 0
+    barrier = Barrier(4)
+
+    def lookup(name):
+        barrier.wait()
+        return user_cache.get_id_for_name(name)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(lookup, ["jdoe", "a", "b", "c"]))
+    assert results == ["user-guid", None, None, None]
+    assert client.user.get_all.call_count == 1
+
+
+def test_group_cache_misses(client):
+    group_cache = GroupCache(client)
+    for _ in range(10):
+        assert group_cache.get_id_for_alias("Unknown Team") is None
+    assert group_cache.get_id_for_alias("Data Team") == "group-guid"
+    assert group_cache.get_name_for_id("group-guid") == "data_team"
+    assert client.group.get_all.call_count == 1
@@ -1,14 +1,19 @@
 # SPDX-License-Identifier: Apache-2.0
 # Copyright 2022 Atlan Pte. Ltd.
+import json
 from unittest.mock import patch
 
 import pytest
 
-from pyatlan.errors import InvalidRequestError
+from pyatlan.errors import InvalidRequestError, LogicError
 from pyatlan.model.enums import AtlanConnectionCategory, AtlanConnectorType
+from pyatlan.model.search import DSL, IndexSearchRequest, Term
 from pyatlan.model.utils import construct_object_key
 from pyatlan.utils import (
     ComparisonCategory,
+    CustomMetadataPlan,
+    EventStreamParser,
+    JsonArrayStreamParser,
     get_base_type,
     is_comparable_type,
     list_attributes_to_params,
@@ -84,6 +89,37 @@ def test_unflatten_custom_metadata(attributes, flattened_attributes, custom_meta
     )
 
 
+def test_custom_metadata_plan_unflattens_only_requested_custom_metadata():
+    plan = CustomMetadataPlan(
+        ["name", "ihnLo19fqaT4x9pU8JKWbQ.Cyw6GbqST9M1dhXIBE1yHp", "mwkV.IBTI"]
+    )
+    assert plan
+    assert not CustomMetadataPlan(["name", "qualifiedName"])
+
+    entity = {
+        "attributes": {"name": "dave", "mwkV.IBTI": 12, "mwkV.other": 1},
+    }
+    plan.unflatten_for_entity(entity)
+    assert entity["businessAttributes"] == {"mwkV": {"IBTI": 12}}
+
+    entity = {"attributes": {"name": "dave"}}
+    plan.unflatten_for_entity(entity)
+    assert "businessAttributes" not in entity
+
+
+def test_search_request_reuses_custom_metadata_plan():
+    request = IndexSearchRequest(
+        dsl=DSL(query=Term(field="name", value="dave")),
+        attributes=["name", "mwkV.IBTI"],
+    )
+    plan = request.custom_metadata_plan
+    assert request.custom_metadata_plan is plan
+
+    request.attributes.append("ihnL.Cyw6")
+    assert request.custom_metadata_plan is not plan
+    assert request.custom_metadata_plan.attributes == ("name", "mwkV.IBTI", "ihnL.Cyw6")
+
+
 @patch("pyatlan.utils.unflatten_custom_metadata")
 def test_unflatten_custom_metadata_for_entity(mock_unflatten_custom_metadata):
     custom_metadata = {"mwkVZhWne8ApD5t1BetxLd": {"IBTIot8BAicd74XmnPGytU": 12}}
@@ -436,3 +472,131 @@ def test_atlan_connector_type_custom_connection_qn(custom_connection_qns):
     )
     assert len(AtlanConnectorType.get_names()) == len_get_names + len(unique_custom_qns)
     assert len(AtlanConnectorType.get_items()) == len_get_items + len(unique_custom_qns)
+
+
+STREAMED_DOCUMENT = {
+    "queryType": "INDEX",
+    "searchParameters": {"query": '{"entities": ["not", "streamed"]}'},
+    "entities": [
+        {"guid": "1", "attributes": {"name": 'sp\u00e9cial "quoted" ]}'}},
+        {"guid": "2", "attributes": {"name": "\u2713", "values": [1.5, None, True]}},
+    ],
+    "approximateCount": 12345,
+    "aggregations": {"test": {"buckets": []}},
+}
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 7, 64, 100000])
+def test_json_array_stream_parser(chunk_size):
+    document = json.dumps(STREAMED_DOCUMENT, ensure_ascii=False).encode("utf-8")
+    parser = JsonArrayStreamParser("entities")
+    elements = []
+    for i in range(0, len(document), chunk_size):
+        elements.extend(parser.feed(document[i : i + chunk_size]))
+    elements.extend(parser.close())
+
+    assert elements == STREAMED_DOCUMENT["entities"]
+    assert parser.fields == {
+        key: value for key, value in STREAMED_DOCUMENT.items() if key != "entities"
+    }
+
+
+def test_json_array_stream_parser_yields_elements_before_document_is_complete():
+    parser = JsonArrayStreamParser("entities")
+
+    assert parser.feed(b'{"entities": [{"guid": "1"}, {"gu') == [{"guid": "1"}]
+    assert parser.feed(b'id": "2"}], "approximateCount": 1') == [{"guid": "2"}]
+    # A number at the end of what has been received may not be complete yet
+    assert "approximateCount" not in parser.fields
+    assert parser.feed(b"0}") == []
+    assert parser.close() == []
+    assert parser.fields == {"approximateCount": 10}
+
+
+@pytest.mark.parametrize(
+    "chunks, expected_count, expected_elements",
+    [
+        ([b'{"approximateCount": 1', b'.5e3, "entities": [1.', b"5]}"], 1500.0, [1.5]),
+        (
+            [b'{"approximateCount": 1.5e', b'3, "entities": [1', b".5E", b"+0]}"],
+            1500.0,
+            [1.5],
+        ),
+        (
+            [b'{"approximateCount": 2e-', b'3, "entities": [-', b"1, 2]}"],
+            0.002,
+            [-1, 2],
+        ),
+    ],
+)
+def test_json_array_stream_parser_with_numbers_split_across_chunks(
+    chunks, expected_count, expected_elements
+):
+    parser = JsonArrayStreamParser("entities")
+    elements = []
+    for chunk in chunks:
+        elements.extend(parser.feed(chunk))
+    elements.extend(parser.close())
+
+    assert elements == expected_elements
+    assert parser.fields == {"approximateCount": expected_count}
+
+
+@pytest.mark.parametrize(
+    "document, expected_fields",
+    [
+        (b"", {}),
+        (b"{}", {}),
+        (b'{"approximateCount": 0}', {"approximateCount": 0}),
+        (b'{"entities": null}', {"entities": None}),
+    ],
+)
+def test_json_array_stream_parser_without_array(document, expected_fields):
+    parser = JsonArrayStreamParser("entities")
+
+    assert parser.feed(document) == []
+    assert parser.close() == []
+    assert parser.fields == expected_fields
+
+
+@pytest.mark.parametrize(
+    "document",
+    [
+        b"[]",
+        b'{"entities": [{"guid": "1"}',
+        b'{"entities": [{"guid": "1"} {"guid": "2"}]}',
+        b'{"approximateCount": 1 "entities": []}',
+    ],
+)
+def test_json_array_stream_parser_with_invalid_document(document):
+    parser = JsonArrayStreamParser("entities")
+
+    with pytest.raises(json.JSONDecodeError):
+        parser.feed(document)
+        parser.close()
+
+
+def test_event_stream_parser_yields_events_before_stream_is_complete():
+    parser = EventStreamParser()
+
+    assert parser.feed(b'data: {"rows": [["1"]]}\r\n\ndata: {"ro') == [
+        {"rows": [["1"]]}
+    ]
+    assert parser.feed(b'ws": [["2"]]') == []
+    assert parser.feed(b"}\ndata: {}") == [{"rows": [["2"]]}]
+    assert parser.close() == [{}]
+
+
+def test_event_stream_parser_with_json_array_of_events():
+    parser = EventStreamParser()
+
+    assert parser.feed(b'\n[{"rows": [["1"]]}, ') == []
+    assert parser.feed(b'{"rows": [["2"]]}]\n') == []
+    assert parser.close() == [{"rows": [["1"]]}, {"rows": [["2"]]}]
+
+
+def test_event_stream_parser_with_invalid_event():
+    parser = EventStreamParser()
+
+    with pytest.raises(LogicError, match="Unable to deserialize value: invalid"):
+        parser.feed(b"data: {}\ninvalid\n")
@@ -0,0 +1,67 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2025 Atlan Pte. Ltd.
+from threading import Event
+from time import perf_counter, sleep
+from unittest.mock import patch
+
+import pytest
+
+from pyatlan.cache.atlan_tag_cache import AtlanTagCache
+from pyatlan.cache.common.warmup import WARMABLE_CACHES
+from pyatlan.cache.enum_cache import EnumCache
+from pyatlan.cache.role_cache import RoleCache
+from pyatlan.cache.user_cache import UserCache
+from pyatlan.client.atlan import AtlanClient
+from pyatlan.errors import InvalidRequestError
+
+
+@pytest.fixture(autouse=True)
+def set_env(monkeypatch):
+    monkeypatch.setenv("ATLAN_BASE_URL", "https://test.atlan.com")
+    monkeypatch.setenv("ATLAN_API_KEY", "test-api-key")
+
+
+@pytest.fixture()
+def client():
+    return AtlanClient()
+
+
+def test_warm_caches_concurrently(client):
+    with (
+        patch.object(AtlanTagCache, "refresh_cache", side_effect=lambda: sleep(0.2)),
+        patch.object(EnumCache, "refresh_cache", side_effect=lambda: sleep(0.2)),
+    ):
+        started = perf_counter()
+        results = client.warm_caches(["atlan_tag_cache", "enum_cache"])
+        assert perf_counter() - started < 0.35
+    assert list(results) == ["atlan_tag_cache", "enum_cache"]
+    for name, result in results.items():
+        assert result.cache == name
+        assert result.succeeded
+        assert result.elapsed >= 0.2
+
+
+def test_warm_caches_reports_errors_and_deadline(client):
+    release = Event()
+    with (
+        patch.object(UserCache, "refresh_cache", side_effect=ValueError("boom")),
+        patch.object(RoleCache, "refresh_cache", side_effect=release.wait),
+    ):
+        results = client.warm_caches(["user_cache", "role_cache"], timeout=0.1)
+        release.set()
+    assert str(results["user_cache"].error) == "boom"
+    assert not results["role_cache"].succeeded
+    assert isinstance(results["role_cache"].error, TimeoutError)
+    assert results["role_cache"].elapsed >= 0.1
+
+
+def test_warm_caches_defaults_to_all_caches(client):
+    with patch.object(AtlanClient, "_call_api", side_effect=ValueError("offline")):
+        results = client.warm_caches(timeout=5)
+    assert list(results) == WARMABLE_CACHES
+
+
+def test_warm_caches_rejects_unknown_caches(client):
+    with pytest.raises(InvalidRequestError, match="Unknown cache.* connection_cache"):
+        client.warm_caches(["atlan_tag_cache", "connection_cache"])
+    assert client.warm_caches([]) == {}